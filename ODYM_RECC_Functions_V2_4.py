@@ -0,0 +1,1572 @@
+# -*- coding: utf-8 -*-
+"""
+File ODYM_RECC_Functions_V2_4.py
+
+Contains helper functions for the ODYM-RECC model v 2.4 (ODYM_RECC_V2_4.py):
+config snapshots, parameter caching, and data handling routines that are specific to RECC and therefore not part of the ODYM function library.
+
+dependencies:
+    numpy >= 1.9
+    scipy >= 0.14
+
+"""
+import os
+import sys
+import ast
+import copy
+import functools
+import hashlib
+import pickle
+import shutil
+import tempfile
+import time
+import traceback
+import zipfile
+import types
+import numpy as np
+import scipy.special
+import logging as log
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Parameters that are only required by individual sectors. A parameter is read if it is not listed here (required by all sectors),
+# or if one of the sectors it is listed for is selected in the config file (SectorSelect).
+# For the other parameters, an empty placeholder of the correct shape is created.
+SectorParameters = {
+    'pav' : ['2_S_RECC_FinalProducts_2015_passvehicles','1_F_Function_Future','3_EI_Products_UsePhase_passvehicles',
+             '3_IO_Vehicles_UsePhase','6_MIP_VehicleOccupancyRate','3_LT_RECC_ProductLifetime_passvehicles','3_MC_RECC_Vehicles',
+             '6_PR_LifeTimeExtension_passvehicles','6_PR_ReUse_Veh','6_PR_CarSharingShare','6_PR_RideSharingShare',
+             '3_SHA_TypeSplit_Vehicles','3_SHA_EnergyCarrierSplit_Vehicles','3_MC_VehicleArchetypes','3_EI_VehicleArchetypes',
+             '3_SHA_DownSizing_Vehicles','3_SHA_LightWeighting_Vehicles','6_MIP_CarSharing_Stock','6_MIP_RideSharing_Occupancy',
+             'X_FLAG_VehicleDownsizingDirection'],
+    'reb' : ['2_S_RECC_FinalProducts_2015_resbuildings','2_S_RECC_FinalProducts_Future_resbuildings',
+             '2_S_RECC_FinalProducts_Future_resbuildings_MIUPotential','3_EI_Products_UsePhase_resbuildings',
+             '3_IO_Buildings_UsePhase_Historic','3_IO_Buildings_UsePhase_Future_Heating','3_IO_Buildings_UsePhase_Future_Cooling',
+             '4_TC_ResidentialEnergyEfficiency_Default','4_TC_ResidentialEnergyEfficiency_Scenario_Heating',
+             '4_TC_ResidentialEnergyEfficiency_Scenario_Cooling','3_LT_RECC_ProductLifetime_resbuildings','3_MC_RECC_Buildings',
+             '3_MC_RECC_Buildings_Renovation_Relative','3_MC_RECC_Buildings_Renovation_Absolute','6_PR_LifeTimeExtension_resbuildings',
+             '6_PR_ReUse_Bld','3_SHA_TypeSplit_Buildings','3_SHA_EnergyCarrierSplit_Buildings','3_MC_BuildingArchetypes',
+             '3_EI_BuildingArchetypes','3_SHA_DownSizing_Buildings','3_SHA_LightWeighting_Buildings','3_MC_CementContentConcrete',
+             '3_SHA_MaxRenovationPotential_ResBuildings','3_SHA_EnergySavingsPot_Renovation_ResBuildings'],
+    'nrb' : ['2_S_RECC_FinalProducts_2015_nonresbuildings','2_S_RECC_FinalProducts_Future_NonResBuildings',
+             '2_S_RECC_FinalProducts_Future_nonresbuildings_MIUPotential','3_EI_Products_UsePhase_nonresbuildings',
+             '3_IO_NonResBuildings_UsePhase','3_LT_RECC_ProductLifetime_NonResbuildings','3_MC_RECC_NonResBuildings',
+             '6_PR_LifeTimeExtension_nonresbuildings','6_PR_ReUse_nonresBld','3_SHA_TypeSplit_NonResBuildings',
+             '3_SHA_EnergyCarrierSplit_NonResBuildings','3_MC_NonResBuildingArchetypes','3_EI_NonResBuildingArchetypes',
+             '3_SHA_DownSizing_NonResBuildings','3_SHA_LightWeighting_NonResBuildings','3_MC_CementContentConcrete',
+             '3_SHA_MaxRenovationPotential_NonResBuildings','3_SHA_EnergySavingsPot_Renovation_NonResBuildings'],
+    'nrbg': ['2_S_RECC_FinalProducts_nonresbuildings_g','3_LT_RECC_ProductLifetime_nonresbuildings_g','3_MC_RECC_Nonresbuildings_g',
+             '3_MC_CementContentConcrete'],
+    'ind' : ['1_F_RECC_FinalProducts_industry','3_LT_RECC_ProductLifetime_industry','3_MC_RECC_industry','6_PR_LifeTimeExtension_industry'],
+    'app' : ['1_F_RECC_FinalProducts_appliances','3_LT_RECC_ProductLifetime_appliances','3_MC_RECC_appliances','6_PR_LifeTimeExtension_appliances']}
+
+# Section 3 preprocessing steps that are only required by individual sectors. Steps that are not listed here are performed for all sector selections.
+SectorSteps = {
+    '1a': ['pav'], # material composition of vehicles
+    '1b': ['reb'], # material composition of res. buildings
+    '1c': ['nrb'], # material composition of nonres. buildings
+    '2a': ['pav'], # vehicle archetype mixing
+    '2b': ['reb'], # res. building archetype mixing
+    '2c': ['nrb'], # nonres. building archetype mixing
+    '2d': ['nrbg'], # nonres. buildings, global: cement content of concrete
+    '6' : ['pav'], # energy carrier split of vehicles
+    '14': ['pav'], # future vehicle stock and kilometrage
+    '15': ['reb'], # future res. building intensity of operation
+    '16': ['reb'], # res. building energy conversion efficiency
+    '17': ['reb'], # res. building energy supply multipliers
+    '19': ['app']} # appliance extrapolation beyond 2050
+
+# Inputs and outputs of the Section 3 preprocessing steps, in the order in which they are performed, see PreprocessingCache:
+# - Config: ScriptConfig entries that the step depends on,
+# - Reads: parameters that are only read by the step,
+# - Writes: parameters that are modified or created by the step (their state before the step is an input, too),
+# - Empty: parameters that are created as empty (zero) arrays, to be filled in later in the model run.
+# A step that reads or modifies a parameter or config entry not declared here would be loaded from an outdated cache entry, 
+# so this table must be updated together with Section 3 of the model script. 
+# PreprocessingCache.Store raises an error if a computed step accessed a parameter that is not declared, config entries are not checked.
+PreprocessingSteps = {
+    '1a': {'Config': [], 'Reads': [], 'Writes': ['3_MC_RECC_Vehicles'], 'Empty': []},
+    '1b': {'Config': [], 'Reads': [], 
+           'Writes': ['3_MC_RECC_Buildings','3_MC_RECC_Buildings_Renovation_Absolute','3_MC_RECC_Buildings_Renovation_Relative'], 'Empty': []},
+    '1c': {'Config': [], 'Reads': [], 'Writes': ['3_MC_RECC_NonResBuildings'], 'Empty': []},
+    '2a': {'Config': ['Include_REStrategy_MaterialSubstitution','Include_REStrategy_UsingLessMaterialByDesign'],
+           'Reads':  ['X_FLAG_VehicleDownsizingDirection','3_MC_RECC_Vehicles','3_MC_VehicleArchetypes','3_EI_VehicleArchetypes'],
+           'Writes': ['3_SHA_LightWeighting_Vehicles','3_SHA_DownSizing_Vehicles','3_MC_RECC_Vehicles_RECC','3_EI_Products_UsePhase_passvehicles'],
+           'Empty':  []},
+    '2b': {'Config': ['Include_REStrategy_MaterialSubstitution','Include_REStrategy_UsingLessMaterialByDesign'],
+           'Reads':  ['3_MC_RECC_Buildings','3_MC_BuildingArchetypes','3_MC_CementContentConcrete','3_EI_BuildingArchetypes'],
+           'Writes': ['3_SHA_LightWeighting_Buildings','3_SHA_DownSizing_Buildings','3_MC_RECC_Buildings_RECC',
+                      '3_MC_RECC_Buildings_Renovation_Absolute','3_EI_Products_UsePhase_resbuildings'],
+           'Empty':  ['3_EI_Products_UsePhase_resbuildings_t','3_MC_RECC_Buildings_t']},
+    '2c': {'Config': ['Include_REStrategy_MaterialSubstitution','Include_REStrategy_UsingLessMaterialByDesign'],
+           'Reads':  ['3_MC_RECC_NonResBuildings','3_MC_NonResBuildingArchetypes','3_MC_CementContentConcrete','3_EI_NonResBuildingArchetypes'],
+           'Writes': ['3_SHA_LightWeighting_NonResBuildings','3_SHA_DownSizing_NonResBuildings','3_MC_RECC_NonResBuildings_RECC',
+                      '3_EI_Products_UsePhase_nonresbuildings'],
+           'Empty':  ['3_EI_Products_UsePhase_nonresbuildings_t']},
+    '2d': {'Config': [], 'Reads': ['3_MC_CementContentConcrete'], 'Writes': ['3_MC_RECC_Nonresbuildings_g'], 'Empty': []},
+    '3' : {'Config': [], 'Reads': [], 
+           'Writes': ['4_PE_GHGIntensityElectricitySupply_Backstop','4_PE_GHGIntensityEnergySupply','4_PE_GHGIntensityEnergySupply_World'], 'Empty': []},
+    '4' : {'Config': ['Include_REStrategy_FabScrapDiversion'], 'Reads': [], 'Writes': ['4_PY_Manufacturing','6_PR_FabricationScrapDiversion'], 'Empty': []},
+    '5' : {'Config': [], 'Reads': [], 'Writes': ['4_PY_EoL_RecoveryRate'], 'Empty': []},
+    '6' : {'Config': [], 'Reads': [], 'Writes': ['3_SHA_EnergyCarrierSplit_Vehicles'], 'Empty': []},
+    '7' : {'Config': [], 'Reads': [], 
+           'Writes': ['6_PR_ReUse_Bld','6_PR_ReUse_nonresBld','6_PR_LifeTimeExtension_passvehicles','6_PR_EoL_RR_Improvement'], 'Empty': []},
+    '8' : {'Config': [], 'Reads': ['3_SHA_RECC_REStrategyScaleUp'], 'Writes': ['3_SHA_RECC_REStrategyScaleUp_r'], 'Empty': []},
+    '9' : {'Config': [], 'Reads': [], 
+           'Writes': ['2_P_RECC_Population_SSP_32R','3_EI_Products_UsePhase_passvehicles','3_EI_Products_UsePhase_resbuildings',
+                      '3_IO_Buildings_UsePhase_Historic','3_EI_Products_UsePhase_nonresbuildings'], 'Empty': []},
+    '10': {'Config': ['Include_REStrategy_ReUse'], 'Reads': [], 'Writes': ['6_PR_ReUse_Veh','6_PR_ReUse_Bld','6_PR_ReUse_nonresBld'], 'Empty': []},
+    '11': {'Config': [], 'Reads': ['6_PR_Calibration'], 
+           'Writes': ['3_EI_Products_UsePhase_passvehicles','3_EI_Products_UsePhase_resbuildings','3_EI_Products_UsePhase_nonresbuildings'], 'Empty': []},
+    '12': {'Config': ['IncludeRecycling'], 'Reads': [], 'Writes': ['4_PY_EoL_RecoveryRate','4_PY_MaterialProductionRemelting'], 'Empty': []},
+    '13': {'Config': ['No_EE_Improvements'], 'Reads': [], 
+           'Writes': ['3_EI_Products_UsePhase_passvehicles','3_MC_RECC_Vehicles_RECC','3_SHA_TypeSplit_Vehicles',
+                      '3_EI_Products_UsePhase_resbuildings','3_MC_RECC_Buildings_RECC','3_SHA_TypeSplit_Buildings',
+                      '3_EI_Products_UsePhase_nonresbuildings','3_MC_RECC_NonResBuildings_RECC','3_SHA_TypeSplit_NonResBuildings'], 'Empty': []},
+    '14': {'Config': [], 'Reads': [], 'Writes': [], 'Empty': ['2_S_RECC_FinalProducts_Future_passvehicles','3_IO_Vehicles_UsePhase_eff']},
+    '15': {'Config': [], 'Reads': ['3_IO_Buildings_UsePhase_Historic','3_IO_Buildings_UsePhase_Future_Heating','3_IO_Buildings_UsePhase_Future_Cooling'], 
+           'Writes': ['3_IO_Buildings_UsePhase'], 'Empty': []},
+    '16': {'Config': [], 'Reads': ['4_TC_ResidentialEnergyEfficiency_Default','4_TC_ResidentialEnergyEfficiency_Scenario_Heating',
+                                   '4_TC_ResidentialEnergyEfficiency_Scenario_Cooling'], 
+           'Writes': ['4_TC_ResidentialEnergyEfficiency'], 'Empty': []},
+    '17': {'Config': [], 'Reads': ['4_TC_ResidentialEnergyEfficiency','3_SHA_EnergyCarrierSplit_Buildings'], 'Writes': ['3_SHA_EnergySupply_Buildings'], 'Empty': []},
+    '19': {'Config': [], 'Reads': [], 'Writes': ['1_F_RECC_FinalProducts_appliances'], 'Empty': []},
+    '20': {'Config': [], 'Reads': [], 'Writes': ['6_MIP_GWP_Bio'], 'Empty': []}}
+
+
+class ModelDimensions(object):
+    """
+    Immutable dimension and item-position index of the model, built once from the model index table IndexTable.
+    All lookups accept the aspect name or the index letter, e.g., Dims.Size['Time'] == Dims.Size['t']:
+    - Size[Key]: number of selected items,
+    - Items[Key]: tuple of the selected classification items,
+    - Position[Key][Item]: position of an item, same as Items[Key].index(Item) but without searching the list,
+    - Classification[Key]: name of the classification,
+    - Letter[Aspect] and Aspect[Letter]: index letter of an aspect and vice versa.
+    Unlike IndexTable, the object does not depend on pandas and is cheap to pickle, e.g., for worker processes.
+    """
+    def __init__(self, IndexTable):
+        self._Build(list(IndexTable.index), list(IndexTable.IndexLetter),
+                    [IndexTable.Classification[i].Items for i in range(0, len(IndexTable.IndexLetter))],
+                    [IndexTable.Classification[i].Name  for i in range(0, len(IndexTable.IndexLetter))])
+
+    def _Build(self, Aspects, IndexLetters, ItemLists, ClassNames):
+        Size, Items, Position, Classification = {}, {}, {}, {}
+        for m in range(0,len(Aspects)):
+            ThisItems    = tuple(ItemLists[m])
+            ThisPosition = {}
+            for n in range(len(ThisItems)-1,-1,-1): # first occurrence wins, as for list.index
+                ThisPosition[ThisItems[n]] = n
+            for ThisKey in [Aspects[m],IndexLetters[m]]:
+                Size[ThisKey]           = len(ThisItems)
+                Items[ThisKey]          = ThisItems
+                Position[ThisKey]       = types.MappingProxyType(ThisPosition)
+                Classification[ThisKey] = ClassNames[m]
+        object.__setattr__(self, 'Aspects',        tuple(Aspects))
+        object.__setattr__(self, 'IndexLetters',   tuple(IndexLetters))
+        object.__setattr__(self, 'Size',           types.MappingProxyType(Size))
+        object.__setattr__(self, 'Items',          types.MappingProxyType(Items))
+        object.__setattr__(self, 'Position',       types.MappingProxyType(Position))
+        object.__setattr__(self, 'Classification', types.MappingProxyType(Classification))
+        object.__setattr__(self, 'Letter',         types.MappingProxyType(dict(zip(Aspects,IndexLetters))))
+        object.__setattr__(self, 'Aspect',         types.MappingProxyType(dict(zip(IndexLetters,Aspects))))
+
+    def __setattr__(self, Name, Value):
+        raise AttributeError('ModelDimensions object is immutable.')
+
+    def __delattr__(self, Name):
+        raise AttributeError('ModelDimensions object is immutable.')
+
+    def __reduce__(self):
+        return (_RebuildModelDimensions, (self.Aspects, self.IndexLetters, [self.Items[Aspect] for Aspect in self.Aspects], 
+                                          [self.Classification[Aspect] for Aspect in self.Aspects]))
+
+    def Shape(self, ThisParIx):
+        """ Returns the array shape for the index structure ThisParIx, e.g., 'tcpr'. """
+        return tuple([self.Size[ThisLetter] for ThisLetter in ThisParIx])
+
+
+def _RebuildModelDimensions(Aspects, IndexLetters, ItemLists, ClassNames):
+    """
+    Rebuilds a pickled ModelDimensions object.
+    """
+    Dims = object.__new__(ModelDimensions)
+    Dims._Build(Aspects, IndexLetters, ItemLists, ClassNames)
+    return Dims
+
+
+def RequiredParameters(PL_Names, SectorList):
+    """
+    Returns the list of parameters in PL_Names that are required for the sectors in SectorList, see SectorParameters.
+    """
+    SectorSpecific = set([Par for Sector in SectorParameters for Par in SectorParameters[Sector]])
+    SectorRequired = set([Par for Sector in SectorList if Sector in SectorParameters for Par in SectorParameters[Sector]])
+    return [Par for Par in PL_Names if Par not in SectorSpecific or Par in SectorRequired]
+
+
+def RequiredSteps(SectorList):
+    """
+    Returns the set of sector-specific Section 3 preprocessing steps that are required for the sectors in SectorList, see SectorSteps.
+    """
+    return set([Step for Step in SectorSteps if len(set(SectorSteps[Step]) & set(SectorList)) > 0])
+
+
+def SelectElements(Items, ElementSelect):
+    """
+    Returns the positions of the items of the element classification Items whose layers are stored in the model run, for the config option ElementSelect:
+    'all': all elements, 'C': total and carbon, or a list of element names, e.g., "['C','Fe','Al']".
+    The first item (total of all elements, used for the material cycle) and carbon (wood and forestry accounting) are always kept.
+    """
+    if ElementSelect == 'all':
+        return list(range(0,len(Items)))
+    try:
+        Selection = ['C'] if ElementSelect == 'C' else ast.literal_eval(ElementSelect)
+    except (ValueError, SyntaxError):
+        raise AssertionError('Fatal: ElementSelect must be all, C, or a list of element names, not ' + str(ElementSelect) + '.')
+    Selection = [Selection] if isinstance(Selection, str) else list(Selection)
+    Missing   = [Element for Element in Selection if Element not in Items]
+    if len(Missing) > 0:
+        raise AssertionError('Fatal: The elements ' + str(Missing) + ' in ElementSelect are not part of the element classification.')
+    return [n for n in range(0,len(Items)) if n == 0 or Items[n] == 'C' or Items[n] in Selection]
+
+
+def InterpolateTimeSeries(Values, SupportTime, NewTime):
+    """
+    Linear interpolation of an entire parameter array along its first (time) axis.
+    The support points are the slices Values[SupportTime,...], SupportTime contains their positions on the time axis (e.g., Idx_Time_Rel).
+    Returns an array of shape (len(NewTime),) + Values.shape[1::] with the interpolated values at the positions NewTime.
+    Gives the same result as interpolating each time series separately with scipy.interpolate.interp1d(..., kind='linear') (which uses np.interp),
+    but for all other indices at once.
+    """
+    SupportTime = np.asarray(SupportTime, dtype=float)
+    NewTime     = np.asarray(NewTime, dtype=float)
+    if NewTime.min() < SupportTime[0] or NewTime.max() > SupportTime[-1]:
+        raise ValueError('A value in NewTime is outside of the interpolation range given by SupportTime.')
+    SupportValues = np.asarray(Values)[SupportTime.astype(int),...]
+    Lo = np.clip(np.searchsorted(SupportTime, NewTime, side='right') - 1, 0, len(SupportTime)-2) # position of lower support point
+    Hi = Lo + 1
+    Shape = (len(NewTime),) + (1,) * (SupportValues.ndim - 1) # broadcast time vectors over all other dimensions
+    Slope = (SupportValues[Hi,...] - SupportValues[Lo,...]) / (SupportTime[Hi] - SupportTime[Lo]).reshape(Shape)
+    NewValues = Slope * (NewTime - SupportTime[Lo]).reshape(Shape) + SupportValues[Lo,...]
+    NewValues[NewTime == SupportTime[-1],...] = SupportValues[-1,...] # last support point is returned as is
+    return NewValues
+
+
+def ExtrapolateTimeSeries(Values, Axis, BasePos, NewPos, RefPos = None):
+    """
+    Extrapolates the tail of an entire parameter array along its time axis Axis, in place, and returns the array.
+    The values at the positions NewPos are Values[BasePos] * (1 + growth rate)^(NewPos - BasePos), for all other indices at once.
+    The annual growth rate is (Values[BasePos]/Values[RefPos] - 1)/(BasePos - RefPos), and zero where Values[RefPos] is zero.
+    If RefPos is None, the growth rate is zero and the values at BasePos are replicated.
+    """
+    TimeFirst = np.moveaxis(Values, Axis, 0) # view with time as first axis, writes go to Values
+    Base      = TimeFirst[BasePos,...]
+    Growth    = np.zeros(Base.shape)
+    if RefPos is not None:
+        Ref    = TimeFirst[RefPos,...]
+        Mask   = Ref != 0
+        Growth[Mask] = (Base[Mask] / Ref[Mask] - 1) / (BasePos - RefPos)
+    NewPos = np.asarray(NewPos)
+    Steps  = (NewPos - BasePos).reshape((len(NewPos),) + (1,) * Base.ndim) # broadcast over all other dimensions
+    TimeFirst[NewPos,...] = Base * np.power(1 + Growth, Steps)
+    return Values
+
+
+def HashFile(FilePath, BlockSize = 2**20):
+    """
+    Returns the sha256 hex digest of the content of a file, or an empty string if the file does not exist.
+    """
+    if not os.path.isfile(FilePath):
+        return ''
+    FileHash = hashlib.sha256()
+    with open(FilePath,'rb') as FileObject:
+        for Block in iter(lambda: FileObject.read(BlockSize), b''):
+            FileHash.update(Block)
+    return FileHash.hexdigest()
+
+
+def HashWorkbook(FilePath):
+    """
+    Returns the sha256 hex digest of the content of an Excel workbook (.xlsx), or an empty string if the file does not exist.
+    The document properties (docProps/) are excluded, as they contain the time of the last save: 
+    a workbook that is re-saved with identical content, e.g., by the scenario control script, keeps its hash.
+    """
+    if not os.path.isfile(FilePath):
+        return ''
+    try:
+        with zipfile.ZipFile(FilePath) as Workbook:
+            FileHash = hashlib.sha256()
+            for ThisMember in sorted(Workbook.namelist()):
+                if ThisMember.startswith('docProps/'):
+                    continue
+                FileHash.update(ThisMember.encode('utf-8'))
+                FileHash.update(Workbook.read(ThisMember))
+            return FileHash.hexdigest()
+    except zipfile.BadZipFile:
+        return HashFile(FilePath)
+
+
+def ParameterCacheKey(ParPath, ThisPar, ThisParIx, IndexMatch, ThisParLayerSel, ParVersion, ClassVersion, ClassHash, Dims):
+    """
+    Returns the cache key for a single model parameter.
+    The key is the sha256 hash of everything that msf.ReadParameterV2 depends on:
+    - the content of the parameter source file (ParPath + '.xlsx'),
+    - the parameter name, version, index structure, index match and layer selection, as specified in the model config file,
+    - the version and content of the master classification,
+    - the items selected for each of the parameter's aspects in the model index table (Dims, see ModelDimensions).
+    A change in any of these re-reads the parameter, all other parameters are still loaded from cache.
+    """
+    KeyHash = hashlib.sha256()
+    for KeyItem in [ThisPar, ParVersion, ThisParIx, IndexMatch, ThisParLayerSel, ClassVersion, ClassHash, HashFile(ParPath + '.xlsx')]:
+        KeyHash.update(str(KeyItem).encode('utf-8'))
+        KeyHash.update(b'|')
+    for ThisLetter in ThisParIx: # index structure is a string of index letters, e.g. 'tcpr'
+        if ThisLetter in Dims.Aspect:
+            KeyHash.update((ThisLetter + ':' + str(Dims.Classification[ThisLetter]) + ':' + repr(list(Dims.Items[ThisLetter]))).encode('utf-8'))
+            KeyHash.update(b'|')
+    return KeyHash.hexdigest()
+
+
+def ParameterCacheFile(CachePath, ThisPar, CacheKey):
+    """
+    Returns the path of the cache file for parameter ThisPar with cache key CacheKey.
+    The cache file (.dat) contains the parameter object without values, the values are stored in a .npy file of the same name.
+    """
+    return os.path.join(CachePath, ThisPar + '__' + CacheKey[0:32] + '.dat')
+
+
+def ParameterValueFile(CacheFile):
+    """
+    Returns the path of the .npy file with the parameter values that belongs to the cache file CacheFile.
+    """
+    return os.path.splitext(CacheFile)[0] + '.npy'
+
+
+def BroadcastValues(Subscripts, Base, Sizes):
+    """
+    Parameter values that are replicated along new indices, without copying, e.g., BroadcastValues('gmwW->grmwW', Base, {'r': Nr}) 
+    has the same values as np.einsum('gmwW,r->grmwW', Base, np.ones(Nr)).
+    Subscripts: index letters of Base and of the returned values, letters that occur twice in Base select the diagonal, e.g., 'mwggr->mwgr'.
+    Sizes:      dictionary with the sizes of the indices that are not in Base
+    Returns a read-only view (np.broadcast_to) of a compact copy of Base, only the compact copy is held in memory.
+    Broadcast values are stored in compact form in the parameter cache, see StoreCachedParameter.
+    """
+    BaseIx, ValueIx = Subscripts.split('->')
+    KeptIx  = ''.join([ThisLetter for ThisLetter in ValueIx if ThisLetter in BaseIx])
+    Compact = np.einsum(BaseIx + '->' + KeptIx, Base).copy()
+    Compact = Compact.reshape([Compact.shape[KeptIx.index(ThisLetter)] if ThisLetter in KeptIx else 1 for ThisLetter in ValueIx])
+    return np.broadcast_to(Compact, [Compact.shape[m] if ThisLetter in KeptIx else Sizes[ThisLetter] for m, ThisLetter in enumerate(ValueIx)])
+
+
+def CompactValues(Values):
+    """
+    Returns the compact form of an array: the broadcast axes of Values (stride 0, see BroadcastValues) are reduced to size 1.
+    np.broadcast_to(CompactValues(Values), Values.shape) restores Values.
+    """
+    Values = np.asarray(Values)
+    return Values[tuple([slice(0,1) if Stride == 0 else slice(None) for Stride in Values.strides])]
+
+
+def ParameterMetaData(ThisParameter):
+    """
+    Returns a shallow copy of a msc.Parameter object without its values.
+    """
+    MetaParameter = copy.copy(ThisParameter)
+    MetaParameter.Values = None
+    return MetaParameter
+
+
+def LoadCachedParameter(CacheFile):
+    """
+    Returns the msc.Parameter object stored in CacheFile, without its values, and the shape of its values, or (None, None) if there is no valid cache entry.
+    The values are to be loaded from ParameterValueFile(CacheFile), see LazyParameterDict.
+    For broadcast values, the .npy file contains the compact values, which are broadcast to the returned shape, see StoreCachedParameter.
+    """
+    if not os.path.isfile(CacheFile) or not os.path.isfile(ParameterValueFile(CacheFile)):
+        return None, None
+    try:
+        with open(CacheFile,'rb') as CacheObject:
+            CacheEntry = pickle.load(CacheObject)
+    except Exception:
+        return None, None # corrupt cache entries are re-read.
+    if not isinstance(CacheEntry,dict) or 'Parameter' not in CacheEntry or 'Shape' not in CacheEntry:
+        return None, None # outdated cache entries are re-read.
+    return CacheEntry['Parameter'], CacheEntry['Shape']
+
+
+def StoreCachedParameter(CacheFile, ThisParameter):
+    """
+    Stores a msc.Parameter object in CacheFile (without values) and its values in ParameterValueFile(CacheFile).
+    Broadcast values (see BroadcastValues) are stored in compact form, CacheFile contains the shape of the parameter values.
+    The files are written under a temporary name and moved into place, so that concurrent model runs never read incomplete entries.
+    """
+    TempFile = CacheFile + '.' + str(os.getpid()) + '.tmp'
+    Values   = np.asarray(ThisParameter.Values)
+    with open(TempFile,'wb') as ValueObject:
+        np.save(ValueObject,CompactValues(Values))
+    os.replace(TempFile,ParameterValueFile(CacheFile))
+    with open(TempFile,'wb') as CacheObject:
+        pickle.dump({'Parameter': ParameterMetaData(ThisParameter), 'Shape': Values.shape},CacheObject,protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(TempFile,CacheFile)
+
+
+def LoadParameterIndex(IndexFile):
+    """
+    Returns the dictionary of parameter objects without values stored in the parameter set index file IndexFile, or an empty dictionary.
+    """
+    if not os.path.isfile(IndexFile):
+        return {}
+    try:
+        with open(IndexFile,'rb') as IndexObject:
+            return pickle.load(IndexObject)
+    except Exception:
+        return {}
+
+
+def StoreParameterIndex(IndexFile, ParameterIndex):
+    """
+    Stores the dictionary of parameter objects without values ParameterIndex in the parameter set index file IndexFile.
+    """
+    TempFile = IndexFile + '.' + str(os.getpid()) + '.tmp'
+    with open(TempFile,'wb') as IndexObject:
+        pickle.dump(ParameterIndex,IndexObject,protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(TempFile,IndexFile)
+
+
+# Entries of the config snapshot, see CheckConfigSnapshot.
+ConfigSnapshotKeys = ['ConfigHash','ClassFile','ClassHash','Name_Script','Name_Scenario','ScriptConfig','ConfigTable','MasterClassification']
+
+
+def SnapshotFile(CachePath, SnapshotName, SnapshotHash):
+    """
+    Returns the path of the snapshot file SnapshotName for the source file(s) with hash SnapshotHash.
+    """
+    return os.path.join(CachePath, SnapshotName + '_' + SnapshotHash[0:32] + '.dat')
+
+
+def LoadSnapshot(SnapshotFile, SnapshotKeys):
+    """
+    Returns the dictionary stored in SnapshotFile, or None if the file does not exist, cannot be read, or lacks one of the SnapshotKeys.
+    """
+    if not os.path.isfile(SnapshotFile):
+        return None
+    try:
+        with open(SnapshotFile,'rb') as SnapshotObject:
+            Snapshot = pickle.load(SnapshotObject)
+    except Exception:
+        return None
+    if not isinstance(Snapshot,dict) or any([ThisKey not in Snapshot for ThisKey in SnapshotKeys]):
+        return None
+    return Snapshot
+
+
+def StoreSnapshot(SnapshotFile, Snapshot):
+    """
+    Stores the dictionary Snapshot in SnapshotFile, written under a temporary name and moved into place.
+    """
+    TempFile = SnapshotFile + '.' + str(os.getpid()) + '.tmp'
+    with open(TempFile,'wb') as SnapshotObject:
+        pickle.dump(Snapshot,SnapshotObject,protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(TempFile,SnapshotFile)
+
+
+def CheckConfigSnapshot(ConfigSnapshot):
+    """
+    Returns True if the config snapshot is complete and consistent:
+    ConfigTable is the tuple returned by msf.ParseConfigFile (without ScriptConfig), 
+    with index table (IT_), parameter list (PL_), and process list (PrL_) entries of equal length each.
+    """
+    if any([ThisKey not in ConfigSnapshot for ThisKey in ConfigSnapshotKeys]):
+        return False
+    if not isinstance(ConfigSnapshot['ScriptConfig'],dict) or not isinstance(ConfigSnapshot['MasterClassification'],dict):
+        return False
+    if not isinstance(ConfigSnapshot['Name_Script'],str) or not isinstance(ConfigSnapshot['Name_Scenario'],str):
+        return False
+    ConfigTable = ConfigSnapshot['ConfigTable']
+    if not isinstance(ConfigTable,tuple) or len(ConfigTable) != 16 or not all([isinstance(ThisList,list) for ThisList in ConfigTable]):
+        return False
+    for ThisRange in [range(0,6),range(6,12),range(12,16)]: # IT_, PL_, and PrL_ entries
+        if len(set([len(ConfigTable[m]) for m in ThisRange])) != 1:
+            return False
+    return True
+
+
+def LoadConfigSnapshot(SnapshotFile, ClassPath):
+    """
+    Returns the config snapshot stored in SnapshotFile, or None if there is no valid snapshot.
+    The snapshot file is keyed by the hash of the config workbook, see HashWorkbook. 
+    In addition, the master classification file in ClassPath must be unchanged since the snapshot was compiled.
+    """
+    ConfigSnapshot = LoadSnapshot(SnapshotFile, ConfigSnapshotKeys)
+    if ConfigSnapshot is None or not CheckConfigSnapshot(ConfigSnapshot):
+        return None
+    if HashFile(os.path.join(ClassPath,ConfigSnapshot['ClassFile'])) != ConfigSnapshot['ClassHash']:
+        return None
+    return ConfigSnapshot
+
+
+def StoreConfigSnapshot(SnapshotFile, ConfigSnapshot):
+    """
+    Checks and stores a config snapshot.
+    """
+    if not CheckConfigSnapshot(ConfigSnapshot):
+        raise AssertionError('Fatal: The parsed config file is incomplete or inconsistent and cannot be stored as snapshot. Check config file.')
+    StoreSnapshot(SnapshotFile, ConfigSnapshot)
+
+
+class LazyParameterDict(dict):
+    """
+    Parameter dictionary for msc.Parameter objects whose values are stored in .npy files.
+    The parameter metadata are held in memory, the values of a parameter are memory-mapped when the parameter is first accessed.
+    The memory map is copy-on-write (mmap_mode='c'): the model can modify parameter values in place, the cache files remain unchanged,
+    and unmodified pages are shared between all model processes that use the same cache files.
+    Broadcast values (see BroadcastValues) are memory-mapped in compact form and returned as read-only broadcast view of the shape given in SetValueFile, as before caching.
+    If Accessed is a set, the keys of all parameters that are looked up or set are added to it, see PreprocessingCache.
+    """
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.ValueFiles = {}   # files and shapes of the values that were not accessed yet
+        self.Accessed   = None # keys of the parameters accessed since Accessed was set to an empty set
+
+    def SetValueFile(self, Key, ValueFile, Shape = None):
+        """ Sets the .npy file of the values of Key, and the shape of the values if they are stored in compact form (None: shape of the stored array). """
+        self.ValueFiles[Key] = (ValueFile, Shape)
+
+    def Meta(self, Key):
+        """ Returns the parameter object of Key without memory-mapping its values, e.g., to read its metadata. Values that were not accessed yet are None. """
+        self._Access(Key)
+        return dict.__getitem__(self, Key)
+
+    def _Access(self, Key):
+        if self.Accessed is not None:
+            self.Accessed.add(Key)
+
+    def __setitem__(self, Key, Item):
+        self._Access(Key)
+        self.ValueFiles.pop(Key, None) # a replaced parameter must not receive the values of its predecessor
+        dict.__setitem__(self, Key, Item)
+
+    def __getitem__(self, Key):
+        self._Access(Key)
+        Item = dict.__getitem__(self, Key)
+        if Key in self.ValueFiles:
+            ValueFile, Shape = self.ValueFiles.pop(Key)
+            Item.Values = np.load(ValueFile, mmap_mode='c')
+            if Shape is not None and tuple(Shape) != Item.Values.shape:
+                Item.Values = np.broadcast_to(Item.Values, Shape)
+        return Item
+
+    def get(self, Key, Default = None):
+        if Key in self:
+            return self[Key]
+        self._Access(Key)
+        return Default
+
+    def LoadAll(self):
+        """ Memory-maps the values of all parameters that were not accessed yet. """
+        for Key in list(self.ValueFiles.keys()):
+            self[Key]
+
+    def values(self):
+        self.LoadAll()
+        for Key in dict.keys(self):
+            self._Access(Key)
+        return dict.values(self)
+
+    def items(self):
+        self.LoadAll()
+        for Key in dict.keys(self):
+            self._Access(Key)
+        return dict.items(self)
+
+
+class PreprocessingCache(object):
+    """
+    Cache of the results of the Section 3 preprocessing steps, see PreprocessingSteps.
+    Each step is cached under a key that contains its config settings and the states of the parameters it reads or writes.
+    The state of a model parameter is its cache key (see ParameterCacheKey) until a step writes it, and the key of that step afterwards, 
+    so that the step keys are chained: a changed parameter file or config switch only re-computes the steps that depend on it.
+    The key of all steps also contains the sector selection, the model dimensions, and the content of the model script and this file.
+    Usage, for each step: 
+        if not S3Cache.Load(Step): 
+            (compute step) 
+            S3Cache.Store(Step)
+    The parameters written by a step are stored as parameter cache files and memory-mapped when first accessed, see LazyParameterDict.
+    Placeholders of parameters that are not required for the sector selection are not stored, empty parameters are re-created.
+    The parameters that a computed step accesses in the parameter dictionary must be declared in PreprocessingSteps, otherwise Store raises an error.
+    """
+    def __init__(self, CachePath, ParameterDict, StateKeys, Placeholders, ScriptConfig, SectorList, Dims, ScriptFile, Logger):
+        self.CachePath     = CachePath
+        self.ParameterDict = ParameterDict
+        self.StateKeys     = dict(StateKeys) # current state of each parameter, updated after each step
+        self.Placeholders  = set(Placeholders)
+        self.ScriptConfig  = ScriptConfig
+        self.Logger        = Logger
+        self.CurrentStep   = None
+        self.CurrentKey    = None
+        self.StartTime     = None
+        KeyHash = hashlib.sha256()
+        for KeyItem in [HashFile(ScriptFile), HashFile(os.path.abspath(__file__)), sorted(SectorList)]:
+            KeyHash.update(str(KeyItem).encode('utf-8'))
+            KeyHash.update(b'|')
+        for ThisLetter in Dims.IndexLetters:
+            KeyHash.update((ThisLetter + ':' + str(Dims.Classification[ThisLetter]) + ':' + repr(list(Dims.Items[ThisLetter]))).encode('utf-8'))
+            KeyHash.update(b'|')
+        self.BaseKey = KeyHash.hexdigest()
+
+    def StepKey(self, Step):
+        """ Returns the cache key of Step for the current parameter states. """
+        ThisStep = PreprocessingSteps[Step]
+        KeyHash  = hashlib.sha256()
+        for KeyItem in [Step, self.BaseKey] + [Key + '=' + str(self.ScriptConfig.get(Key)) for Key in ThisStep['Config']] \
+                     + [Par + '=' + self.StateKeys.get(Par,'') for Par in ThisStep['Reads'] + ThisStep['Writes']]:
+            KeyHash.update(KeyItem.encode('utf-8'))
+            KeyHash.update(b'|')
+        return KeyHash.hexdigest()
+
+    def Load(self, Step):
+        """
+        Inserts the results of Step into the parameter dictionary and returns True, 
+        or returns False if the step is not in the cache: it then has to be computed and stored with Store(Step).
+        """
+        self.CurrentStep = Step
+        self.CurrentKey  = self.StepKey(Step)
+        self.StartTime   = time.time()
+        StepEntry = LoadSnapshot(SnapshotFile(self.CachePath, 'RECC_Section3_Step_' + Step, self.CurrentKey), ['Parameters','Empty'])
+        if StepEntry is None:
+            self.ParameterDict.Accessed = set() # the step is computed, record the parameters it accesses
+            return False
+        CachedPars = {}
+        for Par in StepEntry['Parameters']:
+            CachedPars[Par] = LoadCachedParameter(ParameterCacheFile(self.CachePath, Par, self.CurrentKey))
+            if CachedPars[Par][0] is None:
+                self.ParameterDict.Accessed = set()
+                return False
+        for Par in CachedPars:
+            self.ParameterDict[Par] = CachedPars[Par][0]
+            self.ParameterDict.SetValueFile(Par, ParameterValueFile(ParameterCacheFile(self.CachePath, Par, self.CurrentKey)), CachedPars[Par][1])
+        for Par in StepEntry['Empty']:
+            EmptyPar, EmptyShape = StepEntry['Empty'][Par]
+            EmptyPar = copy.copy(EmptyPar)
+            EmptyPar.Values = np.zeros(EmptyShape)
+            self.ParameterDict[Par] = EmptyPar
+        self._UpdateStates(Step)
+        self.Logger.info('Section 3, step ' + Step + ': loaded from cache in %.2f seconds.' % (time.time() - self.StartTime))
+        return True
+
+    def Store(self, Step):
+        """ Stores the results of Step, which was computed after Load(Step) returned False. """
+        if Step != self.CurrentStep:
+            raise AssertionError('Fatal: Section 3 step ' + Step + ' is stored without being looked up in the cache first.')
+        Time_Compute = time.time() - self.StartTime
+        ThisStep = PreprocessingSteps[Step]
+        Accessed = self.ParameterDict.Accessed
+        self.ParameterDict.Accessed = None
+        Undeclared = sorted(Accessed - set(ThisStep['Reads'] + ThisStep['Writes'] + ThisStep['Empty']))
+        if len(Undeclared) > 0:
+            raise AssertionError('Fatal: Section 3 step ' + Step + ' accessed the parameters ' + str(Undeclared) + 
+                                 ', which are not declared for this step in rf.PreprocessingSteps. Update PreprocessingSteps.')
+        StoredPars = [Par for Par in ThisStep['Writes'] if Par in self.ParameterDict and Par not in self.Placeholders]
+        for Par in StoredPars:
+            StoreCachedParameter(ParameterCacheFile(self.CachePath, Par, self.CurrentKey), self.ParameterDict[Par])
+        EmptyPars = {Par: (ParameterMetaData(self.ParameterDict[Par]), np.shape(self.ParameterDict[Par].Values)) for Par in ThisStep['Empty'] if Par in self.ParameterDict}
+        StoreSnapshot(SnapshotFile(self.CachePath, 'RECC_Section3_Step_' + Step, self.CurrentKey), {'Parameters': StoredPars, 'Empty': EmptyPars})
+        self._UpdateStates(Step)
+        self.Logger.info('Section 3, step ' + Step + ': not in cache, computed in %.2f seconds and stored in %.2f seconds.' % (Time_Compute, time.time() - self.StartTime - Time_Compute))
+
+    def _UpdateStates(self, Step):
+        for Par in PreprocessingSteps[Step]['Writes'] + PreprocessingSteps[Step]['Empty']:
+            if Par not in self.Placeholders:
+                self.StateKeys[Par] = self.CurrentKey
+        self.CurrentStep = None
+
+
+class ListHandler(log.Handler):
+    """
+    Logging handler that collects the log records of a worker process, so that they can be replayed in the main process log.
+    """
+    def __init__(self):
+        log.Handler.__init__(self)
+        self.Records = []
+
+    def emit(self, record):
+        record.msg  = record.getMessage() # resolve arguments before the record is pickled
+        record.args = None
+        self.Records.append(record)
+
+
+class SurvivalBand(object):
+    """
+    Compact storage of the survival functions SF[t,c,...] of the dynamic stock models: only the lower band t >= c is stored, 
+    up to the age MaxAge (t - c < MaxAge), and SF is 0 outside of the band.
+    The survival function of age-cohort c, SF[c:c+Length[c],c,...], is stored contiguously in Values[Offset[c]:Offset[c]+Length[c],...].
+    Without age limit (MaxAge = Nc), this takes half of the memory of the dense array.
+    """
+    def __init__(self, Values, Nc, MaxAge):
+        self.Values = Values
+        self.Nc     = Nc
+        self.MaxAge = MaxAge
+        self.Length = np.minimum(Nc - np.arange(0,Nc,1), MaxAge)
+        self.Offset = np.concatenate(([0], np.cumsum(self.Length)[0:-1]))
+        self.shape  = (Nc, Nc) + Values.shape[1::]
+
+    def Column(self, c):
+        """ Returns the survival function of age-cohort c in the years c to c + Length[c] -1, indices: t,... """
+        return self.Values[self.Offset[c]:self.Offset[c] + self.Length[c]]
+
+    def Year(self, t, Cohorts):
+        """ Returns SF[t,Cohorts,...], the survival of the age-cohorts Cohorts (index array, all cohorts <= t) in year t. """
+        Age    = t - Cohorts
+        InBand = Age < self.MaxAge
+        Result = np.zeros((len(Cohorts),) + self.Values.shape[1::])
+        Result[InBand] = self.Values[self.Offset[Cohorts[InBand]] + Age[InBand]]
+        return Result
+
+    def Reshape(self, Shape):
+        """ Returns the band with the indices after t,c reshaped to Shape, e.g., to combine several indices into one. """
+        return SurvivalBand(self.Values.reshape((self.Values.shape[0],) + tuple(Shape)), self.Nc, self.MaxAge)
+
+
+def NormalSurvivalFunctions(LifeTimes, StdDevFactor, Threshold = 0, MaxAge = 0):
+    """
+    Returns the survival functions SF[t,c,...] of normally distributed lifetimes for all age-cohorts c and all other indices of the 
+    lifetime tensor LifeTimes[...,c] (e.g., products and regions) at once, with the standard deviation StdDevFactor * mean lifetime, as SurvivalBand.
+    For each element, the result equals dsm.DynamicStockModel(t=np.arange(0,Nc,1), lt={'Type': 'Normal', 'Mean': LifeTimes[...,:], 
+    'StdDev': StdDevFactor * LifeTimes[...,:]}).compute_sf(), with the diagonal set to 1 (no outflows from the current year), 
+    as required by the RECC mass balance. Age-cohorts with mean lifetime 0 have no survival function (0 except for the diagonal).
+    The band is truncated after the maximal age at which the survival of any element exceeds Threshold, and after MaxAge (0: no limit).
+    Threshold = 0 and MaxAge = 0 give the exact survival functions.
+    """
+    Mean   = np.moveaxis(np.asarray(LifeTimes, dtype=float), -1, 0) # indices: c,...
+    Nc     = Mean.shape[0]
+    MaxAge = Nc if MaxAge <= 0 else min(int(MaxAge), Nc)
+    Band   = SurvivalBand(np.zeros((0,)), Nc, MaxAge)
+    Cohort = np.repeat(np.arange(0,Nc,1), Band.Length) # age-cohort of each band element
+    Age    = (np.arange(0,len(Cohort),1) - Band.Offset[Cohort]).reshape((-1,) + (1,) * (Mean.ndim -1)) # age of each band element
+    Mean   = Mean[Cohort] # mean lifetime of each band element
+    with np.errstate(divide = 'ignore', invalid = 'ignore'): # cohorts with mean lifetime 0 are set to 0 below.
+        Values = scipy.special.ndtr(-((Age - Mean) / (StdDevFactor * Mean))) # same operations as scipy.stats.norm.sf(Age, loc=Mean, scale=StdDev)
+    Values[Mean == 0] = 0
+    Values[Age.ravel() == 0] = 1
+    if Threshold > 0: # truncate the band after the maximal age with survival above the threshold
+        AgeMax = Age.ravel()[(Values > Threshold).reshape(len(Cohort),-1).any(axis=1)].max() + 1
+        if AgeMax < MaxAge:
+            Values = Values[Age.ravel() < AgeMax]
+            MaxAge = AgeMax
+    return SurvivalBand(Values, Nc, MaxAge)
+
+
+class SurvivalFunctionCache(object):
+    """
+    Cache of the survival functions (SF_Array, as SurvivalBand) of the dynamic stock models, keyed by the lifetime tensor and the standard deviation factor, 
+    see NormalSurvivalFunctions. The band truncation (Threshold, MaxAge) and the storage dtype Dtype (e.g., float32) are set for the entire cache.
+    The most recently used bands are kept in memory (up to MaxSize), all bands are also stored as .npz files in CachePath, 
+    so that they are shared by all scenarios, worker processes, and model runs.
+    The band values are read-only.
+    """
+    def __init__(self, CachePath, MaxSize = 16, Threshold = 0, MaxAge = 0, Dtype = float):
+        self.CachePath = CachePath
+        self.MaxSize   = MaxSize
+        self.Threshold = Threshold
+        self.MaxAge    = MaxAge
+        self.Dtype     = np.dtype(Dtype)
+        self.Arrays    = OrderedDict()
+        self.Requests  = 0
+        self.MemoryHits= 0
+        self.DiskHits  = 0
+        if not os.path.exists(CachePath):
+            os.makedirs(CachePath, exist_ok = True)
+
+    def Key(self, LifeTimes, StdDevFactor):
+        """ Returns the cache key of the survival functions for the lifetime tensor LifeTimes and the standard deviation factor StdDevFactor. """
+        LifeTimes = np.ascontiguousarray(LifeTimes, dtype=float)
+        KeyHash   = hashlib.sha256()
+        KeyHash.update(('Normal|' + repr(float(StdDevFactor)) + '|' + repr(float(self.Threshold)) + '|' + str(int(self.MaxAge)) + '|' + self.Dtype.str + '|' + str(LifeTimes.shape) + '|').encode('utf-8'))
+        KeyHash.update(LifeTimes.tobytes())
+        return KeyHash.hexdigest()
+
+    def Get(self, LifeTimes, StdDevFactor):
+        """
+        Returns the survival functions SF_Array[t,c,...] = NormalSurvivalFunctions(LifeTimes, StdDevFactor, Threshold, MaxAge) for the lifetime tensor LifeTimes[...,c].
+        """
+        self.Requests += 1
+        Key = self.Key(LifeTimes, StdDevFactor)
+        if Key in self.Arrays:
+            self.Arrays.move_to_end(Key)
+            self.MemoryHits += 1
+            return self.Arrays[Key]
+        ValueFile = os.path.join(self.CachePath, 'SF_' + Key[0:32] + '.npz')
+        SF = None
+        if os.path.isfile(ValueFile):
+            try:
+                with np.load(ValueFile) as BandData:
+                    SF = SurvivalBand(BandData['Values'], int(BandData['Nc']), int(BandData['MaxAge']))
+                self.DiskHits += 1
+            except Exception:
+                SF = None # corrupt cache entries are re-computed.
+        if SF is None:
+            SF = NormalSurvivalFunctions(LifeTimes, StdDevFactor, self.Threshold, self.MaxAge)
+            SF.Values = SF.Values.astype(self.Dtype, copy = False)
+            TempFile = ValueFile + '.' + str(os.getpid()) + '.tmp'
+            with open(TempFile,'wb') as ValueObject:
+                np.savez(ValueObject, Values = SF.Values, Nc = SF.Nc, MaxAge = SF.MaxAge)
+            os.replace(TempFile,ValueFile)
+        SF.Values.setflags(write = False)
+        self.Arrays[Key] = SF
+        if len(self.Arrays) > self.MaxSize:
+            self.Arrays.popitem(last = False)
+        return SF
+
+    def Statistics(self):
+        """ Returns a summary of the cache requests since the last call, and resets the counters. """
+        Computed = self.Requests - self.MemoryHits - self.DiskHits
+        Summary  = 'Survival function cache: ' + str(self.Requests) + ' requests, ' + str(self.MemoryHits) + ' memory hits, ' \
+                   + str(self.DiskHits) + ' disk hits, ' + str(Computed) + ' computed' \
+                   + ('.' if self.Requests == 0 else ', hit rate: %.1f %%.' % (100 * (self.MemoryHits + self.DiskHits) / self.Requests))
+        self.Requests, self.MemoryHits, self.DiskHits = 0, 0, 0
+        return Summary
+
+
+def StockDrivenModel(SwitchTime, Stock, InitialStock, SF, TypeSplit, NegativeInflowCorrect = False):
+    """
+    Stock-driven model with initial stock, type split, and negative inflow correction, for all regions (or other independent stocks) at once.
+    Same recursion as dsm.DynamicStockModel(t=np.arange(0,Nc,1), s=Stock[:,r]).compute_stock_driven_model_initialstock_typesplit_negativeinflowcorrect(
+    SwitchTime, InitialStock[:,:,r], SF[:,:,:,r], TypeSplit[:,:,r], NegativeInflowCorrect) for each region r, 
+    where all regions are advanced together, one year at a time.
+    Stock:        total stock, indices: tr
+    InitialStock: stock by age-cohort and type at the end of year SwitchTime -1, indices: cgr
+    SF:           survival functions, indices: tcgr, as SurvivalBand
+    TypeSplit:    type split of the inflow of the future years, indices: tgr
+    Returns the stock by cohort S_c (tcgr), the outflow by cohort O_c (tcgr), the inflow I (tgr), and the negative inflow flags NegInflowFlags (tr).
+    For the model without initial stock and type split (dsm compute_stock_driven_model), use SwitchTime = 0 and a single type with TypeSplit = 1.
+    """
+    Nt, Ng, Nr = TypeSplit.shape
+    # The region is the first index internally, so that the sums over age-cohorts and types are computed in the same order as for the individual regions.
+    TS_r  = np.ascontiguousarray(np.moveaxis(TypeSplit, -1, 0))    # indices: rtg
+    S_c   = np.zeros((Nr,Nt,Nt,Ng))
+    O_c   = np.zeros((Nr,Nt,Nt,Ng))
+    I     = np.zeros((Nr,Nt,Ng))
+    NegInflowFlags = np.zeros((Nr,Nt))
+    # Historic inflows, from the initial stock and its survival in year SwitchTime -1:
+    if SwitchTime > 0:
+        SF_Switch = np.moveaxis(SF.Year(SwitchTime -1, np.arange(0,SwitchTime,1)), -1, 0)
+        Init_r    = np.moveaxis(InitialStock, -1, 0)[:,0:SwitchTime,:]
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            I[:,0:SwitchTime,:] = np.where(SF_Switch != 0, Init_r / SF_Switch, Init_r)
+        # Stock and outflow from historic inflow:
+        for m in range(0, SwitchTime):
+            SF_m = np.moveaxis(SF.Column(m), -1, 0) # survival of cohort m, indices: rtg
+            End  = min(m + SF_m.shape[1] +1, Nt)
+            S_c[:,m:m+SF_m.shape[1],m,:] = SF_m * I[:,m,np.newaxis,:]
+            O_c[:,m,m,:]      = I[:,m,:] * (1 - SF_m[:,0,:])
+            O_c[:,m+1:End,m,:]= S_c[:,m:End-1,m,:] - S_c[:,m+1:End,m,:]
+    # Future years: year-by-year computation, starting from SwitchTime
+    for m in range(SwitchTime, Nt):
+        # 1) Determine inflow from mass balance:
+        SF_m        = np.moveaxis(SF.Column(m), -1, 0) # survival of cohort m, indices: rtg
+        Denominator = (TS_r[:,m,:] * SF_m[:,0,:]).sum(axis=1)
+        Gap         = Stock[m,:] - S_c[:,m,:,:].reshape(Nr,-1).sum(axis=1)
+        Pos         = Denominator != 0 # Else, inflow is 0.
+        I[Pos,m,:]  = TS_r[Pos,m,:] * (Gap[Pos] / Denominator[Pos])[:,np.newaxis]
+        if NegativeInflowCorrect is True:
+            Neg = np.nonzero(I[:,m,:].sum(axis=1) < 0)[0] # regions where the stock-driven model yields negative inflow
+            if Neg.size > 0:
+                NegInflowFlags[Neg,m] = 1
+                Delta     = -1 * I[Neg,m,:].sum(axis=1) # Delta > 0!
+                I[Neg,m,:]= 0 # Set inflow to 0 and distribute mass balance gap onto remaining cohorts:
+                StockSum  = S_c[Neg,m,:,:].reshape(Neg.size,-1).sum(axis=1)
+                Delta_percent = np.zeros(Neg.size)
+                Delta_percent[StockSum != 0] = Delta[StockSum != 0] / StockSum[StockSum != 0]
+                # Increase outflow according to the lost fraction of the stock, shrink the stock of the previous age-cohorts in the current and future years:
+                O_c[Neg,m,:,:]       = O_c[Neg,m,:,:]     + S_c[Neg,m,:,:]     * Delta_percent[:,np.newaxis,np.newaxis]
+                S_c[Neg,m::,0:m,:]   = S_c[Neg,m::,0:m,:] * (1 - Delta_percent)[:,np.newaxis,np.newaxis,np.newaxis]
+                O_c[Neg,m+1::,0:m,:] = O_c[Neg,m+1::,0:m,:] * (1 - Delta_percent)[:,np.newaxis,np.newaxis,np.newaxis]
+        # 2) Add new inflow to stock and determine future decay of new age-cohort
+        End = min(m + SF_m.shape[1] +1, Nt)
+        S_c[:,m:m+SF_m.shape[1],m,:] = SF_m * I[:,m,np.newaxis,:]
+        O_c[:,m,m,:]       = I[:,m,:] * (1 - SF_m[:,0,:])
+        O_c[:,m+1:End,m,:] = S_c[:,m:End-1,m,:] - S_c[:,m+1:End,m,:]
+    return np.moveaxis(S_c, 0, -1), np.moveaxis(O_c, 0, -1), np.moveaxis(I, 0, -1), np.moveaxis(NegInflowFlags, 0, -1)
+
+
+def InflowDrivenModel(Inflow, SF):
+    """
+    Inflow-driven model for all products and regions at once.
+    Inflow: inflow by age-cohort, indices: c...
+    SF:     survival functions, indices: tc..., as SurvivalBand
+    Returns the stock by cohort S_c (tc...) and the outflow by cohort O_c (tc...), same as compute_s_c_inflow_driven() and compute_o_c_from_s_c() 
+    of dsm.DynamicStockModel(t=np.arange(0,Nc,1), i=Inflow[:,...]) with the survival function SF[:,:,...], for each element.
+    """
+    S_c = np.zeros(SF.shape)
+    O_c = np.zeros(SF.shape)
+    for c in range(0, SF.Nc):
+        SF_c = SF.Column(c)
+        End  = min(c + SF_c.shape[0] +1, SF.Nc)
+        S_c[c:c+SF_c.shape[0],c] = Inflow[c] * SF_c
+        O_c[c,c]                 = Inflow[c] - S_c[c,c] # allow for outflow in year 0 already
+        O_c[c+1:End,c]           = S_c[c:End-1,c] - S_c[c+1:End,c]
+    return S_c, O_c
+
+
+def PassengerVehicleStock(Service, CarSharingShare, RideSharingShare, OccupancyRate, Kilometrage, CarSharingStock, RideSharingOccupancy):
+    """
+    Passenger vehicle stock and average vehicle kilometrage from the passenger transport service, for all years t and regions r at once.
+    The stock is calculated for four subdivisions: no sharing, car-sharing (CaS), ride-sharing (RiS), and CaS+RiS.
+    Service:              passenger transport service per capita, indices: tr
+    CarSharingShare:      share of car-sharing in %, indices: tr or t1 (same share for all regions)
+    RideSharingShare:     share of ride-sharing in %, indices: tr
+    OccupancyRate:        vehicle occupancy rate, indices: tr
+    Kilometrage:          vehicle kilometrage without sharing, indices: tr
+    CarSharingStock:      stock factor of car-sharing (6_MIP_CarSharing_Stock), indices: r
+    RideSharingOccupancy: occupancy rate of ride-sharing (6_MIP_RideSharing_Occupancy), indices: r
+    Returns the vehicle stock per capita (tr), set to 0 where there is no stock (NaN), and the average vehicle kilometrage (tr), NaN where there is no stock.
+    """
+    with np.errstate(divide = 'ignore', invalid = 'ignore'): # drive technologies without stock yield NaN, masked below.
+        VehicleService = OccupancyRate * Kilometrage
+        s0        = (1 - CarSharingShare / 100)*(1 - RideSharingShare / 100) * Service / VehicleService
+        s_CaS     = (CarSharingShare / 100)*(1 - RideSharingShare / 100) * Service / VehicleService * CarSharingStock
+        s_RiS     = (1 - CarSharingShare / 100)*(RideSharingShare / 100) * Service / VehicleService / RideSharingOccupancy
+        s_CaS_RiS = (CarSharingShare / 100)*(RideSharingShare / 100) * Service / VehicleService / (RideSharingOccupancy / CarSharingStock)
+        s_total   = s0 + s_CaS + s_RiS + s_CaS_RiS
+        # Average vehicle kilometrage:
+        vkm       = ((s0 + s_RiS) + (s_CaS + s_CaS_RiS) / CarSharingStock) * Kilometrage / s_total
+    s_total[np.isnan(s_total)] = 0 # ignore drive technologies where there is no stock.
+    return s_total, vkm
+
+
+def CarSharingLifetimeFactor(CarSharingShare, CarSharingStock):
+    """
+    Factor on the vehicle lifetime due to car-sharing, for all years t and regions r at once.
+    CarSharingShare: share of car-sharing in %, indices: t (same share for all regions)
+    CarSharingStock: stock factor of car-sharing (6_MIP_CarSharing_Stock), indices: r
+    Returns the lifetime factor, indices: tr
+    """
+    return 1 - CarSharingShare[:,np.newaxis]/100 + CarSharingShare[:,np.newaxis] * CarSharingStock[np.newaxis,:]/100
+
+
+def ReUseAllocation(Outflow, ReUseFactor, Inflow, Composition):
+    """
+    Re-use of materials (via components) from the end-of-life products of a group of goods, for one year.
+    The re-use potential ReUseFactor * Outflow is capped by the material inflow into the new products of the same goods, for each material, 
+    and is then distributed onto the age-cohorts, regions, and goods of the outflow in proportion to their mass share within each material.
+    Outflow:     outflow of materials from the use phase (F_7_8), element position 'all', indices: gcrm
+    ReUseFactor: re-use factor, indices: mgr
+    Inflow:      inflow of materials into new products (F_6_7), element position 'all', indices: grm
+    Composition: element composition of the materials for the age-cohorts that can be re-used, indices: cme, 
+                 the re-use is allocated to the first Composition.shape[0] age-cohorts of Outflow.
+    Returns the re-used materials by element (F_8_17), indices: gcrme
+    """
+    Potential = np.einsum('mgr,gcrm->m', ReUseFactor, Outflow)
+    InflowCap = np.einsum('grm->m', Inflow)
+    Potential = np.where((InflowCap < Potential) & (Potential > 0), InflowCap, Potential) # if re-use potential is larger than new inflow
+    Outflow   = Outflow[:,0:Composition.shape[0],:,:]
+    Total     = np.einsum('gcrm->m', Outflow)
+    MassShare = np.divide(Outflow, Total, out = np.zeros(Outflow.shape), where = Total != 0) # share of combination gcr in total mass of m in outflow
+    return np.einsum('cme,gcrm->gcrme', Composition, Potential * MassShare)
+
+
+def SecondaryMaterialAllocation(Demand, Supplies):
+    """
+    Scrap market balance: allocation of the secondary material supplies to the manufacturing input demand in the order of priority of Supplies, 
+    e.g., diverted fabrication scrap, then secondary material from old scrap, then the stock-piled secondary material, for all materials at once.
+    Only the total mass (element position 0) is used for decision making: Each supply is used as far as the remaining demand allows, 
+    if the total mass of a supply exceeds the remaining demand, all elements of the supply are scaled down to the remaining demand. 
+    The indices ... can be used for additional dimensions, e.g., scenarios.
+    Demand:   manufacturing input demand, total mass, indices: ...m
+    Supplies: list of the supplies in the order of their priority, each with indices: ...me, total mass in element position 0
+    Returns the list of the used supplies (...me) and the list of the remaining demand after each step (...m), the last one is the primary production demand.
+    """
+    Uses      = []
+    Remaining = []
+    for Supply in Supplies:
+        Use       = np.where(Supply[...,0:1] > 0, Supply, 0)
+        Excess    = (Supply[...,0] > 0) & (Supply[...,0] > Demand) # supply is larger than remaining demand
+        Use[Excess,:] = Supply[Excess,:] * Demand[Excess][:,np.newaxis] / Supply[Excess,0:1]
+        Demand    = Demand - Use[...,0]
+        Uses.append(Use)
+        Remaining.append(Demand)
+    return Uses, Remaining
+
+
+def BiogenicCarbonGWP(WoodInflow, LifeTimes, GWP_Bio, CO2FromWood):
+    """
+    GWP_bio of the carbon in the wood inflow into new buildings, for all years t, regions r, and building types g at once.
+    WoodInflow:  wood inflow into new buildings (F_6_7), indices: trg
+    LifeTimes:   lifetime of the buildings of the age-cohort of year t, indices: grt
+    GWP_Bio:     GWP_bio factor by lifetime, in years (6_MIP_GWP_Bio), looked up at the lifetime rounded down
+    CO2FromWood: CO2 from wood combustion per wood mass (3_MC_CO2FromWoodCombustion)
+    Returns the GWP_bio emissions in CO2 equivalents, indices: tr
+    """
+    mass_C = CO2FromWood *12/44 * WoodInflow # total carbon in wood (carbon content ca. 0.5)
+    return np.einsum('trg,grt->tr', 44/12 * mass_C, GWP_Bio[np.floor(LifeTimes).astype(int)]) # convert from C to CO2
+
+
+class ProductElementComposition(object):
+    """
+    Element composition of the products by age-cohort, Par_3_MC_Stock_ByElement_Nr[t,c,r,g,m,e] = MC[c,m,g,r,t] * Composition[c,m,e], in factored form:
+    the material content MC (indices: cmgrt) and the element composition of the materials Composition (cme) are stored, 
+    and the product is only evaluated for the slices that are requested, e.g., for the material stocks and flows of a sector.
+    In the year-by-year material cycle, the composition of the new and of the renovated age-cohorts changes. 
+    The composition of all age-cohorts in the current year is kept in Current (indices: crgme), initialized with year 0.
+    """
+    def __init__(self, MC, Composition, Dtype = float):
+        self.MC          = MC
+        self.Composition = Composition.copy()
+        self.Current     = np.einsum('cmgr,cme->crgme', MC[:,:,:,:,0], Composition, dtype = Dtype, casting = 'same_kind')
+
+    def Layer(self, Goods, Element):
+        """ Returns Par_3_MC_Stock_ByElement_Nr[:,:,:,Goods,:,Element] for the list of goods Goods, indices: gtcrm. """
+        return np.einsum('cmgrt,cm->gtcrm', self.MC[:,:,Goods,:,:], self.Composition[:,:,Element])
+
+    def Products(self, Goods, Values, t):
+        """ Returns Par_3_MC_Stock_ByElement_Nr[t,:,:,Goods,:,:] * Values[c,g,r] for the year t, e.g., the material stock by element of year t for the stock by age-cohort Values, indices: gcrme. """
+        return np.einsum('cmgr,cme,cgr->gcrme', self.MC[:,:,:,:,t][:,:,Goods,:], self.Composition, Values)
+
+    def LayerProducts(self, Goods, Element, Values):
+        """ Returns Par_3_MC_Stock_ByElement_Nr[:,:,:,Goods,:,Element] * Values[t,c,g,r] for all years, e.g., the material stock of one element for the stock by age-cohort Values, indices: gtcrm. """
+        return np.einsum('cmgrt,cm,tcgr->gtcrm', self.MC[:,:,Goods,:,:], self.Composition[:,:,Element], Values)
+
+
+class CohortWindowArray(object):
+    """
+    Compact storage of a stock or flow array with the indices t,c,... (e.g., S_7 and F_7_8: t,c,r,g,m,e), 
+    where in year t only the age-cohorts CohortStart <= c < CohortEnd[t] can be non-zero. Only these cohort windows are stored, one array per year.
+    The array can be used as Values of an ODYM stock or flow: it supports the numpy indexing of the dense array, 
+    with the indices t and c given as integers or slices, and np.asarray() returns the dense array.
+    Sums over the age-cohorts are computed block-wise, one cohort window at a time, without the dense array (see Sum): 
+    np.einsum('tc...->t...', Values) is dispatched to Sum, e.g., for the reduction to t,e in MFAsystem.MassBalance(), other numpy functions get the dense array.
+    Indexing returns dense float64 arrays, also if the values are stored with a lower precision dtype (e.g., float32), 
+    so that all sums are computed in float64. If stored as float64 with all layers, slices of a single year that lie within its cohort window are views, as for numpy arrays.
+    Writing non-zero values outside of the cohort window raises an error.
+    Layers: positions of the last index (e.g., the elements e) that are stored, None: all. 
+    Of the other layers, only the sums over the indices SumAxes (e.g., r and m: (2,4)) are stored by year and age-cohort, in float64, 
+    so that the sums over all layers (e.g., for the mass balance) remain exact. Writes to these layers must cover the indices SumAxes entirely, 
+    and they can only be read in sums over SumAxes with Sum, any other read of them raises an error.
+    """
+    def __init__(self, Shape, CohortStart, CohortEnd, dtype = float, Layers = None, SumAxes = ()):
+        self.shape       = tuple(Shape)
+        self.ndim        = len(self.shape)
+        self.size        = int(np.prod(self.shape))
+        self.dtype       = np.dtype(dtype)
+        self.CohortStart = int(CohortStart)
+        self.CohortEnd   = np.maximum(np.minimum(np.asarray(CohortEnd, dtype=int), self.shape[1]), self.CohortStart)
+        self.Layers      = None if Layers is None or sorted(set(Layers)) == list(range(0,self.shape[-1])) else np.array(sorted(set(Layers)), dtype=int)
+        self.LayerPos    = np.arange(0,self.shape[-1]) if self.Layers is None else np.full(self.shape[-1], -1) # position of each layer in the cohort windows, -1: not stored
+        if self.Layers is not None:
+            self.LayerPos[self.Layers] = np.arange(0,len(self.Layers))
+        BlockShape       = self.shape[2::] if self.Layers is None else self.shape[2:-1] + (len(self.Layers),)
+        self.Blocks      = [np.zeros((self.CohortEnd[t] - self.CohortStart,) + BlockShape, dtype = self.dtype) for t in range(0,self.shape[0])]
+        self.SumAxes     = tuple(sorted(SumAxes))
+        self.Unstored    = np.nonzero(self.LayerPos < 0)[0]
+        self.UnstoredPos = np.full(self.shape[-1], -1) # position of each layer that is not stored in the layer sums, -1: stored
+        self.UnstoredPos[self.Unstored] = np.arange(0,len(self.Unstored))
+        SumShape         = tuple([Size for Axis, Size in enumerate(self.shape[2:-1], 2) if Axis not in self.SumAxes]) + (len(self.Unstored),)
+        self.LayerSums   = [np.zeros((self.CohortEnd[t] - self.CohortStart,) + SumShape) for t in range(0,self.shape[0])]
+
+    def _Split(self, Key):
+        """ Splits the index Key into the index ranges of t and c and the index of the dense sub-array of these ranges. """
+        Key = Key if isinstance(Key, tuple) else (Key,)
+        if any(K is Ellipsis for K in Key):
+            Pos = [K is Ellipsis for K in Key].index(True)
+            Key = Key[0:Pos] + (slice(None),) * (self.ndim - len(Key) + 1) + Key[Pos+1::]
+        Key = Key + (slice(None),) * (self.ndim - len(Key))
+        Ranges, SubKey = [], []
+        for Axis in [0,1]:
+            if isinstance(Key[Axis], (int, np.integer)):
+                Pos = int(Key[Axis]) + (self.shape[Axis] if Key[Axis] < 0 else 0)
+                Ranges.append(range(Pos, Pos + 1))
+                SubKey.append(0)
+            elif isinstance(Key[Axis], slice):
+                Ranges.append(range(*Key[Axis].indices(self.shape[Axis])))
+                SubKey.append(slice(None))
+            else:
+                raise AssertionError('Fatal: The time and age-cohort indices of a CohortWindowArray must be integers or slices.')
+        return Ranges[0], Ranges[1], tuple(SubKey) + Key[2::]
+
+    def _Window(self, t, CRange):
+        """ Returns the slice of the cohort window of year t that covers the cohort range CRange, None if CRange is not entirely within the window. """
+        if len(CRange) > 0 and CRange.step == 1 and CRange.start >= self.CohortStart and CRange.stop <= self.CohortEnd[t]:
+            return slice(CRange.start - self.CohortStart, CRange.stop - self.CohortStart)
+        return None
+
+    def _Dense(self, TRange, CRange, dtype = None, Selection = None, Write = False):
+        """ 
+        Returns the dense sub-array for the year and cohort ranges TRange and CRange. 
+        Selection: list of the selected positions for each of the other indices (see _Selection), only these are copied from the cohort windows.
+        Write: the sub-array is only used to write into it, the layers that are not stored are 0. Otherwise, selecting these layers raises an error.
+        """
+        Selection = [range(0, Size) for Size in self.shape[2::]] if Selection is None else Selection
+        Sub       = np.zeros((len(TRange), len(CRange)) + tuple([len(Positions) for Positions in Selection]), dtype = self.dtype if dtype is None else dtype)
+        Cohorts   = np.array(CRange, dtype=int)
+        Full      = self.Layers is None and all([len(Positions) == Size for Positions, Size in zip(Selection, self.shape[2::])])
+        Stored    = self.LayerPos[np.array(Selection[-1], dtype=int)] # positions of the selected layers in the cohort windows
+        if (Stored < 0).any() and not Write:
+            raise AssertionError('Fatal: The layers ' + str(list(np.array(Selection[-1])[Stored < 0])) + ' of the last index are not stored, only their sums over the indices ' + str(self.SumAxes) + ' can be read with Sum.')
+        for mt, t in enumerate(TRange):
+            InWindow = (Cohorts >= self.CohortStart) & (Cohorts < self.CohortEnd[t])
+            if InWindow.any():
+                Rows = Cohorts[InWindow] - self.CohortStart
+                if (Stored < 0).any(): # layers that are not stored are 0 (for writing)
+                    Window = np.zeros((len(Rows),) + Sub.shape[2::], dtype = Sub.dtype)
+                    Window[..., Stored >= 0] = self.Blocks[t][np.ix_(Rows, *Selection[0:-1], Stored[Stored >= 0])]
+                    Sub[mt, InWindow] = Window
+                elif not Full:
+                    Sub[mt, InWindow] = self.Blocks[t][np.ix_(Rows, *Selection[0:-1], Stored)]
+                elif np.all(np.diff(Rows) == 1): # contiguous cohorts: copy from a view of the cohort window
+                    Sub[mt, InWindow] = self.Blocks[t][Rows[0]:Rows[-1] + 1]
+                else:
+                    Sub[mt, InWindow] = self.Blocks[t][Rows]
+        return Sub
+
+    def _Selection(self, SubKey):
+        """
+        Splits the index SubKey of the other indices (all but t and c) into the positions that are selected for each index, 
+        and the index of the sub-array of these positions that has the same index types as SubKey, so that numpy returns the same result shape.
+        """
+        Selection, SelKey = [], []
+        for Size, K in zip(self.shape[2::], SubKey):
+            if isinstance(K, slice):
+                Selection.append(range(*K.indices(Size)))
+                SelKey.append(slice(None))
+            elif isinstance(K, (int, np.integer)):
+                Selection.append([int(K) + Size if K < 0 else int(K)])
+                SelKey.append(0)
+            else:
+                K = np.asarray(K)
+                if K.dtype == bool:
+                    K = np.nonzero(K)[0]
+                Positions, Inverse = np.unique(np.where(K < 0, K + Size, K), return_inverse = True)
+                Selection.append(Positions)
+                SelKey.append(Inverse.reshape(K.shape))
+        return Selection, tuple(SelKey)
+
+    def _Store(self, TRange, CRange, Sub, Written = None):
+        """ 
+        Stores the dense sub-array Sub for the year and cohort ranges TRange and CRange. 
+        Written: boolean array of the shape of Sub, True for the positions that were written to, their sums over SumAxes replace the stored sums of the layers that are not stored.
+        """
+        Cohorts = np.array(CRange, dtype=int)
+        for mt, t in enumerate(TRange):
+            InWindow = (Cohorts >= self.CohortStart) & (Cohorts < self.CohortEnd[t])
+            if np.any(Sub[mt, ~InWindow]):
+                raise AssertionError('Fatal: Non-zero values outside of the age-cohort window [' + str(self.CohortStart) + ',' + str(self.CohortEnd[t]) + ') of year ' + str(t) + '.')
+            Rows = Cohorts[InWindow] - self.CohortStart
+            if Written is not None and len(self.Unstored) > 0:
+                Axes    = tuple([Axis - 1 for Axis in self.SumAxes]) # the year index is removed
+                Cells   = Written[mt, InWindow][..., self.Unstored]
+                Touched = Cells.any(axis = Axes)
+                if (Touched != Cells.all(axis = Axes)).any():
+                    raise AssertionError('Fatal: Values written to the layers that are not stored must cover the indices ' + str(self.SumAxes) + ' entirely.')
+            self.Blocks[t][Rows] = Sub[mt, InWindow] if self.Layers is None else Sub[mt, InWindow][..., self.Layers]
+            if Written is not None and len(self.Unstored) > 0:
+                LayerSums = self.LayerSums[t][Rows]
+                LayerSums[Touched] = Sub[mt, InWindow][..., self.Unstored].sum(axis = Axes, dtype = float)[Touched]
+                self.LayerSums[t][Rows] = LayerSums
+
+    def __getitem__(self, Key):
+        TRange, CRange, SubKey = self._Split(Key)
+        if len(TRange) == 1 and self._Window(TRange[0], CRange) is not None and self.Layers is None: # view, as for numpy arrays
+            return self.Blocks[TRange[0]][np.newaxis, self._Window(TRange[0], CRange)][SubKey].astype(float, copy = False)
+        # Multiple years: only the selected positions of the other indices are copied from the cohort windows.
+        Selection, SelKey = self._Selection(SubKey[2::])
+        return self._Dense(TRange, CRange, float, Selection)[SubKey[0:2] + SelKey]
+
+    def __setitem__(self, Key, Value):
+        TRange, CRange, SubKey = self._Split(Key)
+        if len(TRange) == 1 and self._Window(TRange[0], CRange) is not None and self.Layers is None:
+            self.Blocks[TRange[0]][np.newaxis, self._Window(TRange[0], CRange)][SubKey] = Value
+            return
+        # Write one year at a time, so that the dense sub-array of only one year is needed:
+        Value = np.asarray(Value)
+        for mt, t in enumerate(TRange):
+            Sub    = self._Dense(range(t, t + 1), CRange, Write = True)
+            Target = Sub[SubKey].shape
+            if len(TRange) == 1:
+                Sub[SubKey] = Value
+            else: # select the year mt of Value: the time index is the first index of Sub[SubKey], 
+                # unless the advanced indices are separated by a slice, then numpy puts the advanced index dimensions first.
+                Advanced = [Pos for Pos, K in enumerate(SubKey) if not isinstance(K, slice)]
+                Arrays   = [np.asarray(SubKey[Pos]) for Pos in Advanced]
+                if any(Array.ndim > 0 for Array in Arrays) and Advanced != list(range(Advanced[0], Advanced[-1] + 1)):
+                    TimePos = np.broadcast(*Arrays).ndim if len(Arrays) > 1 else Arrays[0].ndim
+                else:
+                    TimePos = 0
+                Value_t = Value.reshape((1,) * (len(Target) - Value.ndim) + Value.shape)
+                if Value_t.shape[TimePos] != 1:
+                    Value_t = Value_t[(slice(None),) * TimePos + (slice(mt, mt + 1),)]
+                Sub[SubKey] = Value_t
+            Written = None
+            if len(self.Unstored) > 0:
+                Written = np.zeros(Sub.shape, dtype = bool)
+                Written[SubKey] = True
+            self._Store(range(t, t + 1), CRange, Sub, Written)
+
+    def __array__(self, dtype = None, copy = None):
+        return self._Dense(range(0,self.shape[0]), range(0,self.shape[1]), float if dtype is None else dtype)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.einsum and len(args) == 2 and args[1] is self and len(kwargs) == 0 and isinstance(args[0], str) and '->' in args[0]:
+            In, Out = args[0].replace(' ','').split('->')
+            if len(In) == self.ndim and Out[0:1] == In[0] and In[1] not in Out:
+                return self.Sum(args[0])
+        return func(*[np.asarray(Arg) if isinstance(Arg, CohortWindowArray) else Arg for Arg in args], **kwargs)
+
+    def Sum(self, Subscripts, Key = np.s_[:]):
+        """
+        Returns the sum np.einsum(Subscripts, Values[Key]) over all age-cohorts, computed year by year from the cohort windows, without the dense array,
+        e.g., Sum('tcrgme->te') or Sum('tcrgm->tm', np.s_[:,:,:,:,:,0]) for the element 'all'.
+        Key: all years and age-cohorts (the indices t and c are full slices), and integers or slices for the other indices.
+        Subscripts: the result starts with the time index and does not contain the age-cohort index. The sums are float64.
+        The layers that are not stored can be selected if the result is summed over all positions of the indices SumAxes.
+        """
+        TRange, CRange, SubKey = self._Split(Key)
+        In, Out = Subscripts.replace(' ','').split('->')
+        if TRange != range(0,self.shape[0]) or CRange != range(0,self.shape[1]) or Out[0:1] != In[0] or In[1] in Out \
+           or not all(isinstance(K, (slice, int, np.integer)) for K in SubKey[2::]):
+            raise AssertionError('Fatal: CohortWindowArray.Sum needs all years and age-cohorts, the time index first in the result, and integers or slices for the other indices.')
+        Ix     = In[1::] + '->' + Out[1::]
+        Layers = np.arange(0,self.shape[-1])[SubKey[-1]]
+        Stored = self.LayerPos[Layers]
+        if (Stored < 0).any(): # einsum subscripts and index of the layer sums
+            Letters = iter(In)
+            Letters = [next(Letters) if isinstance(K, slice) else None for K in SubKey]
+            if any([Letters[Axis] is None or Letters[Axis] in Out or range(*SubKey[Axis].indices(self.shape[Axis])) != range(0,self.shape[Axis]) for Axis in self.SumAxes]):
+                raise AssertionError('Fatal: The layers ' + str(list(np.atleast_1d(Layers)[np.atleast_1d(Stored) < 0])) + ' of the last index are not stored, only their sums over the indices ' + str(self.SumAxes) + ' can be read.')
+            IxSums  = ''.join([Letter for Axis, Letter in enumerate(Letters) if Letter is not None and Axis not in self.SumAxes])[1::] + '->' + Out[1::]
+            SumKey  = (slice(None),) + tuple([K for Axis, K in enumerate(SubKey[2:-1], 2) if Axis not in self.SumAxes])
+        Sums   = []
+        for t in range(0,self.shape[0]):
+            if self.Layers is None:
+                Sums.append(np.einsum(Ix, self.Blocks[t][(slice(None),) + SubKey[2::]], dtype = float))
+            elif np.ndim(Layers) == 0:
+                Sums.append(np.einsum(Ix, self.Blocks[t][(slice(None),) + SubKey[2:-1] + (int(Stored),)], dtype = float) if Stored >= 0 else \
+                            np.einsum(IxSums, self.LayerSums[t][SumKey + (int(self.UnstoredPos[Layers]),)]))
+            else:
+                Sum_t = np.einsum(Ix, self.Blocks[t][(slice(None),) + SubKey[2:-1] + (Stored[Stored >= 0],)], dtype = float)
+                if (Stored < 0).any():
+                    Sum_Unstored = np.einsum(IxSums, self.LayerSums[t][SumKey + (self.UnstoredPos[Layers[Stored < 0]],)])
+                    if In[-1] in Out: # combine the layers in their order
+                        Axis     = Out[1::].index(In[-1])
+                        Sum_Both = np.zeros(Sum_t.shape[0:Axis] + (len(Layers),) + Sum_t.shape[Axis+1::])
+                        np.moveaxis(Sum_Both, Axis, -1)[..., Stored >= 0] = np.moveaxis(Sum_t, Axis, -1)
+                        np.moveaxis(Sum_Both, Axis, -1)[..., Stored < 0]  = np.moveaxis(Sum_Unstored, Axis, -1)
+                        Sum_t    = Sum_Both
+                    else:
+                        Sum_t    = Sum_t + Sum_Unstored
+                Sums.append(Sum_t)
+        return np.array(Sums)
+
+    def StoreChange(self, t, Stock):
+        """ Stores the stock change of year t, Values[t] = Stock[t] - Stock[t-1], for the CohortWindowArray Stock with the same cohort windows and layers, including the sums of the layers that are not stored. """
+        if [Block.shape for Block in Stock.Blocks[t-1:t+1]] != [Block.shape for Block in self.Blocks[t-1:t+1]] or Stock.SumAxes != self.SumAxes:
+            raise AssertionError('Fatal: The stock and the stock change must have the same cohort windows and layers.')
+        for Own, Other in [(self.Blocks, Stock.Blocks), (self.LayerSums, Stock.LayerSums)]:
+            Change = Other[t].astype(float)
+            Change[0:len(Other[t-1])] -= Other[t-1]
+            Own[t][...] = Change
+
+    def _Extremes(self):
+        """ Returns the minima and maxima of the cohort windows (of the stored layers), and 0 if the windows do not cover the entire array. """
+        Extremes = [(Block.min(), Block.max()) for Block in self.Blocks if Block.size > 0]
+        if self.CohortStart > 0 or (self.CohortEnd < self.shape[1]).any():
+            Extremes.append((0,0))
+        return Extremes
+
+    def min(self):
+        return min(Extreme[0] for Extreme in self._Extremes())
+
+    def max(self):
+        return max(Extreme[1] for Extreme in self._Extremes())
+
+
+def PrecisionReferenceFile(CachePath, ScriptConfig, CheckKey):
+    """
+    Returns the path of the float64 reference results of the model setup given by the parameter set CheckKey and the config entries ScriptConfig, 
+    without the entries that do not change the results (storage dtype, workers, cache size, logging, description, and run ID).
+    """
+    Excluded = ['Current_UUID','Description','Logging_Verbosity','StorageDtype','PrecisionTolerance','ScenarioWorkers','ParameterReadWorkers','SFCacheSize']
+    KeyHash  = hashlib.sha256(str(CheckKey).encode('utf-8'))
+    for Key in sorted(ScriptConfig):
+        if Key not in Excluded:
+            KeyHash.update((str(Key) + '=' + str(ScriptConfig[Key]) + '|').encode('utf-8'))
+    return SnapshotFile(CachePath, 'RECC_PrecisionReference', KeyHash.hexdigest())
+
+
+def PrecisionDeviations(Results, Reference):
+    """
+    Returns the deviation of each result array in Results from the array with the same name in Reference: the largest absolute difference, 
+    relative to the largest absolute reference value, but to at least 1 (Mt or Mt CO2-eq), so that results close to 0, e.g., the mass balance, are compared absolutely.
+    """
+    return {Name: np.abs(Results[Name] - Reference[Name]).max() / max(np.abs(Reference[Name]).max(), 1) for Name in Results}
+
+
+_ScenarioWorker = None # the ScenarioPool of which the current process is a worker process
+
+
+class ScenarioPool(object):
+    """
+    Parallel execution of the scenario loop (mS, mR) of the model in NoWorkers forked worker processes.
+    Usage, in the loop body: 
+        if not Pool.Dispatch(mS, mR, IsLast, locals()): continue # scenario is computed by a worker process
+        (compute scenario)
+        Pool.Return(mS, mR) # worker processes send their results to the main process and exit here
+    A worker is a fork of the main process at the start of its loop iteration: it shares all data, 
+    in particular the preprocessed ParameterDict, copy-on-write, so that scenario-specific edits of parameters remain local to the worker.
+    The worker returns:
+    - the slice [...,mS,mR] of each array in ResultArrays,
+    - the entries of the parameters in LoopParameters that it changed (parameters written for individual scenarios and read for other scenarios or after the loop),
+    - the entries of the dictionaries in ResultDicts that it added or replaced (e.g., ExitFlags),
+    - its log records, which are replayed in the model log, and its output to stderr.
+    A worker fails if it changed the slice [...,mS,mR] of a variable with the scenario dimensions of the result arrays that is not in ResultArrays (checked for the variables passed to Dispatch, e.g., locals()).
+    An exception in a worker is reported to the main process, which then fails. The exception must not be handled by the code that calls the model: 
+    the model function is decorated with ScenarioWorkerBoundary, where the worker process exits. The worker's output to stderr is also reported if it terminates without result.
+    The last scenario is computed by the main process after all workers have finished and their results are merged, 
+    so that the variables of the last loop iteration and the parameters written for all scenarios are available as in a serial run.
+    The changes of the parameters in ScratchParameters (re-computed in each loop iteration before they are read) are not returned.
+    All other parameters are read-only in a worker: a worker that writes or replaces them fails, instead of losing the change silently.
+    The pool runs serially (Dispatch always returns True) if NoWorkers <= 1, if os.fork is not available (Windows), 
+    or if the model runs in an interactive session, where an exception in a worker cannot be contained.
+    """
+    def __init__(self, NoWorkers, Logger, ResultArrays, ParameterDict, LoopParameters, ScratchParameters, ResultDicts):
+        self.NoWorkers     = NoWorkers
+        self.Logger        = Logger
+        self.ResultArrays  = ResultArrays
+        self.ParameterDict = ParameterDict
+        self.LoopParameters    = list(LoopParameters)
+        self.ScratchParameters = list(ScratchParameters)
+        self.ResultDicts   = ResultDicts
+        self.ScenarioShape = set([Values.shape[-2::] for Values in ResultArrays.values()])
+        if len(self.ScenarioShape) != 1:
+            raise AssertionError('Fatal: The result arrays of the scenario pool must have the same scenario dimensions (last two indices).')
+        self.ScenarioShape = self.ScenarioShape.pop()
+        self.Running       = {} # process id: scenario
+        self.IsWorker      = False
+        self.TempPath      = None
+        self.Parallel      = NoWorkers > 1
+        if self.Parallel and not hasattr(os,'fork'):
+            Logger.info('Parallel execution of the scenario loop requires os.fork, which is not available on this platform. Scenarios are computed serially.')
+            self.Parallel = False
+        if self.Parallel and (hasattr(sys,'ps1') or 'IPython' in sys.modules):
+            Logger.info('Parallel execution of the scenario loop is not available in interactive sessions. Scenarios are computed serially.')
+            self.Parallel = False
+        if self.Parallel:
+            self.TempPath = tempfile.mkdtemp(prefix='RECC_Scenarios_')
+            Logger.info('Computing the scenario loop with ' + str(NoWorkers) + ' worker processes.')
+
+    def Dispatch(self, mS, mR, IsLast, Variables = None):
+        """
+        Returns True if the current process computes scenario (mS, mR), and False if it is computed by a worker process.
+        Variables: dictionary of the variables of the loop (e.g., locals()), a worker checks in Return that it did not change the scenario slices of those that are not result arrays.
+        """
+        if not self.Parallel:
+            return True
+        if IsLast:
+            self.Gather()
+            return True
+        while len(self.Running) >= self.NoWorkers:
+            self._Collect()
+        for Handler in self.Logger.handlers: # nothing buffered must be written twice
+            Handler.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        Pid = os.fork()
+        if Pid == 0:
+            global _ScenarioWorker
+            _ScenarioWorker = self
+            self.IsWorker  = True
+            self.Scenario  = (mS, mR)
+            ErrorFile = os.open(self._ResultFile((mS, mR)) + '.err', os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            os.dup2(ErrorFile, 2) # stderr of the worker, e.g., the traceback of an exception, is reported by the main process
+            os.close(ErrorFile)
+            self.Collector = ListHandler()
+            self.Logger.handlers  = [self.Collector]
+            self.Logger.propagate = False
+            self.ParsBefore  = {Par: np.array(self.ParameterDict[Par].Values) for Par in self.LoopParameters if Par in self.ParameterDict}
+            self.ParsFixed   = self._FixedParameters()
+            for Values in self.ParsFixed.values():
+                Values.flags.writeable = False # in-place writes to undeclared parameters raise an error
+            self.DictsBefore = {Name: dict(self.ResultDicts[Name]) for Name in self.ResultDicts}
+            self.SlicesBefore = {Name: (Values, np.array(Values[...,mS,mR])) for Name, Values in self._ScenarioArrays(Variables).items()}
+            return True
+        self.Running[Pid] = (mS, mR)
+        return False
+
+    def Return(self, mS, mR):
+        """
+        In a worker process: stores the results of scenario (mS, mR) for the main process and exits. In the main process: does nothing.
+        The scenario slices of the arrays passed to Dispatch that are not result arrays must not have changed.
+        """
+        if not self.IsWorker:
+            return
+        ExitCode = 0
+        try:
+            Undeclared = [Par for Par, Values in self._FixedParameters().items() if Par not in self.ParsFixed or Values is not self.ParsFixed[Par]]
+            if len(Undeclared) > 0:
+                raise AssertionError('Fatal: The parameters ' + ', '.join(Undeclared) + ' were replaced in the scenario loop, ' + 
+                                     'but are not declared as loop or scratch parameters of the scenario pool.')
+            Undeclared = [Name for Name, (Values, Before) in self.SlicesBefore.items() if not np.array_equal(Values[...,mS,mR], Before, equal_nan = True)]
+            if len(Undeclared) > 0:
+                raise AssertionError('Fatal: The results ' + ', '.join(Undeclared) + ' of the scenario were computed in the scenario loop, ' + 
+                                     'but are not declared as result arrays of the scenario pool.')
+            Result = {'Arrays': {Name: np.array(self.ResultArrays[Name][...,mS,mR]) for Name in self.ResultArrays}, 'Parameters': {}, 'Dicts': {}}
+            for Par in self.ParsBefore:
+                After   = np.asarray(self.ParameterDict[Par].Values)
+                Changed = np.nonzero(~((After == self.ParsBefore[Par]) | (np.isnan(After) & np.isnan(self.ParsBefore[Par]))))
+                Result['Parameters'][Par] = (Changed, After[Changed])
+            for Name in self.ResultDicts:
+                Before = self.DictsBefore[Name]
+                Result['Dicts'][Name] = {Key: Value for Key, Value in self.ResultDicts[Name].items() if Key not in Before or Value is not Before[Key]}
+            self._StoreResult(Result)
+        except BaseException:
+            self._StoreResult({'Error': traceback.format_exc()})
+            ExitCode = 1
+        os._exit(ExitCode)
+
+    def Gather(self):
+        """
+        Waits for all worker processes and merges their results.
+        """
+        while len(self.Running) > 0:
+            self._Collect()
+        if self.TempPath is not None:
+            shutil.rmtree(self.TempPath, ignore_errors = True)
+            self.TempPath = None
+
+    def _FixedParameters(self):
+        """ Returns the values of all parameters that are neither loop nor scratch parameters. """
+        return {Par: ThisParameter.Values for Par, ThisParameter in self.ParameterDict.items() 
+                if Par not in self.LoopParameters + self.ScratchParameters and isinstance(getattr(ThisParameter,'Values',None), np.ndarray)}
+
+    def _ResultFile(self, Scenario):
+        return os.path.join(self.TempPath, 'Scenario_' + str(Scenario[0]) + '_' + str(Scenario[1]) + '.dat')
+
+    def _StoreResult(self, Result):
+        Result['LogRecords'] = self.Collector.Records
+        StoreSnapshot(self._ResultFile(self.Scenario), Result)
+
+    def _Fail(self):
+        """ In a worker process: reports the exception that is being handled to the main process and exits. """
+        try:
+            self._StoreResult({'Error': traceback.format_exc()})
+        finally:
+            os._exit(1)
+
+    def _ScenarioArrays(self, Variables):
+        """ Returns the arrays in Variables with the scenario dimensions of the result arrays as last two indices that are not result arrays. """
+        Results = [id(Values) for Values in self.ResultArrays.values()]
+        return {Name: Values for Name, Values in ({} if Variables is None else Variables).items() 
+                if isinstance(Values, np.ndarray) and Values.ndim >= 2 and Values.shape[-2::] == self.ScenarioShape and id(Values) not in Results}
+
+    def _Collect(self):
+        """
+        Waits until a worker process has finished and merges its results.
+        """
+        while True:
+            Pid, Status = os.wait()
+            if Pid in self.Running:
+                self._Merge(self.Running.pop(Pid), Status)
+                return
+
+    def _Merge(self, Scenario, Status):
+        mS, mR = Scenario
+        Result = LoadSnapshot(self._ResultFile(Scenario), ['LogRecords'])
+        ErrorOutput = ''
+        if os.path.isfile(self._ResultFile(Scenario) + '.err'):
+            with open(self._ResultFile(Scenario) + '.err', errors = 'replace') as ErrorFile:
+                ErrorOutput = ErrorFile.read()
+        if Result is not None:
+            for Record in Result['LogRecords']:
+                Record.name = self.Logger.name
+                self.Logger.handle(Record)
+        if Result is None or 'Error' in Result:
+            self._Abort()
+            raise AssertionError('Fatal: The model run for scenario ' + str(Scenario) + ' failed in a worker process. ' + 
+                                 ('The worker process terminated without result (exit status ' + str(Status) + '):\n' + ErrorOutput if Result is None else Result['Error']))
+        sys.stderr.write(ErrorOutput)
+        for Name in Result['Arrays']:
+            self.ResultArrays[Name][...,mS,mR] = Result['Arrays'][Name]
+        for Par in Result['Parameters']:
+            Changed, Values = Result['Parameters'][Par]
+            self.ParameterDict[Par].Values[Changed] = Values
+        for Name in Result['Dicts']:
+            self.ResultDicts[Name].update(Result['Dicts'][Name])
+
+    def _Abort(self):
+        """ Terminates all remaining worker processes. """
+        for Pid in list(self.Running.keys()):
+            try:
+                os.kill(Pid, 15) # SIGTERM
+                os.waitpid(Pid, 0)
+            except OSError:
+                pass
+            self.Running.pop(Pid)
+        if self.TempPath is not None:
+            shutil.rmtree(self.TempPath, ignore_errors = True)
+            self.TempPath = None
+
+
+def ScenarioWorkerBoundary(Function):
+    """
+    Decorator of the model function: in a worker process of a ScenarioPool, an exception that leaves the model function is reported to the main process, 
+    and the worker process exits there, so that it never continues the code that called the model (e.g., a batch run that handles the exception).
+    """
+    @functools.wraps(Function)
+    def Bounded(*args, **kwargs):
+        try:
+            return Function(*args, **kwargs)
+        except BaseException:
+            if _ScenarioWorker is not None:
+                _ScenarioWorker._Fail()
+            raise
+    return Bounded
+
+
+_ParReadShared = {} # data that is shared by all parameter reading tasks of a worker process
+
+
+def _InitParameterReadWorker(MasterClassification, IndexTable, IndexTable_ClassificationNames, ScriptConfig):
+    """
+    Initializer of the parameter reading worker processes: stores the shared classification and config data once per worker.
+    """
+    _ParReadShared['MasterClassification']           = MasterClassification
+    _ParReadShared['IndexTable']                     = IndexTable
+    _ParReadShared['IndexTable_ClassificationNames'] = IndexTable_ClassificationNames
+    _ParReadShared['ScriptConfig']                   = ScriptConfig
+
+
+def _ReadParameterTask(ParArgs):
+    """
+    Reads a single parameter with msf.ReadParameterV2 in a worker process.
+    Returns MetaData, Values, and the log records produced while reading.
+    """
+    import ODYM_Functions as msf # the ODYM module directory is on the system path of the parent process.
+    ParPath, ThisPar, ThisParIx, IndexMatch, ThisParLayerSel = ParArgs
+    WorkerLog = log.getLogger('RECC_ParameterReader_' + str(os.getpid()))
+    WorkerLog.setLevel(log.DEBUG)
+    WorkerLog.propagate = False
+    WorkerLog.handlers  = []
+    Collector = ListHandler()
+    WorkerLog.addHandler(Collector)
+    # Do not change order of parameters handed over to function!
+    MetaData, Values = msf.ReadParameterV2(ParPath, ThisPar, ThisParIx, IndexMatch, ThisParLayerSel,
+                                           _ParReadShared['MasterClassification'], _ParReadShared['IndexTable'],
+                                           _ParReadShared['IndexTable_ClassificationNames'], _ParReadShared['ScriptConfig'], WorkerLog, False)
+    return MetaData, Values, Collector.Records
+
+
+def ReadParameterList(ParArgList, MasterClassification, IndexTable, IndexTable_ClassificationNames, ScriptConfig, NoWorkers):
+    """
+    Reads a list of parameters with msf.ReadParameterV2 in a pool of NoWorkers processes.
+    ParArgList contains one tuple (ParPath, ThisPar, ThisParIx, IndexMatch, ThisParLayerSel) per parameter.
+    Returns a list of (MetaData, Values, LogRecords) in the order of ParArgList. 
+    The log records of each parameter are to be replayed by the caller with Mylog.handle(record),
+    so that the model log is identical to that of a serial read.
+    Note: Under the 'spawn' start method (Windows), the script that calls the model must be import-safe (if __name__ == "__main__":).
+    """
+    with ProcessPoolExecutor(max_workers = min(NoWorkers,len(ParArgList)), initializer = _InitParameterReadWorker,
+                             initargs = (MasterClassification, IndexTable, IndexTable_ClassificationNames, ScriptConfig)) as Executor:
+        return list(Executor.map(_ReadParameterTask, ParArgList))
+
+
+# The End.
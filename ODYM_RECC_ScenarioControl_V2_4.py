@@ -15,6 +15,7 @@ Script that modifies the RECC config file to run a list of scenarios and execute
 
 # Import required libraries:
 import os
+import argparse
 import xlrd
 import openpyxl
 
@@ -29,6 +30,12 @@ ScenarioSetting = 'pav_reb_Config_list'
 #ScenarioSetting = 'Global_all'
 #ScenarioSetting = 'TestRun'
 
+# Headless mode for batch runs: no plots, no reloading of the ODYM modules for each scenario.
+# Command line option, e.g.: python ODYM_RECC_ScenarioControl_V2_4.py --headless
+ArgParser = argparse.ArgumentParser(description = 'Runs the ODYM-RECC model for each scenario config in the sheet ScenarioSetting of RECC_ModelConfig_List_V2_4.xlsx.')
+ArgParser.add_argument('--headless', action = 'store_true', help = 'fast-start mode for batch runs: no plots, no reloading of the ODYM modules for each scenario')
+Headless = ArgParser.parse_known_args()[0].headless # unknown arguments, e.g., from an IDE, are ignored
+
 # open scenario sheet
 ModelConfigListFile  = xlrd.open_workbook(os.path.join(RECC_Paths.recc_path,'RECC_ModelConfig_List_V2_4.xlsx'))
 ModelConfigListSheet = ModelConfigListFile.sheet_by_name(ScenarioSetting)
@@ -82,7 +89,7 @@ while True:
     
     mywb.save(os.path.join(RECC_Paths.recc_path,'RECC_Config_V2_4.xlsx'))
     # run the ODYM-RECC model
-    OutputDict = ODYM_RECC_V2_4.main()
+    OutputDict = ODYM_RECC_V2_4.main(Headless = Headless)
     ResultFolders.append(OutputDict['Name_Scenario'])
 
 
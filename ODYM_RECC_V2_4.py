@@ -17,31 +17,34 @@ dependencies:
     scipy >= 0.14
 
 """
-def main():
+import ODYM_RECC_Functions_V2_4 as rf # exception boundary of the worker processes of the scenario loop, see rf.ScenarioPool
+
+
+@rf.ScenarioWorkerBoundary
+def main(Headless = False):
+    """
+    Runs the ODYM-RECC model for the config in RECC_Config_V2_4.xlsx.
+    Headless = True: fast-start mode for batch runs: no plots are created, the ODYM modules are not reloaded, 
+    and the plotting libraries are not imported. Excel libraries are only imported when the config file or results are read or written.
+    """
     # Import required libraries:
+    import time
+    Time_Import_Start = time.time()
     import os
     import sys
     import logging as log
-    import xlrd, xlwt
-    import openpyxl
     import numpy as np
-    import time
     import datetime
     #import scipy.io
     import pandas as pd
     import shutil   
     import uuid
-    import matplotlib.pyplot as plt   
-    from matplotlib.lines import Line2D
     import importlib
     import getpass
     from copy import deepcopy
     from tqdm import tqdm
-    import scipy.stats
-    from scipy.interpolate import interp1d
-    from scipy.interpolate import make_interp_spline
-    import pylab
     import pickle
+    import hashlib
     
     import RECC_Paths # Import path file
     
@@ -53,36 +56,55 @@ def main():
     ##################################
     # add ODYM module directory to system path
     sys.path.insert(0, os.path.join(os.path.join(RECC_Paths.odym_path,'odym'),'modules'))
+    # import packages whose location is now on the system path:    
+    import ODYM_Classes as msc # import the ODYM class file
+    import ODYM_Functions as msf  # import the ODYM function file
+    import dynamic_stock_model as dsm # import the dynamic stock model library
+    import ODYM_RECC_Functions_V2_4 as rf # import the RECC function file
+    if Headless is False: # reload modules to include changes made during an interactive session.
+        importlib.reload(msc)
+        importlib.reload(msf)
+        importlib.reload(dsm)
+        importlib.reload(rf)
+    Time_Import = time.time() - Time_Import_Start
+    
     ### 1.1.) Read main script parameters
     # Mylog.info('### 1.1 - Read main script parameters')
     ProjectSpecs_Name_ConFile = 'RECC_Config_V2_4.xlsx'
-    Model_Configfile = xlrd.open_workbook(ProjectSpecs_Name_ConFile)
-    ScriptConfig = {'Model Setting': Model_Configfile.sheet_by_name('Cover').cell_value(3,3)}
-    Model_Configsheet = Model_Configfile.sheet_by_name(ScriptConfig['Model Setting'])
-    #Read debug modus:   
-    DebugCounter = 0
-    while Model_Configsheet.cell_value(DebugCounter, 2) != 'Logging_Verbosity':
-        DebugCounter += 1
-    ScriptConfig['Logging_Verbosity'] = Model_Configsheet.cell_value(DebugCounter,3) # Read loggin verbosity once entry was reached.    
+    # Folder for cached model parameters and config snapshots:
+    ParCachePath = os.path.join(RECC_Paths.data_path,'RECC_ParameterCache_V_2_4')
+    if not os.path.exists(ParCachePath):
+        os.makedirs(ParCachePath)
+    # The parsed config file and master classification are stored in a snapshot file, keyed by the content hash of the config workbook.
+    # The Excel files are only parsed if the config workbook or the master classification changed since the snapshot was compiled.
+    ConfigHash         = rf.HashWorkbook(ProjectSpecs_Name_ConFile)
+    ConfigSnapshotFile = rf.SnapshotFile(ParCachePath,'RECC_ConfigSnapshot',ConfigHash)
+    ConfigSnapshot     = rf.LoadConfigSnapshot(ConfigSnapshotFile,RECC_Paths.data_path)
+    if ConfigSnapshot is None:
+        import xlrd
+        Model_Configfile = xlrd.open_workbook(ProjectSpecs_Name_ConFile)
+        ScriptConfig = {'Model Setting': Model_Configfile.sheet_by_name('Cover').cell_value(3,3)}
+        Model_Configsheet = Model_Configfile.sheet_by_name(ScriptConfig['Model Setting'])
+        #Read debug modus:   
+        DebugCounter = 0
+        while Model_Configsheet.cell_value(DebugCounter, 2) != 'Logging_Verbosity':
+            DebugCounter += 1
+        ScriptConfig['Logging_Verbosity'] = Model_Configsheet.cell_value(DebugCounter,3) # Read loggin verbosity once entry was reached.    
+        Name_Script   = Model_Configsheet.cell_value(5,3)
+        Name_Scenario = Model_Configsheet.cell_value(6,3) # Regional scope as torso for scenario name
+    else:
+        ScriptConfig  = {'Model Setting': ConfigSnapshot['ScriptConfig']['Model Setting'], 'Logging_Verbosity': ConfigSnapshot['ScriptConfig']['Logging_Verbosity']}
+        Name_Script   = ConfigSnapshot['Name_Script']
+        Name_Scenario = ConfigSnapshot['Name_Scenario']
     # Extract user name from main file
     ProjectSpecs_User_Name     = getpass.getuser()
     
-    # import packages whose location is now on the system path:    
-    import ODYM_Classes as msc # import the ODYM class file
-    importlib.reload(msc)
-    import ODYM_Functions as msf  # import the ODYM function file
-    importlib.reload(msf)
-    import dynamic_stock_model as dsm # import the dynamic stock model library
-    importlib.reload(dsm)
-    
-    Name_Script        = Model_Configsheet.cell_value(5,3)
     if Name_Script != 'ODYM_RECC_V2_4':  # Name of this script must equal the specified name in the Excel config file
         # TODO: This does not work because the logger was not yet initialized
         # log.critical("The name of the current script '%s' does not match to the sript name specfied in the project configuration file '%s'. Exiting the script.",
         #              Name_Script, 'ODYM_RECC_Test1')
         raise AssertionError('Fatal: The name of the current script does not match to the sript name specfied in the project configuration file. Exiting the script.')
     # the model will terminate if the name of the script that is run is not identical to the script name specified in the config file.
-    Name_Scenario            = Model_Configsheet.cell_value(6,3) # Regional scope as torso for scenario name
     StartTime                = datetime.datetime.now()
     TimeString               = str(StartTime.year) + '_' + str(StartTime.month) + '_' + str(StartTime.day) + '__' + str(StartTime.hour) + '_' + str(StartTime.minute) + '_' + str(StartTime.second)
     #DateString               = str(StartTime.year) + '_' + str(StartTime.month) + '_' + str(StartTime.day)
@@ -101,11 +123,17 @@ def main():
     ScriptConfig['Current_UUID'] = str(uuid.uuid4())
     Mylog.info('# Simulation from ' + time.asctime())
     Mylog.info('Unique ID of scenario run: ' + ScriptConfig['Current_UUID'])
+    Mylog.info('Import of libraries and model modules: %.1f seconds.' % Time_Import)
+    if Headless is True:
+        Mylog.info('Headless mode: no plots are created, model modules were not reloaded.')
     
     ### 1.2) Read model control parameters
     Mylog.info('### 1.2 - Read model control parameters')
     #Read control and selection parameters into dictionary
-    ScriptConfig = msf.ParseModelControl(Model_Configsheet,ScriptConfig)
+    if ConfigSnapshot is None:
+        ScriptConfig = msf.ParseModelControl(Model_Configsheet,ScriptConfig)
+    else:
+        ScriptConfig.update(ConfigSnapshot['ScriptConfig'])
     
     Mylog.info('Script: ' + Name_Script + '.py')
     Mylog.info('Model script version: ' + __version__)
@@ -131,12 +159,26 @@ def main():
     # Note: This part reads the items directly from the Exel master,
     # will be replaced by reading them from version-managed csv file.
     class_filename       = str(ScriptConfig['Version of master classification']) + '.xlsx'
-    Classfile            = xlrd.open_workbook(os.path.join(RECC_Paths.data_path,class_filename))
-    Classsheet           = Classfile.sheet_by_name('MAIN_Table')
-    MasterClassification = msf.ParseClassificationFile_Main(Classsheet,Mylog)
+    if ConfigSnapshot is None:
+        Classfile            = xlrd.open_workbook(os.path.join(RECC_Paths.data_path,class_filename))
+        Classsheet           = Classfile.sheet_by_name('MAIN_Table')
+        MasterClassification = msf.ParseClassificationFile_Main(Classsheet,Mylog)
+        ClassHash            = rf.HashFile(os.path.join(RECC_Paths.data_path,class_filename))
         
-    Mylog.info('Read and parse config table, including the model index table, from model config sheet.')
-    IT_Aspects,IT_Description,IT_Dimension,IT_Classification,IT_Selector,IT_IndexLetter,PL_Names,PL_Description,PL_Version,PL_IndexStructure,PL_IndexMatch,PL_IndexLayer,PrL_Number,PrL_Name,PrL_Comment,PrL_Type,ScriptConfig = msf.ParseConfigFile(Model_Configsheet,ScriptConfig,Mylog)    
+        Mylog.info('Read and parse config table, including the model index table, from model config sheet.')
+        IT_Aspects,IT_Description,IT_Dimension,IT_Classification,IT_Selector,IT_IndexLetter,PL_Names,PL_Description,PL_Version,PL_IndexStructure,PL_IndexMatch,PL_IndexLayer,PrL_Number,PrL_Name,PrL_Comment,PrL_Type,ScriptConfig = msf.ParseConfigFile(Model_Configsheet,ScriptConfig,Mylog)    
+        
+        Mylog.info('Store parsed config table and master classification in snapshot file ' + os.path.basename(ConfigSnapshotFile) + '.')
+        rf.StoreConfigSnapshot(ConfigSnapshotFile, {'ConfigHash': ConfigHash, 'ClassFile': class_filename, 'ClassHash': ClassHash,
+                                                    'Name_Script': Name_Script, 'Name_Scenario': Name_Scenario,
+                                                    'ScriptConfig': {Key: ScriptConfig[Key] for Key in ScriptConfig if Key != 'Current_UUID'},
+                                                    'ConfigTable': (IT_Aspects,IT_Description,IT_Dimension,IT_Classification,IT_Selector,IT_IndexLetter,PL_Names,PL_Description,PL_Version,PL_IndexStructure,PL_IndexMatch,PL_IndexLayer,PrL_Number,PrL_Name,PrL_Comment,PrL_Type),
+                                                    'MasterClassification': MasterClassification})
+    else:
+        Mylog.info('Read config table and master classification from snapshot file ' + os.path.basename(ConfigSnapshotFile) + '.')
+        MasterClassification = ConfigSnapshot['MasterClassification']
+        ClassHash            = ConfigSnapshot['ClassHash']
+        IT_Aspects,IT_Description,IT_Dimension,IT_Classification,IT_Selector,IT_IndexLetter,PL_Names,PL_Description,PL_Version,PL_IndexStructure,PL_IndexMatch,PL_IndexLayer,PrL_Number,PrL_Name,PrL_Comment,PrL_Type = ConfigSnapshot['ConfigTable']
     
     Mylog.info('Define model classifications and select items for model classifications according to information provided by config file.')
     ModelClassification  = {} # Dict of model classifications
@@ -154,6 +196,9 @@ def main():
         else:
             Mylog.error('Item select error for aspect ' + IT_Aspects[m] + ' were found in datafile.')
             break
+    # The material cycle is computed for all elements, but only the element layers chosen in ElementSelect are stored for the use phase stock and its outflows (S_7, dS_7, F_7_8, F_8_17):
+    ElementsResolved = rf.SelectElements(ModelClassification['Element'].Items, ScriptConfig.get('ElementSelect','all'))
+    Mylog.info('Element layers stored for the use phase stock and outflows in this model run: ' + ', '.join([str(ModelClassification['Element'].Items[Pos]) for Pos in ElementsResolved]) + '.')
         
     ### 2.2) # Define model index table and parameter dictionary
     Mylog.info('### 2.2 - Define model index table and parameter dictionary')
@@ -178,72 +223,131 @@ def main():
     # list of the classifications used for each indexletter
     IndexTable_ClassificationNames = [IndexTable.Classification[i].Name for i in range(0, len(IndexTable.IndexLetter))]
     
+    # Immutable dimension and item-position index, to be used for all lookups of index sizes, items, and item positions below:
+    Dims = rf.ModelDimensions(IndexTable)
+    
     # 2.3) Define shortcuts for the most important index sizes:
-    Nt = len(IndexTable.Classification[IndexTable.index.get_loc('Time')].Items)
-    Ne = len(IndexTable.Classification[IndexTable.index.get_loc('Element')].Items)
-    Nc = len(IndexTable.Classification[IndexTable.index.get_loc('Cohort')].Items)
-    Nr = len(IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items)
-    Nl = len(IndexTable.Classification[IndexTable.index.get_loc('Region11')].Items)
-    No = len(IndexTable.Classification[IndexTable.index.get_loc('Region1')].Items)
-    NG = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('G')].Items)
-    Ng = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items)
-    Np = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('p')].Items)
-    NB = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('B')].Items)
-    NN = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('N')].Items) # varies: 24 for region-specific nrb and 4 for aggregated global resolution.
-    NI = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('I')].Items)
-    Na = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('a')].Items)
-    #NA = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('A')].Items)
-    NS = len(IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items)
-    NR = len(IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    Nw = len(IndexTable.Classification[IndexTable.index.get_loc('Waste_Scrap')].Items)
-    Nm = len(IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items)
-    NX = len(IndexTable.Classification[IndexTable.index.get_loc('Extensions')].Items)
-    Nn = len(IndexTable.Classification[IndexTable.index.get_loc('Energy')].Items)
-    NV = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('V')].Items)
-    Ns = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('s')].Items)
-    #NT = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('T')].Items)
-    NL = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('L')].Items)
-    NO = len(IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('O')].Items)    
+    Nt = Dims.Size['Time']
+    Ne = Dims.Size['Element']
+    Nc = Dims.Size['Cohort']
+    Nr = Dims.Size['Region32']
+    Nl = Dims.Size['Region11']
+    No = Dims.Size['Region1']
+    NG = Dims.Size['G']
+    Ng = Dims.Size['g']
+    Np = Dims.Size['p']
+    NB = Dims.Size['B']
+    NN = Dims.Size['N'] # varies: 24 for region-specific nrb and 4 for aggregated global resolution.
+    NI = Dims.Size['I']
+    Na = Dims.Size['a']
+    #NA = Dims.Size['A']
+    NS = Dims.Size['Scenario']
+    NR = Dims.Size['Scenario_RCP']
+    Nw = Dims.Size['Waste_Scrap']
+    Nm = Dims.Size['Engineering materials']
+    NX = Dims.Size['Extensions']
+    Nn = Dims.Size['Energy']
+    NV = Dims.Size['V']
+    Ns = Dims.Size['s']
+    #NT = Dims.Size['T']
+    NL = Dims.Size['L']
+    NO = Dims.Size['O']    
     #IndexTable.ix['t']['Classification'].Items # get classification items
     
     SwitchTime = Nc-Nt+1 # Index of first model year (2016)
+    
+    SectorList      = eval(ScriptConfig['SectorSelect'])
+    if 'nrb' in SectorList and 'nrbg' in SectorList:
+        raise AssertionError('Fatal: Non-residential buildings are included both globally (nrbg) and for individual regions (nrb). Double-counting. Exiting the script, check config file.')    
     # 2.4) Read model data and parameters.
     Mylog.info('Read model data and parameters.')
     
-    ParFileName = os.path.join(RECC_Paths.data_path,'RECC_ParameterDict_' + ScriptConfig['RegionalScope'] + '_V_2_4.dat')
-    try: # Load Pickle parameter dict to save processing time
-        ParFileObject = open(ParFileName,'rb')  
-        ParameterDict = pickle.load(ParFileObject)  
-        ParFileObject.close()  
-        Mylog.info('Model data and parameters were read from pickled file with pickle file /parameter reading sequence UUID ' + ParameterDict['Checkkey'])
-    except:
-        ParameterDict = {}
-        mo_start = 0 # set mo for re-reading a certain parameter
-        for mo in range(mo_start,len(PL_Names)):
-            #mo = 76 # set mo for re-reading a certain parameter
-            #ParPath = os.path.join(os.path.abspath(os.path.join(ProjectSpecs_Path_Main, '.')), 'ODYM_RECC_Database', PL_Version[mo])
-            ParPath = os.path.join(RECC_Paths.data_path, PL_Names[mo] + '_' + PL_Version[mo])
-            Mylog.info('Reading parameter ' + PL_Names[mo])
+    # Each parameter is cached separately, under a key that contains the hash of its source file, its index structure,
+    # index match and layer selection, and the master classification version. Only parameters whose key changed are re-read.
+    # The parameter values are stored as .npy files and memory-mapped when a parameter is first accessed, the metadata of the 
+    # entire parameter set are loaded from a single index file.
+    # Number of worker processes for reading parameter files, optional config entry 'ParameterReadWorkers' (default: 1, serial read; 0: one worker per CPU core).
+    NoParReadWorkers = int(float(ScriptConfig.get('ParameterReadWorkers',1)))
+    if NoParReadWorkers == 0:
+        NoParReadWorkers = os.cpu_count()
+    # Only the parameters required for the selected sectors are read, see rf.SectorParameters. 
+    # For all other parameters, an empty placeholder (zeros, no memory is committed until written) is inserted.
+    PL_Required   = rf.RequiredParameters(PL_Names, SectorList)
+    ParCacheKeys  = []
+    ParCacheFiles = {}
+    ParStateKeys  = {} # cache key of each parameter, the input state of the Section 3 preprocessing, see rf.PreprocessingCache
+    mo_start = 0 # set mo for re-reading a certain parameter
+    for mo in range(mo_start,len(PL_Names)):
+        if PL_Names[mo] not in PL_Required:
+            continue
+        #mo = 76 # set mo for re-reading a certain parameter
+        #ParPath = os.path.join(os.path.abspath(os.path.join(ProjectSpecs_Path_Main, '.')), 'ODYM_RECC_Database', PL_Version[mo])
+        ParPath = os.path.join(RECC_Paths.data_path, PL_Names[mo] + '_' + PL_Version[mo])
+        ParCacheKey  = rf.ParameterCacheKey(ParPath, PL_Names[mo], PL_IndexStructure[mo], PL_IndexMatch[mo], PL_IndexLayer[mo],
+                                            PL_Version[mo], ScriptConfig['Version of master classification'], ClassHash, Dims)
+        ParCacheKeys.append(ParCacheKey)
+        ParStateKeys[PL_Names[mo]] = ParCacheKey
+        ParCacheFiles[mo] = rf.ParameterCacheFile(ParCachePath, PL_Names[mo], ParCacheKey)
+    # UUID of this parameter set, derived from the cache keys of all parameters: identical parameter sets have identical check keys.
+    CheckKey = str(uuid.UUID(hashlib.sha256('|'.join(ParCacheKeys).encode('utf-8')).hexdigest()[0:32]))
+    ParIndexFile  = os.path.join(ParCachePath,'RECC_ParameterIndex_' + CheckKey + '.dat')
+    ParIndex      = rf.LoadParameterIndex(ParIndexFile)
+    ParameterDict = rf.LazyParameterDict()
+    for mo in range(mo_start,len(PL_Names)):
+        if PL_Names[mo] not in PL_Required:
+            ParameterDict[PL_Names[mo]] = msc.Parameter(Name=PL_Names[mo], ID=PL_Names[mo], UUID=None, P_Res=None, MetaData=None,
+                                                        Indices=PL_IndexStructure[mo], Values=np.zeros(Dims.Shape(PL_IndexStructure[mo])),
+                                                        Uncert=None, Unit=None)
+            continue
+        if PL_Names[mo] in ParIndex and os.path.isfile(rf.ParameterValueFile(ParCacheFiles[mo])):
+            ParameterDict[PL_Names[mo]], ValueShape = ParIndex[PL_Names[mo]], None # parameters as read from file are never broadcast
+        else:
+            ParameterDict[PL_Names[mo]], ValueShape = rf.LoadCachedParameter(ParCacheFiles[mo])
+        if ParameterDict.Meta(PL_Names[mo]) is not None:
+            ParameterDict.SetValueFile(PL_Names[mo], rf.ParameterValueFile(ParCacheFiles[mo]), ValueShape)
+    # Parse the parameter files that are not in the cache in parallel, results and log records are processed in the serial order below.
+    ParReadList    = [mo for mo in range(mo_start,len(PL_Names)) if ParameterDict.Meta(PL_Names[mo]) is None]
+    ParReadResults = {}
+    if NoParReadWorkers > 1 and len(ParReadList) > 1:
+        Mylog.info('Reading ' + str(len(ParReadList)) + ' parameter files with ' + str(NoParReadWorkers) + ' worker processes.')
+        ParReadArgs    = [(os.path.join(RECC_Paths.data_path, PL_Names[mo] + '_' + PL_Version[mo]), PL_Names[mo], PL_IndexStructure[mo],
+                           PL_IndexMatch[mo], PL_IndexLayer[mo]) for mo in ParReadList]
+        ParReadResults = dict(zip(ParReadList, rf.ReadParameterList(ParReadArgs, MasterClassification, IndexTable,
+                                                                    IndexTable_ClassificationNames, ScriptConfig, NoParReadWorkers)))
+    for mo in range(mo_start,len(PL_Names)):
+        if PL_Names[mo] not in PL_Required:
+            Mylog.info('Parameter ' + PL_Names[mo] + ' is not required for sector selection ' + str(SectorList) + ', not read.')
+            continue
+        if mo not in ParReadList:
+            Mylog.info('Parameter ' + PL_Names[mo] + ' was read from cache file ' + os.path.basename(ParCacheFiles[mo]))
+            Mylog.info('Current parameter file UUID: ' + ParameterDict.Meta(PL_Names[mo]).UUID)
+            continue
+        ParPath = os.path.join(RECC_Paths.data_path, PL_Names[mo] + '_' + PL_Version[mo])
+        Mylog.info('Reading parameter ' + PL_Names[mo])
+        if mo in ParReadResults:
+            MetaData, Values, ParLogRecords = ParReadResults[mo]
+            for ParLogRecord in ParLogRecords:
+                ParLogRecord.name = Mylog.name
+                Mylog.handle(ParLogRecord)
+        else:
             #MetaData, Values = msf.ReadParameter(ParPath = ParPath,ThisPar = PL_Names[mo], ThisParIx = PL_IndexStructure[mo], IndexMatch = PL_IndexMatch[mo], ThisParLayerSel = PL_IndexLayer[mo], MasterClassification,IndexTable,IndexTable_ClassificationNames,ScriptConfig,Mylog) # Do not change order of parameters handed over to function!
             # Do not change order of parameters handed over to function!
             MetaData, Values = msf.ReadParameterV2(ParPath, PL_Names[mo], PL_IndexStructure[mo], PL_IndexMatch[mo],
                                                  PL_IndexLayer[mo], MasterClassification, IndexTable,
                                                  IndexTable_ClassificationNames, ScriptConfig, Mylog, False)
-            ParameterDict[PL_Names[mo]] = msc.Parameter(Name=MetaData['Dataset_Name'], ID=MetaData['Dataset_ID'],
-                                                        UUID=MetaData['Dataset_UUID'], P_Res=None, MetaData=MetaData,
-                                                        Indices=PL_IndexStructure[mo], Values=Values, Uncert=None,
-                                                        Unit=MetaData['Dataset_Unit'])
-            Mylog.info('Current parameter file UUID: ' + MetaData['Dataset_UUID'])
-            Mylog.info('_')
-        Mylog.info('Reading of parameters finished.')
-        CheckKey = str(uuid.uuid4()) # generate UUID for this parameter reading sequence.
-        Mylog.info('Current parameter reading sequence UUID: ' + CheckKey)
-        Mylog.info('Entire parameter set stored under this UUID, will be reloaded for future calculations.')
-        ParameterDict['Checkkey'] = CheckKey
-        # Save to pickle file for next model run
-        ParFileObject = open(ParFileName,'wb') 
-        pickle.dump(ParameterDict,ParFileObject)   
-        ParFileObject.close()
+        ParameterDict[PL_Names[mo]] = msc.Parameter(Name=MetaData['Dataset_Name'], ID=MetaData['Dataset_ID'],
+                                                    UUID=MetaData['Dataset_UUID'], P_Res=None, MetaData=MetaData,
+                                                    Indices=PL_IndexStructure[mo], Values=Values, Uncert=None,
+                                                    Unit=MetaData['Dataset_Unit'])
+        Mylog.info('Current parameter file UUID: ' + MetaData['Dataset_UUID'])
+        Mylog.info('_')
+        # Save to cache file for next model run
+        rf.StoreCachedParameter(ParCacheFiles[mo], ParameterDict[PL_Names[mo]])
+    Mylog.info('Reading of parameters finished.')
+    if len(ParIndex) == 0 or len(ParReadList) > 0: # store metadata of entire parameter set for next model run
+        rf.StoreParameterIndex(ParIndexFile, {PL_Names[mo]: rf.ParameterMetaData(ParameterDict.Meta(PL_Names[mo])) for mo in range(mo_start,len(PL_Names)) if PL_Names[mo] in PL_Required})
+    Mylog.info('Current parameter set UUID: ' + CheckKey)
+    ParameterDict['Checkkey'] = CheckKey
         
     Mylog.info('_')
     Mylog.info('_')
@@ -251,22 +355,20 @@ def main():
     #     Section 3)  Interpolate missing parameter values:      #
     ##############################################################
     # 0) obtain specific indices and positions:
+    # Sector-specific preprocessing steps that are required for the current sector selection, see rf.SectorSteps:
+    Section3Steps   = rf.RequiredSteps(SectorList)
     # m_reg_o         = 0 # reference region for GHG prices and intensities (Default: 0, which is the first region selected in the config file.)
-    LEDindex        = IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items.index('LED')
-    SSP1index       = IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items.index('SSP1')
-    SSP2index       = IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items.index('SSP2')
-    
-    SectorList      = eval(ScriptConfig['SectorSelect'])
-    if 'nrb' in SectorList and 'nrbg' in SectorList:
-        raise AssertionError('Fatal: Non-residential buildings are included both globally (nrbg) and for individual regions (nrb). Double-counting. Exiting the script, check config file.')    
+    LEDindex        = Dims.Position['Scenario']['LED']
+    SSP1index       = Dims.Position['Scenario']['SSP1']
+    SSP2index       = Dims.Position['Scenario']['SSP2']
     
     # index location and range of pass. vehs. in product list.
     try:
-        Sector_pav_loc  = IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items.index('passenger vehicles')
+        Sector_pav_loc  = Dims.Position['Sectors']['passenger vehicles']
     except:
         Sector_pav_loc  = np.nan
     try:
-        Sector_pav_rge  = [IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items.index(i) for i in IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('p')].Items]
+        Sector_pav_rge  = [Dims.Position['g'][i] for i in Dims.Items['p']]
     except:
         if 'pav' in SectorList:
             raise AssertionError('Fatal: All selected items for aspect p must also be selected for aspect g. Exiting the script.')
@@ -274,11 +376,11 @@ def main():
             Sector_pav_rge = []
     # index location and range of res. builds. in product list.
     try:
-        Sector_reb_loc  = IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items.index('residential buildings')
+        Sector_reb_loc  = Dims.Position['Sectors']['residential buildings']
     except:
         Sector_reb_loc  = np.nan
     try:
-        Sector_reb_rge  = [IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items.index(i) for i in IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('B')].Items]
+        Sector_reb_rge  = [Dims.Position['g'][i] for i in Dims.Items['B']]
     except:
         if 'reb' in SectorList:
             raise AssertionError('Fatal: All selected items for aspect B must also be selected for aspect g. Exiting the script.')
@@ -287,11 +389,11 @@ def main():
     # index location and range of nonres. builds. in product list.
     if 'nrb' in SectorList:
         try:
-            Sector_nrb_loc  = IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items.index('nonresidential buildings r')
+            Sector_nrb_loc  = Dims.Position['Sectors']['nonresidential buildings r']
         except:
             Sector_nrb_loc  = np.nan
         try:
-            Sector_nrb_rge  = [IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items.index(i) for i in IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('N')].Items]
+            Sector_nrb_rge  = [Dims.Position['g'][i] for i in Dims.Items['N']]
         except:
             Sector_nrb_rge  = []
     else:
@@ -299,22 +401,22 @@ def main():
     # index location and range of nonres. builds. global in product list.    
     if 'nrbg' in SectorList:       
         try:
-            Sector_nrbg_loc = IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items.index('nonresidential buildings g')
+            Sector_nrbg_loc = Dims.Position['Sectors']['nonresidential buildings g']
         except:
             Sector_nrbg_loc = np.nan
         try:
-            Sector_nrbg_rge = [IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items.index(i) for i in IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('N')].Items]
+            Sector_nrbg_rge = [Dims.Position['g'][i] for i in Dims.Items['N']]
         except:
             Sector_nrbg_rge = []
     else:
         Sector_nrbg_rge = []        
      # index location and range of industry in product list.    
     try:
-        Sector_ind_loc  = IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items.index('industry')
+        Sector_ind_loc  = Dims.Position['Sectors']['industry']
     except:
         Sector_ind_loc  = np.nan
     try:
-        Sector_ind_rge  = [IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items.index(i) for i in IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('I')].Items]
+        Sector_ind_rge  = [Dims.Position['g'][i] for i in Dims.Items['I']]
     except:
         if 'ind' in SectorList:
             raise AssertionError('Fatal: All selected items for aspect I must also be selected for aspect g. Exiting the script.')
@@ -322,38 +424,38 @@ def main():
             Sector_ind_rge = []
     # index location and range of appliances in product list.    
     try:
-        Sector_app_loc  = IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items.index('appliances')
+        Sector_app_loc  = Dims.Position['Sectors']['appliances']
     except:
         Sector_app_loc  = np.nan
     try:
-        Sector_app_rge  = [IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('g')].Items.index(i) for i in IndexTable.Classification[IndexTable.set_index('IndexLetter').index.get_loc('a')].Items]
+        Sector_app_rge  = [Dims.Position['g'][i] for i in Dims.Items['a']]
     except:
         if 'app' in SectorList:
             raise AssertionError('Fatal: All selected items for aspect a must also be selected for aspect g. Exiting the script.')
         else:
             Sector_app_rge = []
         
-    Cement_loc    = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('cement')
-    Concrete_loc  = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('concrete')
-    ConcrAgg_loc  = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('concrete aggregates')
-    Wood_loc      = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('wood and wood products')
-    WroughtAl_loc = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('wrought Al')
-    CastAl_loc    = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('cast Al')
-    Copper_loc    = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('copper electric grade')
-    Plastics_loc  = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('plastics')
-    Zinc_loc      = IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items.index('zinc')
-    Woodwaste_loc = IndexTable.Classification[IndexTable.index.get_loc('Waste_Scrap')].Items.index('used wood')
-    Electric_loc  = IndexTable.Classification[IndexTable.index.get_loc('Energy')].Items.index('electricity')
-    WoodFuel_loc  = IndexTable.Classification[IndexTable.index.get_loc('Energy')].Items.index('fuel wood')
-    Hydrogen_loc  = IndexTable.Classification[IndexTable.index.get_loc('Energy')].Items.index('hydrogen')
-    Carbon_loc    = IndexTable.Classification[IndexTable.index.get_loc('Element')].Items.index('C')
-    ClimPolScen   = IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items.index('RCP2.6')
-    CO2_loc       = IndexTable.Classification[IndexTable.index.get_loc('Extensions')].Items.index('CO2 emisisons per main output')
-    GWP100_loc    = IndexTable.Classification[IndexTable.index.get_loc('Environmental impact/pressure category')].Items.index('GWP100')
-    Heating_loc   = IndexTable.Classification[IndexTable.index.get_loc('ServiceType')].Items.index('Heating')
-    Cooling_loc   = IndexTable.Classification[IndexTable.index.get_loc('ServiceType')].Items.index('Cooling')
-    DomstHW_loc   = IndexTable.Classification[IndexTable.index.get_loc('ServiceType')].Items.index('DHW')
-    Service_Drivg = IndexTable.Classification[IndexTable.index.get_loc('ServiceType')].Items.index('Driving')
+    Cement_loc    = Dims.Position['Engineering materials']['cement']
+    Concrete_loc  = Dims.Position['Engineering materials']['concrete']
+    ConcrAgg_loc  = Dims.Position['Engineering materials']['concrete aggregates']
+    Wood_loc      = Dims.Position['Engineering materials']['wood and wood products']
+    WroughtAl_loc = Dims.Position['Engineering materials']['wrought Al']
+    CastAl_loc    = Dims.Position['Engineering materials']['cast Al']
+    Copper_loc    = Dims.Position['Engineering materials']['copper electric grade']
+    Plastics_loc  = Dims.Position['Engineering materials']['plastics']
+    Zinc_loc      = Dims.Position['Engineering materials']['zinc']
+    Woodwaste_loc = Dims.Position['Waste_Scrap']['used wood']
+    Electric_loc  = Dims.Position['Energy']['electricity']
+    WoodFuel_loc  = Dims.Position['Energy']['fuel wood']
+    Hydrogen_loc  = Dims.Position['Energy']['hydrogen']
+    Carbon_loc    = Dims.Position['Element']['C']
+    ClimPolScen   = Dims.Position['Scenario_RCP']['RCP2.6']
+    CO2_loc       = Dims.Position['Extensions']['CO2 emisisons per main output']
+    GWP100_loc    = Dims.Position['Environmental impact/pressure category']['GWP100']
+    Heating_loc   = Dims.Position['ServiceType']['Heating']
+    Cooling_loc   = Dims.Position['ServiceType']['Cooling']
+    DomstHW_loc   = Dims.Position['ServiceType']['DHW']
+    Service_Drivg = Dims.Position['ServiceType']['Driving']
     Service_Reb   = np.array([Heating_loc,Cooling_loc,DomstHW_loc])
     Ind_2020      = 120 #index of year 2020
     IsClose_Remainder_Small = 1e-15 
@@ -370,24 +472,25 @@ def main():
     
     OutputDict      = {}  # Dictionary with output variables for entire model run, to export checks and analyses.
     
+    # Each of the following steps is loaded from cache if the config switches and parameters it depends on are unchanged, see rf.PreprocessingSteps.
+    S3Cache         = rf.PreprocessingCache(ParCachePath, ParameterDict, ParStateKeys, [Par for Par in PL_Names if Par not in PL_Required],
+                                            ScriptConfig, SectorList, Dims, os.path.abspath(__file__), Mylog)
+    
     # 1a) Material composition of vehicles, will only use historic age-cohorts.
     # Values are given every 5 years, we need all values in between.
-    if 'pav' in SectorList:
+    if '1a' in Section3Steps and not S3Cache.Load('1a'):
         index = PL_Names.index('3_MC_RECC_Vehicles')
         MC_Veh_New = np.zeros(ParameterDict[PL_Names[index]].Values.shape)
         Idx_Time = [1980,1985,1990,1995,2000,2005,2010,2015,2020,2025,2030,2035,2040,2045,2050,2055,2060]
         Idx_Time_Rel = [i -1900 for i in Idx_Time]
         tnew = np.linspace(80, 160, num=81, endpoint=True)
-        for n in range(0,Nm):
-            for o in range(0,Np):
-                for p in range(0,Nr):
-                    f2 = interp1d(Idx_Time_Rel, ParameterDict[PL_Names[index]].Values[Idx_Time_Rel,n,o,p], kind='linear')
-                    MC_Veh_New[80::,n,o,p] = f2(tnew)
+        MC_Veh_New[80::,:,:,:] = rf.InterpolateTimeSeries(ParameterDict[PL_Names[index]].Values, Idx_Time_Rel, tnew) # all m,p,r at once
         ParameterDict[PL_Names[index]].Values = MC_Veh_New.copy()
+        S3Cache.Store('1a')
     
     # 1b) Material composition of res buildings, will only use historic age-cohorts.
     # Values are given every 5 years, we need all values in between.
-    if 'reb' in SectorList:
+    if '1b' in Section3Steps and not S3Cache.Load('1b'):
         index       = PL_Names.index('3_MC_RECC_Buildings')
         index_Ren_A = PL_Names.index('3_MC_RECC_Buildings_Renovation_Absolute')
         index_Ren_R = PL_Names.index('3_MC_RECC_Buildings_Renovation_Relative')
@@ -397,37 +500,29 @@ def main():
         Idx_Time = [1900,1910,1920,1930,1940,1950,1960,1970,1980,1985,1990,1995,2000,2005,2010,2015,2020,2025,2030,2035,2040,2045,2050,2055,2060]
         Idx_Time_Rel = [i -1900 for i in Idx_Time]
         tnew = np.linspace(0, 160, num=161, endpoint=True)
-        for n in range(0,Nm):
-            for o in range(0,NB):
-                for p in range(0,Nr):
-                    f2 = interp1d(Idx_Time_Rel, ParameterDict[PL_Names[index]].Values[Idx_Time_Rel,n,o,p], kind='linear')
-                    MC_Bld_New[:,n,o,p]       = f2(tnew).copy()
-                    fA = interp1d(Idx_Time_Rel, ParameterDict[PL_Names[index_Ren_A]].Values[Idx_Time_Rel,n,o,p], kind='linear')
-                    MC_Bld_New_Ren_A[:,n,o,p] = fA(tnew).copy()
-                    fR = interp1d(Idx_Time_Rel, ParameterDict[PL_Names[index_Ren_R]].Values[Idx_Time_Rel,n,o,p], kind='linear')
-                    MC_Bld_New_Ren_R[:,n,o,p] = fR(tnew).copy()
+        MC_Bld_New[:,:,:,:]       = rf.InterpolateTimeSeries(ParameterDict[PL_Names[index]].Values,       Idx_Time_Rel, tnew) # all m,B,r at once
+        MC_Bld_New_Ren_A[:,:,:,:] = rf.InterpolateTimeSeries(ParameterDict[PL_Names[index_Ren_A]].Values, Idx_Time_Rel, tnew)
+        MC_Bld_New_Ren_R[:,:,:,:] = rf.InterpolateTimeSeries(ParameterDict[PL_Names[index_Ren_R]].Values, Idx_Time_Rel, tnew)
         ParameterDict[PL_Names[index]].Values       = MC_Bld_New.copy()
         ParameterDict[PL_Names[index_Ren_A]].Values = MC_Bld_New_Ren_A.copy()
         ParameterDict[PL_Names[index_Ren_R]].Values = MC_Bld_New_Ren_R.copy()
+        S3Cache.Store('1b')
     
     # 1c) Material composition of nonres buildings, will only use historic age-cohorts.
     # Values are given every 5 years, we need all values in between.
-    if 'nrb' in SectorList:
+    if '1c' in Section3Steps and not S3Cache.Load('1c'):
         index = PL_Names.index('3_MC_RECC_NonResBuildings')
         MC_NRB_New = np.zeros(ParameterDict[PL_Names[index]].Values.shape)
         Idx_Time = [1900,1910,1920,1930,1940,1950,1960,1970,1980,1985,1990,1995,2000,2005,2010,2015,2020,2025,2030,2035,2040,2045,2050,2055,2060]
         Idx_Time_Rel = [i -1900 for i in Idx_Time]
         tnew = np.linspace(0, 160, num=161, endpoint=True)
-        for n in range(0,Nm):
-            for o in range(0,NN):
-                for p in range(0,Nr):
-                    f2 = interp1d(Idx_Time_Rel, ParameterDict[PL_Names[index]].Values[Idx_Time_Rel,n,o,p], kind='linear')
-                    MC_NRB_New[:,n,o,p] = f2(tnew).copy()
+        MC_NRB_New[:,:,:,:] = rf.InterpolateTimeSeries(ParameterDict[PL_Names[index]].Values, Idx_Time_Rel, tnew) # all m,N,r at once
         ParameterDict[PL_Names[index]].Values = MC_NRB_New.copy()
+        S3Cache.Store('1c')
     
     # 2a) Determine future energy intensity and material composition of vehicles by mixing archetypes:
     # Check if RE strategies are active and set implementation curves to 2016 value if not.
-    if 'pav' in SectorList:
+    if '2a' in Section3Steps and not S3Cache.Load('2a'):
         if ScriptConfig['Include_REStrategy_MaterialSubstitution'] == 'False': # no additional lightweighting trough material substitution.
             ParameterDict['3_SHA_LightWeighting_Vehicles'].Values  = np.einsum('prS,t->prtS',ParameterDict['3_SHA_LightWeighting_Vehicles'].Values[:,:,0,:],np.ones((Nt)))
         DownSizingBuffer = ParameterDict['3_SHA_DownSizing_Vehicles'].Values.copy()
@@ -466,10 +561,11 @@ def main():
         np.einsum('prcS,pnrcS->cpnrS',1 - ParameterDict['3_SHA_LightWeighting_Vehicles'].Values/100, np.einsum('rcS,pn->pnrcS',ParameterDict['3_SHA_DownSizing_Vehicles'].Values[1,:,:,:],ParameterDict['3_EI_VehicleArchetypes'].Values[[1 ,5 ,9 ,13,17,21],:])) +\
         np.einsum('prcS,pnrcS->cpnrS',1 - ParameterDict['3_SHA_LightWeighting_Vehicles'].Values/100, np.einsum('rcS,pn->pnrcS',ParameterDict['3_SHA_DownSizing_Vehicles'].Values[2,:,:,:],ParameterDict['3_EI_VehicleArchetypes'].Values[[2 ,6 ,10,14,18,22],:])) +\
         np.einsum('prcS,pnrcS->cpnrS',1 - ParameterDict['3_SHA_LightWeighting_Vehicles'].Values/100, np.einsum('rcS,pn->pnrcS',ParameterDict['3_SHA_DownSizing_Vehicles'].Values[3,:,:,:],ParameterDict['3_EI_VehicleArchetypes'].Values[[3 ,7 ,11,15,19,23],:]))
+        S3Cache.Store('2a')
     
     # 2b) Determine future energy intensity and material composition of residential buildings by mixing archetypes:
     # Expand building light-weighting split to all building types:
-    if 'reb' in SectorList:
+    if '2b' in Section3Steps and not S3Cache.Load('2b'):
         ParameterDict['3_SHA_LightWeighting_Buildings'].Values = np.einsum('B,rtS->BrtS',np.ones(NB),ParameterDict['3_SHA_LightWeighting_Buildings'].Values[Sector_reb_loc,:,:,:]).copy()
         if ScriptConfig['Include_REStrategy_MaterialSubstitution'] == 'False': # no additional lightweighting trough material substitution.
             ParameterDict['3_SHA_LightWeighting_Buildings'].Values = np.einsum('BrS,t->BrtS',ParameterDict['3_SHA_LightWeighting_Buildings'].Values[:,:,0,:],np.ones((Nt)))
@@ -511,9 +607,10 @@ def main():
                                                     UUID=None, P_Res=None, MetaData=None,
                                                     Indices='mBrctS', Values=np.zeros((Nm,NB,Nr,Nc,Nt,NS)), Uncert=None,
                                                     Unit='kg/m2')    
+        S3Cache.Store('2b')
     
     # 2c) Determine future energy intensity and material composition of nonresidential buildings by mixing archetypes:
-    if 'nrb' in SectorList:
+    if '2c' in Section3Steps and not S3Cache.Load('2c'):
         # Expand building light-weighting split to all building types:
         ParameterDict['3_SHA_LightWeighting_NonResBuildings'].Values = np.einsum('N,rtS->NrtS',np.ones(NN),ParameterDict['3_SHA_LightWeighting_NonResBuildings'].Values[Sector_nrb_loc,:,:,:]).copy()
         if ScriptConfig['Include_REStrategy_MaterialSubstitution'] == 'False': # no additional lightweighting trough material substitution.
@@ -547,153 +644,195 @@ def main():
                                                     UUID=None, P_Res=None, MetaData=None,
                                                     Indices='cNVnrt', Values=np.zeros((Nc,NN,NV,Nn,Nr,Nt)), Uncert=None,
                                                     Unit='MJ/m2/yr')
+        S3Cache.Store('2c')
     
-    if 'nrbg' in SectorList:
+    # 2d) Material composition of nonresidential buildings, global resolution:
+    if '2d' in Section3Steps and not S3Cache.Load('2d'):
         # Split concrete into cement and aggregates:
         # Cement for buildings remains, as this item refers to cement in mortar, screed, and plaster. Cement in concrete is calculated as ParameterDict['3_MC_CementContentConcrete'].Values * concrete and added here. 
         # Concrete aggregates (0.87*concrete) are considered as well.
         ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[Cement_loc,:]   = ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[Cement_loc,:] + ParameterDict['3_MC_CementContentConcrete'].Values[Cement_loc,Concrete_loc] * ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[Concrete_loc,:].copy()
         ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[ConcrAgg_loc,:] = (1 - ParameterDict['3_MC_CementContentConcrete'].Values[Cement_loc,Concrete_loc]) * ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[Concrete_loc,:].copy()
         ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[Concrete_loc,:] = 0
+        S3Cache.Store('2d')
         
     # 3) GHG intensity of energy supply: Change unit from g/MJ to kg/MJ and add backstop electricity factor
-    ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values = ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values/1000 # convert g/MJ to kg/MJ
-    ParameterDict['4_PE_GHGIntensityEnergySupply'].Values               = ParameterDict['4_PE_GHGIntensityEnergySupply'].Values/1000 # convert g/MJ to kg/MJ
-    ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values         = ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values/1000 # convert g/MJ to kg/MJ
-    # replace electricity emissions factors < backstop by backstop technology factor:
-    ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Electric_loc,:,:,:,:]       = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Electric_loc,:,:,:,:],      np.einsum('XSRt,r->XSRrt',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Electric_loc,:,:,:],np.ones(Nr)))
-    ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Electric_loc,:,:,:,:] = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Electric_loc,:,:,:,:],np.einsum('XSRt,o->XSRot',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Electric_loc,:,:,:],np.ones(No)))
-    ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Hydrogen_loc,:,:,:,:]       = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Hydrogen_loc,:,:,:,:],      np.einsum('XSRt,r->XSRrt',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Hydrogen_loc,:,:,:],np.ones(Nr)))
-    ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Hydrogen_loc,:,:,:,:] = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Hydrogen_loc,:,:,:,:],np.einsum('XSRt,o->XSRot',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Hydrogen_loc,:,:,:],np.ones(No)))
+    if not S3Cache.Load('3'):
+        ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values = ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values/1000 # convert g/MJ to kg/MJ
+        ParameterDict['4_PE_GHGIntensityEnergySupply'].Values               = ParameterDict['4_PE_GHGIntensityEnergySupply'].Values/1000 # convert g/MJ to kg/MJ
+        ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values         = ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values/1000 # convert g/MJ to kg/MJ
+        # replace electricity emissions factors < backstop by backstop technology factor:
+        ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Electric_loc,:,:,:,:]       = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Electric_loc,:,:,:,:],      np.einsum('XSRt,r->XSRrt',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Electric_loc,:,:,:],np.ones(Nr)))
+        ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Electric_loc,:,:,:,:] = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Electric_loc,:,:,:,:],np.einsum('XSRt,o->XSRot',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Electric_loc,:,:,:],np.ones(No)))
+        ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Hydrogen_loc,:,:,:,:]       = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply'].Values[:,Hydrogen_loc,:,:,:,:],      np.einsum('XSRt,r->XSRrt',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Hydrogen_loc,:,:,:],np.ones(Nr)))
+        ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Hydrogen_loc,:,:,:,:] = np.maximum(ParameterDict['4_PE_GHGIntensityEnergySupply_World'].Values[:,Hydrogen_loc,:,:,:,:],np.einsum('XSRt,o->XSRot',ParameterDict['4_PE_GHGIntensityElectricitySupply_Backstop'].Values[:,Hydrogen_loc,:,:,:],np.ones(No)))
+        S3Cache.Store('3')
     
     # 4) Fabrication yield and fabrication scrap diversion:
     # Extrapolate 2050-2060 as 2015 values
-    index = PL_Names.index('4_PY_Manufacturing')
-    ParameterDict[PL_Names[index]].Values[:,:,:,:,1::,:] = np.einsum('t,mwgFr->mwgFtr',np.ones(45),ParameterDict[PL_Names[index]].Values[:,:,:,:,0,:])
-    if ScriptConfig['Include_REStrategy_FabScrapDiversion'] == 'False':
-        ParameterDict['6_PR_FabricationScrapDiversion'].Values = np.zeros((Nm,Nw,No,NS))
+    if not S3Cache.Load('4'):
+        ParameterDict['4_PY_Manufacturing'].Values = rf.BroadcastValues('mwgFr->mwgFtr',ParameterDict['4_PY_Manufacturing'].Values[:,:,:,:,0,:],{'t': Nt}) # replicate 2015 values, index structure mwgFtr
+        if ScriptConfig['Include_REStrategy_FabScrapDiversion'] == 'False':
+            ParameterDict['6_PR_FabricationScrapDiversion'].Values = np.zeros((Nm,Nw,No,NS))
+        S3Cache.Store('4')
     
     # 5) EoL RR, apply world average to all regions
-    ParameterDict['4_PY_EoL_RecoveryRate'].Values = np.einsum('gmwW,r->grmwW',ParameterDict['4_PY_EoL_RecoveryRate'].Values[:,0,:,:,:],np.ones((Nr)))
+    if not S3Cache.Load('5'):
+        ParameterDict['4_PY_EoL_RecoveryRate'].Values = rf.BroadcastValues('gmwW->grmwW',ParameterDict['4_PY_EoL_RecoveryRate'].Values[:,0,:,:,:],{'r': Nr})
+        S3Cache.Store('5')
     
     # 6) Energy carrier split of vehicles, replicate fixed values for all regions and age-cohorts etc.
-    ParameterDict['3_SHA_EnergyCarrierSplit_Vehicles'].Values = np.einsum('pn,crVS->cprVnS',ParameterDict['3_SHA_EnergyCarrierSplit_Vehicles'].Values[115,:,0,3,:,SSP1index].copy(),np.ones((Nc,Nr,NV,NS)))
+    if '6' in Section3Steps and not S3Cache.Load('6'):
+        ParameterDict['3_SHA_EnergyCarrierSplit_Vehicles'].Values = rf.BroadcastValues('pn->cprVnS',ParameterDict['3_SHA_EnergyCarrierSplit_Vehicles'].Values[115,:,0,3,:,SSP1index],{'c': Nc, 'r': Nr, 'V': NV, 'S': NS})
+        S3Cache.Store('6')
     
     # 7) RE strategy potentials for individual countries are replicated from global average:
-    ParameterDict['6_PR_ReUse_Bld'].Values                      = np.einsum('mB,r->mBr',ParameterDict['6_PR_ReUse_Bld'].Values[:,:,0],np.ones(Nr))
-    ParameterDict['6_PR_ReUse_nonresBld'].Values                = np.einsum('mN,r->mNr',ParameterDict['6_PR_ReUse_nonresBld'].Values[:,:,0],np.ones(Nr))
-    ParameterDict['6_PR_LifeTimeExtension_passvehicles'].Values = np.einsum('pS,r->prS',ParameterDict['6_PR_LifeTimeExtension_passvehicles'].Values[:,0,:],np.ones(Nr))
-    ParameterDict['6_PR_EoL_RR_Improvement'].Values             = np.einsum('gmwW,r->grmwW',ParameterDict['6_PR_EoL_RR_Improvement'].Values[:,0,:,:,:],np.ones(Nr))
+    if not S3Cache.Load('7'):
+        if 'reb' in SectorList:
+            ParameterDict['6_PR_ReUse_Bld'].Values                      = rf.BroadcastValues('mB->mBr',ParameterDict['6_PR_ReUse_Bld'].Values[:,:,0],{'r': Nr})
+        if 'nrb' in SectorList:
+            ParameterDict['6_PR_ReUse_nonresBld'].Values                = rf.BroadcastValues('mN->mNr',ParameterDict['6_PR_ReUse_nonresBld'].Values[:,:,0],{'r': Nr})
+        if 'pav' in SectorList:
+            ParameterDict['6_PR_LifeTimeExtension_passvehicles'].Values = rf.BroadcastValues('pS->prS',ParameterDict['6_PR_LifeTimeExtension_passvehicles'].Values[:,0,:],{'r': Nr})
+        ParameterDict['6_PR_EoL_RR_Improvement'].Values             = rf.BroadcastValues('gmwW->grmwW',ParameterDict['6_PR_EoL_RR_Improvement'].Values[:,0,:,:,:],{'r': Nr})
+        S3Cache.Store('7')
     
     # 8) Define a multi-regional RE strategy scaleup parameter
-    ParameterDict['3_SHA_RECC_REStrategyScaleUp_r'] = msc.Parameter(Name='3_SHA_RECC_REStrategyScaleUp_r', ID='3_SHA_RECC_REStrategyScaleUp_r',
-                                                      UUID=None, P_Res=None, MetaData=None,
-                                                      Indices='trSR', Values=np.zeros((Nt,Nr,NS,NR)), Uncert=None,
-                                                      Unit='kg/unit')
-    ParameterDict['3_SHA_RECC_REStrategyScaleUp_r'].Values        = np.einsum('RtS,r->trSR',ParameterDict['3_SHA_RECC_REStrategyScaleUp'].Values[:,0,:,:],np.ones(Nr)).copy()
+    if not S3Cache.Load('8'):
+        ParameterDict['3_SHA_RECC_REStrategyScaleUp_r'] = msc.Parameter(Name='3_SHA_RECC_REStrategyScaleUp_r', ID='3_SHA_RECC_REStrategyScaleUp_r',
+                                                          UUID=None, P_Res=None, MetaData=None,
+                                                          Indices='trSR', Values=np.zeros((Nt,Nr,NS,NR)), Uncert=None,
+                                                          Unit='kg/unit')
+        ParameterDict['3_SHA_RECC_REStrategyScaleUp_r'].Values        = rf.BroadcastValues('RtS->trSR',ParameterDict['3_SHA_RECC_REStrategyScaleUp'].Values[:,0,:,:],{'r': Nr})
+        S3Cache.Store('8')
     
     # 9) LED scenario data from proxy scenarios:
-    # 2_P_RECC_Population_SSP_32R
-    ParameterDict['2_P_RECC_Population_SSP_32R'].Values[:,:,:,LEDindex]                    = ParameterDict['2_P_RECC_Population_SSP_32R'].Values[:,:,:,SSP2index].copy()
-    # 3_EI_Products_UsePhase, historic
-    ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,:,:,:,LEDindex]    = ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,:,:,:,SSP2index].copy()
-    ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,:,:,:,LEDindex]    = ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,:,:,:,SSP2index].copy()
-    ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,:,:,:,LEDindex] = ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,:,:,:,SSP2index].copy()
-    # 3_IO_Buildings_UsePhase
-    ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[:,:,:,:,LEDindex]             = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[:,:,:,:,SSP2index].copy()
+    if not S3Cache.Load('9'):
+        # 2_P_RECC_Population_SSP_32R
+        ParameterDict['2_P_RECC_Population_SSP_32R'].Values[:,:,:,LEDindex]                    = ParameterDict['2_P_RECC_Population_SSP_32R'].Values[:,:,:,SSP2index].copy()
+        # 3_EI_Products_UsePhase, historic
+        if 'pav' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,:,:,:,LEDindex]    = ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,:,:,:,SSP2index].copy()
+        if 'reb' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,:,:,:,LEDindex]    = ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,:,:,:,SSP2index].copy()
+            # 3_IO_Buildings_UsePhase
+            ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[:,:,:,:,LEDindex]             = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[:,:,:,:,SSP2index].copy()
+        if 'nrb' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,:,:,:,LEDindex] = ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,:,:,:,SSP2index].copy()
+        S3Cache.Store('9')
     
     # 10) Set future vehicle reuse to 2015 levels if strategy is not included:
     # (To reflect that reuse is already happening to some extent.)
-    if ScriptConfig['Include_REStrategy_ReUse'] == 'False':
-        ParameterDict['6_PR_ReUse_Veh'].Values       = np.einsum('mprS,t->mprtS',ParameterDict['6_PR_ReUse_Veh'].Values[:,:,:,1,:],np.ones(Nt)) # stay at current levels, which are > 0.
+    if ScriptConfig['Include_REStrategy_ReUse'] == 'False' and not S3Cache.Load('10'):
+        if 'pav' in SectorList:
+            ParameterDict['6_PR_ReUse_Veh'].Values       = rf.BroadcastValues('mprS->mprtS',ParameterDict['6_PR_ReUse_Veh'].Values[:,:,:,1,:],{'t': Nt}) # stay at current levels, which are > 0.
         ParameterDict['6_PR_ReUse_Bld'].Values       = np.zeros(ParameterDict['6_PR_ReUse_Bld'].Values.shape) # set to zero, which corresponds to current levels.
         ParameterDict['6_PR_ReUse_nonresBld'].Values = np.zeros(ParameterDict['6_PR_ReUse_nonresBld'].Values.shape) # set to zero, which corresponds to current levels.
+        S3Cache.Store('10')
         
     # 11) MODEL CALIBRATION
-    # Calibrate vehicle kilometrage: No longer used! VKM is now calibrated in scenario target table process to deliver correct pC stock number for 2015.
-    #### ParameterDict['3_IO_Vehicles_UsePhase'].Values[3,:,:,:]                             = ParameterDict['3_IO_Vehicles_UsePhase'].Values[3,:,:,:]                           * np.einsum('r,tS->rtS',ParameterDict['6_PR_Calibration'].Values[0,:],np.ones((Nt,NS)))
-    # Calibrate vehicle fuel consumption, cgVnrS    
-    ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,3,:,:,:]        = ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,3,:,:,:]      * np.einsum('r,cgnS->cgnrS',ParameterDict['6_PR_Calibration'].Values[1,:],np.ones((115,Np,Nn,NS)))
-    # Calibrate res. building energy consumption
-    ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,0:3,:,:,:]      = ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,0:3,:,:,:]    * np.einsum('r,cgVnS->cgVnrS',ParameterDict['6_PR_Calibration'].Values[2,:],np.ones((115,NB,3,Nn,NS)))
-    # Calibrate nonres. building energy consumption
-    ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,0:3,:,:,:]   = ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,0:3,:,:,:] * np.einsum('r,cgVnS->cgVnrS',ParameterDict['6_PR_Calibration'].Values[3,:],np.ones((115,NN,3,Nn,NS)))
+    if not S3Cache.Load('11'):
+        # Calibrate vehicle kilometrage: No longer used! VKM is now calibrated in scenario target table process to deliver correct pC stock number for 2015.
+        #### ParameterDict['3_IO_Vehicles_UsePhase'].Values[3,:,:,:]                             = ParameterDict['3_IO_Vehicles_UsePhase'].Values[3,:,:,:]                           * np.einsum('r,tS->rtS',ParameterDict['6_PR_Calibration'].Values[0,:],np.ones((Nt,NS)))
+        # Calibrate vehicle fuel consumption, cgVnrS    
+        if 'pav' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,3,:,:,:]        = ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[0:115,:,3,:,:,:]      * np.einsum('r,cgnS->cgnrS',ParameterDict['6_PR_Calibration'].Values[1,:],np.ones((115,Np,Nn,NS)))
+        # Calibrate res. building energy consumption
+        if 'reb' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,0:3,:,:,:]      = ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[0:115,:,0:3,:,:,:]    * np.einsum('r,cgVnS->cgVnrS',ParameterDict['6_PR_Calibration'].Values[2,:],np.ones((115,NB,3,Nn,NS)))
+        # Calibrate nonres. building energy consumption
+        if 'nrb' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,0:3,:,:,:]   = ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[0:115,:,0:3,:,:,:] * np.einsum('r,cgVnS->cgVnrS',ParameterDict['6_PR_Calibration'].Values[3,:],np.ones((115,NN,3,Nn,NS)))
+        S3Cache.Store('11')
     
     # 12) No recycling scenario (counterfactual reference)
-    if ScriptConfig['IncludeRecycling'] == 'False': # no recycling and remelting
+    if ScriptConfig['IncludeRecycling'] == 'False' and not S3Cache.Load('12'): # no recycling and remelting
         ParameterDict['4_PY_EoL_RecoveryRate'].Values            = np.zeros(ParameterDict['4_PY_EoL_RecoveryRate'].Values.shape)
         ParameterDict['4_PY_MaterialProductionRemelting'].Values = np.zeros(ParameterDict['4_PY_MaterialProductionRemelting'].Values.shape)
+        S3Cache.Store('12')
         
     # 13) No energy efficiency improvements (counterfactual reference)
     # Freeze type split and archetypes at 2020 levels:
-    if ScriptConfig['No_EE_Improvements'] == 'True':
-        ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[Ind_2020::,:,:,:,:,:]    = np.einsum('pVnrS,c->cpVnrS',ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[Ind_2020,:,:,:,:,:],np.ones(Nc-Ind_2020))
-        ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[Ind_2020::,:,:,:,:,:]    = np.einsum('BVnrS,c->cBVnrS',ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[Ind_2020,:,:,:,:,:],np.ones(Nc-Ind_2020))
-        ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[Ind_2020::,:,:,:,:,:] = np.einsum('NVnrS,c->cNVnrS',ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[Ind_2020,:,:,:,:,:],np.ones(Nc-Ind_2020))
-        ParameterDict['3_MC_RECC_NonResBuildings_RECC'].Values[Ind_2020::,:,:,:,:]           = np.einsum('mNrS,c->cmNrS',ParameterDict['3_MC_RECC_NonResBuildings_RECC'].Values[Ind_2020,:,:,:,:],np.ones(Nc-Ind_2020))
-        ParameterDict['3_MC_RECC_Buildings_RECC'].Values[Ind_2020::,:,:,:,:]                 = np.einsum('mBrS,c->cmBrS',ParameterDict['3_MC_RECC_Buildings_RECC'].Values[Ind_2020,:,:,:,:],np.ones(Nc-Ind_2020))
-        ParameterDict['3_MC_RECC_Vehicles_RECC'].Values[Ind_2020::,:,:,:,:]                  = np.einsum('mprS,c->cmprS',ParameterDict['3_MC_RECC_Vehicles_RECC'].Values[Ind_2020,:,:,:,:],np.ones(Nc-Ind_2020))
-        ParameterDict['3_SHA_TypeSplit_Vehicles'].Values[:,:,:,:,4::]                        = np.einsum('GrRp,t->GrRpt',ParameterDict['3_SHA_TypeSplit_Vehicles'].Values[:,:,:,:,4],np.ones(Nt-4)) # index 4 is year 2020.
-        ParameterDict['3_SHA_TypeSplit_Buildings'].Values[:,:,4::,:]                         = np.einsum('BrS,t->BrtS',ParameterDict['3_SHA_TypeSplit_Buildings'].Values[:,:,4,:],np.ones(Nt-4)) # index 4 is year 2020.
-        ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values[:,:,4::,:]                   = np.einsum('NrS,t->NrtS',ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values[:,:,4,:],np.ones(Nt-4)) # index 4 is year 2020.
+    if ScriptConfig['No_EE_Improvements'] == 'True' and not S3Cache.Load('13'):
+        if 'pav' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[Ind_2020::,:,:,:,:,:]    = np.einsum('pVnrS,c->cpVnrS',ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[Ind_2020,:,:,:,:,:],np.ones(Nc-Ind_2020))
+            ParameterDict['3_MC_RECC_Vehicles_RECC'].Values[Ind_2020::,:,:,:,:]                  = np.einsum('mprS,c->cmprS',ParameterDict['3_MC_RECC_Vehicles_RECC'].Values[Ind_2020,:,:,:,:],np.ones(Nc-Ind_2020))
+            ParameterDict['3_SHA_TypeSplit_Vehicles'].Values[:,:,:,:,4::]                        = np.einsum('GrRp,t->GrRpt',ParameterDict['3_SHA_TypeSplit_Vehicles'].Values[:,:,:,:,4],np.ones(Nt-4)) # index 4 is year 2020.
+        if 'reb' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[Ind_2020::,:,:,:,:,:]    = np.einsum('BVnrS,c->cBVnrS',ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[Ind_2020,:,:,:,:,:],np.ones(Nc-Ind_2020))
+            ParameterDict['3_MC_RECC_Buildings_RECC'].Values[Ind_2020::,:,:,:,:]                 = np.einsum('mBrS,c->cmBrS',ParameterDict['3_MC_RECC_Buildings_RECC'].Values[Ind_2020,:,:,:,:],np.ones(Nc-Ind_2020))
+            ParameterDict['3_SHA_TypeSplit_Buildings'].Values[:,:,4::,:]                         = np.einsum('BrS,t->BrtS',ParameterDict['3_SHA_TypeSplit_Buildings'].Values[:,:,4,:],np.ones(Nt-4)) # index 4 is year 2020.
+        if 'nrb' in SectorList:
+            ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[Ind_2020::,:,:,:,:,:] = np.einsum('NVnrS,c->cNVnrS',ParameterDict['3_EI_Products_UsePhase_nonresbuildings'].Values[Ind_2020,:,:,:,:,:],np.ones(Nc-Ind_2020))
+            ParameterDict['3_MC_RECC_NonResBuildings_RECC'].Values[Ind_2020::,:,:,:,:]           = np.einsum('mNrS,c->cmNrS',ParameterDict['3_MC_RECC_NonResBuildings_RECC'].Values[Ind_2020,:,:,:,:],np.ones(Nc-Ind_2020))
+            ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values[:,:,4::,:]                   = np.einsum('NrS,t->NrtS',ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values[:,:,4,:],np.ones(Nt-4)) # index 4 is year 2020.
+        S3Cache.Store('13')
         
     # 14) Define parameter for future vehicle stock:
-    # a) calculated passenger vehicle stock
-    ParameterDict['2_S_RECC_FinalProducts_Future_passvehicles'] = msc.Parameter(Name='2_S_RECC_FinalProducts_Future_passvehicles', ID='2_S_RECC_FinalProducts_Future_passvehicles',
-                                                UUID=None, P_Res=None, MetaData=None,
-                                                Indices='StGr', Values=np.zeros((NS,Nt,NG,Nr)), Uncert=None,
-                                                Unit='cars per person')
-    # b) calculated vehicle kilometrage
-    ParameterDict['3_IO_Vehicles_UsePhase_eff'] = msc.Parameter(Name='3_IO_Vehicles_UsePhase_eff', ID='3_IO_Vehicles_UsePhase_eff',
-                                                UUID=None, P_Res=None, MetaData=None,
-                                                Indices='VrtS', Values=np.zeros((NV,Nr,Nt,NS)), Uncert=None,
-                                                Unit='km per vehicle')
+    if '14' in Section3Steps and not S3Cache.Load('14'):
+        # a) calculated passenger vehicle stock
+        ParameterDict['2_S_RECC_FinalProducts_Future_passvehicles'] = msc.Parameter(Name='2_S_RECC_FinalProducts_Future_passvehicles', ID='2_S_RECC_FinalProducts_Future_passvehicles',
+                                                    UUID=None, P_Res=None, MetaData=None,
+                                                    Indices='StGr', Values=np.zeros((NS,Nt,NG,Nr)), Uncert=None,
+                                                    Unit='cars per person')
+        # b) calculated vehicle kilometrage
+        ParameterDict['3_IO_Vehicles_UsePhase_eff'] = msc.Parameter(Name='3_IO_Vehicles_UsePhase_eff', ID='3_IO_Vehicles_UsePhase_eff',
+                                                    UUID=None, P_Res=None, MetaData=None,
+                                                    Indices='VrtS', Values=np.zeros((NV,Nr,Nt,NS)), Uncert=None,
+                                                    Unit='km per vehicle')
+        S3Cache.Store('14')
     
     # 15) Define parameter for future building stock:
-    # 3_IO changing over time:
-    ParameterDict['3_IO_Buildings_UsePhase'] = msc.Parameter(Name='3_IO_Buildings_UsePhase', ID='3_IO_Buildings_UsePhase',
-                                                UUID=None, P_Res=None, MetaData=None,
-                                                Indices='tcBVrS', Values=np.zeros((Nt,Nc,NB,NV,Nr,NS)), Uncert=None,
-                                                Unit='1')
-    # Historic age-cohorts:
-    # ParameterDict['3_IO_Buildings_UsePhase_Historic'] is a combination of climate and socioeconomic 3_IO determinants.
-    # We single out the former and keep them constant and let the socioeconomic factors change according to the '3_IO_Buildings_UsePhase_Future_...' parameters.
-    Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[0:Nc-Nt+1,:,Heating_loc,:,:] / np.einsum('rS,cB->cBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,0,:],np.ones((Nc-Nt+1,NB))) * 100
-    Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating[np.isnan(Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating)] = 0
-    ParameterDict['3_IO_Buildings_UsePhase'].Values[:,0:SwitchTime,:,Heating_loc,:,:]  = np.einsum('cBrS,t->tcBrS',Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating,np.ones(Nt))
-    Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW     = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[0:Nc-Nt+1,:,DomstHW_loc,:,:] / np.einsum('rS,cB->cBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,0,:],np.ones((Nc-Nt+1,NB))) * 100
-    Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW[np.isnan(Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW)] = 0
-    ParameterDict['3_IO_Buildings_UsePhase'].Values[:,0:SwitchTime,:,DomstHW_loc,:,:]  = np.einsum('cBrS,t->tcBrS',Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW,np.ones(Nt))
-    Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[0:Nc-Nt+1,:,Cooling_loc,:,:] / np.einsum('rS,cB->cBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Cooling'].Values[Sector_reb_loc,:,0,:],np.ones((Nc-Nt+1,NB))) * 100
-    Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling[np.isnan(Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling)] = 0
-    ParameterDict['3_IO_Buildings_UsePhase'].Values[:,0:SwitchTime,:,Cooling_loc,:,:]  = np.einsum('cBrS,t->tcBrS',Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling,np.ones(Nt))
-    # Future age-cohorts:
-    ParameterDict['3_IO_Buildings_UsePhase'].Values[:,SwitchTime::,:,Heating_loc,:,:] = np.einsum('rtS,cB->tcBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,:,:]/100,np.ones((Nc-SwitchTime,NB)))
-    ParameterDict['3_IO_Buildings_UsePhase'].Values[:,SwitchTime::,:,DomstHW_loc,:,:] = np.einsum('rtS,cB->tcBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,:,:]/100,np.ones((Nc-SwitchTime,NB)))
-    ParameterDict['3_IO_Buildings_UsePhase'].Values[:,SwitchTime::,:,Cooling_loc,:,:] = np.einsum('rtS,cB->tcBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Cooling'].Values[Sector_reb_loc,:,:,:]/100,np.ones((Nc-SwitchTime,NB)))
+    if '15' in Section3Steps and not S3Cache.Load('15'):
+        # 3_IO changing over time:
+        ParameterDict['3_IO_Buildings_UsePhase'] = msc.Parameter(Name='3_IO_Buildings_UsePhase', ID='3_IO_Buildings_UsePhase',
+                                                    UUID=None, P_Res=None, MetaData=None,
+                                                    Indices='tcBVrS', Values=np.zeros((Nt,Nc,NB,NV,Nr,NS)), Uncert=None,
+                                                    Unit='1')
+        # Historic age-cohorts:
+        # ParameterDict['3_IO_Buildings_UsePhase_Historic'] is a combination of climate and socioeconomic 3_IO determinants.
+        # We single out the former and keep them constant and let the socioeconomic factors change according to the '3_IO_Buildings_UsePhase_Future_...' parameters.
+        Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[0:Nc-Nt+1,:,Heating_loc,:,:] / np.einsum('rS,cB->cBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,0,:],np.ones((Nc-Nt+1,NB))) * 100
+        Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating[np.isnan(Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating)] = 0
+        ParameterDict['3_IO_Buildings_UsePhase'].Values[:,0:SwitchTime,:,Heating_loc,:,:]  = np.einsum('cBrS,t->tcBrS',Par_3_IO_Buildings_UsePhase_Historic_Climate_Heating,np.ones(Nt))
+        Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW     = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[0:Nc-Nt+1,:,DomstHW_loc,:,:] / np.einsum('rS,cB->cBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,0,:],np.ones((Nc-Nt+1,NB))) * 100
+        Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW[np.isnan(Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW)] = 0
+        ParameterDict['3_IO_Buildings_UsePhase'].Values[:,0:SwitchTime,:,DomstHW_loc,:,:]  = np.einsum('cBrS,t->tcBrS',Par_3_IO_Buildings_UsePhase_Historic_Climate_DHW,np.ones(Nt))
+        Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling = ParameterDict['3_IO_Buildings_UsePhase_Historic'].Values[0:Nc-Nt+1,:,Cooling_loc,:,:] / np.einsum('rS,cB->cBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Cooling'].Values[Sector_reb_loc,:,0,:],np.ones((Nc-Nt+1,NB))) * 100
+        Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling[np.isnan(Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling)] = 0
+        ParameterDict['3_IO_Buildings_UsePhase'].Values[:,0:SwitchTime,:,Cooling_loc,:,:]  = np.einsum('cBrS,t->tcBrS',Par_3_IO_Buildings_UsePhase_Historic_Climate_Cooling,np.ones(Nt))
+        # Future age-cohorts:
+        ParameterDict['3_IO_Buildings_UsePhase'].Values[:,SwitchTime::,:,Heating_loc,:,:] = np.einsum('rtS,cB->tcBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,:,:]/100,np.ones((Nc-SwitchTime,NB)))
+        ParameterDict['3_IO_Buildings_UsePhase'].Values[:,SwitchTime::,:,DomstHW_loc,:,:] = np.einsum('rtS,cB->tcBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Heating'].Values[Sector_reb_loc,:,:,:]/100,np.ones((Nc-SwitchTime,NB)))
+        ParameterDict['3_IO_Buildings_UsePhase'].Values[:,SwitchTime::,:,Cooling_loc,:,:] = np.einsum('rtS,cB->tcBrS',ParameterDict['3_IO_Buildings_UsePhase_Future_Cooling'].Values[Sector_reb_loc,:,:,:]/100,np.ones((Nc-SwitchTime,NB)))
+        S3Cache.Store('15')
     
     # 16) Compile parameter for building energy conversion efficiency:
-    ParameterDict['4_TC_ResidentialEnergyEfficiency'] = msc.Parameter(Name='4_TC_ResidentialEnergyEfficiency', ID='4_TC_ResidentialEnergyEfficiency',
-                                                UUID=None, P_Res=None, MetaData=None,
-                                                Indices='VRrntS', Values=np.zeros((NV,NR,Nr,Nn,Nt,NS)), Uncert=None,
-                                                Unit='1')
-    ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values                                   = np.einsum('VRrn,tS->VRrntS',ParameterDict['4_TC_ResidentialEnergyEfficiency_Default'].Values[:,:,:,:,0],np.ones((Nt,NS)))
-    ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values[Heating_loc,:,:,Electric_loc,:,:] = ParameterDict['4_TC_ResidentialEnergyEfficiency_Scenario_Heating'].Values[Heating_loc,:,:,Electric_loc,:,:] / 100
-    ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values[Cooling_loc,:,:,Electric_loc,:,:] = ParameterDict['4_TC_ResidentialEnergyEfficiency_Scenario_Cooling'].Values[Cooling_loc,:,:,Electric_loc,:,:] / 100
-    ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values[DomstHW_loc,:,:,Electric_loc,:,:] = ParameterDict['4_TC_ResidentialEnergyEfficiency_Scenario_Heating'].Values[DomstHW_loc,:,:,Electric_loc,:,:] / 100
+    if '16' in Section3Steps and not S3Cache.Load('16'):
+        ParameterDict['4_TC_ResidentialEnergyEfficiency'] = msc.Parameter(Name='4_TC_ResidentialEnergyEfficiency', ID='4_TC_ResidentialEnergyEfficiency',
+                                                    UUID=None, P_Res=None, MetaData=None,
+                                                    Indices='VRrntS', Values=np.zeros((NV,NR,Nr,Nn,Nt,NS)), Uncert=None,
+                                                    Unit='1')
+        ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values                                   = np.einsum('VRrn,tS->VRrntS',ParameterDict['4_TC_ResidentialEnergyEfficiency_Default'].Values[:,:,:,:,0],np.ones((Nt,NS)))
+        ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values[Heating_loc,:,:,Electric_loc,:,:] = ParameterDict['4_TC_ResidentialEnergyEfficiency_Scenario_Heating'].Values[Heating_loc,:,:,Electric_loc,:,:] / 100
+        ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values[Cooling_loc,:,:,Electric_loc,:,:] = ParameterDict['4_TC_ResidentialEnergyEfficiency_Scenario_Cooling'].Values[Cooling_loc,:,:,Electric_loc,:,:] / 100
+        ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values[DomstHW_loc,:,:,Electric_loc,:,:] = ParameterDict['4_TC_ResidentialEnergyEfficiency_Scenario_Heating'].Values[DomstHW_loc,:,:,Electric_loc,:,:] / 100
+        S3Cache.Store('16')
     
     # 17) Derive energy supply multipliers for buildings for future age-cohorts
     # From energy carrier split and conversion efficiency, the multipliers converting 1 MJ of final building energy demand into different energy carriers are determined.
-    ParameterDict['3_SHA_EnergySupply_Buildings'] = msc.Parameter(Name='3_SHA_EnergySupply_Buildings', ID='3_SHA_EnergySupply_Buildings',
-                                                UUID=None, P_Res=None, MetaData=None,
-                                                Indices='VRrntS', Values=np.zeros((NV,NR,Nr,Nn,Nt,NS)), Uncert=None,
-                                                Unit='1')
-    Divisor = ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values #VRrntS
-    ParameterDict['3_SHA_EnergySupply_Buildings'].Values = np.divide(np.einsum('VRrnt,S->VRrntS',ParameterDict['3_SHA_EnergyCarrierSplit_Buildings'].Values, np.ones(NS)), Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
-    SHA_EnergySupply_Buildings_Sum_n = np.einsum('VRrntS->VRrtS',ParameterDict['3_SHA_EnergySupply_Buildings'].Values).copy()
-    Divisor = np.einsum('VRrtS,n->VRrntS',SHA_EnergySupply_Buildings_Sum_n,np.ones(Nn)) # The following division happens twice! (cf. model docu)
-    ParameterDict['3_SHA_EnergySupply_Buildings'].Values = np.divide(ParameterDict['3_SHA_EnergySupply_Buildings'].Values, Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
-    ParameterDict['3_SHA_EnergySupply_Buildings'].Values = np.divide(ParameterDict['3_SHA_EnergySupply_Buildings'].Values, Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
+    if '17' in Section3Steps and not S3Cache.Load('17'):
+        ParameterDict['3_SHA_EnergySupply_Buildings'] = msc.Parameter(Name='3_SHA_EnergySupply_Buildings', ID='3_SHA_EnergySupply_Buildings',
+                                                    UUID=None, P_Res=None, MetaData=None,
+                                                    Indices='VRrntS', Values=np.zeros((NV,NR,Nr,Nn,Nt,NS)), Uncert=None,
+                                                    Unit='1')
+        Divisor = ParameterDict['4_TC_ResidentialEnergyEfficiency'].Values #VRrntS
+        ParameterDict['3_SHA_EnergySupply_Buildings'].Values = np.divide(np.einsum('VRrnt,S->VRrntS',ParameterDict['3_SHA_EnergyCarrierSplit_Buildings'].Values, np.ones(NS)), Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
+        SHA_EnergySupply_Buildings_Sum_n = np.einsum('VRrntS->VRrtS',ParameterDict['3_SHA_EnergySupply_Buildings'].Values).copy()
+        Divisor = np.einsum('VRrtS,n->VRrntS',SHA_EnergySupply_Buildings_Sum_n,np.ones(Nn)) # The following division happens twice! (cf. model docu)
+        ParameterDict['3_SHA_EnergySupply_Buildings'].Values = np.divide(ParameterDict['3_SHA_EnergySupply_Buildings'].Values, Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
+        ParameterDict['3_SHA_EnergySupply_Buildings'].Values = np.divide(ParameterDict['3_SHA_EnergySupply_Buildings'].Values, Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
+        S3Cache.Store('17')
     
     # 18) Make sure that all share parameters are non-negative and add up to 100%:
     # not necessary as data fulfil constraints.
@@ -702,40 +841,37 @@ def main():
     #ParameterDict['3_SHA_TypeSplit_Buildings'].Values[np.isnan(ParameterDict['3_SHA_TypeSplit_Buildings'].Values)] = 0
     
     # 19) Extrapolate appliances beyond 2050:
-    for noS in range(0,NS):
-        for noR in range(0,NR):
-            for noa in range(0,Na):
-                if ParameterDict['1_F_RECC_FinalProducts_appliances'].Values[0,140,noS,noR,noa] != 0:
-                    growthrate = (ParameterDict['1_F_RECC_FinalProducts_appliances'].Values[0,150,noS,noR,noa]/ParameterDict['1_F_RECC_FinalProducts_appliances'].Values[0,140,noS,noR,noa]-1)/10
-                else:
-                    growthrate = 0
-                for noT in range(151,161):
-                    ParameterDict['1_F_RECC_FinalProducts_appliances'].Values[0,noT,noS,noR,noa] = ParameterDict['1_F_RECC_FinalProducts_appliances'].Values[0,150,noS,noR,noa] * np.power(1+growthrate,noT-150)
+    if '19' in Section3Steps and not S3Cache.Load('19'):
+        # Growth rate 2040-2050 is continued until 2060, for all scenarios, RCPs, and appliances at once (zero growth where the 2040 value is zero):
+        rf.ExtrapolateTimeSeries(ParameterDict['1_F_RECC_FinalProducts_appliances'].Values, 1, 150, np.arange(151,161), RefPos = 140)
+        S3Cache.Store('19')
         
     # 20) GWP_bio factor interpolation
-    Idx_Time = [1900,1910,1920,1930,1940,1950,1960,1970,1980,1990,2000]
-    Idx_Time_Rel = [i -1900 for i in Idx_Time]
-    tnew = np.linspace(0, 100, num=101, endpoint=True)
-    f2 = interp1d(Idx_Time_Rel, ParameterDict['6_MIP_GWP_Bio'].Values[Idx_Time_Rel].copy(), kind='linear')
-    ParameterDict['6_MIP_GWP_Bio'].Values = np.zeros((300))
-    ParameterDict['6_MIP_GWP_Bio'].Values[0:101] = f2(tnew).copy()    
-    ParameterDict['6_MIP_GWP_Bio'].Values[101::] = -1
+    if not S3Cache.Load('20'):
+        Idx_Time = [1900,1910,1920,1930,1940,1950,1960,1970,1980,1990,2000]
+        Idx_Time_Rel = [i -1900 for i in Idx_Time]
+        tnew = np.linspace(0, 100, num=101, endpoint=True)
+        GWP_Bio_New = rf.InterpolateTimeSeries(ParameterDict['6_MIP_GWP_Bio'].Values, Idx_Time_Rel, tnew)
+        ParameterDict['6_MIP_GWP_Bio'].Values = np.zeros((300))
+        ParameterDict['6_MIP_GWP_Bio'].Values[0:101] = GWP_Bio_New.copy()    
+        ParameterDict['6_MIP_GWP_Bio'].Values[101::] = -1
+        S3Cache.Store('20')
         
     # 21) calculate Stocks on 1. Jan 2016:    
     pC_AgeCohortHist           = np.zeros((NG,Nr))
     #pC_FutureStock             = np.zeros((NS,NG,Nr))
     # a) from historic data:
-    Stocks_2016_passvehicles   = ParameterDict['2_S_RECC_FinalProducts_2015_passvehicles'].Values[0,:,:,:].sum(axis=0)
-    pCStocks_2016_passvehicles = np.einsum('pr,r->rp',Stocks_2016_passvehicles,1/ParameterDict['2_P_RECC_Population_SSP_32R'].Values[0,0,:,1]) 
-    Stocks_2016_resbuildings   = ParameterDict['2_S_RECC_FinalProducts_2015_resbuildings'].Values[0,:,:,:].sum(axis=0)
-    pCStocks_2016_resbuildings = np.einsum('Br,r->rB',Stocks_2016_resbuildings,1/ParameterDict['2_P_RECC_Population_SSP_32R'].Values[0,0,:,1]) 
-    Stocks_2016_nresbuildings  = ParameterDict['2_S_RECC_FinalProducts_2015_nonresbuildings'].Values[0,:,:,:].sum(axis=0)
-    pCStocks_2016_nresbuildings= np.einsum('Nr,r->rN',Stocks_2016_nresbuildings,1/ParameterDict['2_P_RECC_Population_SSP_32R'].Values[0,0,:,1]) 
     if 'pav' in SectorList:
+        Stocks_2016_passvehicles   = ParameterDict['2_S_RECC_FinalProducts_2015_passvehicles'].Values[0,:,:,:].sum(axis=0)
+        pCStocks_2016_passvehicles = np.einsum('pr,r->rp',Stocks_2016_passvehicles,1/ParameterDict['2_P_RECC_Population_SSP_32R'].Values[0,0,:,1]) 
         pC_AgeCohortHist[Sector_pav_loc, :] = pCStocks_2016_passvehicles.sum(axis =1)
     if 'reb' in SectorList:
+        Stocks_2016_resbuildings   = ParameterDict['2_S_RECC_FinalProducts_2015_resbuildings'].Values[0,:,:,:].sum(axis=0)
+        pCStocks_2016_resbuildings = np.einsum('Br,r->rB',Stocks_2016_resbuildings,1/ParameterDict['2_P_RECC_Population_SSP_32R'].Values[0,0,:,1]) 
         pC_AgeCohortHist[Sector_reb_loc, :] = pCStocks_2016_resbuildings.sum(axis =1)
     if 'nrb' in SectorList:    
+        Stocks_2016_nresbuildings  = ParameterDict['2_S_RECC_FinalProducts_2015_nonresbuildings'].Values[0,:,:,:].sum(axis=0)
+        pCStocks_2016_nresbuildings= np.einsum('Nr,r->rN',Stocks_2016_nresbuildings,1/ParameterDict['2_P_RECC_Population_SSP_32R'].Values[0,0,:,1]) 
         pC_AgeCohortHist[Sector_nrb_loc, :] = pCStocks_2016_nresbuildings.sum(axis =1)
     OutputDict['pC_AgeCohortHist']   = pC_AgeCohortHist.copy()
     # b) from future stock curves:
@@ -817,18 +953,63 @@ def main():
     BiogenicCO2WasteCombustion       = np.zeros((Nt,NS,NR))
     
     NegInflowFlags                   = np.zeros((NG,NS,NR))
-    time_dsm                         = np.arange(0,Nc,1) # time array of [0:Nc) needed for some sectors
+    MassBalance_Abs                  = np.zeros((NS,NR)) # total absolute mass balance deviation, Mt
+    # Precision policy, optional config entry 'StorageDtype' (float64 or float32, default: float64): dtype in which the large tensors are stored: 
+    # survival functions, S_7, dS_7, F_7_8, and element composition of the products in the current year Par_3_MC_Stock_ByElement_Nr.Current. All calculations and totals are float64.
+    # Runs with float32 storage are checked against the float64 reference run of the same model setup, with the relative tolerance 'PrecisionTolerance' (default: 1e-4).
+    StorageDtype                     = np.dtype(ScriptConfig.get('StorageDtype','float64'))
+    if StorageDtype not in [np.dtype('float32'), np.dtype('float64')]:
+        raise AssertionError('Fatal: StorageDtype must be float32 or float64.')
+    # Survival functions are computed for all products and regions of a sector at once and looked up in a cache shared by all scenarios and model runs, 
+    # optional config entries 'SFCacheSize': number of survival function arrays kept in memory, 
+    # 'SFThreshold' and 'SFMaxAge': survival functions are only stored up to the maximal age with survival above the threshold, and up to the maximal age (0: exact survival functions).
+    SFCache                          = rf.SurvivalFunctionCache(os.path.join(ParCachePath,'RECC_SurvivalFunctions'), int(float(ScriptConfig.get('SFCacheSize',16))),
+                                                                float(ScriptConfig.get('SFThreshold',0)), int(float(ScriptConfig.get('SFMaxAge',0))), StorageDtype)
     
     ExitFlags = {} # Exit flags for individual model runs
     #  Examples for testing
     #mS = 1
     #mR = 1
     
+    # The scenario loop can run in parallel worker processes, optional config entry 'ScenarioWorkers' (default: 1, serial; 0: one worker per CPU core).
+    # Each worker computes one scenario on a copy-on-write view of all model data and returns its slice [...,mS,mR] of the result arrays, see rf.ScenarioPool.
+    NoScenarioWorkers = int(float(ScriptConfig.get('ScenarioWorkers',1)))
+    if NoScenarioWorkers == 0:
+        NoScenarioWorkers = os.cpu_count()
+    # Result arrays, with scenario indices mS and mR as last two dimensions, their slices [...,mS,mR] are returned by the worker processes.
+    # A worker process that writes to the slice [...,mS,mR] of another local array with these dimensions fails, such arrays must be added here:
+    ScenarioResults   = {'GWP_System_3579di': GWP_System_3579di, 'GWP_UsePhase_7d': GWP_UsePhase_7d, 'GWP_OtherThanUsePhaseDirect': GWP_OtherThanUsePhaseDirect, 'GWP_Materials_3di_9di': GWP_Materials_3di_9di,
+                         'GWP_Vehicles_Direct': GWP_Vehicles_Direct, 'GWP_ReBuildgs_Direct': GWP_ReBuildgs_Direct, 'GWP_NRBuildgs_Direct': GWP_NRBuildgs_Direct, 'GWP_NRBuildgs_Direct_g': GWP_NRBuildgs_Direct_g,
+                         'GWP_Vehicles_indir': GWP_Vehicles_indir, 'GWP_AllBuildings_indir': GWP_AllBuildings_indir, 'GWP_Manufact_5di_all': GWP_Manufact_5di_all, 'GWP_WasteMgt_9di_all': GWP_WasteMgt_9di_all,
+                         'GWP_PrimaryMaterial_3di': GWP_PrimaryMaterial_3di, 'GWP_PrimaryMaterial_3di_m': GWP_PrimaryMaterial_3di_m, 'GWP_SecondaryMetal_di_m': GWP_SecondaryMetal_di_m, 'GWP_UsePhase_7i_Scope2_El': GWP_UsePhase_7i_Scope2_El,
+                         'GWP_UsePhase_7i_OtherIndir': GWP_UsePhase_7i_OtherIndir, 'GWP_MaterialCycle_5di_9di': GWP_MaterialCycle_5di_9di, 'GWP_RecyclingCredit': GWP_RecyclingCredit, 'GWP_ForestCO2Uptake': GWP_ForestCO2Uptake,
+                         'GWP_EnergyRecoveryWasteWood': GWP_EnergyRecoveryWasteWood, 'GWP_ByEnergyCarrier_UsePhase_d': GWP_ByEnergyCarrier_UsePhase_d, 'GWP_ByEnergyCarrier_UsePhase_i': GWP_ByEnergyCarrier_UsePhase_i, 'Material_Inflow': Material_Inflow,
+                         'Scrap_Outflow': Scrap_Outflow, 'PrimaryProduction': PrimaryProduction, 'SecondaryProduct': SecondaryProduct, 'SecondaryExport': SecondaryExport,
+                         'RenovationMaterialInflow_7': RenovationMaterialInflow_7, 'Element_Material_Composition': Element_Material_Composition, 'Element_Material_Composition_raw': Element_Material_Composition_raw, 'Element_Material_Composition_con': Element_Material_Composition_con,
+                         'Manufacturing_Output': Manufacturing_Output, 'NegInflowFlags': NegInflowFlags, 'FabricationScrap': FabricationScrap, 'EnergyCons_UP_Vh': EnergyCons_UP_Vh,
+                         'EnergyCons_UP_Bd': EnergyCons_UP_Bd, 'EnergyCons_UP_Mn': EnergyCons_UP_Mn, 'EnergyCons_UP_Wm': EnergyCons_UP_Wm, 'EnergyCons_UP_Service': EnergyCons_UP_Service,
+                         'EnergyCons_total': EnergyCons_total, 'StockCurves_Totl': StockCurves_Totl, 'StockCurves_Prod': StockCurves_Prod, 'StockCurves_Mat': StockCurves_Mat,
+                         'Inflow_Prod': Inflow_Prod, 'Inflow_Prod_r': Inflow_Prod_r, 'Outflow_Prod': Outflow_Prod, 'EoL_Products_for_WasteMgt': EoL_Products_for_WasteMgt,
+                         'Outflow_Materials_Usephase_all': Outflow_Materials_Usephase_all, 'Outflow_Products_Usephase_all': Outflow_Products_Usephase_all, 'WasteMgtLosses_To_Landfill': WasteMgtLosses_To_Landfill, 'Population': Population,
+                         'pCStocksCurves': pCStocksCurves, 'Vehicle_km': Vehicle_km, 'ReUse_Materials': ReUse_Materials, 'Carbon_Wood_Inflow': Carbon_Wood_Inflow,
+                         'Carbon_Wood_Outflow': Carbon_Wood_Outflow, 'Carbon_Wood_Stock': Carbon_Wood_Stock, 'Vehicle_FuelEff': Vehicle_FuelEff, 'ResBuildng_EnergyCons': ResBuildng_EnergyCons,
+                         'GWP_bio_Credit': GWP_bio_Credit, 'EnergyRecovery_WoodCombustion_EL': EnergyRecovery_WoodCombustion_EL, 'BiogenicCO2WasteCombustion': BiogenicCO2WasteCombustion, 'MassBalance_Abs': MassBalance_Abs}
+    # Parameters written for individual scenarios in the loop and read for other scenarios or after the loop, their changes are returned by the worker processes:
+    ScenarioLoopPars  = ['2_S_RECC_FinalProducts_Future_passvehicles','2_S_RECC_FinalProducts_Future_resbuildings','2_S_RECC_FinalProducts_Future_NonResBuildings',
+                         '3_IO_Vehicles_UsePhase_eff','3_MC_RECC_Buildings_t']
+    # Parameters that the loop re-computes in each iteration before they are read, their changes remain local to the worker processes:
+    ScenarioScratchPars = ['6_PR_CarSharingShare','6_PR_RideSharingShare','3_LT_RECC_ProductLifetime_resbuildings',
+                           '3_EI_Products_UsePhase_resbuildings_t','3_EI_Products_UsePhase_nonresbuildings_t']
+    # All other parameters must not be changed in the scenario loop, a worker process that changes them fails.
+    ScenarioPool      = rf.ScenarioPool(NoScenarioWorkers, Mylog, ScenarioResults, ParameterDict, ScenarioLoopPars, ScenarioScratchPars, {'ExitFlags': ExitFlags, 'OutputDict': OutputDict})
+    
     # Select and loop over scenarios
     for mS in range(0,NS):
         for mR in range(0,NR):
-            SName = IndexTable.loc['Scenario'].Classification.Items[mS]
-            RName = IndexTable.loc['Scenario_RCP'].Classification.Items[mR]
+            if not ScenarioPool.Dispatch(mS, mR, mS == NS-1 and mR == NR-1, locals()): # scenario is computed by a worker process
+                continue
+            SName = Dims.Items['Scenario'][mS]
+            RName = Dims.Items['Scenario_RCP'][mR]
             Mylog.info('_')
             Mylog.info('Computing RECC model for SSP scenario ' + SName + ' and RE scenario ' + RName + '.')
             
@@ -843,7 +1024,7 @@ def main():
                                         Time_Start=Model_Time_Start,
                                         Time_End=Model_Time_End,
                                         IndexTable=IndexTable,
-                                        Elements=IndexTable.loc['Element'].Classification.Items,
+                                        Elements=Dims.Items['Element'],
                                         Graphical=None)
                                   
             # Check Validity of index tables:
@@ -1064,8 +1245,25 @@ def main():
                                                      Indices = 't,o,m,e', Values=None, Uncert=None,
                                                      ID=None, UUID=None)
             
+            # The use phase stock S_7, its change dS_7, the outflow F_7_8, and the re-use F_8_17 can only be non-zero for the age-cohorts from the oldest cohort with historic stock to the current year.
+            # Only these cohort windows and the element layers in ElementsResolved are stored, and these variables are excluded from the initialization with empty arrays.
+            # For the other elements, the sums over regions and materials are stored for each age-cohort and product, so that the mass balance covers all elements.
+            # The sums over all age-cohorts (mass balance and result export) are computed window by window with CohortWindowArray.Sum. Reads of several years, e.g., Values[:,:,:,Sector_pav_rge,:,0], return dense arrays of the selection.
+            StockKeys     = list(RECC_System.StockDict.keys())
+            FlowKeys      = list(RECC_System.FlowDict.keys())
+            CohortWindow_Stocks = {Key: RECC_System.StockDict.pop(Key) for Key in ['S_7','dS_7']}
+            CohortWindow_Flows  = {Key: RECC_System.FlowDict.pop(Key)  for Key in ['F_7_8','F_8_17']}
             RECC_System.Initialize_StockValues() # Assign empty arrays to stocks according to dimensions.
             RECC_System.Initialize_FlowValues()  # Assign empty arrays to flows according to dimensions.
+            CohortStart_7 = Nc - Nt # 2015 age-cohort
+            for HistStock in ['2_S_RECC_FinalProducts_2015_passvehicles','2_S_RECC_FinalProducts_2015_resbuildings','2_S_RECC_FinalProducts_2015_nonresbuildings']:
+                CohortStart_7 = min([CohortStart_7] + list(np.nonzero(RECC_System.ParameterDict[HistStock].Values[0,:,:,:].any(axis=(1,2)))[0]))
+            for CohortWindow_Var in list(CohortWindow_Stocks.values()) + list(CohortWindow_Flows.values()):
+                CohortWindow_Var.Values = rf.CohortWindowArray(Dims.Shape(CohortWindow_Var.Indices.replace(',','')), CohortStart_7, np.arange(Nc-Nt+1,Nc+1), StorageDtype, ElementsResolved, (2,4)) # for the other elements, the sums over r and m are stored
+            CohortWindow_Stocks.update(RECC_System.StockDict)
+            CohortWindow_Flows.update(RECC_System.FlowDict)
+            RECC_System.StockDict = {Key: CohortWindow_Stocks[Key] for Key in StockKeys} # original order of stocks and flows
+            RECC_System.FlowDict  = {Key: CohortWindow_Flows[Key]  for Key in FlowKeys}
             
             ##########################################################
             #    Section 5) Solve dynamic MFA model for RECC         #
@@ -1106,8 +1304,6 @@ def main():
             if 'pav' in SectorList:
                 Mylog.info('Calculate inflows and outflows for use phase, passenger vehicles.')
                 # 1) Determine kilometrage endogenously and apply stock-driven model
-                SF_Array                    = np.zeros((Nc,Nc,Np,Nr)) # survival functions, by year, age-cohort, good, and region. PDFs are stored externally because recreating them with scipy.stats is slow.
-                
                 #Get historic stock at end of 2015 by age-cohort, and covert unit to Vehicles: million.
                 TotalStock_UsePhase_Hist_cpr = RECC_System.ParameterDict['2_S_RECC_FinalProducts_2015_passvehicles'].Values[0,:,:,:]
                 
@@ -1119,34 +1315,18 @@ def main():
                 if ScriptConfig['Include_REStrategy_RideSharing'] == 'False': # set ride-sharing to zero.                
                     RECC_System.ParameterDict['6_PR_RideSharingShare'].Values = np.zeros(RECC_System.ParameterDict['6_PR_RideSharingShare'].Values.shape)
     
-                # i) Calculate pc stocks in the four subdivisions: CaS, RiS, CaS+RiS, none:
-                Total_Vehicle_km_pav_tr_pC          = np.zeros((Nt,Nr))
-                TotalStockCurves_UsePhase_p_pC_test = np.zeros((Nt,Nr)) 
-                for nrr in range(0,Nr):
-                    for ntt in range(0,Nt):            
-                        s0        = (1 - RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,ntt,mS] / 100)*(1 - RECC_System.ParameterDict['6_PR_RideSharingShare'].Values[Sector_pav_loc,nrr,ntt,mS] / 100) \
-                                  * Total_Service_pav_tr_pC[ntt,nrr] /(RECC_System.ParameterDict['6_MIP_VehicleOccupancyRate'].Values[Sector_pav_loc,nrr,ntt,mS] * RECC_System.ParameterDict['3_IO_Vehicles_UsePhase'].Values[Service_Drivg,nrr,ntt,mS])
-                        s_CaS     = (RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,ntt,mS] / 100)*(1 - RECC_System.ParameterDict['6_PR_RideSharingShare'].Values[Sector_pav_loc,nrr,ntt,mS] / 100) \
-                                  * Total_Service_pav_tr_pC[ntt,nrr] /(RECC_System.ParameterDict['6_MIP_VehicleOccupancyRate'].Values[Sector_pav_loc,nrr,ntt,mS] * RECC_System.ParameterDict['3_IO_Vehicles_UsePhase'].Values[Service_Drivg,nrr,ntt,mS]) \
-                                  * (RECC_System.ParameterDict['6_MIP_CarSharing_Stock'].Values[mS,nrr])
-                        s_RiS     = (1 - RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,ntt,mS] / 100)*(RECC_System.ParameterDict['6_PR_RideSharingShare'].Values[Sector_pav_loc,nrr,ntt,mS] / 100) \
-                                  * Total_Service_pav_tr_pC[ntt,nrr] /(RECC_System.ParameterDict['6_MIP_VehicleOccupancyRate'].Values[Sector_pav_loc,nrr,ntt,mS] * RECC_System.ParameterDict['3_IO_Vehicles_UsePhase'].Values[Service_Drivg,nrr,ntt,mS]) \
-                                  / (RECC_System.ParameterDict['6_MIP_RideSharing_Occupancy'].Values[mS,nrr])
-                        s_CaS_RiS = (RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,ntt,mS] / 100)*(RECC_System.ParameterDict['6_PR_RideSharingShare'].Values[Sector_pav_loc,nrr,ntt,mS] / 100) \
-                                  * Total_Service_pav_tr_pC[ntt,nrr] /(RECC_System.ParameterDict['6_MIP_VehicleOccupancyRate'].Values[Sector_pav_loc,nrr,ntt,mS] * RECC_System.ParameterDict['3_IO_Vehicles_UsePhase'].Values[Service_Drivg,nrr,ntt,mS]) \
-                                  / (RECC_System.ParameterDict['6_MIP_RideSharing_Occupancy'].Values[mS,nrr] / RECC_System.ParameterDict['6_MIP_CarSharing_Stock'].Values[mS,nrr])
-    
-                        s_total   = s0.copy() + s_CaS.copy() + s_RiS.copy() + s_CaS_RiS.copy()
-                        TotalStockCurves_UsePhase_p_pC_test[ntt,nrr] = s_total.copy()
-                        TotalStockCurves_UsePhase_p_pC_test[np.isnan(TotalStockCurves_UsePhase_p_pC_test)] = 0 # ignore drive technologies where there is no stock.
-    
-                        # ii) Calculate average vehicle kilometrage and average occupancy rate:
-                        vkm       = ((s0 + s_RiS) + (s_CaS + s_CaS_RiS) / RECC_System.ParameterDict['6_MIP_CarSharing_Stock'].Values[mS,nrr]) * RECC_System.ParameterDict['3_IO_Vehicles_UsePhase'].Values[Service_Drivg,nrr,ntt,mS].copy() / s_total
-                        Total_Vehicle_km_pav_tr_pC[ntt,nrr] = vkm.copy()
-                        # Overwrite predefined values by internally calculated vehicle-km:
-                        RECC_System.ParameterDict['3_IO_Vehicles_UsePhase_eff'].Values[Service_Drivg,nrr,ntt,mS] = Total_Vehicle_km_pav_tr_pC[ntt,nrr]
-                        #ocr       = Total_Service_pav_tr_pC[ntt,nrr] / (s_total * vkm)
-                        
+                # i) Calculate pc stocks in the four subdivisions: CaS, RiS, CaS+RiS, none, for all years and regions at once:
+                # ii) Calculate average vehicle kilometrage (the average occupancy rate would be Total_Service_pav_tr_pC / (s_total * vkm)):
+                TotalStockCurves_UsePhase_p_pC_test, Total_Vehicle_km_pav_tr_pC = rf.PassengerVehicleStock(Total_Service_pav_tr_pC,
+                                                      RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,:,mS][:,np.newaxis],
+                                                      RECC_System.ParameterDict['6_PR_RideSharingShare'].Values[Sector_pav_loc,:,:,mS].transpose(),
+                                                      RECC_System.ParameterDict['6_MIP_VehicleOccupancyRate'].Values[Sector_pav_loc,:,:,mS].transpose(),
+                                                      RECC_System.ParameterDict['3_IO_Vehicles_UsePhase'].Values[Service_Drivg,:,:,mS].transpose(),
+                                                      RECC_System.ParameterDict['6_MIP_CarSharing_Stock'].Values[mS,:],
+                                                      RECC_System.ParameterDict['6_MIP_RideSharing_Occupancy'].Values[mS,:])
+                # Overwrite predefined values by internally calculated vehicle-km:
+                RECC_System.ParameterDict['3_IO_Vehicles_UsePhase_eff'].Values[Service_Drivg,:,:,mS] = Total_Vehicle_km_pav_tr_pC.transpose()
+
                 RECC_System.ParameterDict['3_IO_Vehicles_UsePhase_eff'].Values[np.isnan(RECC_System.ParameterDict['3_IO_Vehicles_UsePhase_eff'].Values)] = 0
                 # iii) Make sure that for no scenario, stock values are below LED values, which is assumed to be the lowest possible stock level.         
                 # This needs to be made sure during the scenario framing process! Here, only the accounting and model equations to convert PKM to VKM and stock are executed, no further checks are made.
@@ -1159,10 +1339,8 @@ def main():
                 Par_RECC_ProductLifetime_p = np.einsum('c,pr->prc',np.ones((Nc)),RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_passvehicles'].Values)
                 # Second, adjust lifetime if car-sharing is present
                 if ScriptConfig['Include_REStrategy_CarSharing'] == 'True': # adjust lifetime of future age-cohorts.
-                    for npp in range(0,Np):
-                        for nrr in range(0,Nr):
-                            for ntt in range(0,Nt):
-                                Par_RECC_ProductLifetime_p[npp,nrr,ntt+SwitchTime-1] = (1 - RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,ntt,mS]/100 + RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,ntt,mS] * RECC_System.ParameterDict['6_MIP_CarSharing_Stock'].Values[mS,nrr]/100) * Par_RECC_ProductLifetime_p[npp,nrr,ntt+SwitchTime-1]
+                    Par_RECC_ProductLifetime_p[:,:,SwitchTime-1::] = rf.CarSharingLifetimeFactor(RECC_System.ParameterDict['6_PR_CarSharingShare'].Values[Sector_pav_loc,0,:,mS],
+                                                                                                  RECC_System.ParameterDict['6_MIP_CarSharing_Stock'].Values[mS,:]).transpose()[np.newaxis,:,:] * Par_RECC_ProductLifetime_p[:,:,SwitchTime-1::]
                             
                 # Include_REStrategy_LifeTimeExtension: Product lifetime extension.
                 # Third, change lifetime of future age-cohorts according to lifetime extension parameter
@@ -1171,40 +1349,30 @@ def main():
                 
                 # 2) Dynamic stock model
                 # Build pdf array from lifetime distribution: Probability of survival.
-                for p in tqdm(range(0, Np), unit=' vehicles types'):
-                    for r in range(0, Nr):
-                        LifeTimes = Par_RECC_ProductLifetime_p[p, r, :]
-                        lt = {'Type'  : 'Normal',
-                              'Mean'  : LifeTimes,
-                              'StdDev': 0.5 * LifeTimes} # flat decline: obsolescence of 16 % in 3 years around mean lifetime.
-                        SF_Array[:, :, p, r] = dsm.DynamicStockModel(t=np.arange(0, Nc, 1), lt=lt).compute_sf().copy()
-                        np.fill_diagonal(SF_Array[:, :, p, r],1) # no outflows from current year, this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
-                        # Those parts of the stock remain in use instead.
+                SF_Array = SFCache.Get(Par_RECC_ProductLifetime_p, 0.5) # flat decline: obsolescence of 16 % in 3 years around mean lifetime.
+                # survival functions, by year, age-cohort, good, and region, with diagonal set to 1: no outflows from current year, this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
+                # Those parts of the stock remain in use instead.
         
-                # Compute evolution of 2015 in-use stocks: initial stock evolution separately from future stock demand and stock-driven model
-                for r in range(0,Nr):   
-                    FutureStock                 = np.zeros((Nc))
-                    FutureStock[SwitchTime::]   = TotalStockCurves_UsePhase_p[1::, r].copy() # Future total stock
-                    InitialStock                = TotalStock_UsePhase_Hist_cpr[:,:,r].copy()
-                    InitialStocksum             = InitialStock.sum()
-                    StockMatch_2015[Sector_pav_loc,r] = TotalStockCurves_UsePhase_p[0, r]/InitialStocksum
-                    SFArrayCombined             = SF_Array[:,:,:,r]
-                    TypeSplit                   = np.zeros((Nc,Np))
-                    TypeSplit[SwitchTime::,:]   = RECC_System.ParameterDict['3_SHA_TypeSplit_Vehicles'].Values[Sector_pav_loc,r,mR,:,1::].transpose() # indices: cp
-                    
-                    RECC_dsm                    = dsm.DynamicStockModel(t=np.arange(0,Nc,1), s=FutureStock.copy(), lt = lt)  # The lt parameter is not used, the sf array is handed over directly in the next step.   
-                    Var_S, Var_O, Var_I, IFlags = RECC_dsm.compute_stock_driven_model_initialstock_typesplit_negativeinflowcorrect(SwitchTime,InitialStock,SFArrayCombined,TypeSplit,NegativeInflowCorrect = True)
-                    
-                    # Below, the results are added with += because the different commodity groups (buildings, vehicles) are calculated separately
-                    # to introduce the type split for each, but using the product resolution of the full model with all sectors.
-                    Stock_Detail_UsePhase_p[0,:,:,r]     += InitialStock.copy() # cgr, needed for correct calculation of mass balance later.
-                    Stock_Detail_UsePhase_p[1::,:,:,r]   += Var_S[SwitchTime::,:,:].copy() # tcpr
-                    Outflow_Detail_UsePhase_p[1::,:,:,r] += Var_O[SwitchTime::,:,:].copy() # tcpr
-                    Inflow_Detail_UsePhase_p[1::,:,r]    += Var_I[SwitchTime::,:].copy() # tpr
-                    Inflow_Prod_r[1::,r,Sector_pav_rge,mS,mR] = Var_I[SwitchTime::,:].copy()
-                    # Check for negative inflows:
-                    if IFlags.sum() != 0:
-                        NegInflowFlags[Sector_pav_loc,mS,mR] = 1 # flag this scenario
+                # Compute evolution of 2015 in-use stocks: initial stock evolution separately from future stock demand and stock-driven model, for all regions at once
+                FutureStock                 = np.zeros((Nc,Nr))
+                FutureStock[SwitchTime::,:] = TotalStockCurves_UsePhase_p[1::,:].copy() # Future total stock
+                InitialStock                = TotalStock_UsePhase_Hist_cpr.copy()
+                StockMatch_2015[Sector_pav_loc,:] = TotalStockCurves_UsePhase_p[0,:]/np.einsum('cpr->r',InitialStock)
+                TypeSplit                   = np.zeros((Nc,Np,Nr))
+                TypeSplit[SwitchTime::,:,:] = np.einsum('rpt->tpr',RECC_System.ParameterDict['3_SHA_TypeSplit_Vehicles'].Values[Sector_pav_loc,:,mR,:,1::]) # indices: tpr
+                
+                Var_S, Var_O, Var_I, IFlags = rf.StockDrivenModel(SwitchTime,FutureStock,InitialStock,SF_Array,TypeSplit,NegativeInflowCorrect = True) # indices: tcpr, tcpr, tpr, tr
+                
+                # Below, the results are added with += because the different commodity groups (buildings, vehicles) are calculated separately
+                # to introduce the type split for each, but using the product resolution of the full model with all sectors.
+                Stock_Detail_UsePhase_p[0,:,:,:]     += InitialStock # cgr, needed for correct calculation of mass balance later.
+                Stock_Detail_UsePhase_p[1::,:,:,:]   += Var_S[SwitchTime::,:,:,:] # tcpr
+                Outflow_Detail_UsePhase_p[1::,:,:,:] += Var_O[SwitchTime::,:,:,:] # tcpr
+                Inflow_Detail_UsePhase_p[1::,:,:]    += Var_I[SwitchTime::,:,:] # tpr
+                Inflow_Prod_r[1::,:,Sector_pav_rge,mS,mR] = np.einsum('tpr->trp',Var_I[SwitchTime::,:,:])
+                # Check for negative inflows:
+                if IFlags.sum() != 0:
+                    NegInflowFlags[Sector_pav_loc,mS,mR] = 1 # flag this scenario
         
                 # Here so far: Units: Vehicles: million. for stocks, X/yr for flows.
                 StockCurves_Totl[:,Sector_pav_loc,mS,mR] = TotalStockCurves_UsePhase_p.sum(axis =1).copy()
@@ -1218,7 +1386,6 @@ def main():
             if 'reb' in SectorList:
                 Mylog.info('Calculate inflows and outflows for use phase, residential buildings.')
                 # 1) Determine total stock and apply stock-driven model
-                SF_Array                    = np.zeros((Nc,Nc,NB,Nr)) # survival functions, by year, age-cohort, good, and region. PDFs are stored externally because recreating them with scipy.stats is slow.
                 
                 #Get historic stock at end of 2015 by age-cohort, and covert unit to Buildings: million m2.
                 TotalStock_UsePhase_Hist_cBr = RECC_System.ParameterDict['2_S_RECC_FinalProducts_2015_resbuildings'].Values[0,:,:,:]
@@ -1232,6 +1399,7 @@ def main():
                     # Calculate counter-factual scenario: X% decrease of stock levels by 2050 compared to scenario reference. X coded in parameter ..._MIUPotential
                     if SName != 'LED':
                         RemainingFraction = 1-RECC_System.ParameterDict['2_S_RECC_FinalProducts_Future_resbuildings_MIUPotential'].Values[Sector_reb_loc,0,mS] / 100
+                        from scipy.interpolate import make_interp_spline # only required for the more intense use strategy
                         #clamped_spline = make_interp_spline(np.arange(0,Nt,1), MIURamp, bc_type=([(2, 0)], [(1, 0)]))
                         clamped_spline = make_interp_spline([0,2,Nt-5,Nt], [1,1,RemainingFraction,RemainingFraction], bc_type=([(2, 0)], [(1, 0)]))
                         MIURamp_Spline = clamped_spline(np.arange(0,Nt,1))
@@ -1272,40 +1440,29 @@ def main():
     
                 # 3) Dynamic stock model, with lifetime depending on age-cohort.
                 # Build pdf array from lifetime distribution: Probability of survival.
-                for B in tqdm(range(0, NB), unit=' res. building types'):
-                    for r in range(0, Nr):
-                        LifeTimes = Par_RECC_ProductLifetime_B[B, r, :]
-                        lt = {'Type'  : 'Normal',
-                              'Mean'  : LifeTimes,
-                              'StdDev': 0.3 * LifeTimes}
-                        SF_Array[:, :, B, r] = dsm.DynamicStockModel(t=np.arange(0, Nc, 1), lt=lt).compute_sf().copy()
-                        np.fill_diagonal(SF_Array[:, :, B, r],1) # no outflows from current year, 
-                        # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
-                        # Those parts of the stock remain in use instead.
+                SF_Array = SFCache.Get(Par_RECC_ProductLifetime_B, 0.3) # survival functions, by year, age-cohort, good, and region, with diagonal set to 1: no outflows from current year, 
+                # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
+                # Those parts of the stock remain in use instead.
         
-                # Compute evolution of 2015 in-use stocks: initial stock evolution separately from future stock demand and stock-driven model
-                for r in range(0,Nr):   
-                    FutureStock                 = np.zeros((Nc))
-                    FutureStock[SwitchTime::]   = TotalStockCurves_UsePhase_B[1::, r].copy()# Future total stock
-                    InitialStock                = TotalStock_UsePhase_Hist_cBr[:,:,r].copy()
-                    InitialStocksum             = InitialStock.sum()
-                    StockMatch_2015[Sector_reb_loc,r] = TotalStockCurves_UsePhase_B[0, r]/InitialStocksum
-                    SFArrayCombined             = SF_Array[:,:,:,r]
-                    TypeSplit                   = np.zeros((Nc,NB))
-                    TypeSplit[SwitchTime::,:]   = RECC_System.ParameterDict['3_SHA_TypeSplit_Buildings'].Values[:,r,1::,mS].transpose() # indices: Bc
-                    
-                    RECC_dsm                    = dsm.DynamicStockModel(t=np.arange(0,Nc,1), s=FutureStock.copy(), lt = lt)  # The lt parameter is not used, the sf array is handed over directly in the next step.   
-                    Var_S, Var_O, Var_I, IFlags = RECC_dsm.compute_stock_driven_model_initialstock_typesplit_negativeinflowcorrect(SwitchTime,InitialStock,SFArrayCombined,TypeSplit,NegativeInflowCorrect = True)
-                    
-                    # Below, the results are added with += because the different commodity groups (buildings, vehicles) are calculated separately
-                    # to introduce the type split for each, but using the product resolution of the full model with all sectors.
-                    Stock_Detail_UsePhase_B[0,:,:,r]     += InitialStock.copy() # cgr, needed for correct calculation of mass balance later.
-                    Stock_Detail_UsePhase_B[1::,:,:,r]   += Var_S[SwitchTime::,:,:].copy() # tcBr
-                    Outflow_Detail_UsePhase_B[1::,:,:,r] += Var_O[SwitchTime::,:,:].copy() # tcBr
-                    Inflow_Detail_UsePhase_B[1::,:,r]    += Var_I[SwitchTime::,:].copy() # tBr
-                    # Check for negative inflows:
-                    if IFlags.sum() != 0:
-                        NegInflowFlags[Sector_reb_loc,mS,mR] = 1 # flag this scenario
+                # Compute evolution of 2015 in-use stocks: initial stock evolution separately from future stock demand and stock-driven model, for all regions at once
+                FutureStock                 = np.zeros((Nc,Nr))
+                FutureStock[SwitchTime::,:] = TotalStockCurves_UsePhase_B[1::,:].copy() # Future total stock
+                InitialStock                = TotalStock_UsePhase_Hist_cBr.copy()
+                StockMatch_2015[Sector_reb_loc,:] = TotalStockCurves_UsePhase_B[0,:]/np.einsum('cBr->r',InitialStock)
+                TypeSplit                   = np.zeros((Nc,NB,Nr))
+                TypeSplit[SwitchTime::,:,:] = np.einsum('Brt->tBr',RECC_System.ParameterDict['3_SHA_TypeSplit_Buildings'].Values[:,:,1::,mS]) # indices: tBr
+                
+                Var_S, Var_O, Var_I, IFlags = rf.StockDrivenModel(SwitchTime,FutureStock,InitialStock,SF_Array,TypeSplit,NegativeInflowCorrect = True) # indices: tcBr, tcBr, tBr, tr
+                
+                # Below, the results are added with += because the different commodity groups (buildings, vehicles) are calculated separately
+                # to introduce the type split for each, but using the product resolution of the full model with all sectors.
+                Stock_Detail_UsePhase_B[0,:,:,:]     += InitialStock # cgr, needed for correct calculation of mass balance later.
+                Stock_Detail_UsePhase_B[1::,:,:,:]   += Var_S[SwitchTime::,:,:,:] # tcBr
+                Outflow_Detail_UsePhase_B[1::,:,:,:] += Var_O[SwitchTime::,:,:,:] # tcBr
+                Inflow_Detail_UsePhase_B[1::,:,:]    += Var_I[SwitchTime::,:,:] # tBr
+                # Check for negative inflows:
+                if IFlags.sum() != 0:
+                    NegInflowFlags[Sector_reb_loc,mS,mR] = 1 # flag this scenario
         
                 # Here so far: Units: Buildings: million m². for stocks, X/yr for flows.
                 StockCurves_Totl[:,Sector_reb_loc,mS,mR] = TotalStockCurves_UsePhase_B.sum(axis =1).copy()
@@ -1333,7 +1490,6 @@ def main():
             if 'nrb' in SectorList:
                 Mylog.info('Calculate inflows and outflows for use phase, nonresidential buildings.')
                 # 1) Determine total stock and apply stock-driven model
-                SF_Array                    = np.zeros((Nc,Nc,NN,Nr)) # survival functions, by year, age-cohort, good, and region. PDFs are stored externally because recreating them with scipy.stats is slow.
                 
                 #Get historic stock at end of 2015 by age-cohort, and covert unit to nonres Buildings: million m2.
                 TotalStock_UsePhase_Hist_cNr = RECC_System.ParameterDict['2_S_RECC_FinalProducts_2015_nonresbuildings'].Values[0,:,:,:]
@@ -1347,6 +1503,7 @@ def main():
                     # Calculate counter-factual scenario: X% decrease of stock levels by 2050 compared to scenario reference. X coded in parameter ..._MIUPotential
                     if SName != 'LED':
                         RemainingFraction = 1-RECC_System.ParameterDict['2_S_RECC_FinalProducts_Future_nonresbuildings_MIUPotential'].Values[Sector_nrb_loc,0,mS] / 100
+                        from scipy.interpolate import make_interp_spline # only required for the more intense use strategy
                         #clamped_spline = make_interp_spline(np.arange(0,Nt,1), MIURamp, bc_type=([(2, 0)], [(1, 0)]))
                         clamped_spline = make_interp_spline([0,2,Nt-5,Nt], [1,1,RemainingFraction,RemainingFraction], bc_type=([(2, 0)], [(1, 0)]))
                         MIURamp_Spline = clamped_spline(np.arange(0,Nt,1))
@@ -1383,40 +1540,29 @@ def main():
       
                 # 3) Dynamic stock model, with lifetime depending on age-cohort.
                 # Build pdf array from lifetime distribution: Probability of survival.
-                for N in tqdm(range(0, NN), unit=' nonres. building types'):
-                    for r in range(0, Nr):
-                        LifeTimes = Par_RECC_ProductLifetime_N[N, r, :]
-                        lt = {'Type'  : 'Normal',
-                              'Mean'  : LifeTimes,
-                              'StdDev': 0.3 * LifeTimes}
-                        SF_Array[:, :, N, r] = dsm.DynamicStockModel(t=np.arange(0, Nc, 1), lt=lt).compute_sf().copy()
-                        np.fill_diagonal(SF_Array[:, :, N, r],1) # no outflows from current year, 
-                        # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
-                        # Those parts of the stock remain in use instead.
+                SF_Array = SFCache.Get(Par_RECC_ProductLifetime_N, 0.3) # survival functions, by year, age-cohort, good, and region, with diagonal set to 1: no outflows from current year, 
+                # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
+                # Those parts of the stock remain in use instead.
         
-                # Compute evolution of 2015 in-use stocks: initial stock evolution separately from future stock demand and stock-driven model
-                for r in range(0,Nr):   
-                    FutureStock                 = np.zeros((Nc))
-                    FutureStock[SwitchTime::]   = TotalStockCurves_UsePhase_N[1::, r].copy()# Future total stock
-                    InitialStock                = TotalStock_UsePhase_Hist_cNr[:,:,r].copy()
-                    InitialStocksum             = InitialStock.sum()
-                    StockMatch_2015[Sector_nrb_loc,r] = TotalStockCurves_UsePhase_N[0, r]/InitialStocksum
-                    SFArrayCombined             = SF_Array[:,:,:,r]
-                    TypeSplit                   = np.zeros((Nc,NN))
-                    TypeSplit[SwitchTime::,:]   = RECC_System.ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values[:,r,1::,mS].transpose() # indices: Nc
-                    
-                    RECC_dsm                    = dsm.DynamicStockModel(t=np.arange(0,Nc,1), s=FutureStock.copy(), lt = lt)  # The lt parameter is not used, the sf array is handed over directly in the next step.   
-                    Var_S, Var_O, Var_I, IFlags = RECC_dsm.compute_stock_driven_model_initialstock_typesplit_negativeinflowcorrect(SwitchTime,InitialStock,SFArrayCombined,TypeSplit,NegativeInflowCorrect = True)
-                    
-                    # Below, the results are added with += because the different commodity groups (buildings, vehicles) are calculated separately
-                    # to introduce the type split for each, but using the product resolution of the full model with all sectors.
-                    Stock_Detail_UsePhase_N[0,:,:,r]     += InitialStock.copy() # cgr, needed for correct calculation of mass balance later.
-                    Stock_Detail_UsePhase_N[1::,:,:,r]   += Var_S[SwitchTime::,:,:].copy() # tcNr
-                    Outflow_Detail_UsePhase_N[1::,:,:,r] += Var_O[SwitchTime::,:,:].copy() # tcNr
-                    Inflow_Detail_UsePhase_N[1::,:,r]    += Var_I[SwitchTime::,:].copy() # tNr
-                    # Check for negative inflows:
-                    if IFlags.sum() != 0:
-                        NegInflowFlags[Sector_nrb_loc,mS,mR] = 1 # flag this scenario
+                # Compute evolution of 2015 in-use stocks: initial stock evolution separately from future stock demand and stock-driven model, for all regions at once
+                FutureStock                 = np.zeros((Nc,Nr))
+                FutureStock[SwitchTime::,:] = TotalStockCurves_UsePhase_N[1::,:].copy() # Future total stock
+                InitialStock                = TotalStock_UsePhase_Hist_cNr.copy()
+                StockMatch_2015[Sector_nrb_loc,:] = TotalStockCurves_UsePhase_N[0,:]/np.einsum('cNr->r',InitialStock)
+                TypeSplit                   = np.zeros((Nc,NN,Nr))
+                TypeSplit[SwitchTime::,:,:] = np.einsum('Nrt->tNr',RECC_System.ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values[:,:,1::,mS]) # indices: tNr
+                
+                Var_S, Var_O, Var_I, IFlags = rf.StockDrivenModel(SwitchTime,FutureStock,InitialStock,SF_Array,TypeSplit,NegativeInflowCorrect = True) # indices: tcNr, tcNr, tNr, tr
+                
+                # Below, the results are added with += because the different commodity groups (buildings, vehicles) are calculated separately
+                # to introduce the type split for each, but using the product resolution of the full model with all sectors.
+                Stock_Detail_UsePhase_N[0,:,:,:]     += InitialStock # cgr, needed for correct calculation of mass balance later.
+                Stock_Detail_UsePhase_N[1::,:,:,:]   += Var_S[SwitchTime::,:,:,:] # tcNr
+                Outflow_Detail_UsePhase_N[1::,:,:,:] += Var_O[SwitchTime::,:,:,:] # tcNr
+                Inflow_Detail_UsePhase_N[1::,:,:]    += Var_I[SwitchTime::,:,:] # tNr
+                # Check for negative inflows:
+                if IFlags.sum() != 0:
+                    NegInflowFlags[Sector_nrb_loc,mS,mR] = 1 # flag this scenario
         
                 # Here so far: Units: Buildings: million m2. for stocks, X/yr for flows.
                 StockCurves_Totl[:,Sector_nrb_loc,mS,mR] = TotalStockCurves_UsePhase_N.sum(axis =1).copy()
@@ -1438,29 +1584,17 @@ def main():
             # Sector: Nonresidential buildings, global total
             if 'nrbg' in SectorList:
                 Mylog.info('Calculate inflows and outflows for use phase, nonresidential buildings.')
-                SF_Array = np.zeros((Nc,Nc,NN,No)) # survival functions, by year, age-cohort, good, and region. PDFs are stored externally because recreating them with scipy.stats is slow.            
+                SF_Array = SFCache.Get(RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_nonresbuildings_g'].Values, 0.3) # survival functions, by year, age-cohort, good, and region, with diagonal set to 1: no outflows from current year, 
+                # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known. Those parts of the stock remain in use instead.
                 s_nrbg   = RECC_System.ParameterDict['2_S_RECC_FinalProducts_nonresbuildings_g'].Values[:,:]  ### dimensions: 'Nt'
     
-                for N in tqdm(range(0, NN), unit='Mm²'):
-                    for o in range(0, No):
-                        # First, replicate lifetimes for all age-cohorts
-                        LifeTimes_nrbg = RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_nonresbuildings_g'].Values[N,o,:] # Dimensions: 'Not'
-                        lt = {'Type'  : 'Normal',
-                              'Mean'  : LifeTimes_nrbg, 
-                              'StdDev': 0.3 * LifeTimes_nrbg}
-                # Compute evolution of nrbg in-use stock and related flows with stock-driven model
-       
-                        RECC_dsm_nrbg            = dsm.DynamicStockModel(time_dsm, s = s_nrbg[N,:].copy(), lt = lt)     
-                        SF_Array[:, :, N, o]     = RECC_dsm_nrbg.compute_sf().copy()                             
-                        np.fill_diagonal(SF_Array[:, :, N, o],1) # no outflows from current year, this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
-                        # Those parts of the stock remain in use instead.
-                        RECC_dsm_nrbg.sf         = SF_Array[:, :, N, o].copy()
-                        
-                        nrbg_sc, nrbg_oc, nrbg_i = RECC_dsm_nrbg.compute_stock_driven_model(NegativeInflowCorrect = False) # Unit: Mm²
-                        
-                        Stock_Detail_UsePhase_Ng[:,:,N,o]        = nrbg_sc[SwitchTime-1::,:].copy() # index structure: tcNo. Unit: million m².
-                        Outflow_Detail_UsePhase_Ng[1::,:,N,o]    = nrbg_oc[SwitchTime::,:].copy()   # index structure: tcNo. Unit: million m².
-                        Inflow_Detail_UsePhase_Ng[1::,N,o]       = nrbg_i[SwitchTime::].copy()      # index structure: tNo.  Unit: million m².     
+                # Compute evolution of nrbg in-use stock and related flows with stock-driven model, for all building types N and regions o at once (single type per stock, no initial stock):
+                nrbg_sc, nrbg_oc, nrbg_i, nrbg_f = rf.StockDrivenModel(0, np.einsum('Nt,o->tNo',s_nrbg,np.ones(No)).reshape(Nc,NN*No), np.zeros((Nc,1,NN*No)), 
+                                                                       SF_Array.Reshape((1,NN*No)), np.ones((Nc,1,NN*No)), NegativeInflowCorrect = False) # Unit: Mm²
+                
+                Stock_Detail_UsePhase_Ng[:,:,:,:]        = nrbg_sc[SwitchTime-1::,:,0,:].reshape(Nt,Nc,NN,No) # index structure: tcNo. Unit: million m².
+                Outflow_Detail_UsePhase_Ng[1::,:,:,:]    = nrbg_oc[SwitchTime::,:,0,:].reshape(Nt-1,Nc,NN,No) # index structure: tcNo. Unit: million m².
+                Inflow_Detail_UsePhase_Ng[1::,:,:]       = nrbg_i[SwitchTime::,0,:].reshape(Nt-1,NN,No)       # index structure: tNo.  Unit: million m².     
                         
                 # Here so far: Units: Buildings: million m2. for stocks, Mm² for flows.
                 StockCurves_Totl[:,Sector_nrbg_loc,mS,mR] = np.einsum('tcNo->t', Stock_Detail_UsePhase_Ng).copy()
@@ -1474,7 +1608,6 @@ def main():
                 Mylog.info('Calculate inflows and outflows for use phase, industry.')
                 # 1) Determine total stock and apply stock-driven model
                 
-                SF_Array                    = np.zeros((Nc,Nc,NI,Nl)) # survival functions, by year, age-cohort, good, and region. PDFs are stored externally because recreating them with scipy.stats is slow.
                 i_Inflow_ind = RECC_System.ParameterDict['1_F_RECC_FinalProducts_industry'].Values[:,:,:,:,:]                     ### dimensions: rSRpt of TotalFutureInflow_UsePhase_ind
            
                 # Include_REStrategy_LifeTimeExtension: Product lifetime extension.
@@ -1483,36 +1616,19 @@ def main():
         
                 # Dynamic stock model
                 # Build pdf array from lifetime distribution: Probability of survival.
-                RECC_dsm_ind_s_c        = np.zeros((Nl,NS,NR,NI,Nc,Nc))
-                RECC_dsm_ind_s_c_o_c    = np.zeros((Nl,NS,NR,NI,Nc,Nc))
-                RECC_dsm_ind_o          = np.zeros((Nl,NS,NR,NI,Nc))
+                SF_Array                = SFCache.Get(Par_RECC_ProductLifetime_ind, 0.3) # survival functions, by year, age-cohort, good, and region, with diagonal set to 1: no outflows from current year, 
+                # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known. Those parts of the stock remain in use instead.
                 Inflow                  = np.zeros((Nt,Nl,NI))
                 
                 TotalStockCurves_UsePhase_I = np.zeros((Nt,NI,Nl))
     
-                for I in tqdm(range(0, NI), unit='EGT types'):
-                    for l in range(0, Nl):
-                                LifeTimes = Par_RECC_ProductLifetime_ind[I, l, :]
-                            
-                                lt = {'Type'  : 'Normal',
-                                      'Mean'  : LifeTimes,
-                                      'StdDev': 0.3 * LifeTimes}
-                # Compute inflow-driven model
-                                RECC_dsm_ind                         = dsm.DynamicStockModel(time_dsm , i = i_Inflow_ind[l,mS,mR,I,:].copy()  , lt = lt)
-                                SF_Array[:, :, I, l]                 = dsm.DynamicStockModel(time_dsm , i = Inflow  , lt = lt).compute_sf().copy()  # The lt parameter is not used, the sf array is handed over directly in the next step.   
-                                np.fill_diagonal(SF_Array[:, :, I, l],1) # no outflows from current year, this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
-                                # Those parts of the stock remain in use instead.
-                                
-                                RECC_dsm_ind.sf                      = SF_Array[:, :, I, l].copy()
-                                RECC_dsm_ind_s_c[l,mS,mR,I,:,:]      = RECC_dsm_ind.compute_s_c_inflow_driven()
-                                RECC_dsm_ind_s_c_o_c[l,mS,mR,I,:,:]  = RECC_dsm_ind.compute_o_c_from_s_c()
-                                RECC_dsm_ind_o[l,mS,mR,I,:]          = RECC_dsm_ind.compute_outflow_total()
-     
-                                Stock_Detail_UsePhase_I[:,:,I,l]     = RECC_dsm_ind_s_c[l,mS,mR,I,SwitchTime-1::,:]
-                                Outflow_Detail_UsePhase_I[:,:,I,l]   = RECC_dsm_ind_s_c_o_c[l,mS,mR,I,SwitchTime-1::,:]
-                                Outflow_Detail_UsePhase_I[0,:,I,l]   = 0 # no flow calculation in first year
-                                Inflow_Detail_UsePhase_I[:,I,l]      = i_Inflow_ind[l,mS,mR,I,SwitchTime-1::] # index structure: tIl
-                                Inflow_Detail_UsePhase_I[0,I,l]      = 0 # no flow calculation in first year
+                # Compute inflow-driven model, for all EGT types and regions at once
+                Var_S, Var_O = rf.InflowDrivenModel(np.einsum('lIc->cIl',i_Inflow_ind[:,mS,mR,:,:]), SF_Array) # indices: tcIl
+                Stock_Detail_UsePhase_I[:,:,:,:]     = Var_S[SwitchTime-1::,:,:,:]
+                Outflow_Detail_UsePhase_I[:,:,:,:]   = Var_O[SwitchTime-1::,:,:,:]
+                Outflow_Detail_UsePhase_I[0,:,:,:]   = 0 # no flow calculation in first year
+                Inflow_Detail_UsePhase_I[:,:,:]      = np.einsum('lIt->tIl',i_Inflow_ind[:,mS,mR,:,SwitchTime-1::]) # index structure: tIl
+                Inflow_Detail_UsePhase_I[0,:,:]      = 0 # no flow calculation in first year
             
             
                 TotalStockCurves_UsePhase_I[:,:,:] = Stock_Detail_UsePhase_I[:,:,:,:].sum(axis=1) 
@@ -1528,7 +1644,6 @@ def main():
             if 'app' in SectorList:            
                 Mylog.info('Calculate inflows and outflows for use phase, appliances.')
                 
-                SF_Array     = np.zeros((Nc,Nc,Na,No)) # survival functions, by year, age-cohort, good, and region. PDFs are stored externally because recreating them with scipy.stats is slow.
                 i_Inflow_app = RECC_System.ParameterDict['1_F_RECC_FinalProducts_appliances'].Values[:,:,:,:,:] # dimensions:ocSRa
             
                 Par_RECC_ProductLifetime_app = RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_appliances'].Values[:]
@@ -1542,36 +1657,17 @@ def main():
          
                 # Dynamic stock model
                 # Build pdf array from lifetime distribution: Probability of survival.
-                RECC_dsm_app_s_c        = np.zeros((No,NS,NR,Na,Nc,Nc))
-                RECC_dsm_app_s_c_o_c    = np.zeros((No,NS,NR,Na,Nc,Nc))
-                RECC_dsm_app_o          = np.zeros((No,NS,NR,Na,Nc))
-                            
+                SF_Array                = SFCache.Get(Par_RECC_ProductLifetime_app, 0.3) # survival functions, by year, age-cohort, good, and region, with diagonal set to 1: no outflows from current year, 
+                # this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known. Those parts of the stock remain in use instead.
                 TotalStockCurves_UsePhase_a = np.zeros((Nt,Na,Nl))
                 
-                for a in tqdm(range(0, Na), unit='App types'):
-                    for o in range(0, No):
-                        LifeTimes = Par_RECC_ProductLifetime_app[a, o, :]
-                    
-                        lt = {'Type'  : 'Normal',
-                              'Mean'  : LifeTimes,
-                              'StdDev': 0.3 * LifeTimes}
-      
-                # Compute inflow-driven model     
-                        RECC_dsm_app                         = dsm.DynamicStockModel(time_dsm , i = i_Inflow_app[o,:,mS,mR,a].copy()  , lt = lt)  
-                        SF_Array[:, :, a, o]                 = dsm.DynamicStockModel(time_dsm , i = i_Inflow_app[o,:,mS,mR,a].copy()  , lt = lt).compute_sf().copy() 
-                        np.fill_diagonal(SF_Array[:, :, a, o],1) # no outflows from current year, this would break the mass balance in the calculation routine below, as the element composition of the current year is not yet known.
-                        # Those parts of the stock remain in use instead.
-                                
-                        RECC_dsm_app.sf                      = SF_Array[:, :, a, o].copy()
-                        RECC_dsm_app_s_c[o,mS,mR,a,:,:]      = RECC_dsm_app.compute_s_c_inflow_driven()
-                        RECC_dsm_app_s_c_o_c[o,mS,mR,a,:,:]  = RECC_dsm_app.compute_o_c_from_s_c()
-                        RECC_dsm_app_o[o,mS,mR,a,:]          = RECC_dsm_app.compute_outflow_total()
-    
-                        Stock_Detail_UsePhase_a[:,:,a,o]     = RECC_dsm_app_s_c[o,mS,mR,a,SwitchTime-1::,:]
-                        Outflow_Detail_UsePhase_a[:,:,a,o]   = RECC_dsm_app_s_c_o_c[o,mS,mR,a,SwitchTime-1::,:]
-                        Outflow_Detail_UsePhase_a[0,:,a,o]   = 0 # no flow calculation in first year
-                        Inflow_Detail_UsePhase_a[:,a,o]      = i_Inflow_app[o,SwitchTime-1::,mS,mR,a] # index structure: tIl
-                        Inflow_Detail_UsePhase_a[0,a,o]      = 0 # no flow calculation in first year
+                # Compute inflow-driven model, for all appliance types and regions at once
+                Var_S, Var_O = rf.InflowDrivenModel(np.einsum('oca->cao',i_Inflow_app[:,:,mS,mR,:]), SF_Array) # indices: tcao
+                Stock_Detail_UsePhase_a[:,:,:,:]     = Var_S[SwitchTime-1::,:,:,:]
+                Outflow_Detail_UsePhase_a[:,:,:,:]   = Var_O[SwitchTime-1::,:,:,:]
+                Outflow_Detail_UsePhase_a[0,:,:,:]   = 0 # no flow calculation in first year
+                Inflow_Detail_UsePhase_a[:,:,:]      = np.einsum('ota->tao',i_Inflow_app[:,SwitchTime-1::,mS,mR,:]) # index structure: tao
+                Inflow_Detail_UsePhase_a[0,:,:]      = 0 # no flow calculation in first year
     
                 TotalStockCurves_UsePhase_a[:,:,:]           = Stock_Detail_UsePhase_a[:,:,:,:].sum(axis=1) 
                                 
@@ -1604,9 +1700,11 @@ def main():
             if 'nrb' in SectorList: 
                 Par_RECC_MC_Nr[:,:,Sector_nrb_rge,:,mS,:]      = np.einsum('cmNr,t->Ncmrt',RECC_System.ParameterDict['3_MC_RECC_NonResBuildings_RECC'].Values[:,:,:,:,mS],np.ones(Nt))
             Par_RECC_MC_Nl = np.zeros((Nc,Nm,NL,Nl,NS))          # for electricity generation technologies in kt/GW
-            Par_RECC_MC_Nl[:,:,Sector_ind_rge_reg,:,mS]        = np.einsum('lc,Im->Icml',np.ones((Nl,Nc)), RECC_System.ParameterDict['3_MC_RECC_industry'].Values[:,:])       #3_MC_RECC_industry has dimensions Im
+            if 'ind' in SectorList:
+                Par_RECC_MC_Nl[:,:,Sector_ind_rge_reg,:,mS]    = np.einsum('lc,Im->Icml',np.ones((Nl,Nc)), RECC_System.ParameterDict['3_MC_RECC_industry'].Values[:,:])       #3_MC_RECC_industry has dimensions Im
             Par_RECC_MC_No = np.zeros((Nc,Nm,NO,No,NS))          # for appliances in g/unit, nonres. buildings in kg/m²
-            Par_RECC_MC_No[:,:,Sector_app_rge_reg,:,mS]        = np.einsum('c,oOm->Ocmo',np.ones((Nc)), RECC_System.ParameterDict['3_MC_RECC_appliances'].Values[:,:,:])      #3_MC_RECC_appliances has dimensions oam
+            if 'app' in SectorList:
+                Par_RECC_MC_No[:,:,Sector_app_rge_reg,:,mS]    = np.einsum('c,oOm->Ocmo',np.ones((Nc)), RECC_System.ParameterDict['3_MC_RECC_appliances'].Values[:,:,:])      #3_MC_RECC_appliances has dimensions oam
             if 'nrbg' in SectorList:
                 Par_RECC_MC_No[:,:,Sector_nrbg_rge_reg,:,mS]       = np.einsum('c,o,mN->Ncmo',np.ones((Nc)), np.ones((No)), RECC_System.ParameterDict['3_MC_RECC_Nonresbuildings_g'].Values[:,:])  #3_MC_RECC_Nonresbuildings_g has dimensions mN
             # Units: Vehicles: kg/unit, Buildings: kg/m2  
@@ -1642,7 +1740,8 @@ def main():
             Divisor                 = 1-Par_FabYieldLoss_total
             Par_FabYield_total_inv  = np.divide(1, Divisor, out=np.zeros_like(Divisor), where=Divisor!=0) # mgto
             # Determine total element composition of products (c: age-cohort), needs to be updated for future age-cohorts, is done below after material cycle computation.
-            Par_3_MC_Stock_ByElement_Nr = np.einsum('cmgrt,cme->tcrgme',Par_RECC_MC_Nr[:,:,:,:,mS,:],Par_Element_Composition_of_Materials_m) # Unit: vehicles: kg/item, buildings: kg/m².
+            # Stored in factored form (material content and element composition of materials), the composition of the current year is in Par_3_MC_Stock_ByElement_Nr.Current (crgme).
+            Par_3_MC_Stock_ByElement_Nr = rf.ProductElementComposition(Par_RECC_MC_Nr[:,:,:,:,mS,:],Par_Element_Composition_of_Materials_m,StorageDtype) # Unit: vehicles: kg/item, buildings: kg/m².
             Par_3_MC_Stock_ByElement_Nl = np.einsum('cmLl,cme->clLme',Par_RECC_MC_Nl[:,:,:,:,mS],    Par_Element_Composition_of_Materials_m) # Unit: ind: kt/GW
             Par_3_MC_Stock_ByElement_No = np.einsum('cmOo,cme->coOme',Par_RECC_MC_No[:,:,:,:,mS],    Par_Element_Composition_of_Materials_m) # Unit: app: g/unit, nrbg: kg/m²
             # Consider EoL recovery rate improvement:
@@ -1662,13 +1761,18 @@ def main():
             # For Buildings, scenarios obtained from RES scaleup curves
             ReUseFactor_tmBrS = np.einsum('tmBr,S->tmBrS',np.einsum('tr,mBr->tmBr',RECC_System.ParameterDict['3_SHA_RECC_REStrategyScaleUp_r'].Values[:,:,mS,mR],RECC_System.ParameterDict['6_PR_ReUse_Bld'].Values),np.ones((NS)))
             ReUseFactor_tmNrS = np.einsum('tmNr,S->tmNrS',np.einsum('tr,mNr->tmNr',RECC_System.ParameterDict['3_SHA_RECC_REStrategyScaleUp_r'].Values[:,:,mS,mR],RECC_System.ParameterDict['6_PR_ReUse_nonresBld'].Values),np.ones((NS)))
+            # Sectors with re-use of materials (via components): goods and re-use factor (indices: tmgrS)
+            ReUseSectors = [(Sector_rge, ReUseFactor) for Sector, Sector_rge, ReUseFactor in [('pav',Sector_pav_rge,ReUseFactor_tmprS),('reb',Sector_reb_rge,ReUseFactor_tmBrS),('nrb',Sector_nrb_rge,ReUseFactor_tmNrS)] if Sector in SectorList]
             
             Mylog.info('Translate total flows into individual materials and elements, for 2015 and historic age-cohorts.')
             if 'pav' in SectorList:
                 # convert product stocks and flows to material stocks and flows, only for chemical element position 'all':
-                # Stock elemental composition, will be updated for future years:
-                RECC_System.StockDict['S_7'].Values[:,:,:,Sector_pav_rge,:,:] = \
-                np.einsum('tcrpme,tcpr->tcrpme',Par_3_MC_Stock_ByElement_Nr[:,:,:,Sector_pav_rge,:,:],Stock_Detail_UsePhase_p)/1000   # Indices='t,c,r,p,m,e'
+                # Stock elemental composition, will be updated for future years: all elements for year 0 and element position 'all' for all years (needed for the inflow below), 
+                # the other elements of the future years are computed in the material cycle loop.
+                RECC_System.StockDict['S_7'].Values[:,:,:,Sector_pav_rge,:,0] = \
+                Par_3_MC_Stock_ByElement_Nr.LayerProducts(Sector_pav_rge,0,Stock_Detail_UsePhase_p)/1000   # Indices='t,c,r,p,m'
+                RECC_System.StockDict['S_7'].Values[0,:,:,Sector_pav_rge,:,:] = \
+                Par_3_MC_Stock_ByElement_Nr.Products(Sector_pav_rge,Stock_Detail_UsePhase_p[0,:,:,:],0)/1000   # Indices='c,r,p,m,e'
                 # Outflow, 'all' elements only:
                 RECC_System.FlowDict['F_7_8'].Values[:,:,:,Sector_pav_rge,:,0] = \
                 np.einsum('pcmrt,tcpr->ptcrm',Par_RECC_MC_Nr[:,:,Sector_pav_rge,:,mS,:],Outflow_Detail_UsePhase_p)/1000 # all elements, Indices='t,c,r,p,m'
@@ -1682,25 +1786,31 @@ def main():
                     
             if 'reb' in SectorList:        
                 # convert product stocks and flows to material stocks and flows, only for chemical element position 'all':
-                # Stock elemental composition, historic for each element and for future years: 'all' elements only
-                RECC_System.StockDict['S_7'].Values[:,:,:,Sector_reb_rge,:,:] = \
-                np.einsum('tcrBme,tcBr->tcrBme',Par_3_MC_Stock_ByElement_Nr[:,:,:,Sector_reb_rge,:,:],Stock_Detail_UsePhase_B)/1000   # Indices='t,c,r,B,m'
+                # Stock elemental composition, historic for each element and for future years: 'all' elements only (read in the material cycle loop before the update)
+                RECC_System.StockDict['S_7'].Values[:,:,:,Sector_reb_rge,:,0] = \
+                Par_3_MC_Stock_ByElement_Nr.LayerProducts(Sector_reb_rge,0,Stock_Detail_UsePhase_B)/1000   # Indices='t,c,r,B,m'
+                RECC_System.StockDict['S_7'].Values[0,:,:,Sector_reb_rge,:,:] = \
+                Par_3_MC_Stock_ByElement_Nr.Products(Sector_reb_rge,Stock_Detail_UsePhase_B[0,:,:,:],0)/1000   # Indices='c,r,B,m,e'
                 # Outflow, 'all' elements only:
+                Par_3_MC_Stock_ByElement_reb_0 = Par_3_MC_Stock_ByElement_Nr.Layer(Sector_reb_rge,0) # Btcrm
                 RECC_System.FlowDict['F_7_8'].Values[:,:,:,Sector_reb_rge,:,0] = \
-                np.einsum('Btcrm,tcBr->Btcrm',Par_3_MC_Stock_ByElement_Nr[:,:,:,Sector_reb_rge,:,0],Outflow_Detail_UsePhase_B)/1000 # all elements, Indices='t,c,r,B,m'
+                np.einsum('Btcrm,tcBr->Btcrm',Par_3_MC_Stock_ByElement_reb_0,Outflow_Detail_UsePhase_B)/1000 # all elements, Indices='t,c,r,B,m'
                 # Inflow of renovation material as stock multiplied with change in material composition:
-                F_6_7_ren[1::,:,:,Sector_reb_rge,:,0]  = np.einsum('tcBr,Btcrm->Btcrm',Stock_Detail_UsePhase_B[1::,:,:,:],np.diff(Par_3_MC_Stock_ByElement_Nr[:,:,:,Sector_reb_rge,:,0],1,axis=1))/1000
+                F_6_7_ren[1::,:,:,Sector_reb_rge,:,0]  = np.einsum('tcBr,Btcrm->Btcrm',Stock_Detail_UsePhase_B[1::,:,:,:],np.diff(Par_3_MC_Stock_ByElement_reb_0,1,axis=1))/1000
                 # inflow of materials in new products
                 for mmt in range(0,Nt):
-                    F_6_7_new[mmt,:,Sector_reb_rge,:,0] = np.einsum('Br,Brm->Brm',Inflow_Detail_UsePhase_B[mmt,:,:],Par_3_MC_Stock_ByElement_Nr[mmt,SwitchTime+mmt-1,:,Sector_reb_rge,:,0])/1000
+                    F_6_7_new[mmt,:,Sector_reb_rge,:,0] = np.einsum('Br,Brm->Brm',Inflow_Detail_UsePhase_B[mmt,:,:],Par_3_MC_Stock_ByElement_reb_0[:,mmt,SwitchTime+mmt-1,:,:])/1000
+                del Par_3_MC_Stock_ByElement_reb_0
                 # Check_reb = (RECC_System.FlowDict['F_6_7'].Values[1::,0,Sector_reb_rge,:,0] - F_6_7_new[1::,0,Sector_reb_rge,:,0] - F_6_7_ren[1::,:,0,Sector_reb_rge,:,0].sum(axis=2)) # must be 0.
                 RECC_System.FlowDict['F_6_7'].Values[:,:,Sector_reb_rge,:,0]   = np.einsum('Btrm->Btrm',F_6_7_new[:,:,Sector_reb_rge,:,0]) + np.einsum('Btcrm->Btrm',F_6_7_ren[:,:,:,Sector_reb_rge,:,0])
                 
             if 'nrb' in SectorList:
                 # convert product stocks and flows to material stocks and flows, only for chemical element position 'all':
-                # Stock elemental composition, historic for each element and for future years: 'all' elements only
-                RECC_System.StockDict['S_7'].Values[:,:,:,Sector_nrb_rge,:,:] = \
-                np.einsum('tcrNme,tcNr->tcrNme',Par_3_MC_Stock_ByElement_Nr[:,:,:,Sector_nrb_rge,:,:],Stock_Detail_UsePhase_N)/1000   # Indices='t,c,r,N,m,e'
+                # Stock elemental composition, historic for each element and for future years: 'all' elements only (needed for the inflow below)
+                RECC_System.StockDict['S_7'].Values[:,:,:,Sector_nrb_rge,:,0] = \
+                Par_3_MC_Stock_ByElement_Nr.LayerProducts(Sector_nrb_rge,0,Stock_Detail_UsePhase_N)/1000   # Indices='t,c,r,N,m'
+                RECC_System.StockDict['S_7'].Values[0,:,:,Sector_nrb_rge,:,:] = \
+                Par_3_MC_Stock_ByElement_Nr.Products(Sector_nrb_rge,Stock_Detail_UsePhase_N[0,:,:,:],0)/1000   # Indices='c,r,N,m,e'
                 # Outflow, 'all' elements only:
                 RECC_System.FlowDict['F_7_8'].Values[:,:,:,Sector_nrb_rge,:,0] = \
                 np.einsum('Ncmrt,tcNr->Ntcrm',Par_RECC_MC_Nr[:,:,Sector_nrb_rge,:,mS,:],Outflow_Detail_UsePhase_N)/1000 # all elements, Indices='t,c,r,N,m'
@@ -1744,6 +1854,42 @@ def main():
                 np.einsum('Ntom,tNo->Ntom',Par_3_MC_Stock_ByElement_No[SwitchTime::,:,Sector_nrbg_rge_reg,:,0],Inflow_Detail_UsePhase_Ng[1::,:,:])/1000 # all elements, Indices='t,o,N,m'              
             #Units so far: Mt/yr
             
+            # Pre-pass of the material cycle: the element composition of the historic age-cohorts (c < SwitchTime) of pav, nrb, ind, app, and nrbg 
+            # does not change in the future years, so that their outflows and stocks by element are computed for all years at once. 
+            # The year-by-year loop below only computes the age-cohorts from KernelStart onwards, whose composition depends on the material cycle of earlier years.
+            # Optional config entry 'MaterialCycleReference' = 'True': no pre-pass, the loop computes all age-cohorts (reference mode, same results).
+            KernelStart = 0 if ScriptConfig.get('MaterialCycleReference','False') == 'True' else SwitchTime
+            # Outflow of the historic age-cohorts of pav and nrb summed over the age-cohorts, for all elements, also those not stored in F_7_8, for the waste mgt. input F_8_9:
+            F_7_8_Historic = np.zeros((Nt,Nr,Ng,Nm,Ne)) # index structure: trgme. Unit: Mt/yr.
+            if KernelStart > 0:
+                if 'pav' in SectorList:
+                    RECC_System.FlowDict['F_7_8'].Values[1::,0:SwitchTime,:,Sector_pav_rge,:,:] = \
+                    np.einsum('crpme,tcpr->tcrpme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_pav_rge,:,:],Outflow_Detail_UsePhase_p[1::,0:SwitchTime,:,:])/1000 # All elements.
+                    F_7_8_Historic[1::,:,Sector_pav_rge,:,:] = \
+                    np.einsum('crpme,tcpr->trpme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_pav_rge,:,:],Outflow_Detail_UsePhase_p[1::,0:SwitchTime,:,:])/1000 # All elements.
+                    RECC_System.StockDict['S_7'].Values[1::,0:SwitchTime,:,Sector_pav_rge,:,:]  = \
+                    np.einsum('crpme,tcpr->tcrpme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_pav_rge,:,:],Stock_Detail_UsePhase_p[1::,0:SwitchTime,:,:])/1000   # All elements.
+                if 'nrb' in SectorList:
+                    RECC_System.FlowDict['F_7_8'].Values[1::,0:SwitchTime,:,Sector_nrb_rge,:,:] = \
+                    np.einsum('crNme,tcNr->tcrNme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_nrb_rge,:,:],Outflow_Detail_UsePhase_N[1::,0:SwitchTime,:,:])/1000 # All elements.
+                    F_7_8_Historic[1::,:,Sector_nrb_rge,:,:] = \
+                    np.einsum('crNme,tcNr->trNme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_nrb_rge,:,:],Outflow_Detail_UsePhase_N[1::,0:SwitchTime,:,:])/1000 # All elements.
+                    RECC_System.StockDict['S_7'].Values[1::,0:SwitchTime,:,Sector_nrb_rge,:,:]  = \
+                    np.einsum('crNme,tcNr->tcrNme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_nrb_rge,:,:],Stock_Detail_UsePhase_N[1::,0:SwitchTime,:,:])/1000   # All elements.
+                RECC_System.FlowDict['F_7_8_Nl'].Values[1::,0:SwitchTime,:,Sector_ind_rge_reg,:,:] = \
+                np.einsum('clIme,tcIl->tclIme',Par_3_MC_Stock_ByElement_Nl[0:SwitchTime,:,Sector_ind_rge_reg,:,:],Outflow_Detail_UsePhase_I[1::,0:SwitchTime,:,:])/1000 # All elements.
+                RECC_System.StockDict['S_7_Nl'].Values[1::,0:SwitchTime,:,Sector_ind_rge_reg,:,:]  = \
+                np.einsum('clIme,tcIl->tclIme',Par_3_MC_Stock_ByElement_Nl[0:SwitchTime,:,Sector_ind_rge_reg,:,:],Stock_Detail_UsePhase_I[1::,0:SwitchTime,:,:])/1000   # All elements. In Mt
+                RECC_System.FlowDict['F_7_8_No'].Values[1::,0:SwitchTime,:,Sector_app_rge_reg,:,:] = \
+                np.einsum('coame,tcao->tcoame',Par_3_MC_Stock_ByElement_No[0:SwitchTime,:,Sector_app_rge_reg,:,:],Outflow_Detail_UsePhase_a[1::,0:SwitchTime,:,:])/1000000000000 # All elements.
+                RECC_System.StockDict['S_7_No'].Values[1::,0:SwitchTime,:,Sector_app_rge_reg,:,:]  = \
+                np.einsum('coame,tcao->tcoame',Par_3_MC_Stock_ByElement_No[0:SwitchTime,:,Sector_app_rge_reg,:,:],Stock_Detail_UsePhase_a[1::,0:SwitchTime,:,:])/1000000000000   # All elements. In Mt
+                if 'nrbg' in SectorList:
+                    RECC_System.FlowDict['F_7_8_No'].Values[1::,0:SwitchTime,:,Sector_nrbg_rge_reg,:,:] = \
+                    np.einsum('coNme,tcNo->tcoNme',Par_3_MC_Stock_ByElement_No[0:SwitchTime,:,Sector_nrbg_rge_reg,:,:],Outflow_Detail_UsePhase_Ng[1::,0:SwitchTime,:,:])/1000 # All elements.
+                    RECC_System.StockDict['S_7_No'].Values[1::,0:SwitchTime,:,Sector_nrbg_rge_reg,:,:]  = \
+                    np.einsum('coNme,tcNo->tcoNme',Par_3_MC_Stock_ByElement_No[0:SwitchTime,:,Sector_nrbg_rge_reg,:,:],Stock_Detail_UsePhase_Ng[1::,0:SwitchTime,:,:])/1000   # All elements. In Mt
+            
             Mylog.info('Calculate material stocks and flows, material cycles, determine elemental composition.')
             # Units: Mt and Mt/yr.
             # This calculation is done year-by-year, and the elemental composition of the materials is in part determined by the scrap flow metal composition
@@ -1757,89 +1903,52 @@ def main():
                 # Calculate use phase outflow and obsolete stock formation
                 # ObsStockFormation = ObsStockFormationFactor(t,g,r) * Outflow_Detail_UsePhase(t,c,g,r), currently not implemented. 
                 
+                # The outflow of year t is computed for all elements in F_7_8_t (index structure: crgme, without the historic age-cohorts of pav and nrb from the pre-pass), 
+                # F_7_8 stores the element layers in ElementsResolved, and the sums over r and m of the others.
+                F_7_8_t = np.zeros((CohortOffset,Nr,Ng,Nm,Ne))
                 if 'pav' in SectorList:
-                    RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_pav_rge,:,:] = \
-                    np.einsum('pcrme,cpr->pcrme',Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_pav_rge,:,:],Outflow_Detail_UsePhase_p[t,0:CohortOffset,:,:])/1000 # All elements.
+                    F_7_8_t[KernelStart:CohortOffset,:,Sector_pav_rge,:,:] = \
+                    np.einsum('crpme,cpr->crpme',Par_3_MC_Stock_ByElement_Nr.Current[KernelStart:CohortOffset,:,Sector_pav_rge,:,:],Outflow_Detail_UsePhase_p[t,KernelStart:CohortOffset,:,:])/1000 # All elements.
                 if 'reb' in SectorList:
-                    RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_reb_rge,:,:] = \
-                    np.einsum('Bcrme,cBr->Bcrme',Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_reb_rge,:,:],Outflow_Detail_UsePhase_B[t,0:CohortOffset,:,:])/1000 # All elements.
+                    F_7_8_t[0:CohortOffset,:,Sector_reb_rge,:,:] = \
+                    np.einsum('crBme,cBr->crBme',Par_3_MC_Stock_ByElement_Nr.Current[0:CohortOffset,:,Sector_reb_rge,:,:],Outflow_Detail_UsePhase_B[t,0:CohortOffset,:,:])/1000 # All elements.
+                    RECC_System.FlowDict['F_7_8'].Values[t,0:KernelStart,:,Sector_reb_rge,:,:] = np.einsum('crBme->Bcrme',F_7_8_t[0:KernelStart,:,Sector_reb_rge,:,:])
                 if 'nrb' in SectorList:
-                    RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_nrb_rge,:,:] = \
-                    np.einsum('Ncrme,cNr->Ncrme',Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_nrb_rge,:,:],Outflow_Detail_UsePhase_N[t,0:CohortOffset,:,:])/1000 # All elements.
+                    F_7_8_t[KernelStart:CohortOffset,:,Sector_nrb_rge,:,:] = \
+                    np.einsum('crNme,cNr->crNme',Par_3_MC_Stock_ByElement_Nr.Current[KernelStart:CohortOffset,:,Sector_nrb_rge,:,:],Outflow_Detail_UsePhase_N[t,KernelStart:CohortOffset,:,:])/1000 # All elements.
+                RECC_System.FlowDict['F_7_8'].Values[t,KernelStart:CohortOffset,:,:,:,:] = F_7_8_t[KernelStart:CohortOffset,:,:,:,:]
     
                 # 1_Nl_No)
-                RECC_System.FlowDict['F_7_8_Nl'].Values[t,0:CohortOffset,:,Sector_ind_rge_reg,:,:] = \
-                np.einsum('clIme,cIl->Iclme',Par_3_MC_Stock_ByElement_Nl[0:CohortOffset,:,Sector_ind_rge_reg,:,:],Outflow_Detail_UsePhase_I[t,0:CohortOffset,:,:])/1000 # All elements.
-                RECC_System.FlowDict['F_7_8_No'].Values[t,0:CohortOffset,:,Sector_app_rge_reg,:,:] = \
-                np.einsum('coame,cao->acome',Par_3_MC_Stock_ByElement_No[0:CohortOffset,:,Sector_app_rge_reg,:,:],Outflow_Detail_UsePhase_a[t,0:CohortOffset,:,:])/1000000000000 # All elements.
+                RECC_System.FlowDict['F_7_8_Nl'].Values[t,KernelStart:CohortOffset,:,Sector_ind_rge_reg,:,:] = \
+                np.einsum('clIme,cIl->Iclme',Par_3_MC_Stock_ByElement_Nl[KernelStart:CohortOffset,:,Sector_ind_rge_reg,:,:],Outflow_Detail_UsePhase_I[t,KernelStart:CohortOffset,:,:])/1000 # All elements.
+                RECC_System.FlowDict['F_7_8_No'].Values[t,KernelStart:CohortOffset,:,Sector_app_rge_reg,:,:] = \
+                np.einsum('coame,cao->acome',Par_3_MC_Stock_ByElement_No[KernelStart:CohortOffset,:,Sector_app_rge_reg,:,:],Outflow_Detail_UsePhase_a[t,KernelStart:CohortOffset,:,:])/1000000000000 # All elements.
                 if 'nrbg' in SectorList:
-                    RECC_System.FlowDict['F_7_8_No'].Values[t,0:CohortOffset,:,Sector_nrbg_rge_reg,:,:] = \
-                    np.einsum('coNme,cNo->Ncome',Par_3_MC_Stock_ByElement_No[0:CohortOffset,:,Sector_nrbg_rge_reg,:,:],Outflow_Detail_UsePhase_Ng[t,0:CohortOffset,:,:])/1000 # All elements.
+                    RECC_System.FlowDict['F_7_8_No'].Values[t,KernelStart:CohortOffset,:,Sector_nrbg_rge_reg,:,:] = \
+                    np.einsum('coNme,cNo->Ncome',Par_3_MC_Stock_ByElement_No[KernelStart:CohortOffset,:,Sector_nrbg_rge_reg,:,:],Outflow_Detail_UsePhase_Ng[t,KernelStart:CohortOffset,:,:])/1000 # All elements.
     
                 # RECC_System.FlowDict['F_8_0'].Values = MatContent * ObsStockFormation. Currently 0, already defined.
                             
                 # 2) Consider re-use of materials in product groups (via components), as ReUseFactor(m,g,r,R,t) * RECC_System.FlowDict['F_7_8'].Values(t,c,r,g,m,e)
-                # Distribute material for re-use onto product groups
-                if 'pav' in SectorList:
-                    ReUsePotential_Materials_t_m_Veh = np.einsum('mpr,pcrm->m',ReUseFactor_tmprS[t,:,:,:,mS],RECC_System.FlowDict['F_7_8'].Values[t,:,:,Sector_pav_rge,:,0]) # in Mt
-                if 'reb' in SectorList:
-                    ReUsePotential_Materials_t_m_Bld = np.einsum('mBr,Bcrm->m',ReUseFactor_tmBrS[t,:,:,:,mS],RECC_System.FlowDict['F_7_8'].Values[t,:,:,Sector_reb_rge,:,0]) # in Mt
-                if 'nrb' in SectorList:
-                    ReUsePotential_Materials_t_m_NRB = np.einsum('mNr,Ncrm->m',ReUseFactor_tmNrS[t,:,:,:,mS],RECC_System.FlowDict['F_7_8'].Values[t,:,:,Sector_nrb_rge,:,0]) # in Mt
+                # Distribute material for re-use onto product groups, re-use potential is capped by the inflow of materials into new products of the same goods.
                 # in the future, re-use will be a region-to-region parameter depicting, e.g., the export of used vehicles from the EU to Africa.
-                # check whether inflow is big enough for potential to be used, correct otherwise:
-                for mmm in range(0,Nm):
-                    # Vehicles
-                    if 'pav' in SectorList:
-                        if RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_pav_rge,mmm,0].sum() < ReUsePotential_Materials_t_m_Veh[mmm]: # if re-use potential is larger than new inflow:
-                            if ReUsePotential_Materials_t_m_Veh[mmm] > 0:
-                                ReUsePotential_Materials_t_m_Veh[mmm] = RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_pav_rge,mmm,0].sum()
-                    # residential buildings
-                    if 'reb' in SectorList:
-                        if RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_reb_rge,mmm,0].sum() < ReUsePotential_Materials_t_m_Bld[mmm]: # if re-use potential is larger than new inflow:
-                            if ReUsePotential_Materials_t_m_Bld[mmm] > 0:
-                                ReUsePotential_Materials_t_m_Bld[mmm] = RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_reb_rge,mmm,0].sum()
-                    # nonresidential buildings
-                    if 'nrb' in SectorList:
-                        if RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_nrb_rge,mmm,0].sum() < ReUsePotential_Materials_t_m_NRB[mmm]: # if re-use potential is larger than new inflow:
-                            if ReUsePotential_Materials_t_m_NRB[mmm] > 0:
-                                ReUsePotential_Materials_t_m_NRB[mmm] = RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_nrb_rge,mmm,0].sum()
-                    
-                # Vehicles
-                if 'pav' in SectorList:
-                    Divisor = np.einsum('m,crp->pcrm',np.einsum('pcrm->m',RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_pav_rge,:,0]),np.ones((CohortOffset,Nr,Np)))
-                    MassShareVeh = np.divide(RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_pav_rge,:,0], Divisor, out=np.zeros_like(Divisor), where=Divisor!=0) # index: pcrm
-                    # share of combination crg in total mass of m in outflow 7_8
-                    RECC_System.FlowDict['F_8_17'].Values[t,0:CohortOffset,:,Sector_pav_rge,:,:] = \
-                    np.einsum('cme,pcrm->pcrme', Par_Element_Composition_of_Materials_u[0:CohortOffset,:,:],\
-                    np.einsum('m,pcrm->pcrm',ReUsePotential_Materials_t_m_Veh,MassShareVeh))  # All elements.
-                # residential Buildings
-                if 'reb' in SectorList:
-                    Divisor = np.einsum('m,crB->Bcrm',np.einsum('Bcrm->m',RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_reb_rge,:,0]),np.ones((CohortOffset,Nr,NB)))
-                    MassShareBld = np.divide(RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_reb_rge,:,0], Divisor, out=np.zeros_like(Divisor), where=Divisor!=0) # index: Bcrm
-                    # share of combination crg in total mass of m in outflow 7_8
-                    RECC_System.FlowDict['F_8_17'].Values[t,0:CohortOffset,:,Sector_reb_rge,:,:] = \
-                    np.einsum('cme,Bcrm->Bcrme', Par_Element_Composition_of_Materials_u[0:CohortOffset,:,:],\
-                    np.einsum('m,Bcrm->Bcrm',ReUsePotential_Materials_t_m_Bld,MassShareBld))  # All elements.
-                # nonresidential Buildings
-                if 'nrb' in SectorList:
-                    Divisor = np.einsum('m,crN->Ncrm',np.einsum('Ncrm->m',RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_nrb_rge,:,0]),np.ones((CohortOffset,Nr,NN)))
-                    MassShareNRB = np.divide(RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,Sector_nrb_rge,:,0], Divisor, out=np.zeros_like(Divisor), where=Divisor!=0) # index: Ncrm
-                    # share of combination crg in total mass of m in outflow 7_8
-                    RECC_System.FlowDict['F_8_17'].Values[t,0:CohortOffset,:,Sector_nrb_rge,:,:] = \
-                    np.einsum('cme,Ncrm->Ncrme', Par_Element_Composition_of_Materials_u[0:CohortOffset,:,:],\
-                    np.einsum('m,Ncrm->Ncrm',ReUsePotential_Materials_t_m_NRB,MassShareNRB))  # All elements.
+                # As for F_7_8, the re-use of year t is computed for all elements in F_8_17_t (index structure: crgme), F_8_17 stores the element layers in ElementsResolved, and the sums over r and m of the others.
+                F_8_17_t = np.zeros((CohortOffset,Nr,Ng,Nm,Ne))
+                for Sector_rge, ReUseFactor in ReUseSectors:
+                    F_8_17_t[:,:,Sector_rge,:,:] = \
+                    np.einsum('gcrme->crgme',rf.ReUseAllocation(RECC_System.FlowDict['F_7_8'].Values[t,:,:,Sector_rge,:,0],ReUseFactor[t,:,:,:,mS],RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_rge,:,0],Par_Element_Composition_of_Materials_u[0:CohortOffset,:,:])) # All elements, in Mt
+                RECC_System.FlowDict['F_8_17'].Values[t,0:CohortOffset,:,:,:,:] = F_8_17_t
                 
                 # reused material mapped to final consumption region and good, proportional to final consumption breakdown into products and regions.
                 # can be replaced by region-by-region reuse parameter.             
                 Divisor = np.einsum('m,rg->rgm',np.einsum('rgm->m',RECC_System.FlowDict['F_6_7'].Values[t,:,:,:,0]),np.ones((Nr,Ng)))
                 InvMass = np.divide(1, Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
                 RECC_System.FlowDict['F_17_6'].Values[t,0:CohortOffset,:,:,:,:] = \
-                np.einsum('cme,rgm->crgme',np.einsum('crgme->cme',RECC_System.FlowDict['F_8_17'].Values[t,0:CohortOffset,:,:,:,:]),\
+                np.einsum('cme,rgm->crgme',np.einsum('crgme->cme',F_8_17_t),\
                 RECC_System.FlowDict['F_6_7'].Values[t,:,:,:,0]*InvMass)
                 
                 # 3) calculate inflow waste mgt as EoL products - obsolete stock formation - re-use
-                RECC_System.FlowDict['F_8_9'].Values[t,:,:,:,:]           = np.einsum('crgme->rgme',RECC_System.FlowDict['F_7_8'].Values[t,0:CohortOffset,:,:,:,:]    - RECC_System.FlowDict['F_8_0'].Values[t,0:CohortOffset,:,:,:,:]    - RECC_System.FlowDict['F_8_17'].Values[t,0:CohortOffset,:,:,:,:])
+                RECC_System.FlowDict['F_8_9'].Values[t,:,:,:,:]           = F_7_8_Historic[t,:,:,:,:] + np.einsum('crgme->rgme',F_7_8_t - RECC_System.FlowDict['F_8_0'].Values[t,0:CohortOffset,:,:,:,:] - F_8_17_t)
                 if len(Sector_11reg_rge) > 0:
                     RECC_System.FlowDict['F_8_9_Nl'].Values[t,:,:,:,:]    = np.einsum('clLme->lLme',RECC_System.FlowDict['F_7_8_Nl'].Values[t,0:CohortOffset,:,:,:,:] - RECC_System.FlowDict['F_8_0_Nl'].Values[t,0:CohortOffset,:,:,:,:] - RECC_System.FlowDict['F_8_17_Nl'].Values[t,0:CohortOffset,:,:,:,:])
                 if len(Sector_1reg_rge) > 0:
@@ -1887,39 +1996,15 @@ def main():
                 # 8) SCRAP MARKET BALANCE:
                 # Below, only the total mass is taken into consideration for decision making. In later model versions, alloy and tramp element composition constraints can be added instead.
                 
-                # a) Use diverted fab scrap first, if possible:
-                DivFabScrap_to_Manuf = np.zeros((Nm,Ne))
-                for mat in range(0,Nm):
-                    if Fabscrapdiversionpotential_tme[mat,0] > 0:
-                        if Fabscrapdiversionpotential_tme[mat,0] > Manufacturing_Input_m_adj[mat]:
-                            DivFabScrap_to_Manuf[mat,:]            = (Fabscrapdiversionpotential_tme[mat,:] * Manufacturing_Input_m_adj[mat] / Fabscrapdiversionpotential_tme[mat,0]).copy()
-                        else:
-                            DivFabScrap_to_Manuf[mat,:]            = Fabscrapdiversionpotential_tme[mat,:].copy()
+                # a) Use diverted fab scrap first, if possible, b) then use secondary material, if possible, 
+                # c) then use stock-piled secondary material, if available and if possible. The remaining demand is met by primary production.
+                RECC_System.StockDict['S_12'].Values[t,0,:,:]      = RECC_System.StockDict['S_12'].Values[t-1,0,:,:] # age stock pile by 1 year
+                ScrapMarketUse, ScrapMarketRemainingDemand         = rf.SecondaryMaterialAllocation(Manufacturing_Input_m_adj,[Fabscrapdiversionpotential_tme,RECC_System.FlowDict['F_9_12'].Values[t,0,:,:],RECC_System.StockDict['S_12'].Values[t,0,:,:]])
+                DivFabScrap_to_Manuf, SecondaryMaterialUse, StockPileSecondaryMaterialUse = ScrapMarketUse
+                RemainingManufactInputDemand_1, RemainingManufactInputDemand_2, PrimaryProductionDemand = ScrapMarketRemainingDemand
                 Non_DivFabScrap                                    = Fabscrapdiversionpotential_tme - DivFabScrap_to_Manuf
-                RemainingManufactInputDemand_1                     = Manufacturing_Input_m_adj - DivFabScrap_to_Manuf[:,0]    
-                
-                # b) Use secondary material, if possible:            
-                SecondaryMaterialUse = np.zeros((Nm,Ne))
-                for mat in range(0,Nm):
-                    if RECC_System.FlowDict['F_9_12'].Values[t,0,mat,0] > 0:
-                        if RECC_System.FlowDict['F_9_12'].Values[t,0,mat,0] > RemainingManufactInputDemand_1[mat]:
-                            SecondaryMaterialUse[mat,:]            = (RECC_System.FlowDict['F_9_12'].Values[t,0,mat,:] * RemainingManufactInputDemand_1[mat] / RECC_System.FlowDict['F_9_12'].Values[t,0,mat,0]).copy()
-                        else:
-                            SecondaryMaterialUse[mat,:]            = RECC_System.FlowDict['F_9_12'].Values[t,0,mat,:].copy()
                 Non_UsedSecMaterial                                = RECC_System.FlowDict['F_9_12'].Values[t,0,:,:] - SecondaryMaterialUse
-                RemainingManufactInputDemand_2                     = RemainingManufactInputDemand_1 - SecondaryMaterialUse[:,0]
-                
-                # c) Use stock-piled secondary material, if available and if possible:
-                RECC_System.StockDict['S_12'].Values[t,0,:,:]      = RECC_System.StockDict['S_12'].Values[t-1,0,:,:] # age stock pile by 1 year
-                StockPileSecondaryMaterialUse = np.zeros((Nm,Ne))
-                for mat in range(0,Nm):
-                    if RECC_System.StockDict['S_12'].Values[t,0,mat,0] > 0:
-                        if RECC_System.StockDict['S_12'].Values[t,0,mat,0] > RemainingManufactInputDemand_2[mat]:
-                            StockPileSecondaryMaterialUse[mat,:]   = (RECC_System.StockDict['S_12'].Values[t,0,mat,:] * RemainingManufactInputDemand_2[mat] / RECC_System.StockDict['S_12'].Values[t,0,mat,0]).copy()
-                        else:
-                            StockPileSecondaryMaterialUse[mat,:]   = RECC_System.StockDict['S_12'].Values[t,0,mat,:].copy()
                 RECC_System.StockDict['S_12'].Values[t,0,:,:]      = RECC_System.StockDict['S_12'].Values[t,0,:,:] - StockPileSecondaryMaterialUse
-                PrimaryProductionDemand = RemainingManufactInputDemand_2 - StockPileSecondaryMaterialUse[:,0]
                 
                 # d) convert internal calculations to system variables:
                 RECC_System.FlowDict['F_12_5'].Values[t,0,:,:]     = DivFabScrap_to_Manuf + SecondaryMaterialUse + StockPileSecondaryMaterialUse
@@ -1974,41 +2059,39 @@ def main():
             
                 # 12) Calculate element composition of final consumption and latest age-cohort in in-use stock
                 if 'pav' in SectorList:
-                    # update mat. composition by element for current year and latest age-cohort
-                    Par_3_MC_Stock_ByElement_Nr[t,0:CohortOffset,:,Sector_pav_rge,:,:] = Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_pav_rge,:,:]
-                    Par_3_MC_Stock_ByElement_Nr[t,CohortOffset,:,Sector_pav_rge,:,:]   = np.einsum('me,Bmr->Brme',Par_Element_Composition_of_Materials_c[t,:,:],Par_RECC_MC_Nr[CohortOffset,:,Sector_pav_rge,:,mS,t])
+                    # update mat. composition by element for latest age-cohort, the composition of the other age-cohorts does not change
+                    Par_3_MC_Stock_ByElement_Nr.Current[CohortOffset,:,Sector_pav_rge,:,:]   = np.einsum('me,Bmr->Brme',Par_Element_Composition_of_Materials_c[t,:,:],Par_RECC_MC_Nr[CohortOffset,:,Sector_pav_rge,:,mS,t])
                     RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_pav_rge,:,:]   = \
-                    np.einsum('prme,pr->prme',Par_3_MC_Stock_ByElement_Nr[t,CohortOffset,:,Sector_pav_rge,:,:],Inflow_Detail_UsePhase_p[t,:,:])/1000 # all elements, Indices='t,r,p,m,e'
-                    RECC_System.StockDict['S_7'].Values[t,0:CohortOffset+1,:,Sector_pav_rge,:,:] = \
-                    np.einsum('pcrme,cpr->pcrme',Par_3_MC_Stock_ByElement_Nr[t,0:CohortOffset+1,:,Sector_pav_rge,:,:],Stock_Detail_UsePhase_p[t,0:CohortOffset+1,:,:])/1000 # All elements.
+                    np.einsum('prme,pr->prme',Par_3_MC_Stock_ByElement_Nr.Current[CohortOffset,:,Sector_pav_rge,:,:],Inflow_Detail_UsePhase_p[t,:,:])/1000 # all elements, Indices='t,r,p,m,e'
+                    RECC_System.StockDict['S_7'].Values[t,KernelStart:CohortOffset+1,:,Sector_pav_rge,:,:] = \
+                    np.einsum('crpme,cpr->pcrme',Par_3_MC_Stock_ByElement_Nr.Current[KernelStart:CohortOffset+1,:,Sector_pav_rge,:,:],Stock_Detail_UsePhase_p[t,KernelStart:CohortOffset+1,:,:])/1000 # All elements.
     
                 if 'reb' in SectorList:
                     # update mat. composition by element for current year and latest age-cohort
-                    Par_3_MC_Stock_ByElement_Nr[t,CohortOffset,:,Sector_reb_rge,:,:]   = np.einsum('me,Bmr->Brme',Par_Element_Composition_of_Materials_c[t,:,:],Par_RECC_MC_Nr[SwitchTime+t-1,:,Sector_reb_rge,:,mS,t])
+                    Par_3_MC_Stock_ByElement_Nr.Current[CohortOffset,:,Sector_reb_rge,:,:]   = np.einsum('me,Bmr->Brme',Par_Element_Composition_of_Materials_c[t,:,:],Par_RECC_MC_Nr[SwitchTime+t-1,:,Sector_reb_rge,:,mS,t])
                     # Determine element breakdown of inflow and renovation material
                     RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_reb_rge,:,:]   = \
                     np.einsum('me,Brm->Brme',Par_Element_Composition_of_Materials_c[t,:,:],RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_reb_rge,:,0]) # all elements, Indices='t,r,B,m,e'
                     F_6_7_ren[t,:,:,Sector_reb_rge,:,:] = np.einsum('me,Bcrm->Bcrme',Par_Element_Composition_of_Materials_c[t,:,:],F_6_7_ren[t,:,:,Sector_reb_rge,:,0]) # all elements, Indices='t,c,r,B,m,e' (c is age-cohort where material flows)
                     # Determine the element material composition at the end of last year, as weighting factor for existing stock
-                    Divisor  = np.einsum('Bcrm,e->Bcrme',Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_reb_rge,:,0],np.ones(Ne))
-                    Par_ElementComposition_LastYear = np.divide(Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_reb_rge,:,:],Divisor, out=np.zeros_like(Divisor), where=Divisor!=0) #Bcrme
+                    Divisor  = np.einsum('Bcrm,e->Bcrme',Par_3_MC_Stock_ByElement_Nr.Current[0:CohortOffset,:,Sector_reb_rge,:,0],np.ones(Ne))
+                    Par_ElementComposition_LastYear = np.divide(np.einsum('crBme->Bcrme',Par_3_MC_Stock_ByElement_Nr.Current[0:CohortOffset,:,Sector_reb_rge,:,:]),Divisor, out=np.zeros_like(Divisor), where=Divisor!=0) #Bcrme
                     # Compile all materials present in stock broken down by element:
                     StockMat = F_6_7_ren[t,0:CohortOffset,:,Sector_reb_rge,:,:] + np.einsum('Bcrm,Bcrme->Bcrme',RECC_System.StockDict['S_7'].Values[t,0:CohortOffset,:,Sector_reb_rge,:,0] - F_6_7_ren[t,0:CohortOffset,:,Sector_reb_rge,:,0],Par_ElementComposition_LastYear)
                     Divisor  = np.einsum('Bcrm,e->Bcrme',StockMat[:,:,:,:,0],np.ones(Ne))
                     # Caculate product element composition of latest age-cohort from total materials by element:
-                    Par_3_MC_Stock_ByElement_Nr[t,0:CohortOffset,:,Sector_reb_rge,:,:]  = np.einsum('Bcmr,Bcrme->Bcrme',Par_RECC_MC_Nr[0:CohortOffset,:,Sector_reb_rge,:,mS,t],np.divide(StockMat,Divisor, out=np.zeros_like(Divisor), where=Divisor!=0))
+                    Par_3_MC_Stock_ByElement_Nr.Current[0:CohortOffset,:,Sector_reb_rge,:,:]  = np.einsum('Bcmr,Bcrme->crBme',Par_RECC_MC_Nr[0:CohortOffset,:,Sector_reb_rge,:,mS,t],np.divide(StockMat,Divisor, out=np.zeros_like(Divisor), where=Divisor!=0))
                     # Update stock: break down material into elements:                
                     RECC_System.StockDict['S_7'].Values[t,0:CohortOffset +1,:,Sector_reb_rge,:,:] = \
-                    np.einsum('Bcrme,cBr->Bcrme',Par_3_MC_Stock_ByElement_Nr[t,0:CohortOffset +1,:,Sector_reb_rge,:,:],Stock_Detail_UsePhase_B[t,0:CohortOffset +1,:,:])/1000
+                    np.einsum('crBme,cBr->Bcrme',Par_3_MC_Stock_ByElement_Nr.Current[0:CohortOffset +1,:,Sector_reb_rge,:,:],Stock_Detail_UsePhase_B[t,0:CohortOffset +1,:,:])/1000
                     
                 if 'nrb' in SectorList:
-                    # update mat. composition by element for current year and latest age-cohort
-                    Par_3_MC_Stock_ByElement_Nr[t,0:CohortOffset,:,Sector_nrb_rge,:,:] = Par_3_MC_Stock_ByElement_Nr[t-1,0:CohortOffset,:,Sector_nrb_rge,:,:]
-                    Par_3_MC_Stock_ByElement_Nr[t,CohortOffset,:,Sector_nrb_rge,:,:]   = np.einsum('me,Bmr->Brme',Par_Element_Composition_of_Materials_c[t,:,:],Par_RECC_MC_Nr[CohortOffset,:,Sector_nrb_rge,:,mS,t])
+                    # update mat. composition by element for latest age-cohort, the composition of the other age-cohorts does not change
+                    Par_3_MC_Stock_ByElement_Nr.Current[CohortOffset,:,Sector_nrb_rge,:,:]   = np.einsum('me,Bmr->Brme',Par_Element_Composition_of_Materials_c[t,:,:],Par_RECC_MC_Nr[CohortOffset,:,Sector_nrb_rge,:,mS,t])
                     RECC_System.FlowDict['F_6_7'].Values[t,:,Sector_nrb_rge,:,:]   = \
-                    np.einsum('Nrme,Nr->Nrme',Par_3_MC_Stock_ByElement_Nr[t,CohortOffset,:,Sector_nrb_rge,:,:],Inflow_Detail_UsePhase_N[t,:,:])/1000 # all elements, Indices='t,r,N,m,e'
-                    RECC_System.StockDict['S_7'].Values[t,0:CohortOffset +1,:,Sector_nrb_rge,:,:] = \
-                    np.einsum('Ncrme,cNr->Ncrme',Par_3_MC_Stock_ByElement_Nr[t,0:CohortOffset +1,:,Sector_nrb_rge,:,:],Stock_Detail_UsePhase_N[t,0:CohortOffset +1,:,:])/1000 # All elements.
+                    np.einsum('Nrme,Nr->Nrme',Par_3_MC_Stock_ByElement_Nr.Current[CohortOffset,:,Sector_nrb_rge,:,:],Inflow_Detail_UsePhase_N[t,:,:])/1000 # all elements, Indices='t,r,N,m,e'
+                    RECC_System.StockDict['S_7'].Values[t,KernelStart:CohortOffset +1,:,Sector_nrb_rge,:,:] = \
+                    np.einsum('crNme,cNr->Ncrme',Par_3_MC_Stock_ByElement_Nr.Current[KernelStart:CohortOffset +1,:,Sector_nrb_rge,:,:],Stock_Detail_UsePhase_N[t,KernelStart:CohortOffset +1,:,:])/1000 # All elements.
                     
                 RECC_System.FlowDict['F_6_7_Nl'].Values[t,:,:,:,:]   = \
                 np.einsum('lIme,Il->lIme',Par_3_MC_Stock_ByElement_Nl[CohortOffset,:,:,:,:],Inflow_Detail_UsePhase_I[t,:,:])/1000 # all elements, Indices='t,l,I,m,e'                
@@ -2019,13 +2102,13 @@ def main():
                     RECC_System.FlowDict['F_6_7_No'].Values[t,:,Sector_nrbg_rge_reg,:,:]   = \
                     np.einsum('Nome,No->Nome',Par_3_MC_Stock_ByElement_No[CohortOffset,:,Sector_nrbg_rge_reg,:,:],Inflow_Detail_UsePhase_Ng[t,:,:])/1000 # all elements, Indices='t,o,N,m,e'                
                     
-                RECC_System.StockDict['S_7_Nl'].Values[t,0:CohortOffset +1,:,Sector_ind_rge_reg,:,:] = \
-                np.einsum('clIme,cIl->Iclme',Par_3_MC_Stock_ByElement_Nl[0:CohortOffset +1,:,Sector_ind_rge_reg,:,:],Stock_Detail_UsePhase_I[t,0:CohortOffset +1,:,:])/1000 # All elements. In Mt
-                RECC_System.StockDict['S_7_No'].Values[t,0:CohortOffset +1,:,Sector_app_rge_reg,:,:] = \
-                np.einsum('coame,cao->acome',Par_3_MC_Stock_ByElement_No[0:CohortOffset +1,:,Sector_app_rge_reg,:,:],Stock_Detail_UsePhase_a[t,0:CohortOffset +1,:,:])/1000000000000 # All elements.In Mt
+                RECC_System.StockDict['S_7_Nl'].Values[t,KernelStart:CohortOffset +1,:,Sector_ind_rge_reg,:,:] = \
+                np.einsum('clIme,cIl->Iclme',Par_3_MC_Stock_ByElement_Nl[KernelStart:CohortOffset +1,:,Sector_ind_rge_reg,:,:],Stock_Detail_UsePhase_I[t,KernelStart:CohortOffset +1,:,:])/1000 # All elements. In Mt
+                RECC_System.StockDict['S_7_No'].Values[t,KernelStart:CohortOffset +1,:,Sector_app_rge_reg,:,:] = \
+                np.einsum('coame,cao->acome',Par_3_MC_Stock_ByElement_No[KernelStart:CohortOffset +1,:,Sector_app_rge_reg,:,:],Stock_Detail_UsePhase_a[t,KernelStart:CohortOffset +1,:,:])/1000000000000 # All elements.In Mt
                 if 'nrbg' in SectorList: # results for global region o are on position 0 of r index.
-                    RECC_System.StockDict['S_7_No'].Values[t,0:CohortOffset +1,:,Sector_nrbg_rge_reg,:,:] = \
-                    np.einsum('coNme,cNo->Ncome',Par_3_MC_Stock_ByElement_No[0:CohortOffset +1,:,Sector_nrbg_rge_reg,:,:],Stock_Detail_UsePhase_Ng[t,0:CohortOffset +1,:,:])/1000 # All elements.In Mt
+                    RECC_System.StockDict['S_7_No'].Values[t,KernelStart:CohortOffset +1,:,Sector_nrbg_rge_reg,:,:] = \
+                    np.einsum('coNme,cNo->Ncome',Par_3_MC_Stock_ByElement_No[KernelStart:CohortOffset +1,:,Sector_nrbg_rge_reg,:,:],Stock_Detail_UsePhase_Ng[t,KernelStart:CohortOffset +1,:,:])/1000 # All elements.In Mt
                   
                 # 13) Calculate waste mgt. losses.
                 RECC_System.FlowDict['F_9_0'].Values[t,:]          = np.einsum('rgme->e',RECC_System.FlowDict['F_8_9'].Values[t,:,:,:,:])    - np.einsum('rwe->e',RECC_System.FlowDict['F_9_10'].Values[t,:,:,:]) \
@@ -2042,13 +2125,28 @@ def main():
                 BiogenicCO2WasteCombustion[t,mS,mR]        =     RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] * WoodMaterialLoss_t
                 
                 # 14) Calculate stock changes
-                RECC_System.StockDict['dS_7'].Values[t,:,:,:,:,:]     = RECC_System.StockDict['S_7'].Values[t,:,:,:,:,:] - RECC_System.StockDict['S_7'].Values[t-1,:,:,:,:,:]
+                RECC_System.StockDict['dS_7'].Values.StoreChange(t,RECC_System.StockDict['S_7'].Values) # = S_7[t] - S_7[t-1], also for the element layers that are not stored
                 RECC_System.StockDict['dS_7_Nl'].Values[t,:,:,:,:,:]  = RECC_System.StockDict['S_7_Nl'].Values[t,:,:,:,:,:] - RECC_System.StockDict['S_7_Nl'].Values[t-1,:,:,:,:,:]
                 RECC_System.StockDict['dS_7_No'].Values[t,:,:,:,:,:]  = RECC_System.StockDict['S_7_No'].Values[t,:,:,:,:,:] - RECC_System.StockDict['S_7_No'].Values[t-1,:,:,:,:,:]            
                 RECC_System.StockDict['dS_10'].Values[t,:,:,:]        = RECC_System.StockDict['S_10'].Values[t,t,:,:,:]  - RECC_System.StockDict['S_10'].Values[t-1,t-1,:,:,:]
                 RECC_System.StockDict['dS_12'].Values[t,:,:,:]        = RECC_System.StockDict['S_12'].Values[t,:,:,:]    - RECC_System.StockDict['S_12'].Values[t-1,:,:,:]
                 RECC_System.StockDict['dS_0'].Values[t,:]             = RECC_System.FlowDict['F_9_0'].Values[t,:] + np.einsum('rme->e',RECC_System.FlowDict['F_12_0'].Values[t,:,:,:]) + np.einsum('crgme->e',RECC_System.FlowDict['F_8_0'].Values[t,:,:,:,:,:]) - np.einsum('me->e',RECC_System.FlowDict['F_0_3'].Values[t,:,:])
                 
+            # Reference mode check: the outflows and stocks of the historic age-cohorts of pav and nrb that the loop computed must be those of the pre-pass, 
+            # for the stored element layers (incl. the total of all elements), after conversion to the storage dtype.
+            if KernelStart == 0:
+                HistoricCohortTerms = [] # variable name, values, product positions in g, and outflow or stock by product, index structure: tcgr
+                if 'pav' in SectorList:
+                    HistoricCohortTerms += [('F_7_8', RECC_System.FlowDict['F_7_8'].Values, Sector_pav_rge, Outflow_Detail_UsePhase_p), ('S_7', RECC_System.StockDict['S_7'].Values, Sector_pav_rge, Stock_Detail_UsePhase_p)]
+                if 'nrb' in SectorList:
+                    HistoricCohortTerms += [('F_7_8', RECC_System.FlowDict['F_7_8'].Values, Sector_nrb_rge, Outflow_Detail_UsePhase_N), ('S_7', RECC_System.StockDict['S_7'].Values, Sector_nrb_rge, Stock_Detail_UsePhase_N)]
+                for HistoricName, HistoricValues, Sector_rge, Detail_UsePhase in HistoricCohortTerms:
+                    PrePass_Values = np.einsum('crgme,tcgr->tcrgme',Par_3_MC_Stock_ByElement_Nr.Current[0:SwitchTime,:,Sector_rge,:,:][:,:,:,:,ElementsResolved],Detail_UsePhase[1::,0:SwitchTime,:,:])/1000
+                    Loop_Values    = HistoricValues[1::,0:SwitchTime,:,:,:,ElementsResolved][:,:,:,Sector_rge,:,:]
+                    if not np.allclose(Loop_Values, PrePass_Values.astype(StorageDtype).astype(float), rtol = 1e-12, atol = 0):
+                        raise AssertionError('Fatal: Reference mode (MaterialCycleReference): the loop results of ' + HistoricName + ' for the historic age-cohorts differ from the pre-pass.')
+                Mylog.info('Reference mode (MaterialCycleReference): the loop results of F_7_8 and S_7 for the historic age-cohorts are those of the pre-pass.')
+                
             # Diagnostics:
     #         Aa = np.einsum('ptcrm->trm',RECC_System.FlowDict['F_7_8'].Values[:,:,:,Sector_pav_rge,:,0]) # VehiclesOutflowMaterials
     #        Ab = np.einsum('Btcrm->trm',RECC_System.FlowDict['F_7_8'].Values[:,:,:,Sector_reb_rge,:,0]) # BuildingOutflowMaterials
@@ -2198,6 +2296,7 @@ def main():
             Forest_GrowthTable_fuelwd = np.zeros((Nt,Nt))
             np.fill_diagonal(Forest_GrowthTable_fuelwd, -1* RECC_System.FlowDict['F_2_7'].Values[:,Carbon_loc])
             # We also take into account for the regrowth of forest attributable to all wood present in the 2015 stock.
+            import scipy.stats # only required for the forest regrowth curves
             RegrowthCurve_Timber = scipy.stats.norm.cdf(np.arange(0,Nc,1),RECC_System.ParameterDict['3_LT_ForestRotationPeriod_Timber'  ].Values[Wood_loc]    /2, RECC_System.ParameterDict['3_LT_ForestRotationPeriod_Timber'  ].Values[Wood_loc]    /4)
             RegrowthCurve_FuelWo = scipy.stats.norm.cdf(np.arange(0,Nt,1),RECC_System.ParameterDict['3_LT_ForestRotationPeriod_FuelWood'].Values[WoodFuel_loc]/2, RECC_System.ParameterDict['3_LT_ForestRotationPeriod_FuelWood'].Values[WoodFuel_loc]/4)
             # Scale regrowth curves and insert them into growth tables:
@@ -2227,6 +2326,7 @@ def main():
             #BalAbs = -1 # means that mass bal. computation was commented out to save computation time.
             Bal = RECC_System.MassBalance()
             BalAbs = np.abs(Bal).sum()
+            MassBalance_Abs[mS,mR] = BalAbs
             Mylog.info('Total mass balance deviation (np.abs(Bal).sum() for socioeconomic scenario ' + SName + ' and RE scenario ' + RName + ': ' + str(BalAbs) + ' Mt.')                    
     
             # H) Calculate direct emissions by combustion of energy carriers in processes
@@ -2298,28 +2398,14 @@ def main():
             SysVar_GHGEms_GWP_bio_r = np.zeros((NX,Nt,Nr))
             SysVar_GHGEms_GWP_bio_o = np.zeros((NX,Nt))
             if 'reb' in SectorList:
-                for ntt in range(0,Nt):
-                    for nrr in range(0,Nr):
-                        for nBB in range(0,NB):
-                            #total carbon in wood (carbon content ca. 0.5)
-                            mass_C  = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] *12/44 * RECC_System.FlowDict['F_6_7'].Values[ntt,nrr,Sector_reb_rge[nBB],9,0]
-                            GWP_bio = RECC_System.ParameterDict['6_MIP_GWP_Bio'].Values[int(np.floor(RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_resbuildings'].Values[nBB,nrr,ntt+SwitchTime-1]))]
-                            SysVar_GHGEms_GWP_bio_r[0,ntt,nrr] += 44/12 * mass_C * GWP_bio # convert from C to CO2
+                SysVar_GHGEms_GWP_bio_r[0,:,:] += rf.BiogenicCarbonGWP(RECC_System.FlowDict['F_6_7'].Values[:,:,Sector_reb_rge,9,0],RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_resbuildings'].Values[:,:,SwitchTime-1:SwitchTime-1+Nt],\
+                                                   RECC_System.ParameterDict['6_MIP_GWP_Bio'].Values,RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc])
             if 'nrb' in SectorList:
-                for ntt in range(0,Nt):
-                    for nrr in range(0,Nr):
-                        for nNN in range(0,NN):
-                            #total carbon in wood (carbon content ca. 0.5)
-                            mass_C  = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] *12/44 * RECC_System.FlowDict['F_6_7'].Values[ntt,nrr,Sector_nrb_rge[nNN],9,0]
-                            GWP_bio = RECC_System.ParameterDict['6_MIP_GWP_Bio'].Values[int(np.floor(RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_NonResbuildings'].Values[nNN,nrr,ntt+SwitchTime-1]))]
-                            SysVar_GHGEms_GWP_bio_r[0,ntt,nrr] += 44/12 * mass_C * GWP_bio # convert from C to CO2                        
+                SysVar_GHGEms_GWP_bio_r[0,:,:] += rf.BiogenicCarbonGWP(RECC_System.FlowDict['F_6_7'].Values[:,:,Sector_nrb_rge,9,0],RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_NonResbuildings'].Values[:,:,SwitchTime-1:SwitchTime-1+Nt],\
+                                                   RECC_System.ParameterDict['6_MIP_GWP_Bio'].Values,RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc])
             if 'nrbg' in SectorList:
-                for ntt in range(0,Nt):
-                    for nNN in range(0,NN):
-                        #total carbon in wood (carbon content ca. 0.5)
-                        mass_C  = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] *12/44 * RECC_System.FlowDict['F_6_7_No'].Values[ntt,0,Sector_nrbg_rge_reg[nNN],9,0]
-                        GWP_bio = RECC_System.ParameterDict['6_MIP_GWP_Bio'].Values[int(np.floor(RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_nonresbuildings_g'].Values[nNN,0,ntt+SwitchTime-1]))]
-                        SysVar_GHGEms_GWP_bio_o[0,ntt] += 44/12 * mass_C * GWP_bio # convert from C to CO2                        
+                SysVar_GHGEms_GWP_bio_o[0,:]   += rf.BiogenicCarbonGWP(RECC_System.FlowDict['F_6_7_No'].Values[:,0:1,Sector_nrbg_rge_reg,9,0],RECC_System.ParameterDict['3_LT_RECC_ProductLifetime_nonresbuildings_g'].Values[:,0:1,SwitchTime-1:SwitchTime-1+Nt],\
+                                                   RECC_System.ParameterDict['6_MIP_GWP_Bio'].Values,RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc])[:,0]
             SysVar_GHGEms_GWP_bio = np.einsum('Xtr->Xt',SysVar_GHGEms_GWP_bio_r) + SysVar_GHGEms_GWP_bio_o
             # not used anymore! Have time and process-explicit carbon flow and stock accounting now.
             SysVar_CO2UptakeEmissions_Forests = np.zeros((NX,Nt,Nm))
@@ -2394,8 +2480,8 @@ def main():
             FabricationScrap[:,:,mS,mR]                 = RECC_System.FlowDict['F_5_10'].Values[:,0,:,0].copy()
             ReUse_Materials[:,:,mS,mR]                  = np.einsum('tcrgm->tm',RECC_System.FlowDict['F_17_6'].Values[:,:,:,:,:,0]) + np.einsum('tclLm->tm',RECC_System.FlowDict['F_17_6_Nl'].Values[:,:,:,:,:,0]) + np.einsum('tcoOm->tm',RECC_System.FlowDict['F_17_6_No'].Values[:,:,:,:,:,0])
             Carbon_Wood_Inflow[:,mS,mR]                 = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] * 12/44 * (np.einsum('trg->t', RECC_System.FlowDict['F_6_7'].Values[:,:,:,Wood_loc,0]).copy() + np.einsum('tlL->t', RECC_System.FlowDict['F_6_7_Nl'].Values[:,:,:,Wood_loc,0]).copy() + np.einsum('toO->t', RECC_System.FlowDict['F_6_7_No'].Values[:,:,:,Wood_loc,0]).copy())
-            Carbon_Wood_Outflow[:,mS,mR]                = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] * 12/44 * (np.einsum('tcrg->t',RECC_System.FlowDict['F_7_8'].Values[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tclL->t',RECC_System.FlowDict['F_7_8_Nl'].Values[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tcoO->t',RECC_System.FlowDict['F_7_8_No'].Values[:,:,:,:,Wood_loc,0]).copy())
-            Carbon_Wood_Stock[:,mS,mR]                  = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] * 12/44 * (np.einsum('tcrg->t',RECC_System.StockDict['S_7'].Values[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tclL->t',RECC_System.StockDict['S_7_Nl'].Values[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tcoO->t',RECC_System.StockDict['S_7_No'].Values[:,:,:,:,Wood_loc,0]).copy())
+            Carbon_Wood_Outflow[:,mS,mR]                = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] * 12/44 * (RECC_System.FlowDict['F_7_8'].Values.Sum('tcrg->t',np.s_[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tclL->t',RECC_System.FlowDict['F_7_8_Nl'].Values[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tcoO->t',RECC_System.FlowDict['F_7_8_No'].Values[:,:,:,:,Wood_loc,0]).copy())
+            Carbon_Wood_Stock[:,mS,mR]                  = RECC_System.ParameterDict['3_MC_CO2FromWoodCombustion'].Values[0,Wood_loc] * 12/44 * (RECC_System.StockDict['S_7'].Values.Sum('tcrg->t',np.s_[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tclL->t',RECC_System.StockDict['S_7_Nl'].Values[:,:,:,:,Wood_loc,0]).copy() + np.einsum('tcoO->t',RECC_System.StockDict['S_7_No'].Values[:,:,:,:,Wood_loc,0]).copy())
             # Energy flows
             EnergyCons_UP_Vh[:,mS,mR]                   = np.einsum('trpn->t',SysVar_EnergyDemand_UsePhase_ByEnergyCarrier_pav).copy()
             EnergyCons_UP_Bd[:,mS,mR]                   = np.einsum('trBn->t',SysVar_EnergyDemand_UsePhase_ByEnergyCarrier_reb).copy() + np.einsum('trNn->t',SysVar_EnergyDemand_UsePhase_ByEnergyCarrier_nrb).copy() + np.einsum('toNn->t',SysVar_EnergyDemand_UsePhase_ByEnergyCarrier_nrbg).copy()
@@ -2409,23 +2495,24 @@ def main():
             # Service flows
             # Hop over to save memory:
             # Vehicle_km[:,mS,mR]                         = np.einsum('tcpr->t',SysVar_StockServiceProvision_UsePhase_pav[:,:,:,:,Service_Driving])
-            Vehicle_km[:,mS,mR]                         = np.einsum('rt,tcpr->t', RECC_System.ParameterDict['3_IO_Vehicles_UsePhase_eff' ].Values[Service_Drivg,:,:,mS],   Stock_Detail_UsePhase_p)
+            if 'pav' in SectorList:
+                Vehicle_km[:,mS,mR]                     = np.einsum('rt,tcpr->t', RECC_System.ParameterDict['3_IO_Vehicles_UsePhase_eff' ].Values[Service_Drivg,:,:,mS],   Stock_Detail_UsePhase_p)
             # Parameters        
             Vehicle_FuelEff[:,:,:,mS,mR]                = np.einsum('tpnr->tpr',RECC_System.ParameterDict['3_EI_Products_UsePhase_passvehicles'].Values[SwitchTime-1::,:,Service_Drivg,:,:,mS])
             ResBuildng_EnergyCons[:,:,:,mS,mR]          = np.einsum('VtBnr->tBr',RECC_System.ParameterDict['3_EI_Products_UsePhase_resbuildings'].Values[SwitchTime-1::,:,Service_Reb,:,:,mS])
             GWP_bio_Credit[:,mS,mR]                     = SysVar_GHGEms_GWP_bio[0,:].copy()
             # Product flows
             EoL_Products_for_WasteMgt[:,:,mS,mR]        = np.einsum('trgm->tg', RECC_System.FlowDict['F_8_9'].Values[:,:,:,:,0]).copy()
-            Outflow_Products_Usephase_all[:,:,mS,mR]    = np.einsum('tcrgm->tg',RECC_System.FlowDict['F_7_8'].Values[:,:,:,:,:,0]).copy()
+            Outflow_Products_Usephase_all[:,:,mS,mR]    = RECC_System.FlowDict['F_7_8'].Values.Sum('tcrgm->tg',np.s_[:,:,:,:,:,0]).copy()
             if 'ind' in SectorList:
                 EoL_Products_for_WasteMgt[:,Sector_11reg_rge,mS,mR]        = np.einsum('tlLm->tL', RECC_System.FlowDict['F_8_9_Nl'].Values[:,:,:,:,0]).copy()
                 Outflow_Products_Usephase_all[:,Sector_11reg_rge,mS,mR]    = np.einsum('tclLm->tL',RECC_System.FlowDict['F_7_8_Nl'].Values[:,:,:,:,:,0]).copy()   
             if 'app' in SectorList or 'nrbg' in SectorList:
                 EoL_Products_for_WasteMgt[:,Sector_1reg_rge,mS,mR]         = np.einsum('toOm->tO', RECC_System.FlowDict['F_8_9_No'].Values[:,:,:,:,0]).copy()
                 Outflow_Products_Usephase_all[:,Sector_1reg_rge,mS,mR]     = np.einsum('tcoOm->tO',RECC_System.FlowDict['F_7_8_No'].Values[:,:,:,:,:,0]).copy()               
-            Outflow_Materials_Usephase_all[:,:,mS,mR]   = np.einsum('tcrgm->tm',RECC_System.FlowDict['F_7_8'].Values[:,:,:,:,:,0]).copy() + np.einsum('tclLm->tm',RECC_System.FlowDict['F_7_8_Nl'].Values[:,:,:,:,:,0]).copy() + np.einsum('tcoOm->tm',RECC_System.FlowDict['F_7_8_No'].Values[:,:,:,:,:,0]).copy()
+            Outflow_Materials_Usephase_all[:,:,mS,mR]   = RECC_System.FlowDict['F_7_8'].Values.Sum('tcrgm->tm',np.s_[:,:,:,:,:,0]).copy() + np.einsum('tclLm->tm',RECC_System.FlowDict['F_7_8_Nl'].Values[:,:,:,:,:,0]).copy() + np.einsum('tcoOm->tm',RECC_System.FlowDict['F_7_8_No'].Values[:,:,:,:,:,0]).copy()
             WasteMgtLosses_To_Landfill[:,:,mS,mR]       = RECC_System.FlowDict['F_9_0'].Values.copy()
-            StockCurves_Mat[:,:,mS,mR]                  = np.einsum('tcrgm->tm',RECC_System.StockDict['S_7'].Values[:,:,:,:,:,0]).copy() + np.einsum('tclLm->tm',RECC_System.StockDict['S_7_Nl'].Values[:,:,:,:,:,0]).copy() + np.einsum('tcoOm->tm',RECC_System.StockDict['S_7_No'].Values[:,:,:,:,:,0]).copy()
+            StockCurves_Mat[:,:,mS,mR]                  = RECC_System.StockDict['S_7'].Values.Sum('tcrgm->tm',np.s_[:,:,:,:,:,0]).copy() + np.einsum('tclLm->tm',RECC_System.StockDict['S_7_Nl'].Values[:,:,:,:,:,0]).copy() + np.einsum('tcoOm->tm',RECC_System.StockDict['S_7_No'].Values[:,:,:,:,:,0]).copy()
             
     #        # Diagnostics:
     #        Aa = np.einsum('trpn->trp',SysVar_EnergyDemand_UsePhase_ByEnergyCarrier_pav)   # Total use phase energy demand, pav
@@ -2446,6 +2533,8 @@ def main():
             ExitFlags['Positive_Inflow_F6_7_R32_SSP_'  + str(mS) + '_RCP_' + str(mR)] = np.isclose(RECC_System.FlowDict['F_6_7'].Values.min(),0, IsClose_Remainder_Small)
             ExitFlags['Positive_Outflow_F7_8_R32_SSP_' + str(mS) + '_RCP_' + str(mR)] = np.isclose(RECC_System.FlowDict['F_7_8'].Values.min(),0, IsClose_Remainder_Small)  
             ExitFlags['Positive_Inflow_F8_9_R32_SSP_'  + str(mS) + '_RCP_' + str(mR)] = np.isclose(RECC_System.FlowDict['F_8_9'].Values.min(),0, IsClose_Remainder_Small)
+            Mylog.info(SFCache.Statistics())
+            ScenarioPool.Return(mS, mR) # worker processes return their results to the main process and exit here
             
             # del RECC_System # Delete system when done, clear memory.
             '''                
@@ -2475,6 +2564,8 @@ def main():
     #   Section 7) Export and plot results, save, and close      #
     ##############################################################
     Mylog.info('## 5 - Evaluate results, save, and close')
+    import xlwt
+    import openpyxl
     myfont = xlwt.Font()
     myfont.bold = True
     mystyle = xlwt.XFStyle()
@@ -2483,19 +2574,38 @@ def main():
     Mylog.info('### 5.0 - Check data and resuls for boundary constraints and plausibility. Exit flags.')
     Mylog.info('Model input')          
     
-    ExitFlags['3_SHA_LightWeighting_Vehicles_min']             = ParameterDict['3_SHA_LightWeighting_Vehicles'].Values.min() >= 0
-    ExitFlags['3_SHA_LightWeighting_Vehicles_max']             = ParameterDict['3_SHA_LightWeighting_Vehicles'].Values.max()/100 <= 1 # unit is % not 1!
-    ExitFlags['3_SHA_DownSizing_Vehicles_min']                 = ParameterDict['3_SHA_DownSizing_Vehicles'].Values.min() >= 0
-    ExitFlags['3_SHA_DownSizing_Vehicles_max']                 = ParameterDict['3_SHA_DownSizing_Vehicles'].Values.max() <= 1
-    ExitFlags['3_SHA_TypeSplit_Vehicles_min']                  = ParameterDict['3_SHA_TypeSplit_Vehicles'].Values.min() >= 0
-    ExitFlags['3_SHA_TypeSplit_Vehicles_max']                  = ParameterDict['3_SHA_TypeSplit_Vehicles'].Values.max() <= 1
-    ExitFlags['3_SHA_TypeSplit_Buildings_min']                 = ParameterDict['3_SHA_TypeSplit_Buildings'].Values.min() >= 0
-    ExitFlags['3_SHA_TypeSplit_Buildings_max']                 = ParameterDict['3_SHA_TypeSplit_Buildings'].Values.max() <= 1
-    ExitFlags['3_SHA_TypeSplit_Buildings_sum']                 = np.isclose(ParameterDict['3_SHA_TypeSplit_Buildings'].Values.sum(),Nr*Nt*NS, IsClose_Remainder_Large)
-    ExitFlags['3_SHA_TypeSplit_NonResBuildings_min']           = ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values.min() >= 0
-    ExitFlags['3_SHA_TypeSplit_NonResBuildings_max']           = ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values.max() <= 1
+    if 'pav' in SectorList:
+        ExitFlags['3_SHA_LightWeighting_Vehicles_min']             = ParameterDict['3_SHA_LightWeighting_Vehicles'].Values.min() >= 0
+        ExitFlags['3_SHA_LightWeighting_Vehicles_max']             = ParameterDict['3_SHA_LightWeighting_Vehicles'].Values.max()/100 <= 1 # unit is % not 1!
+        ExitFlags['3_SHA_DownSizing_Vehicles_min']                 = ParameterDict['3_SHA_DownSizing_Vehicles'].Values.min() >= 0
+        ExitFlags['3_SHA_DownSizing_Vehicles_max']                 = ParameterDict['3_SHA_DownSizing_Vehicles'].Values.max() <= 1
+        ExitFlags['3_SHA_TypeSplit_Vehicles_min']                  = ParameterDict['3_SHA_TypeSplit_Vehicles'].Values.min() >= 0
+        ExitFlags['3_SHA_TypeSplit_Vehicles_max']                  = ParameterDict['3_SHA_TypeSplit_Vehicles'].Values.max() <= 1
+    if 'reb' in SectorList:
+        ExitFlags['3_SHA_TypeSplit_Buildings_min']                 = ParameterDict['3_SHA_TypeSplit_Buildings'].Values.min() >= 0
+        ExitFlags['3_SHA_TypeSplit_Buildings_max']                 = ParameterDict['3_SHA_TypeSplit_Buildings'].Values.max() <= 1
+        ExitFlags['3_SHA_TypeSplit_Buildings_sum']                 = np.isclose(ParameterDict['3_SHA_TypeSplit_Buildings'].Values.sum(),Nr*Nt*NS, IsClose_Remainder_Large)
+    if 'nrb' in SectorList:
+        ExitFlags['3_SHA_TypeSplit_NonResBuildings_min']           = ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values.min() >= 0
+        ExitFlags['3_SHA_TypeSplit_NonResBuildings_max']           = ParameterDict['3_SHA_TypeSplit_NonResBuildings'].Values.max() <= 1
     ExitFlags['LTE_Renovation_Consistency']                    = bool(ScriptConfig['Include_REStrategy_LifeTimeExtension']) & bool(ScriptConfig['Include_Renovation_reb']) & bool(ScriptConfig['Include_Renovation_nrb'])
     ExitFlags['Secondary_Material_Flows_Positive']             = SecondaryProduct.min() >= 0
+    # Precision guard: float64 runs store the mass balance and the key GWP results as reference for runs of the same model setup with float32 storage.
+    PrecisionResults = {'MassBalance_Abs': MassBalance_Abs, 'GWP_System_3579di': GWP_System_3579di, 'GWP_UsePhase_7d': GWP_UsePhase_7d,
+                        'GWP_OtherThanUsePhaseDirect': GWP_OtherThanUsePhaseDirect, 'GWP_Materials_3di_9di': GWP_Materials_3di_9di}
+    PrecisionFile    = rf.PrecisionReferenceFile(ParCachePath, ScriptConfig, CheckKey)
+    if StorageDtype == np.dtype('float64'):
+        rf.StoreSnapshot(PrecisionFile, PrecisionResults)
+    else:
+        PrecisionReference = rf.LoadSnapshot(PrecisionFile, list(PrecisionResults.keys()))
+        if PrecisionReference is None:
+            Mylog.warning('No float64 reference run for this model setup, the results with ' + str(StorageDtype) + ' storage could not be checked. Run the model once with StorageDtype float64.')
+        else:
+            PrecisionTolerance = float(ScriptConfig.get('PrecisionTolerance',1e-4))
+            for Name, Deviation in rf.PrecisionDeviations(PrecisionResults, PrecisionReference).items():
+                ExitFlags['Precision_' + str(StorageDtype) + '_' + Name] = Deviation <= PrecisionTolerance
+                if Deviation > PrecisionTolerance:
+                    Mylog.warning('Result ' + Name + ' with ' + str(StorageDtype) + ' storage deviates from the float64 reference run by ' + '%.2e' % Deviation + ', more than the tolerance ' + str(PrecisionTolerance) + '.')
     
     
     ExitFlag_Export  = xlwt.Workbook(encoding = 'ascii') # Export file for exitflags
@@ -2528,193 +2638,193 @@ def main():
         ws2.cell(row=1, column=m+1).value = ColLabels[m]
         ws2.cell(row=1, column=m+1).font  = openpyxl.styles.Font(bold=True)
     for n in range(m+1,m+1+Nt):
-        ws2.cell(row=1, column=n+1).value = int(IndexTable.Classification[IndexTable.index.get_loc('Time')].Items[n-m-1])
+        ws2.cell(row=1, column=n+1).value = int(Dims.Items['Time'][n-m-1])
         ws2.cell(row=1, column=m+1).font  = openpyxl.styles.Font(bold=True)
     
     # GHG overview, bulk materials
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_System_3579di,2,len(ColLabels),'GHG emissions, system-wide _3579di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'all processes','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_PrimaryMaterial_3di,newrowoffset,len(ColLabels),'GHG emissions, primary material production _3di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'Process and direct emissions in process 3 and related energy supply','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,8,:,:],newrowoffset,len(ColLabels),'Cement production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,0:4,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Primary steel production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct.sum(axis=1),newrowoffset,len(ColLabels),'Secondary materials, total','Mt / yr',ScriptConfig['RegionalScope'],'F_10_12','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_System_3579di,2,len(ColLabels),'GHG emissions, system-wide _3579di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'all processes','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_PrimaryMaterial_3di,newrowoffset,len(ColLabels),'GHG emissions, primary material production _3di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'Process and direct emissions in process 3 and related energy supply','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,8,:,:],newrowoffset,len(ColLabels),'Cement production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,0:4,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Primary steel production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct.sum(axis=1),newrowoffset,len(ColLabels),'Secondary materials, total','Mt / yr',ScriptConfig['RegionalScope'],'F_10_12','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # final material consumption, fab scrap
     for m in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Material_Inflow[:,:,m,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Final consumption of materials: ' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[m],'Mt / yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Material_Inflow[:,:,m,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Final consumption of materials: ' + Dims.Items['Engineering materials'][m],'Mt / yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for m in range(0,Nw):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,FabricationScrap[:,m,:,:],newrowoffset,len(ColLabels),'Fabrication scrap: ' + IndexTable.Classification[IndexTable.index.get_loc('Waste_Scrap')].Items[m],'Mt / yr',ScriptConfig['RegionalScope'],'F_5_10','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,FabricationScrap[:,m,:,:],newrowoffset,len(ColLabels),'Fabrication scrap: ' + Dims.Items['Waste_Scrap'][m],'Mt / yr',ScriptConfig['RegionalScope'],'F_5_10','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # secondary materials
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,0:4,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Secondary steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,4:6,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Secondary Al','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,6,:,:],newrowoffset,len(ColLabels),'Secondary copper','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_UsePhase_7d,newrowoffset,len(ColLabels),'GHG emissions, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_OtherThanUsePhaseDirect,newrowoffset,len(ColLabels),'GHG emissions, other than use phase direct: all industries and energy supply','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,0:4,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Secondary steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,4:6,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Secondary Al','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,6,:,:],newrowoffset,len(ColLabels),'Secondary copper','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_UsePhase_7d,newrowoffset,len(ColLabels),'GHG emissions, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_OtherThanUsePhaseDirect,newrowoffset,len(ColLabels),'GHG emissions, other than use phase direct: all industries and energy supply','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'F_9_12','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # GHG emissions, detail
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Vehicles_Direct.sum(axis =1),newrowoffset,len(ColLabels),'GHG emissions, vehicles, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_7_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_ReBuildgs_Direct.sum(axis =1),newrowoffset,len(ColLabels),'GHG emissions, res. buildings, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_7_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_NRBuildgs_Direct.sum(axis =1),newrowoffset,len(ColLabels),'GHG emissions, non-res. buildings, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_7_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Vehicles_indir,newrowoffset,len(ColLabels),'GHG emissions, vehicles, energy supply _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_AllBuildings_indir,newrowoffset,len(ColLabels),'GHG emissions, res+non-res buildings, energy supply _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Manufact_5di_all,newrowoffset,len(ColLabels),'GHG emissions, manufacturing _5i, all','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_5_0','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_WasteMgt_9di_all,newrowoffset,len(ColLabels),'GHG emissions, waste mgt. and remelting _9di, all','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_9_0','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,4:6,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Primary Al production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,6,:,:],newrowoffset,len(ColLabels),'Primary Cu production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Materials_3di_9di,newrowoffset,len(ColLabels),'GHG emissions, material cycle industries and their energy supply _3di_9di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_3_0 and related energy supply emissions','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Vehicles_Direct.sum(axis =1),newrowoffset,len(ColLabels),'GHG emissions, vehicles, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_7_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_ReBuildgs_Direct.sum(axis =1),newrowoffset,len(ColLabels),'GHG emissions, res. buildings, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_7_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_NRBuildgs_Direct.sum(axis =1),newrowoffset,len(ColLabels),'GHG emissions, non-res. buildings, use phase _7d','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_7_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Vehicles_indir,newrowoffset,len(ColLabels),'GHG emissions, vehicles, energy supply _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_AllBuildings_indir,newrowoffset,len(ColLabels),'GHG emissions, res+non-res buildings, energy supply _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Manufact_5di_all,newrowoffset,len(ColLabels),'GHG emissions, manufacturing _5i, all','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_5_0','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_WasteMgt_9di_all,newrowoffset,len(ColLabels),'GHG emissions, waste mgt. and remelting _9di, all','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_9_0','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,4:6,:,:].sum(axis=1),newrowoffset,len(ColLabels),'Primary Al production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,6,:,:],newrowoffset,len(ColLabels),'Primary Cu production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_Materials_3di_9di,newrowoffset,len(ColLabels),'GHG emissions, material cycle industries and their energy supply _3di_9di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_3_0 and related energy supply emissions','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # energy flows
     for nn in range(0,Nn):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_total[:,nn,:,:],newrowoffset,len(ColLabels),'energy consumption, system-wide: ' + IndexTable.Classification[IndexTable.index.get_loc('Energy')].Items[nn],'Tt / yr',ScriptConfig['RegionalScope'],'F_15_x','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Vh,newrowoffset,len(ColLabels),'Energy cons., use phase, vehicles','TJ/yr',ScriptConfig['RegionalScope'],'E_16_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Bd,newrowoffset,len(ColLabels),'Energy cons., use phase, res+non-res buildings','TJ/yr',ScriptConfig['RegionalScope'],'E_16_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Mn,newrowoffset,len(ColLabels),'Energy cons., use phase, manufacturing','TJ/yr',ScriptConfig['RegionalScope'],'E_16_5','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Wm,newrowoffset,len(ColLabels),'Energy cons., use phase, waste mgt. and remelting','TJ/yr',ScriptConfig['RegionalScope'],'E_16_9','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_total[:,nn,:,:],newrowoffset,len(ColLabels),'energy consumption, system-wide: ' + Dims.Items['Energy'][nn],'Tt / yr',ScriptConfig['RegionalScope'],'F_15_x','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Vh,newrowoffset,len(ColLabels),'Energy cons., use phase, vehicles','TJ/yr',ScriptConfig['RegionalScope'],'E_16_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Bd,newrowoffset,len(ColLabels),'Energy cons., use phase, res+non-res buildings','TJ/yr',ScriptConfig['RegionalScope'],'E_16_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Mn,newrowoffset,len(ColLabels),'Energy cons., use phase, manufacturing','TJ/yr',ScriptConfig['RegionalScope'],'E_16_5','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Wm,newrowoffset,len(ColLabels),'Energy cons., use phase, waste mgt. and remelting','TJ/yr',ScriptConfig['RegionalScope'],'E_16_9','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # stocks
     if 'pav' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Totl[:,Sector_pav_loc,:,:],newrowoffset,len(ColLabels),'In-use stock, pass. vehicles','million units',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Totl[:,Sector_pav_loc,:,:],newrowoffset,len(ColLabels),'In-use stock, pass. vehicles','million units',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     if 'reb' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Totl[:,Sector_reb_loc,:,:],newrowoffset,len(ColLabels),'In-use stock, res. buildings','million m2',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Totl[:,Sector_reb_loc,:,:],newrowoffset,len(ColLabels),'In-use stock, res. buildings','million m2',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     if 'nrb' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Totl[:,Sector_nrb_loc,:,:],newrowoffset,len(ColLabels),'In-use stock, nonres. buildings','million m2',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Totl[:,Sector_nrb_loc,:,:],newrowoffset,len(ColLabels),'In-use stock, nonres. buildings','million m2',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for mg in range(0,Ng):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Prod[:,mg,:,:],newrowoffset,len(ColLabels),'In-use stock, ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[mg],'Vehicles: million, Buildings: million m2',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Prod[:,mg,:,:],newrowoffset,len(ColLabels),'In-use stock, ' + Dims.Items['Good'][mg],'Vehicles: million, Buildings: million m2',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for mm in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Mat[:,mm,:,:],newrowoffset,len(ColLabels),'In-use stock, ' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[mm],'Mt',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,StockCurves_Mat[:,mm,:,:],newrowoffset,len(ColLabels),'In-use stock, ' + Dims.Items['Engineering materials'][mm],'Mt',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     #per capita stocks per sector
     for mr in range(0,Nr):
         for mG in range(0,NG):
-            newrowoffset = msf.xlsxExportAdd_tAB(ws2,pCStocksCurves[:,mG,mr,:,:],newrowoffset,len(ColLabels),'per capita in-use stock, ' + IndexTable.Classification[IndexTable.index.get_loc('Sectors')].Items[mG],'vehicles: cars per person, buildings: m2 per person',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'S_7 (part, per capita)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+            newrowoffset = msf.xlsxExportAdd_tAB(ws2,pCStocksCurves[:,mG,mr,:,:],newrowoffset,len(ColLabels),'per capita in-use stock, ' + Dims.Items['Sectors'][mG],'vehicles: cars per person, buildings: m2 per person',Dims.Items['Region32'][mr],'S_7 (part, per capita)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     #population
     for mr in range(0,Nr):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Population[:,mr,:,:],newrowoffset,len(ColLabels),'Population','million',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'P (population)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Population[:,mr,:,:],newrowoffset,len(ColLabels),'Population','million',Dims.Items['Region32'][mr],'P (population)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     #UsingLessMaterialByDesign and Mat subst. shares
     # a) pass. vehicles:
     if 'pav' in SectorList:
         for mr in range(0,Nr):
             for ms in range(0,Ns):
-                newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_DownSizing_Vehicles'].Values[ms,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels),'Share of newly registered pass. vehicles in segment ' +IndexTable.Classification[IndexTable.index.get_loc('Car_segments')].Items[ms],'1',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'F_6_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)    
+                newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_DownSizing_Vehicles'].Values[ms,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels),'Share of newly registered pass. vehicles in segment ' +Dims.Items['Car_segments'][ms],'1',Dims.Items['Region32'][mr],'F_6_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])    
             for mp in range(0,len(Sector_pav_rge)):
-                newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_LightWeighting_Vehicles'].Values[mp,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels), 'Share of newly registered light-weighted ' +IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[Sector_pav_rge[mp]],'%',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'F_6_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)      
+                newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_LightWeighting_Vehicles'].Values[mp,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels), 'Share of newly registered light-weighted ' +Dims.Items['Good'][Sector_pav_rge[mp]],'%',Dims.Items['Region32'][mr],'F_6_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])      
     # b) res. buildings   
     if 'reb' in SectorList:     
         for mr in range(0,Nr):
-            newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_DownSizing_Buildings'].Values[0,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels),'Share of newly built downsized res. buildings','%',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'F_6_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)    
+            newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_DownSizing_Buildings'].Values[0,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels),'Share of newly built downsized res. buildings','%',Dims.Items['Region32'][mr],'F_6_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])    
             for mB in range(0,len(Sector_reb_rge)):
-                newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_LightWeighting_Buildings'].Values[mB,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels),'Share of newly built light-weighted ' +IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[Sector_reb_rge[mB]],'%',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'F_6_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)    
+                newrowoffset = msf.xlsxExportAdd_tAB(ws2,np.einsum('tS,R->tSR',ParameterDict['3_SHA_LightWeighting_Buildings'].Values[mB,mr,:,:],np.ones((NR))),newrowoffset,len(ColLabels),'Share of newly built light-weighted ' +Dims.Items['Good'][Sector_reb_rge[mB]],'%',Dims.Items['Region32'][mr],'F_6_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])    
     #vehicle km 
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Vehicle_km,newrowoffset,len(ColLabels),'km driven by pass. vehicles','million km/yr',ScriptConfig['RegionalScope'],'P7 (use phase)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Vehicle_km,newrowoffset,len(ColLabels),'km driven by pass. vehicles','million km/yr',ScriptConfig['RegionalScope'],'P7 (use phase)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # Use phase indirect GHG, primary prodution GHG, material cycle and recycling credit
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_UsePhase_7i_Scope2_El,newrowoffset,len(ColLabels),'GHG emissions, use phase scope 2 (electricity) _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (electricity, for use phase energy)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_UsePhase_7i_OtherIndir,newrowoffset,len(ColLabels),'GHG emissions, use phase other indirect (non-el.) _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (other than el., for use phase energy)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_PrimaryMaterial_3di,newrowoffset,len(ColLabels),'GHG emissions, primary material production (redundant) _3di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_3_0','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_MaterialCycle_5di_9di,newrowoffset,len(ColLabels),'GHG emissions, manufact, wast mgt., remelting and indirect _5di_9di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_9_0 + E_15_0 (part, for energy supply waste mgt.)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_RecyclingCredit,newrowoffset,len(ColLabels),'GHG emissions, recycling credits','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'outside system','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_ForestCO2Uptake,newrowoffset,len(ColLabels),'GHG sequestration by forests (w. neg. sign)','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'Process 1','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_EnergyRecoveryWasteWood,newrowoffset,len(ColLabels),'GHG emissions, energy recovery from waste wood (biogenic C plus energy substitution within System)','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'waste mgt. and energy supply','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_UsePhase_7i_Scope2_El,newrowoffset,len(ColLabels),'GHG emissions, use phase scope 2 (electricity) _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (electricity, for use phase energy)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_UsePhase_7i_OtherIndir,newrowoffset,len(ColLabels),'GHG emissions, use phase other indirect (non-el.) _7i','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_15_0 (other than el., for use phase energy)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_PrimaryMaterial_3di,newrowoffset,len(ColLabels),'GHG emissions, primary material production (redundant) _3di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_3_0','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_MaterialCycle_5di_9di,newrowoffset,len(ColLabels),'GHG emissions, manufact, wast mgt., remelting and indirect _5di_9di','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'E_9_0 + E_15_0 (part, for energy supply waste mgt.)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_RecyclingCredit,newrowoffset,len(ColLabels),'GHG emissions, recycling credits','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'outside system','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_ForestCO2Uptake,newrowoffset,len(ColLabels),'GHG sequestration by forests (w. neg. sign)','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'Process 1','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_EnergyRecoveryWasteWood,newrowoffset,len(ColLabels),'GHG emissions, energy recovery from waste wood (biogenic C plus energy substitution within System)','Mt of CO2-eq / yr',ScriptConfig['RegionalScope'],'waste mgt. and energy supply','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # Primary and secondary material production, if not included above already
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,0,:,:], newrowoffset,len(ColLabels),'Primary construction grade steel production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,1,:,:], newrowoffset,len(ColLabels),'Primary automotive steel production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,2,:,:], newrowoffset,len(ColLabels),'Primary stainless production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,3,:,:], newrowoffset,len(ColLabels),'Primary cast iron production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,4,:,:], newrowoffset,len(ColLabels),'Primary wrought Al production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,5,:,:], newrowoffset,len(ColLabels),'Primary cast Al production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,7,:,:], newrowoffset,len(ColLabels),'Primary plastics production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,9,:,:], newrowoffset,len(ColLabels),'Wood, from forests','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,10,:,:],newrowoffset,len(ColLabels),'Primary zinc production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,0,:,:],  newrowoffset,len(ColLabels),'Secondary construction steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,1,:,:],  newrowoffset,len(ColLabels),'Secondary automotive steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,2,:,:],  newrowoffset,len(ColLabels),'Secondary stainless steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,3,:,:],  newrowoffset,len(ColLabels),'Secondary cast iron','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,4,:,:],  newrowoffset,len(ColLabels),'Secondary wrought Al','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,5,:,:],  newrowoffset,len(ColLabels),'Secondary cast Al','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,7,:,:],  newrowoffset,len(ColLabels),'Secondary plastics','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,9,:,:],  newrowoffset,len(ColLabels),'Recycled wood','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,10,:,:], newrowoffset,len(ColLabels),'Recycled zinc','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,11,:,:], newrowoffset,len(ColLabels),'Recycled concrete','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,0,:,:], newrowoffset,len(ColLabels),'Primary construction grade steel production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,1,:,:], newrowoffset,len(ColLabels),'Primary automotive steel production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,2,:,:], newrowoffset,len(ColLabels),'Primary stainless production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,3,:,:], newrowoffset,len(ColLabels),'Primary cast iron production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,4,:,:], newrowoffset,len(ColLabels),'Primary wrought Al production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,5,:,:], newrowoffset,len(ColLabels),'Primary cast Al production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,7,:,:], newrowoffset,len(ColLabels),'Primary plastics production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,9,:,:], newrowoffset,len(ColLabels),'Wood, from forests','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,PrimaryProduction[:,10,:,:],newrowoffset,len(ColLabels),'Primary zinc production','Mt / yr',ScriptConfig['RegionalScope'],'F_3_4 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,0,:,:],  newrowoffset,len(ColLabels),'Secondary construction steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,1,:,:],  newrowoffset,len(ColLabels),'Secondary automotive steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,2,:,:],  newrowoffset,len(ColLabels),'Secondary stainless steel','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,3,:,:],  newrowoffset,len(ColLabels),'Secondary cast iron','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,4,:,:],  newrowoffset,len(ColLabels),'Secondary wrought Al','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,5,:,:],  newrowoffset,len(ColLabels),'Secondary cast Al','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,7,:,:],  newrowoffset,len(ColLabels),'Secondary plastics','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,9,:,:],  newrowoffset,len(ColLabels),'Recycled wood','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,10,:,:], newrowoffset,len(ColLabels),'Recycled zinc','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryProduct[:,11,:,:], newrowoffset,len(ColLabels),'Recycled concrete','Mt / yr',ScriptConfig['RegionalScope'],'F_9_12 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # GHG of primary and secondary material production
     for mm in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_PrimaryMaterial_3di_m[:,mm,:,:],newrowoffset,len(ColLabels),'GHG emissions, production of primary _3di_' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[mm],'Mt/yr',ScriptConfig['RegionalScope'],'E_3_0 (part) and associated em. in E_15_0','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_PrimaryMaterial_3di_m[:,mm,:,:],newrowoffset,len(ColLabels),'GHG emissions, production of primary _3di_' + Dims.Items['Engineering materials'][mm],'Mt/yr',ScriptConfig['RegionalScope'],'E_3_0 (part) and associated em. in E_15_0','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for mm in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_SecondaryMetal_di_m[:,mm,:,:],newrowoffset,len(ColLabels),'GHG emissions, production of secondary _di_' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[mm],'Mt/yr',ScriptConfig['RegionalScope'],'E_9_0 (part) and associated em. in E_15_0','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_SecondaryMetal_di_m[:,mm,:,:],newrowoffset,len(ColLabels),'GHG emissions, production of secondary _di_' + Dims.Items['Engineering materials'][mm],'Mt/yr',ScriptConfig['RegionalScope'],'E_9_0 (part) and associated em. in E_15_0','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # inflow and outflow of commodities
     for mg in range(0,Ng):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Inflow_Prod[:,mg,:,:],newrowoffset,len(ColLabels),'final consumption (use phase inflow), ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Inflow_Prod[:,mg,:,:],newrowoffset,len(ColLabels),'final consumption (use phase inflow), ' + Dims.Items['Good'][mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     if 'pav' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Inflow_Prod[:,Sector_pav_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'final consumption (use phase inflow), all drive technologies together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Inflow_Prod[:,Sector_pav_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'final consumption (use phase inflow), all drive technologies together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     if 'reb' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Inflow_Prod[:,Sector_reb_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'final consumption (use phase inflow), all res. building types together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Inflow_Prod[:,Sector_reb_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'final consumption (use phase inflow), all res. building types together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_6_7','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for mg in range(0,Ng):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Prod[:,mg,:,:],newrowoffset,len(ColLabels),'EoL products (use phase outflow), ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Prod[:,mg,:,:],newrowoffset,len(ColLabels),'EoL products (use phase outflow), ' + Dims.Items['Good'][mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     if 'pav' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Prod[:,Sector_pav_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'EoL products (use phase outflow), all drive technologies together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Prod[:,Sector_pav_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'EoL products (use phase outflow), all drive technologies together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     if 'reb' in SectorList:
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Prod[:,Sector_reb_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'EoL products (use phase outflow), all building types together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)        
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Prod[:,Sector_reb_rge,:,:].sum(axis=1),newrowoffset,len(ColLabels),'EoL products (use phase outflow), all building types together','Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])        
     # Material reuse
     for mm in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,ReUse_Materials[:,mm,:,:],newrowoffset,len(ColLabels),'ReUse of materials in products, ' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[mm],'Mt/yr',ScriptConfig['RegionalScope'],'F_17_6','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,ReUse_Materials[:,mm,:,:],newrowoffset,len(ColLabels),'ReUse of materials in products, ' + Dims.Items['Engineering materials'][mm],'Mt/yr',ScriptConfig['RegionalScope'],'F_17_6','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # carbon in wood inflow, stock, and outflow
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Carbon_Wood_Inflow, newrowoffset,len(ColLabels),'Carbon in wood and wood products, final consumption/inflow','Mt/yr',ScriptConfig['RegionalScope'],'F_6_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)    
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Carbon_Wood_Outflow,newrowoffset,len(ColLabels),'Carbon in wood and wood products, EoL flows, outflow use phase','Mt/yr',ScriptConfig['RegionalScope'],'F_7_8 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)        
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Carbon_Wood_Stock,  newrowoffset,len(ColLabels),'Carbon in wood and wood products, in-use stock','Mt',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)    
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Carbon_Wood_Inflow, newrowoffset,len(ColLabels),'Carbon in wood and wood products, final consumption/inflow','Mt/yr',ScriptConfig['RegionalScope'],'F_6_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])    
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Carbon_Wood_Outflow,newrowoffset,len(ColLabels),'Carbon in wood and wood products, EoL flows, outflow use phase','Mt/yr',ScriptConfig['RegionalScope'],'F_7_8 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])        
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Carbon_Wood_Stock,  newrowoffset,len(ColLabels),'Carbon in wood and wood products, in-use stock','Mt',ScriptConfig['RegionalScope'],'S_7 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])    
     # specific energy consumption of vehicles and buildings
     for mr in range(0,Nr):
         for mp in range(0,len(Sector_pav_rge)):
-            newrowoffset = msf.xlsxExportAdd_tAB(ws2,Vehicle_FuelEff[:,mp,mr,:,:],newrowoffset,len(ColLabels),'specific energy consumption, driving, ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[Sector_pav_rge[mp]],'MJ/km',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'use phase','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+            newrowoffset = msf.xlsxExportAdd_tAB(ws2,Vehicle_FuelEff[:,mp,mr,:,:],newrowoffset,len(ColLabels),'specific energy consumption, driving, ' + Dims.Items['Good'][Sector_pav_rge[mp]],'MJ/km',Dims.Items['Region32'][mr],'use phase','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for mr in range(0,Nr):
         for mB in range(0,len(Sector_reb_rge)):
-            newrowoffset = msf.xlsxExportAdd_tAB(ws2,ResBuildng_EnergyCons[:,mB,mr,:,:],newrowoffset,len(ColLabels),'specific energy consumption, heating/cooling/DHW, ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[Sector_reb_rge[mB]],'MJ/m2',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'use phase','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+            newrowoffset = msf.xlsxExportAdd_tAB(ws2,ResBuildng_EnergyCons[:,mB,mr,:,:],newrowoffset,len(ColLabels),'specific energy consumption, heating/cooling/DHW, ' + Dims.Items['Good'][Sector_reb_rge[mB]],'MJ/m2',Dims.Items['Region32'][mr],'use phase','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # specific energy consumption of vehicles and residential buildings
     for mr in range(0,Nr):
         for mV in range(0,NV):
-            newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Service[:,mr,mV,:,:],newrowoffset,len(ColLabels),'Total use phase energy consumption, ' + IndexTable.Classification[IndexTable.index.get_loc('ServiceType')].Items[mV],'TJ/yr',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'use phase','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+            newrowoffset = msf.xlsxExportAdd_tAB(ws2,EnergyCons_UP_Service[:,mr,mV,:,:],newrowoffset,len(ColLabels),'Total use phase energy consumption, ' + Dims.Items['ServiceType'][mV],'TJ/yr',Dims.Items['Region32'][mr],'use phase','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # GWP by energy carrier, vehicles and residential buildings
     for mr in range(0,Nr):
         for mn in range(0,Nn):
-            newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_ByEnergyCarrier_UsePhase_d[:,mr,mn,:,:] + GWP_ByEnergyCarrier_UsePhase_i[:,mr,mn,:,:],newrowoffset,len(ColLabels),'GWP by energy carrier, use phase direct + indirect, all sectors covered by model run, ' + IndexTable.Classification[IndexTable.index.get_loc('Energy')].Items[mn],'Mt/yr',IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items[mr],'use phase and scope 2','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+            newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_ByEnergyCarrier_UsePhase_d[:,mr,mn,:,:] + GWP_ByEnergyCarrier_UsePhase_i[:,mr,mn,:,:],newrowoffset,len(ColLabels),'GWP by energy carrier, use phase direct + indirect, all sectors covered by model run, ' + Dims.Items['Energy'][mn],'Mt/yr',Dims.Items['Region32'][mr],'use phase and scope 2','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # carbon credit from longterm biomass storage
-    # newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_bio_Credit,newrowoffset,len(ColLabels),'GWP_bio_usephase','Mt / yr',ScriptConfig['RegionalScope'],'use phase','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)        
+    # newrowoffset = msf.xlsxExportAdd_tAB(ws2,GWP_bio_Credit,newrowoffset,len(ColLabels),'GWP_bio_usephase','Mt / yr',ScriptConfig['RegionalScope'],'use phase','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])        
     # Excess secondary material export    
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,0,:,:], newrowoffset,len(ColLabels),'Export of Secondary construction steel','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,1,:,:], newrowoffset,len(ColLabels),'Export of Secondary automotive steel','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,2,:,:], newrowoffset,len(ColLabels),'Export of Secondary stainless steel','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,3,:,:], newrowoffset,len(ColLabels),'Export of Secondary cast iron','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,4,:,:], newrowoffset,len(ColLabels),'Export of Secondary wrought Al','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,5,:,:], newrowoffset,len(ColLabels),'Export of Secondary cast Al','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,6,:,:], newrowoffset,len(ColLabels),'Export of Secondary copper','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,7,:,:], newrowoffset,len(ColLabels),'Export of Secondary plastics','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,8,:,:], newrowoffset,len(ColLabels),'Export of Secondary cement','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,9,:,:], newrowoffset,len(ColLabels),'Export of Recycled wood','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,10,:,:],newrowoffset,len(ColLabels),'Export of Recycled zinc','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,11,:,:],newrowoffset,len(ColLabels),'Export of Recycled concrete','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,12,:,:],newrowoffset,len(ColLabels),'Export of Secondary concrete aggregates','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,0,:,:], newrowoffset,len(ColLabels),'Export of Secondary construction steel','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,1,:,:], newrowoffset,len(ColLabels),'Export of Secondary automotive steel','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,2,:,:], newrowoffset,len(ColLabels),'Export of Secondary stainless steel','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,3,:,:], newrowoffset,len(ColLabels),'Export of Secondary cast iron','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,4,:,:], newrowoffset,len(ColLabels),'Export of Secondary wrought Al','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,5,:,:], newrowoffset,len(ColLabels),'Export of Secondary cast Al','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,6,:,:], newrowoffset,len(ColLabels),'Export of Secondary copper','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,7,:,:], newrowoffset,len(ColLabels),'Export of Secondary plastics','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,8,:,:], newrowoffset,len(ColLabels),'Export of Secondary cement','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,9,:,:], newrowoffset,len(ColLabels),'Export of Recycled wood','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,10,:,:],newrowoffset,len(ColLabels),'Export of Recycled zinc','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,11,:,:],newrowoffset,len(ColLabels),'Export of Recycled concrete','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,SecondaryExport[:,12,:,:],newrowoffset,len(ColLabels),'Export of Secondary concrete aggregates','Mt / yr',ScriptConfig['RegionalScope'],'F_12_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # manufacturing output by materials
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,0,:,:].sum(axis=1), newrowoffset,len(ColLabels),'construction steel in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,1,:,:].sum(axis=1), newrowoffset,len(ColLabels),'automotive steel in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,2,:,:].sum(axis=1), newrowoffset,len(ColLabels),'stainless steel in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,3,:,:].sum(axis=1), newrowoffset,len(ColLabels),'cast iron in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,4,:,:].sum(axis=1), newrowoffset,len(ColLabels),'wrought Al in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,5,:,:].sum(axis=1), newrowoffset,len(ColLabels),'cast Al in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,6,:,:].sum(axis=1), newrowoffset,len(ColLabels),'copper in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,7,:,:].sum(axis=1), newrowoffset,len(ColLabels),'plastics in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,8,:,:].sum(axis=1), newrowoffset,len(ColLabels),'cement in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,9,:,:].sum(axis=1), newrowoffset,len(ColLabels),'wood in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,10,:,:].sum(axis=1),newrowoffset,len(ColLabels),'zinc in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,11,:,:].sum(axis=1),newrowoffset,len(ColLabels),'concrete in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
-    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,12,:,:].sum(axis=1),newrowoffset,len(ColLabels),'concrete aggregates in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,0,:,:].sum(axis=1), newrowoffset,len(ColLabels),'construction steel in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,1,:,:].sum(axis=1), newrowoffset,len(ColLabels),'automotive steel in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,2,:,:].sum(axis=1), newrowoffset,len(ColLabels),'stainless steel in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,3,:,:].sum(axis=1), newrowoffset,len(ColLabels),'cast iron in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,4,:,:].sum(axis=1), newrowoffset,len(ColLabels),'wrought Al in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,5,:,:].sum(axis=1), newrowoffset,len(ColLabels),'cast Al in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,6,:,:].sum(axis=1), newrowoffset,len(ColLabels),'copper in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,7,:,:].sum(axis=1), newrowoffset,len(ColLabels),'plastics in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,8,:,:].sum(axis=1), newrowoffset,len(ColLabels),'cement in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,9,:,:].sum(axis=1), newrowoffset,len(ColLabels),'wood in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,10,:,:].sum(axis=1),newrowoffset,len(ColLabels),'zinc in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,11,:,:].sum(axis=1),newrowoffset,len(ColLabels),'concrete in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
+    newrowoffset = msf.xlsxExportAdd_tAB(ws2,Manufacturing_Output[:,:,12,:,:].sum(axis=1),newrowoffset,len(ColLabels),'concrete aggregates in manufactured goods','Mt / yr',ScriptConfig['RegionalScope'],'F_5_6 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # postconsumer scrap
     for m in range(0,Nw):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Scrap_Outflow[:,m,:,:],newrowoffset,len(ColLabels),'Postconsumer scrap: ' + IndexTable.Classification[IndexTable.index.get_loc('Waste_Scrap')].Items[m],'Mt / yr',ScriptConfig['RegionalScope'],'F_9_10 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Scrap_Outflow[:,m,:,:],newrowoffset,len(ColLabels),'Postconsumer scrap: ' + Dims.Items['Waste_Scrap'][m],'Mt / yr',ScriptConfig['RegionalScope'],'F_9_10 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # EoL Products to waste mgt.
     for mg in range(0,Ng):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,EoL_Products_for_WasteMgt[:,mg,:,:],newrowoffset,len(ColLabels),'EoL Products to waste mgt., ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_8_9 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,EoL_Products_for_WasteMgt[:,mg,:,:],newrowoffset,len(ColLabels),'EoL Products to waste mgt., ' + Dims.Items['Good'][mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_8_9 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # Outflow of products from use phase        
     for mg in range(0,Ng):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Products_Usephase_all[:,mg,:,:],newrowoffset,len(ColLabels),'Outflow of products from use phase, ' + IndexTable.Classification[IndexTable.index.get_loc('Good')].Items[mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Products_Usephase_all[:,mg,:,:],newrowoffset,len(ColLabels),'Outflow of products from use phase, ' + Dims.Items['Good'][mg],'Vehicles: million/yr, Buildings: million m2/yr',ScriptConfig['RegionalScope'],'F_7_8 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     for mm in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Materials_Usephase_all[:,mm,:,:],newrowoffset,len(ColLabels),'Outflow of materials from use phase, ' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[mm],'Mt/yr',ScriptConfig['RegionalScope'],'F_7_8 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,Outflow_Materials_Usephase_all[:,mm,:,:],newrowoffset,len(ColLabels),'Outflow of materials from use phase, ' + Dims.Items['Engineering materials'][mm],'Mt/yr',ScriptConfig['RegionalScope'],'F_7_8 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # Losses from waste mgt.        
     for me in range(0,Ne):    
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,WasteMgtLosses_To_Landfill[:,me,:,:],newrowoffset,len(ColLabels),'Waste mgt and remelting losses, ' + IndexTable.Classification[IndexTable.index.get_loc('Element')].Items[me],'Mt/yr',ScriptConfig['RegionalScope'],'F_9_0 (part)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,WasteMgtLosses_To_Landfill[:,me,:,:],newrowoffset,len(ColLabels),'Waste mgt and remelting losses, ' + Dims.Items['Element'][me],'Mt/yr',ScriptConfig['RegionalScope'],'F_9_0 (part)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
     # Renovation material inflow:
     for mm in range(0,Nm):
-        newrowoffset = msf.xlsxExportAdd_tAB(ws2,RenovationMaterialInflow_7[:,mm,:,:],newrowoffset,len(ColLabels),'Inflow of renovation material into use phase, ' + IndexTable.Classification[IndexTable.index.get_loc('Engineering materials')].Items[mm],'Mt/yr',ScriptConfig['RegionalScope'],'F_6_7 (part: renovation inflow)','Cf. Cover sheet',IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items,IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items)
+        newrowoffset = msf.xlsxExportAdd_tAB(ws2,RenovationMaterialInflow_7[:,mm,:,:],newrowoffset,len(ColLabels),'Inflow of renovation material into use phase, ' + Dims.Items['Engineering materials'][mm],'Mt/yr',ScriptConfig['RegionalScope'],'F_6_7 (part: renovation inflow)','Cf. Cover sheet',Dims.Items['Scenario'],Dims.Items['Scenario_RCP'])
         
     
     # Post calibration 2015 parameter values
@@ -2725,31 +2835,31 @@ def main():
         pav_Sheet.write(0,1,label = '2015 post calibration values, by model region', style = mystyle)
         pav_Sheet.write(1,1,label = 'region', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             pav_Sheet.write(m,1,label = Rname, style = mystyle)
             m+=1
         # pC stock values
         pav_Sheet.write(1,2,label = '2015 per capita stock values, total (all segments and drive technologies), by model region. Unit: 1 (veh. per person).', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             pav_Sheet.write(m,2,label = TotalStockCurves_UsePhase_p_pC[0,m-2])
             m+=1
         # passenger-km
         pav_Sheet.write(1,3,label = '2015 annual passenger kilometrage, by model region. Unit: km/yr.', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             pav_Sheet.write(m,3,label = Total_Service_pav_tr_pC[0,m-2])
             m+=1
         # vehicle km
         pav_Sheet.write(1,4,label = '2015 annual vehicle kilometrage, by model region. Unit: km/yr. Value for SSP1.', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             pav_Sheet.write(m,4,label = ParameterDict['3_IO_Vehicles_UsePhase_eff'].Values[Service_Drivg,m-2,0,1])
             m+=1
         # vehicle occupancy rate
         pav_Sheet.write(1,5,label = '2015 average vehicle occupancy rate, across all segments and drive technologies, by model region. Unit: km/yr. Value for SSP1.', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             pav_Sheet.write(m,5,label = ParameterDict['6_MIP_VehicleOccupancyRate'].Values[Sector_pav_loc,m-2,0,1])
             m+=1
                     
@@ -2758,276 +2868,280 @@ def main():
         reb_Sheet.write(0,1,label = '2015 post calibration values, by model region', style = mystyle)
         reb_Sheet.write(1,1,label = 'region', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             reb_Sheet.write(m,1,label = Rname, style = mystyle)
             m+=1
         # pC stock values
         reb_Sheet.write(1,2,label = '2015 per capita stock values, total (all building types and energy standars), by model region. Unit: m2 per person.', style = mystyle)
         m=2
-        for Rname in IndexTable.Classification[IndexTable.index.get_loc('Region32')].Items:
+        for Rname in Dims.Items['Region32']:
             reb_Sheet.write(m,2,label = TotalStockCurves_UsePhase_B_pC[0,m-2])
             m+=1
     
     # PLOT
-    MyColorCycle = pylab.cm.Paired(np.arange(0,1,0.2))
-    #linewidth = [1.2,2.4,1.2,1.2,1.2]
-    linewidth  = [1.2,2,1.2]
-    linewidth2 = [1.2,2,1.2]
-    
-    Figurecounter = 1
-    LegendItems_SSP    = IndexTable.Classification[IndexTable.index.get_loc('Scenario')].Items
-    #LegendItems_RCP    = IndexTable.Classification[IndexTable.index.get_loc('Scenario_RCP')].Items
-    LegendItems_SSP_RE = ['LED, no EST', 'LED, 2°C ES', 'SSP1, no EST', 'SSP1, 2°C ES', 'SSP2, no EST', 'SSP2, 2°C ES']
-    LegendItems_SSP_UP = ['Use Phase, SSP1, no EST', 'Rest of system GHG, SSP1, no EST','Use Phase, SSP1, 2°C ES', 'Rest of system GHG, SSP1, 2°C ES']
-    ColorOrder         = [1,0,3]
-    
-    # policy baseline vs. RCP 2.6
-    fig1, ax1 = plt.subplots()
-    ax1.set_prop_cycle('color', MyColorCycle)
-    ProxyHandlesList = []
-    for m in range(0,NS):
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),GWP_System_3579di[:,m,0], linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),GWP_System_3579di[:,m,1], linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
-    #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
-    plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper left')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
-    plt.ylabel('GHG emissions of system, Mt/yr.', fontsize = 12) 
-    plt.xlabel('year', fontsize = 12) 
-    plt.title('System-wide emissions, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
-    if ScriptConfig['UseGivenPlotBoundaries'] == True:
-        plt.axis([2016, 2050, 0, ScriptConfig['Plot1Max']])
-    plt.show()
-    fig_name = 'GHG_Ems_Overview'
-    # include figure in logfile:
-    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    Figurecounter += 1
-    
-    fig1, ax1 = plt.subplots()
-    ax1.set_prop_cycle('color', MyColorCycle)
-    ProxyHandlesList = []
-    for m in range(0,NS):
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),GWP_PrimaryMaterial_3di[:,m,1])
-    plt.legend(LegendItems_SSP,shadow = False, prop={'size':9}, loc = 'upper right' ,bbox_to_anchor=(1.20, 1))
-    plt.ylabel('GHG emissions of primary material production, Mt/yr.', fontsize = 12) 
-    plt.xlabel('year', fontsize = 12) 
-    plt.title('GHG primary materials, with EST', fontsize = 12) 
-    if ScriptConfig['UseGivenPlotBoundaries'] == True:
-        plt.axis([2015, 2050, 0, ScriptConfig['Plot2Max']])
-    plt.show()
-    fig_name = 'GHG_PP_WithEST'
-    # include figure in logfile:
-    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    Figurecounter += 1
-    
-    # primary steel, no CP and 2°C combined:
-    fig1, ax1 = plt.subplots()
-    ax1.set_prop_cycle('color', MyColorCycle)
-    ProxyHandlesList = []
-    for m in range(0,NS):
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,0:3,m,0].sum(axis=1), linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,0:3,m,1].sum(axis=1), linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
-    #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
-    plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper right')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
-    plt.ylabel('Primary steel production, Mt/yr.', fontsize = 12) 
-    plt.xlabel('year', fontsize = 12) 
-    plt.title('Primary steel production, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
-    if ScriptConfig['UseGivenPlotBoundaries'] == True:
-        plt.axis([2017, 2050, 0, 0.15 * ScriptConfig['Plot2Max']])
-    plt.show()
-    fig_name = 'PSteel_Overview'
-    # include figure in logfile:
-    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    Figurecounter += 1
-    
-    # Cement production, no RE and RE combined:
-    fig1, ax1 = plt.subplots()
-    ax1.set_prop_cycle('color', MyColorCycle)
-    ProxyHandlesList = []
-    for m in range(0,NS):
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,8,m,0], linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,8,m,1], linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
-    #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
-    plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper right')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
-    plt.ylabel('Cement production, Mt/yr.', fontsize = 12) 
-    plt.xlabel('year', fontsize = 12) 
-    plt.title('Cement production, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
-    if ScriptConfig['UseGivenPlotBoundaries'] == True:
-        plt.axis([2017, 2050, 0, 0.30 * ScriptConfig['Plot2Max']])
-    plt.show()
-    fig_name = 'Cement_Overview'
-    # include figure in logfile:
-    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    Figurecounter += 1
-    
-    # Recycled steel, RE and no RE
-    fig1, ax1 = plt.subplots()
-    ax1.set_prop_cycle('color', MyColorCycle)
-    ProxyHandlesList = []
-    for m in range(0,NS):
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), SecondaryProduct[:,0:4,m,0].sum(axis =1), linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
-        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), SecondaryProduct[:,0:4,m,1].sum(axis =1), linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
-        #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
-    #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
-    plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper left')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
-    plt.ylabel('Recycled steel and iron, Mt/yr.', fontsize = 12) 
-    plt.xlabel('year', fontsize = 12) 
-    plt.title('Recycled iron and steel, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
-    if ScriptConfig['UseGivenPlotBoundaries'] == True:
-        plt.axis([2018, 2050, 0, 0.8 * ScriptConfig['Plot3Max']])
-    plt.show()
-    fig_name = 'SteelRecycling_Overview'
-    # include figure in logfile:
-    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    Figurecounter += 1
-    
-    # Use phase and indirect emissions, RE and no RE
-    fig1, ax1 = plt.subplots()
-    ax1.set_prop_cycle('color', MyColorCycle)
-    ProxyHandlesList = []
-    # Use phase and other ems., SSP1, no RE
-    ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_UsePhase_7d[:,0,0] , linewidth = linewidth[2], color = MyColorCycle[ColorOrder[2],:])
-    ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_OtherThanUsePhaseDirect[:,0,0] ,    linewidth = linewidth[2], color = MyColorCycle[ColorOrder[2],:], linestyle = '--')
-    # Use phase and other ems., SSP1, with RE
-    ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_UsePhase_7d[:,0,1] , linewidth = linewidth[2], color = MyColorCycle[ColorOrder[1],:])
-    ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_OtherThanUsePhaseDirect[:,0,1] ,    linewidth = linewidth[2], color = MyColorCycle[ColorOrder[1],:], linestyle = '--')
-    #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
-    plt.legend(LegendItems_SSP_UP,shadow = False, prop={'size':9}, loc = 'upper right')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
-    plt.ylabel('GHG emissions, Mt/yr.', fontsize = 12) 
-    plt.xlabel('year', fontsize = 12) 
-    plt.title('GHG emissions by process and scenario, SSP1, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
-    if ScriptConfig['UseGivenPlotBoundaries'] == True:
-        plt.axis([2018, 2050, 0, 0.75 * ScriptConfig['Plot1Max']])
-    plt.show()
-    fig_name = 'GHG_UsePhase_Overview'
-    # include figure in logfile:
-    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    Figurecounter += 1
-    
-    # Plot implementation curves
-    #    fig1, ax1 = plt.subplots()
-    #    ax1.set_prop_cycle('color', MyColorCycle)
-    #    ProxyHandlesList = []
-    #    for m in range(0,NR):
-    #        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), ParameterDict['3_SHA_RECC_REStrategyScaleUp'].Values[m,0,:,1]) # world region, SSP1
-    #    plt_lgd  = plt.legend(LegendItems_RCP,shadow = False, prop={'size':9}, loc = 'upper right' ,bbox_to_anchor=(1.20, 1))
-    #    plt.ylabel('Stock reduction potential seized, %.', fontsize = 12) 
-    #    plt.xlabel('year', fontsize = 12) 
-    #    plt.title('Implementation curves for more intense use, by region and scenario', fontsize = 12) 
-    #    if ScriptConfig['UseGivenPlotBoundaries'] == True:    
-    #        plt.axis([2020, 2050, 0, 110])
-    #    plt.show()
-    #    fig_name = 'ImplementationCurves_' + IndexTable.Classification[IndexTable.index.get_loc('Region')].Items[0]
-    #    # include figure in logfile:
-    #    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-    #    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=500, bbox_inches='tight')
-    #    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-    #    Figurecounter += 1
-    
-    
-    # Plot system emissions, by process, stacked.
-    # Area plot, stacked, GHG emissions, material production, waste mgt, remelting, etc.
-    MyColorCycle = pylab.cm.gist_earth(np.arange(0,1,0.155)) # select 12 colors from the 'Set1' color map.            
-    #grey0_9      = np.array([0.9,0.9,0.9,1])
-    
-    SSPScens   = ['LED','SSP1','SSP2']
-    RCPScens   = ['No climate policy','2 degrees C energy mix']
-    Area       = ['use phase','use phase, scope 2 (el)','use phase, other indirect','primary material product.','manufact. & recycling','total (+ recycl. credit & biogen. C)']     
-    
-    for mS in range(0,NS): # SSP
-        for mR in range(0,NR): # RCP
-    
-            fig  = plt.figure(figsize=(8,5))
-            ax1  = plt.axes([0.08,0.08,0.85,0.9])
-            
-            ProxyHandlesList = []   # For legend     
-            
-            # plot area
-            ax1.fill_between(np.arange(2015,2061),np.zeros((Nt)), GWP_UsePhase_7d[:,mS,mR], linestyle = '-', facecolor = MyColorCycle[1,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[1,:])) # create proxy artist for legend
-            ax1.fill_between(np.arange(2015,2061),GWP_UsePhase_7d[:,mS,mR], GWP_UsePhase_7d[:,mS,mR] + GWP_UsePhase_7i_Scope2_El[:,mS,mR], linestyle = '-', facecolor = MyColorCycle[2,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[2,:])) # create proxy artist for legend
-            ax1.fill_between(np.arange(2015,2061),GWP_UsePhase_7d[:,mS,mR] + GWP_UsePhase_7i_Scope2_El[:,mS,mR], GWP_UsePhase_7d[:,mS,mR] + GWP_UsePhase_7i_Scope2_El[:,mS,mR] + GWP_UsePhase_7i_OtherIndir[:,mS,mR], linestyle = '-', facecolor = MyColorCycle[3,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[3,:])) # create proxy artist for legend
-            ax1.fill_between(np.arange(2016,2061),GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR], GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR] + GWP_PrimaryMaterial_3di[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[4,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[4,:])) # create proxy artist for legend    
-            ax1.fill_between(np.arange(2016,2061),GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR] + GWP_PrimaryMaterial_3di[1::,mS,mR], GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR] + GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_MaterialCycle_5di_9di[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[5,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[5,:])) # create proxy artist for legend    
-            plt.plot(np.arange(2016,2061), GWP_System_3579di[1::,mS,mR] , linewidth = linewidth[2], color = 'k')
-            plta = Line2D(np.arange(2016,2061), GWP_System_3579di[1::,mS,mR] , linewidth = linewidth[2], color = 'k')
-            ProxyHandlesList.append(plta) # create proxy artist for legend    
-            #plt.text(Data[m,:].min()*0.55, 7.8, 'Baseline: ' + ("%3.0f" % Base[m]) + ' Mt/yr.',fontsize=14,fontweight='bold')
-            
-            plt.title('GHG emissions, stacked by process group, \n' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.', fontsize = 18)
-            plt.ylabel('Mt of CO2-eq.', fontsize = 18)
-            plt.xlabel('Year', fontsize = 18)
-            plt.xticks(fontsize=18)
-            plt.yticks(fontsize=18)
-            plt.legend(handles = reversed(ProxyHandlesList),labels = reversed(Area), shadow = False, prop={'size':14},ncol=1, loc = 'upper right')# ,bbox_to_anchor=(1.91, 1)) 
-            ax1.set_xlim([2015, 2060])
-            
-            plt.show()
-            fig_name = 'GWP_TimeSeries_AllProcesses_Stacked_' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.png'
-            # include figure in logfile:
-            fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-            # comment out to save disk space in archive:
-            fig.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-            Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-            Figurecounter += 1
-    
-    # Area plot, for material industries:
-    Area2   = ['primary material product.','waste mgt. & recycling','manufacturing']     
-    
-    for mS in range(0,NS): # SSP
-        for mR in range(0,NR): # RCP
-    
-            fig  = plt.figure(figsize=(8,5))
-            ax1  = plt.axes([0.08,0.08,0.85,0.9])
-            
-            ProxyHandlesList = []   # For legend     
-            
-            # plot area
-            ax1.fill_between(np.arange(2016,2061),np.zeros((Nt-1)), GWP_PrimaryMaterial_3di[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[4,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[4,:])) # create proxy artist for legend
-            ax1.fill_between(np.arange(2016,2061),GWP_PrimaryMaterial_3di[1::,mS,mR], GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_WasteMgt_9di_all[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[5,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[5,:])) # create proxy artist for legend
-            ax1.fill_between(np.arange(2016,2061),GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_WasteMgt_9di_all[1::,mS,mR], GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_WasteMgt_9di_all[1::,mS,mR] + GWP_Manufact_5di_all[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[6,:], linewidth = 0.5)
-            ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[6,:])) # create proxy artist for legend
-            
-            
-            plt.title('GHG emissions, stacked by process group, \n' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.', fontsize = 18)
-            plt.ylabel('Mt of CO2-eq.', fontsize = 18)
-            plt.xlabel('Year', fontsize = 18)
-            plt.xticks(fontsize=18)
-            plt.yticks(fontsize=18)
-            plt.legend(handles = reversed(ProxyHandlesList),labels = reversed(Area2), shadow = False, prop={'size':14},ncol=1, loc = 'upper right')# ,bbox_to_anchor=(1.91, 1)) 
-            ax1.set_xlim([2015, 2060])
-            
-            plt.show()
-            fig_name = 'GWP_TimeSeries_Materials_Stacked_' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.png'
-            # include figure in logfile:
-            fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
-            # comment out to save disk space in archive:
-            fig.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
-            Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
-            Figurecounter += 1
+    if Headless is False:
+        import matplotlib.pyplot as plt   
+        from matplotlib.lines import Line2D
+        import pylab
+        MyColorCycle = pylab.cm.Paired(np.arange(0,1,0.2))
+        #linewidth = [1.2,2.4,1.2,1.2,1.2]
+        linewidth  = [1.2,2,1.2]
+        linewidth2 = [1.2,2,1.2]
+    
+        Figurecounter = 1
+        LegendItems_SSP    = Dims.Items['Scenario']
+        #LegendItems_RCP    = Dims.Items['Scenario_RCP']
+        LegendItems_SSP_RE = ['LED, no EST', 'LED, 2°C ES', 'SSP1, no EST', 'SSP1, 2°C ES', 'SSP2, no EST', 'SSP2, 2°C ES']
+        LegendItems_SSP_UP = ['Use Phase, SSP1, no EST', 'Rest of system GHG, SSP1, no EST','Use Phase, SSP1, 2°C ES', 'Rest of system GHG, SSP1, 2°C ES']
+        ColorOrder         = [1,0,3]
+    
+        # policy baseline vs. RCP 2.6
+        fig1, ax1 = plt.subplots()
+        ax1.set_prop_cycle('color', MyColorCycle)
+        ProxyHandlesList = []
+        for m in range(0,NS):
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),GWP_System_3579di[:,m,0], linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),GWP_System_3579di[:,m,1], linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
+        #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
+        plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper left')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
+        plt.ylabel('GHG emissions of system, Mt/yr.', fontsize = 12) 
+        plt.xlabel('year', fontsize = 12) 
+        plt.title('System-wide emissions, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
+        if ScriptConfig['UseGivenPlotBoundaries'] == True:
+            plt.axis([2016, 2050, 0, ScriptConfig['Plot1Max']])
+        plt.show()
+        fig_name = 'GHG_Ems_Overview'
+        # include figure in logfile:
+        fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+        Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        Figurecounter += 1
+    
+        fig1, ax1 = plt.subplots()
+        ax1.set_prop_cycle('color', MyColorCycle)
+        ProxyHandlesList = []
+        for m in range(0,NS):
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),GWP_PrimaryMaterial_3di[:,m,1])
+        plt.legend(LegendItems_SSP,shadow = False, prop={'size':9}, loc = 'upper right' ,bbox_to_anchor=(1.20, 1))
+        plt.ylabel('GHG emissions of primary material production, Mt/yr.', fontsize = 12) 
+        plt.xlabel('year', fontsize = 12) 
+        plt.title('GHG primary materials, with EST', fontsize = 12) 
+        if ScriptConfig['UseGivenPlotBoundaries'] == True:
+            plt.axis([2015, 2050, 0, ScriptConfig['Plot2Max']])
+        plt.show()
+        fig_name = 'GHG_PP_WithEST'
+        # include figure in logfile:
+        fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+        Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        Figurecounter += 1
+    
+        # primary steel, no CP and 2°C combined:
+        fig1, ax1 = plt.subplots()
+        ax1.set_prop_cycle('color', MyColorCycle)
+        ProxyHandlesList = []
+        for m in range(0,NS):
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,0:3,m,0].sum(axis=1), linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,0:3,m,1].sum(axis=1), linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
+        #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
+        plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper right')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
+        plt.ylabel('Primary steel production, Mt/yr.', fontsize = 12) 
+        plt.xlabel('year', fontsize = 12) 
+        plt.title('Primary steel production, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
+        if ScriptConfig['UseGivenPlotBoundaries'] == True:
+            plt.axis([2017, 2050, 0, 0.15 * ScriptConfig['Plot2Max']])
+        plt.show()
+        fig_name = 'PSteel_Overview'
+        # include figure in logfile:
+        fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+        Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        Figurecounter += 1
+    
+        # Cement production, no RE and RE combined:
+        fig1, ax1 = plt.subplots()
+        ax1.set_prop_cycle('color', MyColorCycle)
+        ProxyHandlesList = []
+        for m in range(0,NS):
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,8,m,0], linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1),PrimaryProduction[:,8,m,1], linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
+        #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
+        plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper right')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
+        plt.ylabel('Cement production, Mt/yr.', fontsize = 12) 
+        plt.xlabel('year', fontsize = 12) 
+        plt.title('Cement production, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
+        if ScriptConfig['UseGivenPlotBoundaries'] == True:
+            plt.axis([2017, 2050, 0, 0.30 * ScriptConfig['Plot2Max']])
+        plt.show()
+        fig_name = 'Cement_Overview'
+        # include figure in logfile:
+        fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+        Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        Figurecounter += 1
+    
+        # Recycled steel, RE and no RE
+        fig1, ax1 = plt.subplots()
+        ax1.set_prop_cycle('color', MyColorCycle)
+        ProxyHandlesList = []
+        for m in range(0,NS):
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), SecondaryProduct[:,0:4,m,0].sum(axis =1), linewidth = linewidth[m], color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.line((0, 0), 1, 1, fc=MyColorCycle[m,:]))
+            ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), SecondaryProduct[:,0:4,m,1].sum(axis =1), linewidth = linewidth2[m], linestyle = '--', color = MyColorCycle[ColorOrder[m],:])
+            #ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[m,:]))     
+        #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
+        plt.legend(LegendItems_SSP_RE,shadow = False, prop={'size':9}, loc = 'upper left')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
+        plt.ylabel('Recycled steel and iron, Mt/yr.', fontsize = 12) 
+        plt.xlabel('year', fontsize = 12) 
+        plt.title('Recycled iron and steel, by SSP scenario, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
+        if ScriptConfig['UseGivenPlotBoundaries'] == True:
+            plt.axis([2018, 2050, 0, 0.8 * ScriptConfig['Plot3Max']])
+        plt.show()
+        fig_name = 'SteelRecycling_Overview'
+        # include figure in logfile:
+        fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+        Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        Figurecounter += 1
+    
+        # Use phase and indirect emissions, RE and no RE
+        fig1, ax1 = plt.subplots()
+        ax1.set_prop_cycle('color', MyColorCycle)
+        ProxyHandlesList = []
+        # Use phase and other ems., SSP1, no RE
+        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_UsePhase_7d[:,0,0] , linewidth = linewidth[2], color = MyColorCycle[ColorOrder[2],:])
+        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_OtherThanUsePhaseDirect[:,0,0] ,    linewidth = linewidth[2], color = MyColorCycle[ColorOrder[2],:], linestyle = '--')
+        # Use phase and other ems., SSP1, with RE
+        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_UsePhase_7d[:,0,1] , linewidth = linewidth[2], color = MyColorCycle[ColorOrder[1],:])
+        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), GWP_OtherThanUsePhaseDirect[:,0,1] ,    linewidth = linewidth[2], color = MyColorCycle[ColorOrder[1],:], linestyle = '--')
+        #plt_lgd  = plt.legend(reversed(ProxyHandlesList),reversed(LegendItems_SSP_RE),shadow = False, prop={'size':9}, loc = 'lower left')# 'upper right' ,bbox_to_anchor=(1.20, 1))
+        plt.legend(LegendItems_SSP_UP,shadow = False, prop={'size':9}, loc = 'upper right')# 'upper right' ,bbox_to_anchor=(1.20, 1))    
+        plt.ylabel('GHG emissions, Mt/yr.', fontsize = 12) 
+        plt.xlabel('year', fontsize = 12) 
+        plt.title('GHG emissions by process and scenario, SSP1, '+ ScriptConfig['RegionalScope'] + '.', fontsize = 12) 
+        if ScriptConfig['UseGivenPlotBoundaries'] == True:
+            plt.axis([2018, 2050, 0, 0.75 * ScriptConfig['Plot1Max']])
+        plt.show()
+        fig_name = 'GHG_UsePhase_Overview'
+        # include figure in logfile:
+        fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+        Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        Figurecounter += 1
+    
+        # Plot implementation curves
+        #    fig1, ax1 = plt.subplots()
+        #    ax1.set_prop_cycle('color', MyColorCycle)
+        #    ProxyHandlesList = []
+        #    for m in range(0,NR):
+        #        ax1.plot(np.arange(Model_Time_Start,Model_Time_End +1), ParameterDict['3_SHA_RECC_REStrategyScaleUp'].Values[m,0,:,1]) # world region, SSP1
+        #    plt_lgd  = plt.legend(LegendItems_RCP,shadow = False, prop={'size':9}, loc = 'upper right' ,bbox_to_anchor=(1.20, 1))
+        #    plt.ylabel('Stock reduction potential seized, %.', fontsize = 12) 
+        #    plt.xlabel('year', fontsize = 12) 
+        #    plt.title('Implementation curves for more intense use, by region and scenario', fontsize = 12) 
+        #    if ScriptConfig['UseGivenPlotBoundaries'] == True:    
+        #        plt.axis([2020, 2050, 0, 110])
+        #    plt.show()
+        #    fig_name = 'ImplementationCurves_' + Dims.Items['Region'][0]
+        #    # include figure in logfile:
+        #    fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+        #    fig1.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=500, bbox_inches='tight')
+        #    Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+        #    Figurecounter += 1
+    
+    
+        # Plot system emissions, by process, stacked.
+        # Area plot, stacked, GHG emissions, material production, waste mgt, remelting, etc.
+        MyColorCycle = pylab.cm.gist_earth(np.arange(0,1,0.155)) # select 12 colors from the 'Set1' color map.            
+        #grey0_9      = np.array([0.9,0.9,0.9,1])
+    
+        SSPScens   = ['LED','SSP1','SSP2']
+        RCPScens   = ['No climate policy','2 degrees C energy mix']
+        Area       = ['use phase','use phase, scope 2 (el)','use phase, other indirect','primary material product.','manufact. & recycling','total (+ recycl. credit & biogen. C)']     
+    
+        for mS in range(0,NS): # SSP
+            for mR in range(0,NR): # RCP
+    
+                fig  = plt.figure(figsize=(8,5))
+                ax1  = plt.axes([0.08,0.08,0.85,0.9])
+            
+                ProxyHandlesList = []   # For legend     
+            
+                # plot area
+                ax1.fill_between(np.arange(2015,2061),np.zeros((Nt)), GWP_UsePhase_7d[:,mS,mR], linestyle = '-', facecolor = MyColorCycle[1,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[1,:])) # create proxy artist for legend
+                ax1.fill_between(np.arange(2015,2061),GWP_UsePhase_7d[:,mS,mR], GWP_UsePhase_7d[:,mS,mR] + GWP_UsePhase_7i_Scope2_El[:,mS,mR], linestyle = '-', facecolor = MyColorCycle[2,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[2,:])) # create proxy artist for legend
+                ax1.fill_between(np.arange(2015,2061),GWP_UsePhase_7d[:,mS,mR] + GWP_UsePhase_7i_Scope2_El[:,mS,mR], GWP_UsePhase_7d[:,mS,mR] + GWP_UsePhase_7i_Scope2_El[:,mS,mR] + GWP_UsePhase_7i_OtherIndir[:,mS,mR], linestyle = '-', facecolor = MyColorCycle[3,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[3,:])) # create proxy artist for legend
+                ax1.fill_between(np.arange(2016,2061),GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR], GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR] + GWP_PrimaryMaterial_3di[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[4,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[4,:])) # create proxy artist for legend    
+                ax1.fill_between(np.arange(2016,2061),GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR] + GWP_PrimaryMaterial_3di[1::,mS,mR], GWP_UsePhase_7d[1::,mS,mR] + GWP_UsePhase_7i_Scope2_El[1::,mS,mR] + GWP_UsePhase_7i_OtherIndir[1::,mS,mR] + GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_MaterialCycle_5di_9di[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[5,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[5,:])) # create proxy artist for legend    
+                plt.plot(np.arange(2016,2061), GWP_System_3579di[1::,mS,mR] , linewidth = linewidth[2], color = 'k')
+                plta = Line2D(np.arange(2016,2061), GWP_System_3579di[1::,mS,mR] , linewidth = linewidth[2], color = 'k')
+                ProxyHandlesList.append(plta) # create proxy artist for legend    
+                #plt.text(Data[m,:].min()*0.55, 7.8, 'Baseline: ' + ("%3.0f" % Base[m]) + ' Mt/yr.',fontsize=14,fontweight='bold')
+            
+                plt.title('GHG emissions, stacked by process group, \n' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.', fontsize = 18)
+                plt.ylabel('Mt of CO2-eq.', fontsize = 18)
+                plt.xlabel('Year', fontsize = 18)
+                plt.xticks(fontsize=18)
+                plt.yticks(fontsize=18)
+                plt.legend(handles = reversed(ProxyHandlesList),labels = reversed(Area), shadow = False, prop={'size':14},ncol=1, loc = 'upper right')# ,bbox_to_anchor=(1.91, 1)) 
+                ax1.set_xlim([2015, 2060])
+            
+                plt.show()
+                fig_name = 'GWP_TimeSeries_AllProcesses_Stacked_' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.png'
+                # include figure in logfile:
+                fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+                # comment out to save disk space in archive:
+                fig.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+                Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+                Figurecounter += 1
+    
+        # Area plot, for material industries:
+        Area2   = ['primary material product.','waste mgt. & recycling','manufacturing']     
+    
+        for mS in range(0,NS): # SSP
+            for mR in range(0,NR): # RCP
+    
+                fig  = plt.figure(figsize=(8,5))
+                ax1  = plt.axes([0.08,0.08,0.85,0.9])
+            
+                ProxyHandlesList = []   # For legend     
+            
+                # plot area
+                ax1.fill_between(np.arange(2016,2061),np.zeros((Nt-1)), GWP_PrimaryMaterial_3di[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[4,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[4,:])) # create proxy artist for legend
+                ax1.fill_between(np.arange(2016,2061),GWP_PrimaryMaterial_3di[1::,mS,mR], GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_WasteMgt_9di_all[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[5,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[5,:])) # create proxy artist for legend
+                ax1.fill_between(np.arange(2016,2061),GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_WasteMgt_9di_all[1::,mS,mR], GWP_PrimaryMaterial_3di[1::,mS,mR] + GWP_WasteMgt_9di_all[1::,mS,mR] + GWP_Manufact_5di_all[1::,mS,mR], linestyle = '-', facecolor = MyColorCycle[6,:], linewidth = 0.5)
+                ProxyHandlesList.append(plt.Rectangle((0, 0), 1, 1, fc=MyColorCycle[6,:])) # create proxy artist for legend
+            
+            
+                plt.title('GHG emissions, stacked by process group, \n' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.', fontsize = 18)
+                plt.ylabel('Mt of CO2-eq.', fontsize = 18)
+                plt.xlabel('Year', fontsize = 18)
+                plt.xticks(fontsize=18)
+                plt.yticks(fontsize=18)
+                plt.legend(handles = reversed(ProxyHandlesList),labels = reversed(Area2), shadow = False, prop={'size':14},ncol=1, loc = 'upper right')# ,bbox_to_anchor=(1.91, 1)) 
+                ax1.set_xlim([2015, 2060])
+            
+                plt.show()
+                fig_name = 'GWP_TimeSeries_Materials_Stacked_' + ScriptConfig['RegionalScope'] + ', ' + SSPScens[mS] + ', ' + RCPScens[mR] + '.png'
+                # include figure in logfile:
+                fig_name = 'Figure ' + str(Figurecounter) + '_' + fig_name + '_' + ScriptConfig['RegionalScope'] + '.png'
+                # comment out to save disk space in archive:
+                fig.savefig(os.path.join(ProjectSpecs_Path_Result, fig_name), dpi=60, bbox_inches='tight')
+                Mylog.info('![%s](%s){ width=850px }' % (fig_name, fig_name))
+                Figurecounter += 1
     
     ### 5.2) Export to Excel
     Mylog.info('### 5.2 - Export to Excel')
@@ -3048,10 +3162,10 @@ def main():
     MyLabels= []
     for S in range(0,NS):
         for R in range(0,NR):
-            MyLabels.append(RECC_System.IndexTable.set_index('IndexLetter').loc['S'].Classification.Items[S] + ', ' + RECC_System.IndexTable.set_index('IndexLetter').loc['R'].Classification.Items[R])
+            MyLabels.append(Dims.Items['S'][S] + ', ' + Dims.Items['R'][R])
         
     ResultArray = GWP_System_3579di.reshape(Nt,NS * NR)    
-    msf.ExcelSheetFill(Result_workbook_GHG, 'TotalGHGFootprint', ResultArray, topcornerlabel = 'System-wide GHG emissions, Mt/yr', rowlabels = RECC_System.IndexTable.set_index('IndexLetter').loc['t'].Classification.Items, collabels = MyLabels, Style = mystyle, rowselect = None, colselect = None)
+    msf.ExcelSheetFill(Result_workbook_GHG, 'TotalGHGFootprint', ResultArray, topcornerlabel = 'System-wide GHG emissions, Mt/yr', rowlabels = Dims.Items['t'], collabels = MyLabels, Style = mystyle, rowselect = None, colselect = None)
     
     Result_workbook_GHG.save(os.path.join(ProjectSpecs_Path_Result,'SysVar_TotalGHGFootprint.xls'))
     Calib_Result_workbook.save(os.path.join(ProjectSpecs_Path_Result,'CalibResults.xls'))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the config snapshot: workbook hashes, snapshot files, and the consistency check of the parsed config file.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import zipfile
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+
+def WriteWorkbook(FilePath, Sheet, Created):
+    """ Writes a minimal zip archive with the member layout of an .xlsx workbook. """
+    with zipfile.ZipFile(FilePath, 'w') as Workbook:
+        Workbook.writestr('docProps/core.xml', '<created>' + Created + '</created>')
+        Workbook.writestr('xl/worksheets/sheet1.xml', Sheet)
+
+
+def ToySnapshot(ClassPath):
+    """ Config snapshot as compiled in Section 1 of the model script, with a master classification file in ClassPath. """
+    with open(os.path.join(ClassPath, 'RECC_Classifications.xlsx'), 'wb') as ClassFile:
+        ClassFile.write(b'classification 1')
+    ConfigTable = tuple([['Time','Region'] for m in range(0,6)] + [['1_F_A','1_F_B','1_F_C'] for m in range(6,12)]
+                        + [['Use phase'] for m in range(12,16)]) # IT_, PL_, and PrL_ entries
+    return {'ConfigHash': 'abc', 'ClassFile': 'RECC_Classifications.xlsx',
+            'ClassHash': rf.HashFile(os.path.join(ClassPath, 'RECC_Classifications.xlsx')),
+            'Name_Script': 'ODYM_RECC_V2_4', 'Name_Scenario': 'Test', 'ScriptConfig': {'SectorSelect': 'pav'},
+            'ConfigTable': ConfigTable, 'MasterClassification': {'Time': 'Classification'}}
+
+
+def test_HashWorkbook(tmp_path):
+    FilePath = str(tmp_path / 'Config.xlsx')
+    assert rf.HashWorkbook(FilePath) == ''
+    WriteWorkbook(FilePath, '<sheet>1</sheet>', '2020-01-01')
+    Hash = rf.HashWorkbook(FilePath)
+    WriteWorkbook(FilePath, '<sheet>1</sheet>', '2024-06-30') # re-saved with identical content
+    assert rf.HashWorkbook(FilePath) == Hash
+    WriteWorkbook(FilePath, '<sheet>2</sheet>', '2024-06-30')
+    assert rf.HashWorkbook(FilePath) != Hash
+    with open(FilePath, 'wb') as NoWorkbook: # files that are no zip archive are hashed as a whole
+        NoWorkbook.write(b'no workbook')
+    assert rf.HashWorkbook(FilePath) == rf.HashFile(FilePath)
+
+
+def test_ConfigSnapshot(tmp_path):
+    ConfigSnapshot = ToySnapshot(str(tmp_path))
+    SnapshotFile   = rf.SnapshotFile(str(tmp_path), 'RECC_Config', 'ab' * 32)
+    assert SnapshotFile == os.path.join(str(tmp_path), 'RECC_Config_' + 'ab' * 16 + '.dat')
+    assert rf.LoadConfigSnapshot(SnapshotFile, str(tmp_path)) is None
+    rf.StoreConfigSnapshot(SnapshotFile, ConfigSnapshot)
+    assert rf.LoadConfigSnapshot(SnapshotFile, str(tmp_path)) == ConfigSnapshot
+    with open(os.path.join(str(tmp_path), 'RECC_Classifications.xlsx'), 'wb') as ClassFile: # changed master classification
+        ClassFile.write(b'classification 2')
+    assert rf.LoadConfigSnapshot(SnapshotFile, str(tmp_path)) is None
+
+
+@pytest.mark.parametrize('Key, Value', [
+    ('ScriptConfig', None),
+    ('Name_Scenario', 1),
+    ('ConfigTable', [['Time']] * 16),                                            # list instead of tuple
+    ('ConfigTable', tuple([['Time']] * 15)),                                     # entry missing
+    ('ConfigTable', tuple([['Time']] * 5 + [['Time','Region']] + [['A']] * 10)), # IT_ entries of different length
+    ('ConfigTable', tuple([['Time']] * 6 + [['A']] * 6 + [['P']] * 3 + [[]]))])  # PrL_ entries of different length
+def test_ConfigSnapshot_Inconsistent(tmp_path, Key, Value):
+    ConfigSnapshot = ToySnapshot(str(tmp_path))
+    assert rf.CheckConfigSnapshot(ConfigSnapshot)
+    ConfigSnapshot[Key] = Value
+    assert not rf.CheckConfigSnapshot(ConfigSnapshot)
+    with pytest.raises(AssertionError):
+        rf.StoreConfigSnapshot(str(tmp_path / 'Snapshot.dat'), ConfigSnapshot)
+    assert not os.path.isfile(str(tmp_path / 'Snapshot.dat'))
+
+
+def test_Snapshot_Invalid(tmp_path):
+    SnapshotFile = str(tmp_path / 'Snapshot.dat')
+    rf.StoreSnapshot(SnapshotFile, {'A': 1})
+    assert rf.LoadSnapshot(SnapshotFile, ['A']) == {'A': 1}
+    assert rf.LoadSnapshot(SnapshotFile, ['A','B']) is None # outdated snapshot
+    with open(SnapshotFile, 'wb') as SnapshotObject:       # corrupt snapshot
+        SnapshotObject.write(b'no pickle')
+    assert rf.LoadSnapshot(SnapshotFile, ['A']) is None
+    ConfigSnapshot = ToySnapshot(str(tmp_path))
+    del ConfigSnapshot['MasterClassification']
+    rf.StoreSnapshot(SnapshotFile, ConfigSnapshot)
+    assert rf.LoadConfigSnapshot(SnapshotFile, str(tmp_path)) is None
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the model dimension index ModelDimensions against lookups in the model index table.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import types
+import pickle
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+
+def ToyIndexTable():
+    """ Stand-in for the model index table (a pandas DataFrame indexed by aspect), with the columns used by ModelDimensions. """
+    Classification = [types.SimpleNamespace(Name='Time',     Items=[2015,2016,2017,2018]),
+                      types.SimpleNamespace(Name='Regions',  Items=['R1','R2','R3']),
+                      types.SimpleNamespace(Name='Elements', Items=['All','C','Fe','C'])] # duplicate item: first occurrence wins
+    return types.SimpleNamespace(index=['Time','Region','Element'], IndexLetter=['t','r','e'], Classification=Classification)
+
+
+def test_ModelDimensions():
+    IndexTable = ToyIndexTable()
+    Dims = rf.ModelDimensions(IndexTable)
+    assert Dims.Aspects == ('Time','Region','Element') and Dims.IndexLetters == ('t','r','e')
+    for m, Aspect in enumerate(IndexTable.index):
+        Letter = IndexTable.IndexLetter[m]
+        Items  = IndexTable.Classification[m].Items
+        assert Dims.Letter[Aspect] == Letter and Dims.Aspect[Letter] == Aspect
+        for Key in [Aspect, Letter]:
+            assert Dims.Size[Key] == len(Items)
+            assert Dims.Items[Key] == tuple(Items)
+            assert Dims.Classification[Key] == IndexTable.Classification[m].Name
+            assert all([Dims.Position[Key][Item] == Items.index(Item) for Item in Items])
+    assert Dims.Position['e']['C'] == 1
+    assert Dims.Shape('tre') == (4,3,4) and Dims.Shape('') == ()
+
+
+def test_ModelDimensions_Immutable():
+    Dims = rf.ModelDimensions(ToyIndexTable())
+    with pytest.raises(AttributeError):
+        Dims.Size = {}
+    with pytest.raises(AttributeError):
+        del Dims.Items
+    with pytest.raises(TypeError):
+        Dims.Size['t'] = 5
+    with pytest.raises(TypeError):
+        Dims.Position['r']['R4'] = 3
+    assert isinstance(Dims.Items['r'], tuple)
+
+
+def test_ModelDimensions_Pickle():
+    Dims   = rf.ModelDimensions(ToyIndexTable())
+    Copied = pickle.loads(pickle.dumps(Dims, protocol=pickle.HIGHEST_PROTOCOL))
+    assert isinstance(Copied, rf.ModelDimensions)
+    for Name in ['Aspects','IndexLetters']:
+        assert getattr(Copied, Name) == getattr(Dims, Name)
+    for Name in ['Size','Items','Classification','Letter','Aspect']:
+        assert dict(getattr(Copied, Name)) == dict(getattr(Dims, Name))
+    assert all([dict(Copied.Position[Key]) == dict(Dims.Position[Key]) for Key in Dims.Position])
+    with pytest.raises(AttributeError):
+        Copied.Size = {}
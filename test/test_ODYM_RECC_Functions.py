@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the vectorized functions in ODYM_RECC_Functions_V2_4.py against the loops of the model script that they replace.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import numpy as np
+import scipy.stats
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+
+def Dense(Band):
+    """ Dense survival functions SF[t,c,...] of a SurvivalBand. """
+    SF = np.zeros(Band.shape)
+    for c in range(0, Band.Nc):
+        SF[c:c + Band.Length[c], c] = Band.Column(c)
+    return SF
+
+
+def test_NormalSurvivalFunctions():
+    Rng       = np.random.default_rng(0)
+    Nc        = 30
+    LifeTimes = Rng.random((3,2,Nc)) * 40 # indices: grc
+    LifeTimes[1,0,5] = 0                  # cohort without lifetime
+    SF        = Dense(rf.NormalSurvivalFunctions(LifeTimes, 0.2))
+    for g in range(0,3):
+        for r in range(0,2):
+            Reference = np.zeros((Nc,Nc))
+            for c in range(0,Nc):
+                if LifeTimes[g,r,c] != 0:
+                    Reference[c::,c] = scipy.stats.norm.sf(np.arange(0,Nc-c), loc=LifeTimes[g,r,c], scale=0.2 * LifeTimes[g,r,c])
+            np.fill_diagonal(Reference, 1) # no outflows from the current year
+            np.testing.assert_allclose(SF[:,:,g,r], Reference, rtol=1e-12, atol=1e-15)
+
+
+def test_NormalSurvivalFunctions_MaxAge():
+    LifeTimes = np.random.default_rng(1).random((2,25)) * 20 + 1
+    Band      = rf.NormalSurvivalFunctions(LifeTimes, 0.3, MaxAge = 10)
+    SF        = Dense(Band)
+    Full      = Dense(rf.NormalSurvivalFunctions(LifeTimes, 0.3))
+    Age       = np.subtract.outer(np.arange(0,25), np.arange(0,25))
+    np.testing.assert_array_equal(SF[Age < 10], Full[Age < 10])
+    assert not SF[Age >= 10].any()
+
+
+def StockDrivenModel_Region(SwitchTime, Stock, InitialStock, SF, TypeSplit, NegativeInflowCorrect):
+    """ dsm compute_stock_driven_model_initialstock_typesplit_negativeinflowcorrect for a single region, indices: t, cg, tcg, tg. """
+    Nt, Ng = TypeSplit.shape
+    S_c    = np.zeros((Nt,Nt,Ng))
+    O_c    = np.zeros((Nt,Nt,Ng))
+    I      = np.zeros((Nt,Ng))
+    Flags  = np.zeros(Nt)
+    for c in range(0,SwitchTime):
+        for g in range(0,Ng):
+            I[c,g] = InitialStock[c,g] / SF[SwitchTime -1,c,g] if SF[SwitchTime -1,c,g] != 0 else InitialStock[c,g]
+    S_c[:,0:SwitchTime,:] = np.einsum('tcg,cg->tcg', SF[:,0:SwitchTime,:], I[0:SwitchTime,:])
+    for m in range(0,SwitchTime):
+        O_c[m,m,:]      = I[m,:] * (1 - SF[m,m,:])
+        O_c[m+1::,m,:]  = S_c[m:-1,m,:] - S_c[m+1::,m,:]
+    for m in range(SwitchTime,Nt):
+        if (TypeSplit[m,:] * SF[m,m,:]).sum() != 0:
+            I[m,:] = TypeSplit[m,:] * ((Stock[m] - S_c[m,:,:].sum()) / (TypeSplit[m,:] * SF[m,m,:]).sum())
+        if NegativeInflowCorrect is True and I[m,:].sum() < 0:
+            Flags[m] = 1
+            Delta    = -1 * I[m,:].sum()
+            I[m,:]   = 0
+            Delta_percent = Delta / S_c[m,:,:].sum() if S_c[m,:,:].sum() != 0 else 0
+            O_c[m,:,:]       = O_c[m,:,:] + S_c[m,:,:] * Delta_percent
+            S_c[m::,0:m,:]   = S_c[m::,0:m,:] * (1 - Delta_percent)
+            O_c[m+1::,0:m,:] = O_c[m+1::,0:m,:] * (1 - Delta_percent)
+        S_c[m::,m,:]   = SF[m::,m,:] * I[m,:]
+        O_c[m,m,:]     = I[m,:] * (1 - SF[m,m,:])
+        O_c[m+1::,m,:] = S_c[m:-1,m,:] - S_c[m+1::,m,:]
+    return S_c, O_c, I, Flags
+
+
+@pytest.mark.parametrize('NegativeInflowCorrect', [False, True])
+def test_StockDrivenModel(NegativeInflowCorrect):
+    Rng          = np.random.default_rng(2)
+    Nt, Ng, Nr   = 40, 3, 4
+    SwitchTime   = 15
+    SF_Band      = rf.NormalSurvivalFunctions(Rng.random((Ng,Nr,Nt)) * 30 + 5, 0.3) # indices: tcgr
+    SF           = Dense(SF_Band)
+    InitialStock = Rng.random((Nt,Ng,Nr))
+    InitialStock[SwitchTime::] = 0
+    TypeSplit    = Rng.random((Nt,Ng,Nr))
+    TypeSplit    = TypeSplit / TypeSplit.sum(axis=1, keepdims=True)
+    Stock        = np.linspace(1, 2, Nt)[:,np.newaxis] * InitialStock.sum(axis=(0,1)) * 0.8
+    Stock[25::,1] = Stock[25::,1] * 0.3 # stock drop: negative inflow in region 1
+    S_c, O_c, I, Flags = rf.StockDrivenModel(SwitchTime, Stock, InitialStock, SF_Band, TypeSplit, NegativeInflowCorrect)
+    for r in range(0,Nr):
+        Ref_S_c, Ref_O_c, Ref_I, Ref_Flags = StockDrivenModel_Region(SwitchTime, Stock[:,r], InitialStock[:,:,r], SF[:,:,:,r], TypeSplit[:,:,r], NegativeInflowCorrect)
+        np.testing.assert_allclose(S_c[:,:,:,r], Ref_S_c, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(O_c[:,:,:,r], Ref_O_c, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(I[:,:,r],     Ref_I,   rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(Flags[:,r], Ref_Flags)
+    assert Flags[:,1].any() == NegativeInflowCorrect
+    assert Flags[:,[0,2,3]].sum() == 0
+
+
+
+def StockDrivenModel_Single(Stock, SF):
+    """ dsm compute_stock_driven_model(NegativeInflowCorrect = False) for a single stock without initial stock and type split, indices: t, tc. """
+    Nt  = len(Stock)
+    s_c = np.zeros((Nt,Nt))
+    o_c = np.zeros((Nt,Nt))
+    i   = np.zeros(Nt)
+    if SF[0,0] != 0:
+        i[0] = Stock[0] / SF[0,0]
+    s_c[:,0] = i[0] * SF[:,0]
+    o_c[0,0] = i[0] - s_c[0,0]
+    for m in range(1,Nt):
+        o_c[m,0:m] = s_c[m-1,0:m] - s_c[m,0:m]
+        if SF[m,m] != 0:
+            i[m] = (Stock[m] - s_c[m,:].sum()) / SF[m,m]
+        s_c[m::,m] = i[m] * SF[m::,m]
+        o_c[m,m]   = i[m] * (1 - SF[m,m])
+    return s_c, o_c, i
+
+
+def test_StockDrivenModel_NoInitialStock():
+    """ Nonres. buildings, global (nrbg): all building types N and regions o as separate stocks with a single type, SwitchTime = 0, negative inflows are kept. """
+    Rng      = np.random.default_rng(3)
+    Nc, NN, No = 30, 3, 2
+    SF_Band  = rf.NormalSurvivalFunctions(Rng.random((NN,No,Nc)) * 20 + 5, 0.3) # indices: tcNo
+    SF       = Dense(SF_Band)
+    s_nrbg   = np.linspace(1, 3, Nc)[np.newaxis,:] * (1 + Rng.random((NN,1)))     # indices: Nt
+    s_nrbg[1,18::] = s_nrbg[1,18::] * 0.5 # stock drop: negative inflow of building type 1 in year 18
+    # call of the model script:
+    nrbg_sc, nrbg_oc, nrbg_i, nrbg_f = rf.StockDrivenModel(0, np.einsum('Nt,o->tNo',s_nrbg,np.ones(No)).reshape(Nc,NN*No), np.zeros((Nc,1,NN*No)), 
+                                                           SF_Band.Reshape((1,NN*No)), np.ones((Nc,1,NN*No)), NegativeInflowCorrect = False)
+    assert not nrbg_f.any()
+    assert (nrbg_i[18,0,:].reshape(NN,No)[1,:] < 0).all()
+    for N in range(0,NN):
+        for o in range(0,No):
+            Ref_sc, Ref_oc, Ref_i = StockDrivenModel_Single(s_nrbg[N,:], SF[:,:,N,o])
+            np.testing.assert_allclose(nrbg_sc[:,:,0,:].reshape(Nc,Nc,NN,No)[:,:,N,o], Ref_sc, rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(nrbg_oc[:,:,0,:].reshape(Nc,Nc,NN,No)[:,:,N,o], Ref_oc, rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(nrbg_i[:,0,:].reshape(Nc,NN,No)[:,N,o],         Ref_i,  rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(Ref_sc.sum(axis=1), s_nrbg[N,:], rtol=1e-12)
+
+def test_ReUseAllocation():
+    Rng = np.random.default_rng(3)
+    for Trial in range(0,50):
+        Nc, Nr, Ng, Nm, Ne = Rng.integers(10,30), Rng.integers(1,6), 4, Rng.integers(2,6), 3
+        CohortOffset = Nc - 2
+        Outflow      = Rng.random((Ng,Nc,Nr,Nm)) # F_7_8, element 0, indices: gcrm
+        Outflow[:,CohortOffset+1::] = 0
+        Outflow[0,:,:,0] = 0
+        Inflow       = Rng.random((Ng,Nr,Nm)) * Rng.choice([0.01,1,100]) # F_6_7, element 0, indices: grm
+        ReUseFactor  = Rng.random((Nm,Ng,Nr))
+        Composition  = Rng.random((CohortOffset,Nm,Ne))
+        # Loops of the model script:
+        Potential = np.einsum('mgr,gcrm->m', ReUseFactor, Outflow)
+        for mmm in range(0,Nm):
+            if Inflow[:,:,mmm].sum() < Potential[mmm]:
+                if Potential[mmm] > 0:
+                    Potential[mmm] = Inflow[:,:,mmm].sum()
+        Divisor   = np.einsum('m,crg->gcrm', np.einsum('gcrm->m', Outflow[:,0:CohortOffset]), np.ones((CohortOffset,Nr,Ng)))
+        MassShare = np.divide(Outflow[:,0:CohortOffset], Divisor, out=np.zeros_like(Divisor), where=Divisor!=0)
+        Reference = np.einsum('cme,gcrm->gcrme', Composition, np.einsum('m,gcrm->gcrm', Potential, MassShare))
+        np.testing.assert_allclose(rf.ReUseAllocation(Outflow, ReUseFactor, Inflow, Composition), Reference, rtol=1e-12, atol=1e-15)
+
+
+def SecondaryMaterialUse(Demand, Supply):
+    """ Loop of the model script for one supply, indices: m, me. """
+    Nm, Ne = Supply.shape
+    Use = np.zeros((Nm,Ne))
+    for mat in range(0,Nm):
+        if Supply[mat,0] > 0:
+            if Supply[mat,0] > Demand[mat]:
+                Use[mat,:] = Supply[mat,:] * Demand[mat] / Supply[mat,0]
+            else:
+                Use[mat,:] = Supply[mat,:].copy()
+    return Use, Demand - Use[:,0]
+
+
+def test_SecondaryMaterialAllocation():
+    Rng = np.random.default_rng(4)
+    for Trial in range(0,200):
+        Nm, Ne = Rng.integers(1,10), Rng.integers(2,6)
+        Demand = Rng.random(Nm) * 5
+        Demand[Rng.random(Nm) < 0.2] = 0
+        Supplies = []
+        for Supply in range(0,3):
+            Supplies.append(Rng.random((Nm,Ne)) * Rng.choice([0.1,1,10]))
+            Supplies[-1][Rng.random(Nm) < 0.3] = 0
+        Uses, Remaining = rf.SecondaryMaterialAllocation(Demand, Supplies)
+        Rest = Demand
+        for Supply in range(0,3):
+            Use, Rest = SecondaryMaterialUse(Rest, Supplies[Supply])
+            np.testing.assert_array_equal(Uses[Supply], Use)
+            np.testing.assert_array_equal(Remaining[Supply], Rest)
+
+
+def test_BiogenicCarbonGWP():
+    Rng = np.random.default_rng(5)
+    Nt, Nr, Ng = 20, 3, 4
+    WoodInflow = Rng.random((Nt,Nr,Ng))   # indices: trg
+    LifeTimes  = Rng.random((Ng,Nr,Nt)) * 150 # indices: grt
+    GWP_Bio    = Rng.random(200) - 0.5
+    Reference  = np.zeros((Nt,Nr))
+    for ntt in range(0,Nt):
+        for nrr in range(0,Nr):
+            for ngg in range(0,Ng):
+                mass_C = 0.9 * 12/44 * WoodInflow[ntt,nrr,ngg]
+                Reference[ntt,nrr] += 44/12 * mass_C * GWP_Bio[int(np.floor(LifeTimes[ngg,nrr,ntt]))]
+    np.testing.assert_allclose(rf.BiogenicCarbonGWP(WoodInflow, LifeTimes, GWP_Bio, 0.9), Reference, rtol=1e-12, atol=1e-15)
+
+
+def test_ProductElementComposition():
+    """ The factored composition against the dense Par_3_MC_Stock_ByElement_Nr[t,c,r,g,m,e] = MC[c,m,g,r,t] * Composition[c,m,e]. """
+    Rng         = np.random.default_rng(14)
+    MC          = Rng.random((6,3,4,2,5)) # indices: cmgrt
+    Composition = Rng.random((6,3,3))     # indices: cme
+    Stock       = Rng.random((5,6,4,2))   # indices: tcgr
+    Goods       = [0,2]
+    Dense       = np.einsum('cmgrt,cme->tcrgme', MC, Composition)
+    Reference   = np.einsum('tcrgme,tcgr->tcrgme', Dense, Stock)[:,:,:,Goods,:,:]
+    Factored    = rf.ProductElementComposition(MC, Composition)
+    np.testing.assert_allclose(Factored.Current, Dense[0], rtol=1e-14)
+    np.testing.assert_allclose(Factored.Layer(Goods, 1), Dense[:,:,:,Goods,:,1], rtol=1e-14) # numpy puts the sector index first
+    np.testing.assert_allclose(Factored.Products(Goods, Stock[2][:,Goods,:], 2), np.einsum('crgme->gcrme', Reference[2]), rtol=1e-14)
+    np.testing.assert_allclose(Factored.LayerProducts(Goods, 0, Stock[:,:,Goods,:]), np.einsum('tcrgm->gtcrm', Reference[...,0]), rtol=1e-14)
+
+
+def CohortWindowValues(Shape, CohortStart, CohortEnd, Seed):
+    """ Dense random values that are 0 outside of the cohort windows. """
+    Values = np.random.default_rng(Seed).random(Shape)
+    for t in range(0,Shape[0]):
+        Values[t,0:CohortStart] = 0
+        Values[t,CohortEnd[t]::] = 0
+    return Values
+
+
+Keys = [(2,slice(0,6)), (3,slice(2,5),1), (slice(1,4),slice(None),0,[0,2],slice(None),0), (4,slice(2,8),slice(None),[1,2],slice(None),slice(None)),
+        (slice(None),slice(None),slice(None),slice(None),slice(None),[2,0]), (Ellipsis,1), (-1,)]
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_CohortWindowArray(dtype):
+    Shape     = (5,9,2,3,4,3) # indices: tcrgme
+    CohortEnd = np.arange(5,10)
+    Values    = CohortWindowValues(Shape, 2, CohortEnd, 6).astype(dtype).astype(float)
+    Array     = rf.CohortWindowArray(Shape, 2, CohortEnd, dtype)
+    Array[:,:,:,:,:,:] = Values
+    np.testing.assert_array_equal(np.asarray(Array), Values)
+    for Key in Keys:
+        np.testing.assert_array_equal(Array[Key], Values[Key])
+    # single year and several years, with the advanced indices separated by a slice:
+    Array[3,2:6,:,[0,2],:,:] = 0.5
+    Values[3,2:6,:,[0,2],:,:] = 0.5
+    Array[1:3,2:5,0,[1,2],:,0] = 0.25
+    Values[1:3,2:5,0,[1,2],:,0] = 0.25
+    np.testing.assert_array_equal(np.asarray(Array), Values)
+    assert Array.min() == Values.min() and Array.max() == Values.max()
+
+
+def test_CohortWindowArray_OutsideWindow():
+    Array = rf.CohortWindowArray((4,6,2), 1, np.arange(3,7))
+    Array[0,0:3] = 0 # zeros may be written outside of the window
+    with pytest.raises(AssertionError):
+        Array[0,0:3] = 1 # cohort 0 is before the window
+    with pytest.raises(AssertionError):
+        Array[1,4] = 1   # cohort 4 is after the window of year 1
+    assert not np.asarray(Array).any()
+
+
+def test_CohortWindowArray_Layers():
+    """ Layer 1 is not stored, only its sums over r and m are, reading it in any other way raises an error. """
+    Shape     = (5,9,2,3,4,3)
+    CohortEnd = np.arange(5,10)
+    Values    = CohortWindowValues(Shape, 2, CohortEnd, 7)
+    Array     = rf.CohortWindowArray(Shape, 2, CohortEnd, float, [0,2], (2,4))
+    Array[:,:,:,:,:,:] = Values
+    Update    = np.random.default_rng(13).random(Values[3,2:6,:,[0,2],:,:].shape) # overwrites the sums of some of the age-cohorts and products
+    Array[3,2:6,:,[0,2],:,:]  = Update
+    Values[3,2:6,:,[0,2],:,:] = Update
+    Array[1:3,2:5,:,[1,2],:,0]  = 0.25 # only the stored layer 0
+    Values[1:3,2:5,:,[1,2],:,0] = 0.25
+    Layer_1   = np.zeros(Shape, dtype = bool)
+    Layer_1[...,1] = True
+    for Key in Keys:
+        if Layer_1[Key].any():
+            with pytest.raises(AssertionError):
+                Array[Key]
+        else:
+            np.testing.assert_array_equal(Array[Key], Values[Key])
+    with pytest.raises(AssertionError):
+        np.asarray(Array)
+    for Subscripts, Key in [('tcrgme->te', np.s_[:]), ('tcrgme->tge', np.s_[:]), ('tcrgme->t', np.s_[:]), ('tcrgm->tg', np.s_[:,:,:,:,:,1]), ('tcrgme->te', np.s_[:,:,:,:,:,0:2])]:
+        np.testing.assert_allclose(Array.Sum(Subscripts, Key), np.einsum(Subscripts, Values[Key]), rtol=1e-12)
+    np.testing.assert_allclose(np.einsum('tcrgme->te', Array), np.einsum('tcrgme->te', Values), rtol=1e-12)
+    with pytest.raises(AssertionError):
+        Array.Sum('tcrgme->tre')   # layer 1 is not stored by region
+    with pytest.raises(AssertionError):
+        Array[3,2:6,0,:,:,:] = 1 # layer 1 can only be written for all regions and materials
+    Change = rf.CohortWindowArray(Shape, 2, CohortEnd, float, [0,2], (2,4))
+    for t in range(1,5):
+        Change.StoreChange(t, Array)
+    Values_Change = np.concatenate((np.zeros((1,) + Shape[1::]), np.diff(Values, 1, axis = 0)))
+    np.testing.assert_allclose(Change.Sum('tcrgme->tge'), np.einsum('tcrgme->tge', Values_Change), rtol=1e-12, atol=1e-14)
+    np.testing.assert_array_equal(Change[:,:,:,:,:,[0,2]], Values_Change[:,:,:,:,:,[0,2]])
+    assert rf.CohortWindowArray(Shape, 2, CohortEnd, float, range(0,3)).Layers is None
+
+
+def test_CohortWindowArray_SectorIndices():
+    """ Index patterns of the model script: the sector index list and the element index are advanced indices separated by a slice, numpy puts the sector index first. """
+    Shape     = (5,9,2,4,3,3) # indices: tcrgme
+    CohortEnd = np.arange(5,10)
+    Sector    = [0,2]
+    Values    = CohortWindowValues(Shape, 2, CohortEnd, 8)
+    Array     = rf.CohortWindowArray(Shape, 2, CohortEnd)
+    Array[:,:,:,:,:,:] = Values
+    Outflow   = CohortWindowValues((5,9,2,2,3), 2, CohortEnd, 9).transpose(3,0,1,2,4) # indices: ptcrm
+    Array[:,:,:,Sector,:,0]  = Outflow
+    Values[:,:,:,Sector,:,0] = Outflow
+    Stock     = np.random.default_rng(10).random(Values[3,2:7,:,Sector,:,:].shape)
+    Array[3,2:7,:,Sector,:,:]  = Stock
+    Values[3,2:7,:,Sector,:,:] = Stock
+    Historic  = np.random.default_rng(11).random(Values[1::,2:4,:,Sector,:,:].shape)
+    Array[1::,2:4,:,Sector,:,:]  = Historic
+    Values[1::,2:4,:,Sector,:,:] = Historic
+    np.testing.assert_array_equal(np.asarray(Array), Values)
+    for Key in [np.s_[:,:,:,Sector,:,0], np.s_[1::,:,:,Sector,:,0], np.s_[3,:,:,Sector,:,0], np.s_[3,2:7,:,Sector,:,:], np.s_[1::,2:4,:,Sector,:,:]]:
+        assert Array[Key].shape == Values[Key].shape
+        np.testing.assert_array_equal(Array[Key], Values[Key])
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_CohortWindowArray_Sum(dtype, monkeypatch):
+    Shape     = (5,9,2,3,4,3)
+    CohortEnd = np.arange(5,10)
+    Values    = CohortWindowValues(Shape, 2, CohortEnd, 12).astype(dtype).astype(float)
+    Array     = rf.CohortWindowArray(Shape, 2, CohortEnd, dtype)
+    Array[:,:,:,:,:,:] = Values
+    monkeypatch.setattr(Array, '_Dense', None) # the sums do not use the dense array
+    for Subscripts, Key in [('tcrgme->te', np.s_[:]), ('tcrgme->tmg', np.s_[:]), ('tcrgm->tm', np.s_[:,:,:,:,:,0]), ('tcrg->t', np.s_[:,:,:,:,1,0]), ('tcgme->tge', np.s_[:,:,1])]:
+        np.testing.assert_allclose(Array.Sum(Subscripts, Key), np.einsum(Subscripts, Values[Key]), rtol=1e-12)
+    np.testing.assert_allclose(np.einsum('tcrgme->te', Array), np.einsum('tcrgme->te', Values), rtol=1e-12) # dispatched to Sum
+    with pytest.raises(AssertionError):
+        Array.Sum('tcrgme->tce')
+    with pytest.raises(AssertionError):
+        Array.Sum('tcrgme->te', np.s_[1::])
+
+
+def test_SelectElements():
+    Items = ['All','C','H','Fe','other']
+    assert rf.SelectElements(Items, 'all') == [0,1,2,3,4]
+    assert rf.SelectElements(Items, 'C')   == [0,1]
+    assert rf.SelectElements(Items, "['Fe']") == [0,1,3]
+    with pytest.raises(AssertionError):
+        rf.SelectElements(Items, "['Al']")
+    with pytest.raises(AssertionError):
+        rf.SelectElements(Items, "__import__('os')")
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the broadcast storage of replicated Section 3 parameters: BroadcastValues, CompactValues,
+their storage in the parameter cache, and the absence of in-place writes to broadcast parameters in the model script.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import ast
+import types
+import numpy as np
+import pytest
+
+RepoPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RepoPath)
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+
+@pytest.mark.parametrize('Subscripts, BaseShape, Sizes, Ones', [
+    ('gmwW->grmwW', (3,4,2,2), {'r': 5},                        'gmwW,r->grmwW'),
+    ('pn->cprVnS',  (4,3),     {'c': 6, 'r': 5, 'V': 2, 'S': 3}, 'pn,crVS->cprVnS'),
+    ('RtS->trSR',   (2,7,3),   {'r': 5},                        'RtS,r->trSR'),
+    ('mwgFr->mwgFtr', (2,3,4,4,5), {'t': 6},                    'mwgFr,t->mwgFtr')])
+def test_BroadcastValues(Subscripts, BaseShape, Sizes, Ones):
+    Base    = np.random.default_rng(0).random(BaseShape)
+    Values  = rf.BroadcastValues(Subscripts, Base, Sizes)
+    OnesIx  = Ones.split(',')[1].split('->')[0]
+    np.testing.assert_array_equal(Values, np.einsum(Ones, Base, np.ones([Sizes[ThisLetter] for ThisLetter in OnesIx])))
+    assert not Values.flags.writeable
+    with pytest.raises(ValueError):
+        Values[(0,) * Values.ndim] = 1
+    Base[(0,) * Base.ndim] = -1 # the values are a copy of Base
+    assert Values.min() >= 0
+    assert rf.CompactValues(Values).size == Base.size
+
+
+def test_BroadcastValues_Diagonal():
+    Base   = np.random.default_rng(1).random((2,3,4,4,5))
+    Values = rf.BroadcastValues('mwggr->mwgtr', Base, {'t': 6})
+    np.testing.assert_array_equal(Values, np.einsum('mwggr,t->mwgtr', Base, np.ones(6)))
+
+
+def test_FabricationYield_Diagonal():
+    """ 4_PY_Manufacturing keeps its index structure mwgFtr, the model takes the diagonal of product = manufacturing process with the unchanged einsum. """
+    Base   = np.random.default_rng(2).random((2,3,4,4,7,1)) # mwgFtr, only 2015 (t = 0) is used
+    Values = Base.copy()
+    rf.ExtrapolateTimeSeries(Values, 4, 0, np.arange(1,7))
+    Broadcast = rf.BroadcastValues('mwgFr->mwgFtr', Base[:,:,:,:,0,:], {'t': 7})
+    assert Broadcast.shape == Values.shape
+    np.testing.assert_array_equal(np.einsum('mwggto->mwgto', Broadcast), np.einsum('mwggto->mwgto', Values))
+
+
+def test_CompactValues():
+    Base    = np.random.default_rng(3).random((3,1,4))
+    Values  = np.broadcast_to(Base, (3,5,4))
+    Compact = rf.CompactValues(Values)
+    assert Compact.shape == (3,1,4)
+    np.testing.assert_array_equal(np.broadcast_to(Compact, Values.shape), Values)
+    Dense   = np.random.default_rng(4).random((3,5,4)) # arrays without broadcast axes are unchanged
+    assert rf.CompactValues(Dense).shape == Dense.shape
+    np.testing.assert_array_equal(rf.CompactValues(Dense), Dense)
+
+
+def test_CachedBroadcastParameter(tmp_path):
+    """ Broadcast values are stored in compact form and memory-mapped as read-only broadcast view; the parameter object is not extended. """
+    Values    = rf.BroadcastValues('gmwW->grmwW', np.random.default_rng(5).random((3,4,2,2)), {'r': 6})
+    Parameter = types.SimpleNamespace(Name='4_PY_EoL_RecoveryRate', Indices='grmwW', Values=Values)
+    CacheFile = str(tmp_path / 'Par.dat')
+    rf.StoreCachedParameter(CacheFile, Parameter)
+    assert np.load(rf.ParameterValueFile(CacheFile)).shape == (3,1,4,2,2)
+    MetaParameter, Shape = rf.LoadCachedParameter(CacheFile)
+    assert MetaParameter.Values is None and MetaParameter.Indices == 'grmwW' and Shape == Values.shape
+    assert sorted(vars(MetaParameter)) == sorted(vars(Parameter))
+    ParameterDict = rf.LazyParameterDict()
+    ParameterDict['4_PY_EoL_RecoveryRate'] = MetaParameter
+    ParameterDict.SetValueFile('4_PY_EoL_RecoveryRate', rf.ParameterValueFile(CacheFile), Shape)
+    Loaded = ParameterDict['4_PY_EoL_RecoveryRate'].Values
+    np.testing.assert_array_equal(Loaded, Values)
+    assert not Loaded.flags.writeable
+
+
+def BroadcastParameters(Tree):
+    """ Names of the parameters that are assigned broadcast values with rf.BroadcastValues in the model script. """
+    Names = set()
+    for Node in ast.walk(Tree):
+        if isinstance(Node, ast.Assign) and isinstance(Node.value, ast.Call) and isinstance(Node.value.func, ast.Attribute) \
+           and Node.value.func.attr == 'BroadcastValues':
+            for Target in Node.targets:
+                Name = ParameterName(Target)
+                if Name is not None:
+                    Names.add(Name)
+    return Names
+
+
+def ParameterName(Node):
+    """ Returns X for an expression ...ParameterDict['X'].Values, and None otherwise. """
+    if isinstance(Node, ast.Attribute) and Node.attr == 'Values' and isinstance(Node.value, ast.Subscript):
+        Dict = Node.value.value
+        if ((isinstance(Dict, ast.Name) and Dict.id == 'ParameterDict') or (isinstance(Dict, ast.Attribute) and Dict.attr == 'ParameterDict')) \
+           and isinstance(Node.value.slice, ast.Constant):
+            return Node.value.slice.value
+    return None
+
+
+def test_NoInPlaceWritesToBroadcastParameters():
+    """ Broadcast values are read-only views: the model script must replace them, not write into them (Section 3 steps 4 to 8 and 10, and the model loop). """
+    with open(os.path.join(RepoPath, 'ODYM_RECC_V2_4.py'), encoding='utf-8-sig') as ScriptFile:
+        Tree = ast.parse(ScriptFile.read())
+    Broadcast = BroadcastParameters(Tree)
+    assert {'4_PY_Manufacturing','4_PY_EoL_RecoveryRate','3_SHA_EnergyCarrierSplit_Vehicles','6_PR_ReUse_Bld','6_PR_ReUse_nonresBld',
+            '6_PR_LifeTimeExtension_passvehicles','6_PR_EoL_RR_Improvement','3_SHA_RECC_REStrategyScaleUp_r','6_PR_ReUse_Veh'} <= Broadcast
+    Writes = []
+    for Node in ast.walk(Tree):
+        Targets = Node.targets if isinstance(Node, ast.Assign) else [Node.target] if isinstance(Node, ast.AugAssign) else []
+        for Target in Targets:
+            if isinstance(Target, ast.Subscript) and ParameterName(Target.value) in Broadcast:
+                Writes.append((ParameterName(Target.value), Target.lineno))
+            if isinstance(Node, ast.AugAssign) and ParameterName(Target) in Broadcast:
+                Writes.append((ParameterName(Target), Target.lineno))
+        if isinstance(Node, ast.Call) and isinstance(Node.func, ast.Attribute) and Node.func.attr == 'ExtrapolateTimeSeries' \
+           and len(Node.args) > 0 and ParameterName(Node.args[0]) in Broadcast: # extrapolates in place
+            Writes.append((ParameterName(Node.args[0]), Node.lineno))
+    assert Writes == []
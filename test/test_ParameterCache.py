@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the parameter cache: cache keys, cache files, and the storage of parameter objects and values.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import types
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+
+def ToyDims(Regions = ('R1','R2','R3')):
+    """ ModelDimensions object with time, cohort, product, and region aspects. """
+    return rf._RebuildModelDimensions(['Time','Cohort','Good','Region'], ['t','c','g','r'],
+                                      [(2015,2016,2017),(2014,2015,2016,2017),('Car','Bus'),Regions],
+                                      ['Time','Time','Products','Regions'])
+
+
+def ToyParameter(Name, Indices, Values):
+    """ Stand-in for msc.Parameter: a plain object with name, index structure, and values. """
+    return types.SimpleNamespace(Name=Name, ID=1, P_Res=None, MetaData={'Dataset_Unit': 'Mt/yr'}, Indices=Indices, Values=Values,
+                                 Uncert=None, Unit='Mt/yr')
+
+
+def CacheKey(ParPath, Dims, ThisParIx = 'tgr', ParVersion = 'V1.0', ClassHash = 'abc'):
+    return rf.ParameterCacheKey(ParPath, '1_F_Test', ThisParIx, 'tgr', None, ParVersion, 'V2.0', ClassHash, Dims)
+
+
+def test_ParameterCacheKey(tmp_path):
+    ParPath = str(tmp_path / '1_F_Test_V1.0')
+    with open(ParPath + '.xlsx', 'wb') as ParFile:
+        ParFile.write(b'values 1')
+    Dims = ToyDims()
+    Key  = CacheKey(ParPath, Dims)
+    assert Key == CacheKey(ParPath, ToyDims()) # deterministic
+    assert len(Key) == 64
+    # any input of msf.ReadParameterV2 changes the key:
+    assert Key != CacheKey(ParPath, Dims, ParVersion = 'V1.1')
+    assert Key != CacheKey(ParPath, Dims, ClassHash = 'abd')
+    assert Key != CacheKey(ParPath, Dims, ThisParIx = 'tcgr')
+    assert Key != CacheKey(ParPath, ToyDims(Regions = ('R1','R2')))
+    with open(ParPath + '.xlsx', 'wb') as ParFile:
+        ParFile.write(b'values 2')
+    NewKey = CacheKey(ParPath, Dims)
+    assert NewKey != Key
+    # the item selection of aspects that the parameter does not use does not change the key:
+    assert rf.ParameterCacheKey(ParPath, '1_F_Test', 'tg', 'tg', None, 'V1.0', 'V2.0', 'abc', Dims) == \
+           rf.ParameterCacheKey(ParPath, '1_F_Test', 'tg', 'tg', None, 'V1.0', 'V2.0', 'abc', ToyDims(Regions = ('R1','R2')))
+
+
+def test_ParameterCacheFile():
+    CacheFile = rf.ParameterCacheFile('cache', '1_F_Test', 'ab' * 32)
+    assert CacheFile == os.path.join('cache', '1_F_Test__' + 'ab' * 16 + '.dat')
+    assert rf.ParameterValueFile(CacheFile) == os.path.join('cache', '1_F_Test__' + 'ab' * 16 + '.npy')
+
+
+def test_CachedParameter(tmp_path):
+    Values    = np.random.default_rng(0).random((3,2,3))
+    Parameter = ToyParameter('1_F_Test', 'tgr', Values)
+    CacheFile = str(tmp_path / 'Par.dat')
+    assert rf.LoadCachedParameter(CacheFile) == (None, None)
+    rf.StoreCachedParameter(CacheFile, Parameter)
+    assert Parameter.Values is Values # the stored parameter keeps its values
+    assert sorted(os.listdir(str(tmp_path))) == ['Par.dat', 'Par.npy'] # no temporary files are left behind
+    MetaParameter, Shape = rf.LoadCachedParameter(CacheFile)
+    assert MetaParameter.Values is None and Shape == (3,2,3)
+    assert MetaParameter.Indices == 'tgr' and MetaParameter.MetaData == Parameter.MetaData
+    np.testing.assert_array_equal(np.load(rf.ParameterValueFile(CacheFile)), Values)
+
+
+def test_CachedParameter_Invalid(tmp_path):
+    CacheFile = str(tmp_path / 'Par.dat')
+    rf.StoreCachedParameter(CacheFile, ToyParameter('1_F_Test', 'tgr', np.ones((3,2,3))))
+    os.remove(rf.ParameterValueFile(CacheFile)) # entry without values
+    assert rf.LoadCachedParameter(CacheFile) == (None, None)
+    rf.StoreCachedParameter(CacheFile, ToyParameter('1_F_Test', 'tgr', np.ones((3,2,3))))
+    with open(CacheFile, 'wb') as CacheObject: # corrupt entry
+        CacheObject.write(b'no pickle')
+    assert rf.LoadCachedParameter(CacheFile) == (None, None)
+
+
+
+def test_ParameterIndex(tmp_path):
+    IndexFile = str(tmp_path / 'Index.dat')
+    assert rf.LoadParameterIndex(IndexFile) == {}
+    ParameterIndex = {'1_F_Test': rf.ParameterMetaData(ToyParameter('1_F_Test', 'tgr', np.ones(3)))}
+    rf.StoreParameterIndex(IndexFile, ParameterIndex)
+    Loaded = rf.LoadParameterIndex(IndexFile)
+    assert list(Loaded) == ['1_F_Test'] and Loaded['1_F_Test'].Values is None
+    with open(IndexFile, 'wb') as IndexObject:
+        IndexObject.write(b'no pickle')
+    assert rf.LoadParameterIndex(IndexFile) == {}
+
+
+def LazyDict(tmp_path, Parameters):
+    """ LazyParameterDict with the parameters stored in the cache, as loaded in Section 2 of the model script. """
+    ParameterDict = rf.LazyParameterDict()
+    for Par in Parameters:
+        CacheFile = str(tmp_path / (Par.Name + '.dat'))
+        rf.StoreCachedParameter(CacheFile, Par)
+        MetaParameter, Shape = rf.LoadCachedParameter(CacheFile)
+        ParameterDict[Par.Name] = MetaParameter
+        ParameterDict.SetValueFile(Par.Name, rf.ParameterValueFile(CacheFile), Shape)
+    return ParameterDict
+
+
+def test_LazyParameterDict(tmp_path):
+    Values_A = np.random.default_rng(1).random((3,2,3))
+    Values_B = np.random.default_rng(2).random((2,3))
+    ParameterDict = LazyDict(tmp_path, [ToyParameter('A', 'tgr', Values_A), ToyParameter('B', 'gr', Values_B)])
+    assert sorted(ParameterDict.ValueFiles) == ['A', 'B']
+    assert ParameterDict.Meta('A').Values is None and ParameterDict.Meta('A').Indices == 'tgr' # metadata without values
+    assert 'A' in ParameterDict.ValueFiles
+    A = ParameterDict['A'] # memory-mapped on first access
+    assert isinstance(A.Values, np.memmap)
+    np.testing.assert_array_equal(A.Values, Values_A)
+    assert sorted(ParameterDict.ValueFiles) == ['B']
+    assert ParameterDict['A'] is A and ParameterDict['A'].Values is A.Values # mapped once
+    assert ParameterDict.get('C') is None and ParameterDict.get('C', 0) == 0
+    np.testing.assert_array_equal(ParameterDict.get('B').Values, Values_B)
+    assert ParameterDict.ValueFiles == {}
+
+
+def test_LazyParameterDict_CopyOnWrite(tmp_path):
+    Values = np.random.default_rng(3).random((3,2,3))
+    ParameterDict = LazyDict(tmp_path, [ToyParameter('A', 'tgr', Values)])
+    ParameterDict['A'].Values[0,:,:] = -1 # the model modifies values in place, the cache file remains unchanged
+    assert ParameterDict['A'].Values[0,:,:].max() == -1
+    np.testing.assert_array_equal(np.load(str(tmp_path / 'A.npy')), Values)
+    MetaParameter, Shape = rf.LoadCachedParameter(str(tmp_path / 'A.dat')) # a new dictionary maps the unchanged cache file
+    ParameterDict = rf.LazyParameterDict({'A': MetaParameter})
+    ParameterDict.SetValueFile('A', str(tmp_path / 'A.npy'), Shape)
+    ParameterDict.LoadAll()
+    assert ParameterDict.ValueFiles == {}
+    np.testing.assert_array_equal(ParameterDict['A'].Values, Values)
+
+
+def test_LazyParameterDict_Replace(tmp_path):
+    ParameterDict = LazyDict(tmp_path, [ToyParameter('A', 'tgr', np.ones((3,2,3))), ToyParameter('B', 'gr', np.ones((2,3)))])
+    ParameterDict['A'] = ToyParameter('A', 'tgr', np.zeros(4)) # a replaced parameter does not receive the values of its predecessor
+    np.testing.assert_array_equal(ParameterDict['A'].Values, np.zeros(4))
+    Items = dict(ParameterDict.items()) # items and values map all remaining parameters
+    assert ParameterDict.ValueFiles == {}
+    np.testing.assert_array_equal(Items['B'].Values, np.ones((2,3)))
+    assert all([Par.Values is not None for Par in ParameterDict.values()])
+    with pytest.raises(KeyError):
+        ParameterDict['C']
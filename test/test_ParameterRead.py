@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the parallel parameter reading (ReadParameterList) against a serial read.
+ODYM is not required: the worker processes import a test reader module ODYM_Functions with the signature of msf.ReadParameterV2,
+which writes log records and returns the dataset UUID of the parameter file, and finishes the parameters in reverse order.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import logging as log
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+TestReader = '''
+import time
+import numpy as np
+
+def ReadParameterV2(ParPath, ThisPar, ThisParIx, IndexMatch, ThisParLayerSel, MasterClassification, IndexTable,
+                    IndexTable_ClassificationNames, ScriptConfig, Mylog, ParseUncertainty):
+    with open(ParPath + '.txt') as ParFile:
+        UUID = ParFile.read()
+    Position = int(ThisPar.split('_')[-1])
+    time.sleep(0.05 * (5 - Position)) # later parameters finish first
+    Mylog.info('Reading ' + ThisPar + ' with index structure ' + ThisParIx + ' from ' + ParPath)
+    Mylog.warning('Layer selection of ' + ThisPar + ': ' + str(ThisParLayerSel) + ', region ' + IndexTable['r'][Position % 2])
+    MetaData = {'Dataset_Name': ThisPar, 'Dataset_UUID': UUID, 'Scenario': ScriptConfig['Scenario']}
+    return MetaData, np.full((2,3), Position, dtype=float)
+'''
+
+
+@pytest.fixture
+def ParArgList(tmp_path, monkeypatch):
+    with open(str(tmp_path / 'ODYM_Functions.py'), 'w') as ReaderFile:
+        ReaderFile.write(TestReader)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, 'ODYM_Functions', raising = False)
+    ArgList = []
+    for Position in range(0,5):
+        ParPath = str(tmp_path / ('1_F_Par_' + str(Position) + '_V1.0'))
+        with open(ParPath + '.txt', 'w') as ParFile:
+            ParFile.write('uuid-' + str(Position) * 4)
+        ArgList.append((ParPath, '1_F_Par_' + str(Position), 'tr', 'tr', [Position]))
+    return ArgList
+
+
+def ReplayedLog(Results):
+    """ Replays the log records of the parameters in list order, as Section 2 of the model script does, and returns the log messages. """
+    Mylog     = log.getLogger('RECC_TestReplay')
+    Mylog.setLevel(log.DEBUG)
+    Mylog.propagate = False
+    Collector = rf.ListHandler()
+    Mylog.handlers = [Collector]
+    for MetaData, Values, ParLogRecords in Results:
+        for ParLogRecord in ParLogRecords:
+            ParLogRecord.name = Mylog.name
+            Mylog.handle(ParLogRecord)
+        Mylog.info('Current parameter file UUID: ' + MetaData['Dataset_UUID'])
+    return [(Record.levelname, Record.getMessage()) for Record in Collector.Records]
+
+
+@pytest.mark.parametrize('NoWorkers', [2, 5])
+def test_ReadParameterList(ParArgList, NoWorkers):
+    import ODYM_Functions as msf # the test reader
+    IndexTable   = {'r': ['R1','R2']}
+    ScriptConfig = {'Scenario': 'Test'}
+    Serial = []
+    for ParArgs in ParArgList:
+        SerialLog = log.getLogger('RECC_TestSerial')
+        SerialLog.setLevel(log.DEBUG) # as the worker log and the model log
+        SerialLog.propagate = False
+        Collector = rf.ListHandler()
+        SerialLog.handlers = [Collector]
+        MetaData, Values = msf.ReadParameterV2(*ParArgs, {}, IndexTable, [], ScriptConfig, SerialLog, False)
+        Serial.append((MetaData, Values, Collector.Records))
+    Parallel = rf.ReadParameterList(ParArgList, {}, IndexTable, [], ScriptConfig, NoWorkers)
+    assert [MetaData['Dataset_Name'] for MetaData, Values, Records in Parallel] == [ParArgs[1] for ParArgs in ParArgList]
+    assert [MetaData['Dataset_UUID'] for MetaData, Values, Records in Parallel] == ['uuid-' + str(Position) * 4 for Position in range(0,5)]
+    assert [MetaData for MetaData, Values, Records in Parallel] == [MetaData for MetaData, Values, Records in Serial]
+    for (Values, SerialValues) in zip([Result[1] for Result in Parallel], [Result[1] for Result in Serial]):
+        np.testing.assert_array_equal(Values, SerialValues)
+    assert ReplayedLog(Parallel) == ReplayedLog(Serial)
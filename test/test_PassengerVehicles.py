@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the vectorized passenger vehicle stock, kilometrage, and car-sharing lifetime factor against the loops of the model script that they replace.
+The parameter arrays have the index structures of the model parameters, and the functions are called as in the model loop.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+Nt, Nr, NS, NV = 6, 4, 2, 5
+Sector_pav_loc, Service_Drivg, mS = 0, 3, 1
+
+
+def ToyParameters(Seed):
+    """ Values of the model parameters used for the passenger vehicle stock, with zero service and ride-sharing in some years and regions. """
+    Rng = np.random.default_rng(Seed)
+    ParameterDict = {'6_PR_CarSharingShare':        Rng.random((2,1,Nt,NS)) * 100,             # index structure GrtS
+                     '6_PR_RideSharingShare':       Rng.random((2,Nr,Nt,NS)) * 100,            # GrtS
+                     '6_MIP_VehicleOccupancyRate':  1 + Rng.random((2,Nr,Nt,NS)),              # GrtS
+                     '3_IO_Vehicles_UsePhase':      1e4 * (1 + Rng.random((NV,Nr,Nt,NS))),     # VrtS
+                     '6_MIP_CarSharing_Stock':      Rng.random((NS,Nr)),                       # Sr
+                     '6_MIP_RideSharing_Occupancy': 1 + Rng.random((NS,Nr))}                   # Sr
+    ParameterDict['6_PR_RideSharingShare'][Sector_pav_loc,1,2,mS] = 0
+    Service = 1e4 * Rng.random((Nt,Nr))
+    Service[0,2] = 0 # no stock
+    return ParameterDict, Service
+
+
+def test_PassengerVehicleStock():
+    ParameterDict, Total_Service_pav_tr_pC = ToyParameters(0)
+    # loop of the model script before vectorization:
+    Total_Vehicle_km_pav_tr_pC          = np.zeros((Nt,Nr))
+    TotalStockCurves_UsePhase_p_pC_test = np.zeros((Nt,Nr))
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        for nrr in range(0,Nr):
+            for ntt in range(0,Nt):
+                s0        = (1 - ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,ntt,mS] / 100)*(1 - ParameterDict['6_PR_RideSharingShare'][Sector_pav_loc,nrr,ntt,mS] / 100) \
+                          * Total_Service_pav_tr_pC[ntt,nrr] /(ParameterDict['6_MIP_VehicleOccupancyRate'][Sector_pav_loc,nrr,ntt,mS] * ParameterDict['3_IO_Vehicles_UsePhase'][Service_Drivg,nrr,ntt,mS])
+                s_CaS     = (ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,ntt,mS] / 100)*(1 - ParameterDict['6_PR_RideSharingShare'][Sector_pav_loc,nrr,ntt,mS] / 100) \
+                          * Total_Service_pav_tr_pC[ntt,nrr] /(ParameterDict['6_MIP_VehicleOccupancyRate'][Sector_pav_loc,nrr,ntt,mS] * ParameterDict['3_IO_Vehicles_UsePhase'][Service_Drivg,nrr,ntt,mS]) \
+                          * (ParameterDict['6_MIP_CarSharing_Stock'][mS,nrr])
+                s_RiS     = (1 - ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,ntt,mS] / 100)*(ParameterDict['6_PR_RideSharingShare'][Sector_pav_loc,nrr,ntt,mS] / 100) \
+                          * Total_Service_pav_tr_pC[ntt,nrr] /(ParameterDict['6_MIP_VehicleOccupancyRate'][Sector_pav_loc,nrr,ntt,mS] * ParameterDict['3_IO_Vehicles_UsePhase'][Service_Drivg,nrr,ntt,mS]) \
+                          / (ParameterDict['6_MIP_RideSharing_Occupancy'][mS,nrr])
+                s_CaS_RiS = (ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,ntt,mS] / 100)*(ParameterDict['6_PR_RideSharingShare'][Sector_pav_loc,nrr,ntt,mS] / 100) \
+                          * Total_Service_pav_tr_pC[ntt,nrr] /(ParameterDict['6_MIP_VehicleOccupancyRate'][Sector_pav_loc,nrr,ntt,mS] * ParameterDict['3_IO_Vehicles_UsePhase'][Service_Drivg,nrr,ntt,mS]) \
+                          / (ParameterDict['6_MIP_RideSharing_Occupancy'][mS,nrr] / ParameterDict['6_MIP_CarSharing_Stock'][mS,nrr])
+                s_total   = s0.copy() + s_CaS.copy() + s_RiS.copy() + s_CaS_RiS.copy()
+                TotalStockCurves_UsePhase_p_pC_test[ntt,nrr] = s_total.copy()
+                TotalStockCurves_UsePhase_p_pC_test[np.isnan(TotalStockCurves_UsePhase_p_pC_test)] = 0
+                vkm       = ((s0 + s_RiS) + (s_CaS + s_CaS_RiS) / ParameterDict['6_MIP_CarSharing_Stock'][mS,nrr]) * ParameterDict['3_IO_Vehicles_UsePhase'][Service_Drivg,nrr,ntt,mS].copy() / s_total
+                Total_Vehicle_km_pav_tr_pC[ntt,nrr] = vkm.copy()
+    # call of the model script:
+    Stock, Kilometrage = rf.PassengerVehicleStock(Total_Service_pav_tr_pC,
+                                                  ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,:,mS][:,np.newaxis],
+                                                  ParameterDict['6_PR_RideSharingShare'][Sector_pav_loc,:,:,mS].transpose(),
+                                                  ParameterDict['6_MIP_VehicleOccupancyRate'][Sector_pav_loc,:,:,mS].transpose(),
+                                                  ParameterDict['3_IO_Vehicles_UsePhase'][Service_Drivg,:,:,mS].transpose(),
+                                                  ParameterDict['6_MIP_CarSharing_Stock'][mS,:],
+                                                  ParameterDict['6_MIP_RideSharing_Occupancy'][mS,:])
+    assert Stock.shape == (Nt,Nr) and Kilometrage.shape == (Nt,Nr)
+    assert Stock[0,2] == 0 and np.isnan(Kilometrage[0,2]) # no stock, as in the loop
+    np.testing.assert_allclose(Stock, TotalStockCurves_UsePhase_p_pC_test, rtol=1e-13, atol=0)
+    np.testing.assert_allclose(Kilometrage, Total_Vehicle_km_pav_tr_pC, rtol=1e-13, atol=0) # NaN at the same positions
+
+
+def test_CarSharingLifetimeFactor():
+    ParameterDict, Total_Service_pav_tr_pC = ToyParameters(1)
+    Np, SwitchTime = 3, 3
+    Par_RECC_ProductLifetime_p = 10 + np.random.default_rng(2).random((Np,Nr,Nt + SwitchTime - 1)) # lifetime, index structure prc
+    Loop = Par_RECC_ProductLifetime_p.copy()
+    for npp in range(0,Np):
+        for nrr in range(0,Nr):
+            for ntt in range(0,Nt):
+                Loop[npp,nrr,ntt+SwitchTime-1] = (1 - ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,ntt,mS]/100 + ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,ntt,mS] * ParameterDict['6_MIP_CarSharing_Stock'][mS,nrr]/100) * Loop[npp,nrr,ntt+SwitchTime-1]
+    Par_RECC_ProductLifetime_p[:,:,SwitchTime-1::] = rf.CarSharingLifetimeFactor(ParameterDict['6_PR_CarSharingShare'][Sector_pav_loc,0,:,mS],
+                                                                                  ParameterDict['6_MIP_CarSharing_Stock'][mS,:]).transpose()[np.newaxis,:,:] * Par_RECC_ProductLifetime_p[:,:,SwitchTime-1::]
+    np.testing.assert_allclose(Par_RECC_ProductLifetime_p, Loop, rtol=1e-14, atol=0)
+    np.testing.assert_array_equal(Par_RECC_ProductLifetime_p[:,:,0:SwitchTime-1], Loop[:,:,0:SwitchTime-1]) # historic cohorts are unchanged
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the cache of the Section 3 preprocessing steps: chained step keys, re-computation of dependent steps, and the check of undeclared parameters.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import types
+import logging as log
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+# Parameters of steps 1a (reads and writes 3_MC_RECC_Vehicles), 2a (reads 3_MC_RECC_Vehicles), and 3 (independent of both).
+Step2aPars = ['X_FLAG_VehicleDownsizingDirection','3_MC_VehicleArchetypes','3_EI_VehicleArchetypes','3_SHA_LightWeighting_Vehicles',
+              '3_SHA_DownSizing_Vehicles','3_MC_RECC_Vehicles_RECC','3_EI_Products_UsePhase_passvehicles']
+Step3Pars  = ['4_PE_GHGIntensityElectricitySupply_Backstop','4_PE_GHGIntensityEnergySupply','4_PE_GHGIntensityEnergySupply_World']
+
+
+class ToyModel(object):
+    """ Parameter dictionary and cache of a model run, with steps 1a, 2a, and 3 as in Section 3 of the model script. """
+    def __init__(self, CachePath, StateKeys, ScriptConfig):
+        self.ParameterDict = rf.LazyParameterDict()
+        for Par in ['3_MC_RECC_Vehicles', '6_PR_Calibration'] + Step2aPars + Step3Pars:
+            self.ParameterDict[Par] = types.SimpleNamespace(Name=Par, Values=np.ones((2,3)))
+        ScriptFile = os.path.join(CachePath, 'ODYM_RECC_Test.py')
+        if not os.path.isfile(ScriptFile):
+            with open(ScriptFile, 'w') as ScriptObject:
+                ScriptObject.write('# model script')
+        Dims = rf._RebuildModelDimensions(['Time','Region'], ['t','r'], [(2015,2016),('R1','R2','R3')], ['Time','Regions'])
+        self.S3Cache  = rf.PreprocessingCache(CachePath, self.ParameterDict, StateKeys, [], ScriptConfig, ['pav'], Dims, ScriptFile,
+                                              log.getLogger('RECC_TestPreprocessingCache'))
+        self.Computed = []
+
+    def Run(self):
+        """ Performs the steps, returns the list of computed steps. """
+        ParameterDict = self.ParameterDict
+        if not self.S3Cache.Load('1a'):
+            ParameterDict['3_MC_RECC_Vehicles'].Values = ParameterDict['3_MC_RECC_Vehicles'].Values * 2
+            self.S3Cache.Store('1a')
+            self.Computed.append('1a')
+        if not self.S3Cache.Load('2a'):
+            ParameterDict['3_MC_RECC_Vehicles_RECC'].Values = ParameterDict['3_MC_RECC_Vehicles'].Values + ParameterDict['3_MC_VehicleArchetypes'].Values
+            self.S3Cache.Store('2a')
+            self.Computed.append('2a')
+        if not self.S3Cache.Load('3'):
+            ParameterDict['4_PE_GHGIntensityEnergySupply'].Values = ParameterDict['4_PE_GHGIntensityEnergySupply'].Values * 3
+            self.S3Cache.Store('3')
+            self.Computed.append('3')
+        return self.Computed
+
+
+StateKeys    = {Par: 'key of ' + Par for Par in ['3_MC_RECC_Vehicles'] + Step2aPars + Step3Pars}
+ScriptConfig = {'Include_REStrategy_MaterialSubstitution': 'True', 'Include_REStrategy_UsingLessMaterialByDesign': 'True'}
+
+
+def test_PreprocessingCache(tmp_path):
+    Model = ToyModel(str(tmp_path), StateKeys, ScriptConfig)
+    assert Model.Run() == ['1a','2a','3']
+    Cached = ToyModel(str(tmp_path), StateKeys, ScriptConfig)
+    assert Cached.Run() == []
+    for Par in ['3_MC_RECC_Vehicles','3_MC_RECC_Vehicles_RECC','4_PE_GHGIntensityEnergySupply']:
+        assert Par in Cached.ParameterDict.ValueFiles # loaded from the parameter cache files
+        np.testing.assert_array_equal(Cached.ParameterDict[Par].Values, Model.ParameterDict[Par].Values)
+    np.testing.assert_array_equal(Cached.ParameterDict['3_MC_RECC_Vehicles_RECC'].Values, 3 * np.ones((2,3)))
+
+
+@pytest.mark.parametrize('Changed, Config, Computed', [
+    ('3_MC_RECC_Vehicles',     {},                                                   ['1a','2a']), # input of 1a, chained to 2a
+    ('3_MC_VehicleArchetypes', {},                                                   ['2a']),
+    ('4_PE_GHGIntensityEnergySupply', {},                                            ['3']),
+    (None, {'Include_REStrategy_MaterialSubstitution': 'False'},                     ['2a']),      # config switch of 2a
+    (None, {'IncludeRecycling': 'False'},                                            [])])         # config switch of other steps
+def test_PreprocessingCache_Chained(tmp_path, Changed, Config, Computed):
+    assert ToyModel(str(tmp_path), StateKeys, ScriptConfig).Run() == ['1a','2a','3']
+    NewStateKeys = dict(StateKeys)
+    if Changed is not None:
+        NewStateKeys[Changed] = 'new key of ' + Changed # changed parameter file
+    NewConfig = dict(ScriptConfig)
+    NewConfig.update(Config)
+    assert ToyModel(str(tmp_path), NewStateKeys, NewConfig).Run() == Computed
+    assert ToyModel(str(tmp_path), NewStateKeys, NewConfig).Run() == [] # the new results are cached, too
+    assert ToyModel(str(tmp_path), StateKeys, ScriptConfig).Run() == [] # and so are the old ones
+
+
+def test_PreprocessingCache_StepKeys(tmp_path):
+    """ The state of a parameter written by a step is the key of that step. """
+    Model = ToyModel(str(tmp_path), StateKeys, ScriptConfig)
+    Key_1a = Model.S3Cache.StepKey('1a')
+    Model.Run()
+    assert Model.S3Cache.StateKeys['3_MC_RECC_Vehicles'] == Key_1a
+    assert Model.S3Cache.StateKeys['3_MC_RECC_Vehicles_RECC'] == Model.S3Cache.StateKeys['3_SHA_DownSizing_Vehicles']
+    assert Model.S3Cache.StateKeys['3_MC_VehicleArchetypes'] == StateKeys['3_MC_VehicleArchetypes'] # read only
+
+
+def test_PreprocessingCache_Undeclared(tmp_path):
+    Model = ToyModel(str(tmp_path), StateKeys, ScriptConfig)
+    assert not Model.S3Cache.Load('1a')
+    Model.ParameterDict['3_MC_RECC_Vehicles'].Values = Model.ParameterDict['3_MC_RECC_Vehicles'].Values * Model.ParameterDict['6_PR_Calibration'].Values
+    with pytest.raises(AssertionError, match='6_PR_Calibration'):
+        Model.S3Cache.Store('1a')
+    assert Model.ParameterDict.Accessed is None
+    assert not ToyModel(str(tmp_path), StateKeys, ScriptConfig).S3Cache.Load('1a') # nothing was stored
+    Model.ParameterDict['6_PR_Calibration'] # accesses outside of a computed step are not recorded
+    assert Model.ParameterDict.Accessed is None
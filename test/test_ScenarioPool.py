@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the parallel scenario loop rf.ScenarioPool on a toy loop: forked worker processes give the same results as the serial loop.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import types
+import logging
+import numpy as np
+import pytest
+
+RepoPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RepoPath)
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason = 'The scenario pool runs serially without os.fork.')
+
+
+@rf.ScenarioWorkerBoundary
+def ToyLoop(NoWorkers, Logger, Fail = None, Undeclared = False):
+    """ Scenario loop in the structure of the model script: result arrays, a loop parameter, a scratch parameter, and the exit flags. """
+    NS, NR        = 3, 2
+    Results       = np.zeros((4,NS,NR))
+    Totals        = np.zeros((NS,NR))
+    Other         = np.zeros((5,NS,NR)) # not a result array
+    ExitFlags     = {}
+    ParameterDict = {'Loop':    types.SimpleNamespace(Values = np.zeros((NS,NR))), 
+                     'Scratch': types.SimpleNamespace(Values = np.zeros(4)), 
+                     'Fixed':   types.SimpleNamespace(Values = np.arange(0,4.))}
+    Pool = rf.ScenarioPool(NoWorkers, Logger, {'Results': Results, 'Totals': Totals}, ParameterDict, ['Loop'], ['Scratch'], {'ExitFlags': ExitFlags})
+    for mS in range(0,NS):
+        for mR in range(0,NR):
+            if not Pool.Dispatch(mS, mR, mS == NS-1 and mR == NR-1, locals()):
+                continue
+            ParameterDict['Scratch'].Values[:] = mR + 1
+            Results[:,mS,mR] = ParameterDict['Fixed'].Values * (mS + 1) + ParameterDict['Scratch'].Values
+            Totals[mS,mR]    = Results[:,mS,mR].sum()
+            ParameterDict['Loop'].Values[mS,mR] = 10 * mS + mR
+            ExitFlags['Scenario_' + str(mS) + '_' + str(mR)] = True
+            Logger.info('Scenario ' + str((mS,mR)) + ' computed.')
+            if Undeclared:
+                Other[:,mS,mR] = 1
+            if Fail == (mS, mR):
+                raise ValueError('Toy scenario fails.')
+            Pool.Return(mS, mR)
+    return Results, Totals, ParameterDict['Loop'].Values, ExitFlags
+
+
+def ToyLogger(Name):
+    Logger = logging.getLogger(Name)
+    Logger.setLevel(logging.INFO)
+    Logger.handlers = [rf.ListHandler()]
+    Logger.propagate = False
+    return Logger
+
+
+def test_ScenarioPool_SerialAndForked():
+    SerialLogger, ForkedLogger = ToyLogger('ToySerial'), ToyLogger('ToyForked')
+    Serial = ToyLoop(1, SerialLogger)
+    Forked = ToyLoop(2, ForkedLogger)
+    for SerialResult, ForkedResult in zip(Serial[0:3], Forked[0:3]):
+        np.testing.assert_array_equal(ForkedResult, SerialResult)
+    assert Forked[3] == Serial[3]
+    Messages = [Record.getMessage() for Record in ForkedLogger.handlers[0].Records if Record.getMessage().startswith('Scenario')]
+    assert sorted(Messages) == sorted([Record.getMessage() for Record in SerialLogger.handlers[0].Records])
+
+
+def test_ScenarioPool_UndeclaredResult():
+    with pytest.raises(AssertionError, match = 'Other'):
+        ToyLoop(2, ToyLogger('ToyUndeclared'), Undeclared = True)
+
+
+def test_ScenarioPool_WorkerException():
+    with pytest.raises(AssertionError, match = 'Toy scenario fails'):
+        ToyLoop(2, ToyLogger('ToyFail'), Fail = (0,1))
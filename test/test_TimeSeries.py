@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the vectorized time series interpolation and extrapolation against the per-series loops of the model script that they replace.
+Run from the repository root with: python -m pytest -q test
+"""
+
+import os
+import sys
+import numpy as np
+import pytest
+from scipy.interpolate import interp1d
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ODYM_RECC_Functions_V2_4 as rf  # noqa: E402
+
+
+@pytest.mark.parametrize('Idx_Time, tnew', [
+    ([1980,1985,1990,1995,2000,2005,2010,2015,2020,2025,2030,2035,2040,2045,2050,2055,2060], np.linspace(80, 160, num=81, endpoint=True)),
+    ([1900,1910,1920,1930,1940,1950,1960,1970,1980,1985,1990,1995,2000,2005,2010,2015,2020,2025,2030,2035,2040,2045,2050,2055,2060],
+     np.linspace(0, 160, num=161, endpoint=True))])
+def test_InterpolateTimeSeries(Idx_Time, tnew):
+    """ Material composition of vehicles and buildings, Section 3 steps 1a to 1c, index structure tmBr. """
+    Idx_Time_Rel = [i - 1900 for i in Idx_Time]
+    Values       = np.random.default_rng(0).random((161,3,4,2))
+    Values[Idx_Time_Rel[3],1,:,:] = 0 # zero support values
+    Interpolated = rf.InterpolateTimeSeries(Values, Idx_Time_Rel, tnew)
+    assert Interpolated.shape == (len(tnew),3,4,2)
+    Loop = np.zeros((len(tnew),3,4,2))
+    for n in range(0,3):
+        for o in range(0,4):
+            for p in range(0,2):
+                f2 = interp1d(Idx_Time_Rel, Values[Idx_Time_Rel,n,o,p], kind='linear')
+                Loop[:,n,o,p] = f2(tnew)
+    np.testing.assert_allclose(Interpolated, Loop, rtol=1e-12, atol=1e-15)
+    np.testing.assert_array_equal(Interpolated[[int(t) - int(tnew[0]) for t in Idx_Time_Rel if t >= tnew[0]],...],
+                                  Values[[t for t in Idx_Time_Rel if t >= tnew[0]],...]) # values at the support points are unchanged
+
+
+def test_InterpolateTimeSeries_Vector():
+    """ GWP_bio, Section 3 step 20, index structure t. """
+    Idx_Time_Rel = [0,10,20,30,40,50,60,70,80,90,100]
+    tnew   = np.linspace(0, 100, num=101, endpoint=True)
+    Values = np.random.default_rng(1).random(161)
+    np.testing.assert_allclose(rf.InterpolateTimeSeries(Values, Idx_Time_Rel, tnew),
+                               interp1d(Idx_Time_Rel, Values[Idx_Time_Rel].copy(), kind='linear')(tnew), rtol=1e-12, atol=1e-15)
+
+
+def test_InterpolateTimeSeries_OutOfRange():
+    with pytest.raises(ValueError):
+        rf.InterpolateTimeSeries(np.ones((161,2)), [10,20,30], np.linspace(0, 30, num=31))
+    with pytest.raises(ValueError):
+        rf.InterpolateTimeSeries(np.ones((161,2)), [10,20,30], np.linspace(10, 31, num=22))
+
+
+def test_ExtrapolateTimeSeries():
+    """ Appliance demand beyond 2050, Section 3 step 19, index structure ocSRa, with the growth rate 2040-2050. """
+    Values = np.random.default_rng(2).random((1,161,3,2,4))
+    Values[0,140,1,0,:] = 0 # zero growth where the 2040 value is zero
+    Loop   = Values.copy()
+    for noS in range(0,3):
+        for noR in range(0,2):
+            for noa in range(0,4):
+                if Loop[0,140,noS,noR,noa] != 0:
+                    growthrate = (Loop[0,150,noS,noR,noa]/Loop[0,140,noS,noR,noa]-1)/10
+                else:
+                    growthrate = 0
+                for noT in range(151,161):
+                    Loop[0,noT,noS,noR,noa] = Loop[0,150,noS,noR,noa] * np.power(1+growthrate,noT-150)
+    Extrapolated = rf.ExtrapolateTimeSeries(Values, 1, 150, np.arange(151,161), RefPos = 140)
+    assert Extrapolated is Values # in place
+    np.testing.assert_allclose(Values, Loop, rtol=1e-12, atol=0)
+    np.testing.assert_array_equal(Values[0,151::,1,0,:], np.einsum('t,a->ta', np.ones(10), Values[0,150,1,0,:]))
+
+
+def test_ExtrapolateTimeSeries_Replicate():
+    """ Without RefPos, the values at BasePos are replicated, e.g., the 2015 fabrication yields, index structure mwgFtr. """
+    Values = np.random.default_rng(3).random((2,3,4,4,7,2))
+    Loop   = Values.copy()
+    Loop[:,:,:,:,1::,:] = np.einsum('t,mwgFr->mwgFtr', np.ones(6), Loop[:,:,:,:,0,:])
+    rf.ExtrapolateTimeSeries(Values, 4, 0, np.arange(1,7))
+    np.testing.assert_array_equal(Values, Loop)